@@ -8,8 +8,9 @@ from importlib.metadata import PackageNotFoundError, version
 from PySDM.attributes.impl.attribute_registry import register_attribute
 
 from . import attributes
-from . import environments, exporters, products
+from . import decomposition, environments, exporters, products
 from .builder import Builder
+from .ensemble_runner import EnsembleRunner
 from .formulae import Formulae
 from .particulator import Particulator
 
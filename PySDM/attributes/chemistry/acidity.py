@@ -25,7 +25,7 @@ class Acidity(DerivedAttribute):
     def recalculate(self):
         dynamic = self.particulator.dynamics["AqueousChemistry"]
 
-        self.particulator.backend.equilibrate_H(
+        stats = self.particulator.backend.equilibrate_H(
             equilibrium_consts=dynamic.equilibrium_consts,
             cell_id=self.cell_id.get(),
             conc=_conc(
@@ -41,4 +41,11 @@ class Acidity(DerivedAttribute):
             H_max=dynamic.pH_H_max,
             ionic_strength_threshold=dynamic.ionic_strength_threshold,
             rtol=dynamic.pH_rtol,
+            warm_start=dynamic.pH_warm_start,
+        )
+        n_solved, n_iterations, max_iterations = stats
+        dynamic.counters["pH solves"] += n_solved
+        dynamic.counters["pH iterations"] += n_iterations
+        dynamic.counters["pH max iterations"] = max(
+            dynamic.counters["pH max iterations"], max_iterations
         )
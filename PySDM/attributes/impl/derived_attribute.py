@@ -20,7 +20,8 @@ class DerivedAttribute(Attribute):
         )
         if self.timestamp < dependencies_timestamp:
             self.timestamp = dependencies_timestamp
-            self.recalculate()
+            with self.particulator.profiler.span(f"recalculate: {self.name}"):
+                self.recalculate()
 
     def recalculate(self):
         raise NotImplementedError()
@@ -5,3 +5,4 @@ attributes used for tracking cell-particle mapping in multi-dimensional simulati
 from .cell_id import CellId
 from .cell_origin import CellOrigin
 from .position_in_cell import PositionInCell
+from .super_droplet_id import SuperDropletId
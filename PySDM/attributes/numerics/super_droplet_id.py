@@ -0,0 +1,17 @@
+"""
+persistent super-droplet identifier (carried along through sorting, compaction
+ and migration between slabs, unlike the position in attribute arrays)
+"""
+
+from PySDM.attributes.impl import BaseAttribute, register_attribute
+
+
+@register_attribute()
+class SuperDropletId(BaseAttribute):
+    """defaults to the initial position in attribute arrays (see
+    `PySDM.builder.Builder.build`), hence with domain decomposition globally unique
+    values are to be provided; super-droplets added by splitting inherit the
+    identifier of the one they were split from"""
+
+    def __init__(self, builder):
+        super().__init__(builder, name="super droplet id", dtype=int)
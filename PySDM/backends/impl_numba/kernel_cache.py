@@ -0,0 +1,459 @@
+"""
+persistent, content-addressed on-disk cache of Numba-compiled kernels (both the
+ `PySDM.formulae.Formulae`-generated physics functions and the backend-method kernels);
+ disabled by default, enabled by setting the `PYSDM_KERNEL_CACHE_DIR` environment variable
+ or by calling `kernel_cache.enable(directory)`
+
+Each compiled kernel is stored under a key computed from a structural fingerprint of the
+ Python function (bytecode, constants, referenced globals and closure variables, recursively
+ following other jitted functions, including the formulae choices and the constants namedtuple
+ captured by them), the JIT flags, and the versions of Python, Numba, llvmlite and PySDM.
+ Any change in any of these yields a new key, hence stale entries are never loaded
+ (invalidation is implicit); entries are then removed by the eviction policy:
+ on `enable()` (and on explicit `evict()` calls) entries not used for longer than `max_age`
+ seconds are deleted, and then least-recently-used entries are deleted until the total
+ size of the cache directory is below `max_size` bytes; `clear()` removes all entries.
+"""
+
+import hashlib
+import inspect
+import os
+import shutil
+import sys
+import time
+import types
+from collections import namedtuple
+from importlib.metadata import PackageNotFoundError, version
+
+import llvmlite
+import numba
+import numpy as np
+from numba.core.caching import (
+    CompileResultCacheImpl,
+    FunctionCache,
+    IndexDataCacheFile,
+    NullCache,
+    _CacheLocator,
+)
+from numba.core.dispatcher import Dispatcher
+
+DEFAULT_MAX_SIZE = 512 * 1024**2
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+INDEX_SUFFIX = ".nbi"
+
+CacheEntry = namedtuple("CacheEntry", ("paths", "size", "last_used"))
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _versions():
+    try:
+        pysdm_version = version("PySDM")
+    except PackageNotFoundError:
+        pysdm_version = None
+    return (
+        sys.version,
+        numba.__version__,
+        llvmlite.__version__,
+        np.__version__,
+        pysdm_version,
+    )
+
+
+def _fingerprint_scalar(obj, _names, _visiting):
+    return type(obj).__name__, repr(obj)
+
+
+def _fingerprint_ndarray(obj, _names, _visiting):
+    return (
+        "ndarray",
+        str(obj.dtype),
+        obj.shape,
+        hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+    )
+
+
+def _fingerprint_module(obj, _names, _visiting):
+    return "module", obj.__name__
+
+
+def _fingerprint_type(obj, _names, _visiting):
+    return "type", obj.__module__, obj.__qualname__
+
+
+def _fingerprint_sequence(obj, names, visiting):
+    if hasattr(obj, "_fields"):
+        return (
+            type(obj).__qualname__,
+            tuple(
+                (field, fingerprint(getattr(obj, field), names, visiting))
+                for field in obj._fields
+                if names is None or field in names
+            ),
+        )
+    return type(obj).__name__, tuple(fingerprint(item, names, visiting) for item in obj)
+
+
+def _fingerprint_dict(obj, names, visiting):
+    return "dict", tuple(
+        (fingerprint(key, names, visiting), fingerprint(value, names, visiting))
+        for key, value in sorted(obj.items(), key=lambda item: repr(item[0]))
+    )
+
+
+def _fingerprint_dispatcher(obj, _names, visiting):
+    return (
+        "dispatcher",
+        fingerprint(obj.targetoptions, None, visiting),
+        fingerprint(obj.py_func, None, visiting),
+    )
+
+
+def _fingerprint_code(obj, _names, visiting):
+    return (
+        "code",
+        obj.co_name,
+        obj.co_code,
+        obj.co_names,
+        obj.co_varnames,
+        tuple(fingerprint(const, None, visiting) for const in obj.co_consts),
+    )
+
+
+def _fingerprint_function(obj, _names, visiting):
+    if id(obj) in visiting:
+        return "recursion", obj.__qualname__
+    visiting.add(id(obj))
+    code = obj.__code__
+    code_names = _names_used(code)
+    referenced_globals = tuple(
+        (name, fingerprint(obj.__globals__[name], code_names, visiting))
+        for name in sorted(code_names)
+        if name in obj.__globals__
+    )
+    closure = tuple(
+        fingerprint(cell.cell_contents, code_names, visiting)
+        for cell in obj.__closure__ or ()
+    )
+    visiting.discard(id(obj))
+    return (
+        "function",
+        obj.__module__,
+        obj.__qualname__,
+        fingerprint(code, None, visiting),
+        fingerprint(obj.__defaults__, None, visiting),
+        fingerprint(obj.__kwdefaults__, None, visiting),
+        referenced_globals,
+        closure,
+    )
+
+
+_FINGERPRINTS = (
+    (
+        (type(None), bool, int, float, complex, str, bytes, np.generic, np.dtype),
+        _fingerprint_scalar,
+    ),
+    (np.ndarray, _fingerprint_ndarray),
+    (types.ModuleType, _fingerprint_module),
+    (type, _fingerprint_type),
+    ((tuple, list), _fingerprint_sequence),
+    (dict, _fingerprint_dict),
+    (Dispatcher, _fingerprint_dispatcher),
+    (types.CodeType, _fingerprint_code),
+    (types.FunctionType, _fingerprint_function),
+)
+
+
+def fingerprint(obj, names=None, _visiting=None):
+    """returns a hashable, process-independent structural description of `obj`
+    (raising `_Uncacheable` for objects which cannot be described deterministically);
+    if `names` is given, only namedtuple fields listed therein are described
+    (for namedtuples such as the constants catalogue referenced from within functions)
+    """
+    _visiting = _visiting if _visiting is not None else set()
+    for classes, describe in _FINGERPRINTS:
+        if isinstance(obj, classes):
+            return describe(obj, names, _visiting)
+    if hasattr(obj, "py_func"):  # e.g., vectorized formulae
+        return type(obj).__qualname__, fingerprint(obj.py_func, None, _visiting)
+    raise _Uncacheable(type(obj).__qualname__)
+
+
+def _names_used(code):
+    """global and attribute names used in a given code object (including nested ones)"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _names_used(const)
+    return names
+
+
+class _Locator(_CacheLocator):
+    def __init__(self, cache, key):
+        self._cache = cache
+        self._key = key
+        self._py_file = "<PySDM kernel cache>"
+
+    def get_cache_path(self):
+        return os.path.join(self._cache.directory, self._key[:2])
+
+    def get_source_stamp(self):
+        return self._key
+
+    def get_disambiguator(self):
+        return self._key
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        raise NotImplementedError()
+
+
+class _CacheImpl(CompileResultCacheImpl):
+    _locator_classes = ()
+
+    def __init__(self, py_func, *, cache, key):  # pylint: disable=super-init-not-called
+        self._lineno = py_func.__code__.co_firstlineno
+        self._kernel_cache = cache
+        self._locator = _Locator(cache, key)
+        self._filename_base = self.get_filename_base(
+            py_func.__qualname__.replace("<locals>.", "").split(".")[-1],
+            getattr(sys, "abiflags", ""),
+        )
+
+    def check_cachable(self, cres):
+        if any(not lifted.can_cache for lifted in cres.lifted) or (
+            cres.library.has_dynamic_globals
+        ):
+            self._kernel_cache.uncacheable += 1
+            return False
+        return True
+
+
+class _FunctionCache(FunctionCache):
+    """Numba cache whose index key is the content-derived key rather than the default
+    (process-dependent in case of closures) pickle of closure variables"""
+
+    def __init__(self, py_func, *, cache, key):  # pylint: disable=super-init-not-called
+        self._kernel_cache = cache
+        self._key = key
+        self._name = repr(py_func)
+        self._py_func = py_func
+        self._impl = _CacheImpl(py_func, cache=cache, key=key)
+        self._cache_path = self._impl.locator.get_cache_path()
+        self._cache_file = IndexDataCacheFile(
+            cache_path=self._cache_path,
+            filename_base=self._impl.filename_base,
+            source_stamp=self._impl.locator.get_source_stamp(),
+        )
+        self.enable()
+
+    def _index_key(self, sig, codegen):
+        return sig, codegen.magic_tuple(), self._key
+
+    def load_overload(self, sig, target_context):
+        try:
+            data = super().load_overload(sig, target_context)
+        except Exception:  # pylint: disable=broad-exception-caught
+            data = None
+        if data is None:
+            self._kernel_cache.misses += 1
+        else:
+            self._kernel_cache.hits += 1
+            self._kernel_cache.touch(
+                self._cache_file._index_path  # pylint: disable=protected-access
+            )
+        return data
+
+    def save_overload(self, sig, data):
+        try:
+            super().save_overload(sig, data)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g., signatures involving first-class functions cannot be pickled
+            self._kernel_cache.uncacheable += 1
+
+
+class _LazyCache:
+    """placeholder set as the dispatcher's cache: defers fingerprinting of the function until
+    the first compilation (i.e. until all globals referenced by the function are defined)
+    """
+
+    def __init__(self, dispatcher, cache):
+        self._dispatcher = dispatcher
+        self._kernel_cache = cache
+        self._impl = None
+
+    def __resolve(self):
+        if self._impl is None:
+            if self._kernel_cache.directory is None:
+                return None
+            try:
+                key = self._kernel_cache.key(self._dispatcher)
+            except _Uncacheable:
+                self._kernel_cache.uncacheable += 1
+                self._dispatcher._cache = (
+                    NullCache()
+                )  # pylint: disable=protected-access
+                return None
+            self._impl = _FunctionCache(
+                self._dispatcher.py_func, cache=self._kernel_cache, key=key
+            )
+        return self._impl
+
+    @property
+    def cache_path(self):
+        impl = self.__resolve()
+        return None if impl is None else impl.cache_path
+
+    def load_overload(self, sig, target_context):
+        impl = self.__resolve()
+        return None if impl is None else impl.load_overload(sig, target_context)
+
+    def save_overload(self, sig, data):
+        impl = self.__resolve()
+        if impl is not None:
+            impl.save_overload(sig, data)
+
+    def enable(self):
+        pass
+
+    def disable(self):
+        pass
+
+    def flush(self):
+        if self._impl is not None:
+            self._impl.flush()
+
+
+class KernelCache:
+    """on-disk cache of compiled kernels (see module docstring for key and eviction policy)"""
+
+    def __init__(
+        self, directory=None, max_size=DEFAULT_MAX_SIZE, max_age=DEFAULT_MAX_AGE
+    ):
+        self.directory = None
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        if directory is not None:
+            self.enable(directory)
+
+    def enable(self, directory, *, max_size=None, max_age=None):
+        """sets the cache directory (created if needed) and evicts stale entries"""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = os.path.abspath(directory)
+        if max_size is not None:
+            self.max_size = max_size
+        if max_age is not None:
+            self.max_age = max_age
+        self.evict()
+
+    def disable(self):
+        """stops loading from and saving to disk (already-compiled kernels are unaffected)"""
+        self.directory = None
+
+    @property
+    def enabled(self):
+        return self.directory is not None
+
+    def key(self, dispatcher):
+        """content-addressed key of a given dispatcher (flags, code, globals, closure)"""
+        description = repr((_versions(), fingerprint(dispatcher)))
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def jit(self, dispatcher):
+        """attaches the persistent cache to a (not yet compiled) Numba dispatcher"""
+        if not isinstance(dispatcher, Dispatcher):  # e.g., with NUMBA_DISABLE_JIT
+            return dispatcher
+        dispatcher._cache = _LazyCache(  # pylint: disable=protected-access
+            dispatcher, self
+        )
+        return dispatcher
+
+    @staticmethod
+    def touch(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def entries(self):
+        """returns a list of `CacheEntry` tuples (one per index file with its data files)"""
+        result = []
+        if self.directory is None or not os.path.isdir(self.directory):
+            return result
+        for subdir in os.scandir(self.directory):
+            if not subdir.is_dir():
+                continue
+            files = {}
+            for file in os.scandir(subdir.path):
+                base = file.name.split(".py", 1)[0]
+                files.setdefault(base, []).append(file)
+            for group in files.values():
+                stats = [file.stat() for file in group]
+                index_mtimes = [
+                    stat.st_mtime
+                    for file, stat in zip(group, stats)
+                    if file.name.endswith(INDEX_SUFFIX)
+                ]
+                result.append(
+                    CacheEntry(
+                        paths=tuple(file.path for file in group),
+                        size=sum(stat.st_size for stat in stats),
+                        last_used=max(
+                            index_mtimes or [stat.st_mtime for stat in stats]
+                        ),
+                    )
+                )
+        return result
+
+    def size(self):
+        return sum(entry.size for entry in self.entries())
+
+    def evict(self, *, max_size=None, max_age=None, now=None):
+        """removes entries unused for longer than `max_age` [s] and then least-recently-used
+        entries until the cache occupies at most `max_size` bytes; returns number of
+        removed entries"""
+        max_size = self.max_size if max_size is None else max_size
+        max_age = self.max_age if max_age is None else max_age
+        now = time.time() if now is None else now
+        entries = sorted(self.entries(), key=lambda entry: entry.last_used)
+        total = sum(entry.size for entry in entries)
+        removed = 0
+        for entry in entries:
+            if now - entry.last_used <= max_age and total <= max_size:
+                break
+            for path in entry.paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= entry.size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """removes all entries from the cache directory"""
+        if self.directory is not None and os.path.isdir(self.directory):
+            for subdir in os.scandir(self.directory):
+                if subdir.is_dir():
+                    shutil.rmtree(subdir.path, ignore_errors=True)
+
+
+kernel_cache = KernelCache(
+    directory=os.environ.get("PYSDM_KERNEL_CACHE_DIR", None),
+    max_size=int(os.environ.get("PYSDM_KERNEL_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE)),
+    max_age=float(os.environ.get("PYSDM_KERNEL_CACHE_MAX_AGE", DEFAULT_MAX_AGE)),
+)
+
+
+def njit(*args, **kwargs):
+    """drop-in replacement for `numba.njit` attaching the persistent `kernel_cache`
+    (the `cache` flag is dropped as Numba's own cache does not support closures)"""
+    kwargs.pop("cache", None)
+    if args and inspect.isfunction(args[0]):
+        return kernel_cache.jit(numba.njit(**kwargs)(args[0]))
+    return lambda func: kernel_cache.jit(numba.njit(*args, **kwargs)(func))
@@ -0,0 +1,82 @@
+"""
+lookup tables of scalar functions of a single argument, linearly interpolated within
+ njitted code (used for sampling fragment sizes in place of evaluating transcendental
+ functions of the per-pair parameters, see
+ `PySDM.backends.impl_numba.methods.fragmentation_methods`)
+"""
+
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
+
+
+class LookupTable:  # pylint: disable=too-few-public-methods
+    """values of `functions` on a uniform grid of `n_points` spanning `x_range` (uniform
+    in `log(x)` if `log_grid` is set); outside of `x_range` the backend falls back to
+    evaluating the functions. For a function with continuous second derivative, the
+    linear-interpolation error within a grid cell of width `h` is bounded by
+    `h**2 / 8 * max|f''|` and is (to leading order in `h`) maximal at the cell midpoint,
+    hence `error` (the maximal absolute deviation from each function at grid-cell
+    midpoints) estimates the error bound of the table"""
+
+    def __init__(self, *, functions, x_range, n_points, log_grid=False):
+        assert n_points > 1 and x_range[0] < x_range[1]
+        grid = np.linspace(
+            *(np.log(x_range) if log_grid else np.asarray(x_range, dtype=float)),
+            n_points,
+        )
+        midpoints = (grid[1:] + grid[:-1]) / 2
+        if log_grid:
+            grid, midpoints = np.exp(grid), np.exp(midpoints)
+
+        values = np.asarray([[fun(x) for x in grid] for fun in functions])
+        self.error = np.amax(
+            np.abs(
+                np.asarray([[fun(x) for x in midpoints] for fun in functions])
+                - (values[:, 1:] + values[:, :-1]) / 2
+            ),
+            axis=1,
+        )
+        x_min = np.log(x_range[0]) if log_grid else x_range[0]
+        x_max = np.log(x_range[1]) if log_grid else x_range[1]
+        self.data = self.__layout(
+            (x_min, (x_max - x_min) / (n_points - 1), log_grid, n_points), values
+        )
+        """ representation passed to `lookup()`: a row with the grid parameters
+        followed by rows of function values """
+
+    @staticmethod
+    def __layout(header, values):
+        data = np.zeros((values.shape[0] + 1, max(len(header), values.shape[1])))
+        data[0, : len(header)] = header
+        data[1:, : values.shape[1]] = values
+        return data
+
+    @staticmethod
+    def disabled(n_functions):
+        """`data` of a table spanning no argument values (hence always falling back
+        to evaluating the functions)"""
+        return LookupTable.__layout((0, 1, False, 0), np.zeros((n_functions, 0)))
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def lookup(table, x):
+    """returns the grid index and the interpolation weight of `x` in `table` (given
+    as `LookupTable.data`), with the index being negative if `x` is out of range"""
+    x_min, dx, log_grid, n_points = table[0, 0], table[0, 1], table[0, 2], table[0, 3]
+    if log_grid:
+        if not x > 0:
+            return -1, 0.0
+        x = np.log(x)
+    position = (x - x_min) / dx
+    if not 0 <= position < n_points - 1:
+        return -1, 0.0
+    i = int(position)
+    return i, position - i
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def interpolate(table, row, i, weight):
+    """returns the value of the `row`-th function at the position found by `lookup()`"""
+    return table[row + 1, i] + weight * (table[row + 1, i + 1] - table[row + 1, i])
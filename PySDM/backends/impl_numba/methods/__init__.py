@@ -8,6 +8,7 @@ from .fragmentation_methods import FragmentationMethods
 from .freezing_methods import FreezingMethods
 from .index_methods import IndexMethods
 from .isotope_methods import IsotopeMethods
+from .merge_split_methods import MergeSplitMethods
 from .moments_methods import MomentsMethods
 from .pair_methods import PairMethods
 from .physics_methods import PhysicsMethods
@@ -3,20 +3,22 @@ CPU implementation of backend methods for aqueous chemistry
 """
 
 from collections import namedtuple
+from functools import cached_property
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.dynamics.impl.chemistry_utils import (
     DIFFUSION_CONST,
-    DISSOCIATION_FACTORS,
     GASEOUS_COMPOUNDS,
     MASS_ACCOMMODATION_COEFFICIENTS,
     EquilibriumConsts,
     HenryConsts,
+    KinConst,
     KineticConsts,
     SpecificGravities,
     k4,
@@ -28,6 +30,7 @@ _MAX_ITER_DEFAULT = 32
 _REALY_CLOSE_THRESHOLD = 1e-6
 _QUITE_CLOSE_THRESHOLD = 1
 _QUITE_CLOSE_MULTIPLIER = 2
+_WARM_START_MULTIPLIER = 10**0.01
 
 _K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
 _conc = namedtuple("_conc", ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI"))
@@ -41,11 +44,24 @@ class ChemistryMethods(BackendMethods):
         self.EQUILIBRIUM_CONST = EquilibriumConsts(self.formulae)
         self.specific_gravities = SpecificGravities(self.formulae.constants)
 
+    def _arrhenius_params(self, consts):
+        """(prefactor, activation energy) rows for use in kernels: van 't Hoff
+        temperature dependence of `EqConst` instances is expressed in the Arrhenius
+        form (as for `KinConst` ones) since Numba does not support passing the
+        keyword-only `T_0` argument of `vant_hoff()`"""
+        rows = []
+        for const in consts:
+            if isinstance(const, KinConst):
+                rows.append((const.A, const.Ea))
+            else:
+                R_T0 = self.formulae.constants.R_str * const.T0
+                rows.append((const.K * np.exp(const.dH / R_T0), const.dH))
+        return np.asarray(rows)
+
     def dissolution(  # pylint:disable=too-many-locals
         self,
         *,
         n_cell,
-        n_threads,
         cell_order,
         cell_start_arg,
         idx,
@@ -62,98 +78,132 @@ class ChemistryMethods(BackendMethods):
         droplet_volume,
         multiplicity,
     ):
-        assert n_cell == 1
-        assert n_threads == 1
-        for i in range(n_cell):
-            cell_id = cell_order[i]
-
-            cell_start = cell_start_arg[cell_id]
-            cell_end = cell_start_arg[cell_id + 1]
-            n_sd_in_cell = cell_end - cell_start
-            if n_sd_in_cell == 0:
-                continue
-
-            super_droplet_ids = numba.typed.List()
-            for sd_id in idx[cell_start:cell_end]:
-                if do_chemistry_flag.data[sd_id]:
-                    super_droplet_ids.append(sd_id)
-
-            if len(super_droplet_ids) == 0:
-                return
-
-            for key, compound in GASEOUS_COMPOUNDS.items():
-                ChemistryMethods.dissolution_body(
-                    super_droplet_ids=super_droplet_ids,
-                    mole_amounts=mole_amounts[key].data,
-                    env_mixing_ratio=env_mixing_ratio[compound][cell_id : cell_id + 1],
-                    henrysConstant=self.HENRY_CONST.HENRY_CONST[compound].at(
-                        env_T[cell_id]
-                    ),
-                    env_p=env_p[cell_id],
-                    env_T=env_T[cell_id],
-                    env_rho_d=env_rho_d[cell_id],
-                    timestep=timestep,
-                    dv=dv,
-                    droplet_volume=droplet_volume.data,
-                    multiplicity=multiplicity.data,
-                    system_type=system_type,
-                    specific_gravity=self.specific_gravities[compound],
-                    alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
-                    diffusion_const=DIFFUSION_CONST[compound],
-                    dissociation_factor=dissociation_factors[compound].data,
-                    radius=self.formulae.trivia.radius,
-                    const=self.formulae.constants,
-                )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-    def dissolution_body(  # pylint: disable=too-many-locals
-        *,
-        super_droplet_ids,
-        mole_amounts,
-        env_mixing_ratio,
-        henrysConstant,
-        env_p,
-        env_T,
-        env_rho_d,
-        timestep,
-        dv,
-        droplet_volume,
-        multiplicity,
-        system_type,
-        specific_gravity,
-        alpha,
-        diffusion_const,
-        dissociation_factor,
-        radius,
-        const,
-    ):
-        mole_amount_taken = 0
-        for i in super_droplet_ids:
-            Mc = specific_gravity * const.Md
-            Rc = const.R_str / Mc
-            cinf = env_p / env_T / (const.Rd / env_mixing_ratio[0] + Rc) / Mc
-            r_w = radius(volume=droplet_volume[i])
-            v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
-            dt_over_scale = timestep / (
-                4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
-            )
-            A_old = mole_amounts[i] / droplet_volume[i]
-            H_eff = henrysConstant * dissociation_factor[i]
-            A_new = (A_old + dt_over_scale * cinf) / (
-                1 + dt_over_scale / H_eff / const.R_str / env_T
-            )
-            new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
-            assert new_mole_amount_per_real_droplet >= 0
-
-            mole_amount_taken += multiplicity[i] * (
-                new_mole_amount_per_real_droplet - mole_amounts[i]
-            )
-            mole_amounts[i] = new_mole_amount_per_real_droplet
-        delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
-        assert delta_mr <= env_mixing_ratio
-        if system_type == "closed":
-            env_mixing_ratio -= delta_mr
+        """uptake (or release) of gaseous compounds by droplets in all cells, with
+        the gas-phase mixing ratios in `env_mixing_ratio` (one value per cell)
+        depleted by the per-cell totals of the uptake in closed systems; `dv` is
+        either a scalar or a per-cell array (as in `ParcelEnsemble`)"""
+        compounds = tuple(GASEOUS_COMPOUNDS.values())
+        n_failed = self._dissolution_body(
+            n_threads=min(numba.get_num_threads(), n_cell),
+            n_cell=n_cell,
+            cell_order=cell_order,
+            cell_start_arg=cell_start_arg.data,
+            idx=idx.data,
+            do_chemistry_flag=do_chemistry_flag.data,
+            mole_amounts=tuple(mole_amounts[key].data for key in GASEOUS_COMPOUNDS),
+            env_mixing_ratio=tuple(env_mixing_ratio[c] for c in compounds),
+            env_T=env_T.data,
+            env_p=env_p.data,
+            env_rho_d=env_rho_d.data,
+            dissociation_factors=tuple(dissociation_factors[c].data for c in compounds),
+            timestep=timestep,
+            dv=np.broadcast_to(dv, (n_cell,)).astype(float),
+            closed_system=system_type == "closed",
+            droplet_volume=droplet_volume.data,
+            multiplicity=multiplicity.data,
+            henry_consts=self._arrhenius_params(
+                self.HENRY_CONST.HENRY_CONST[c] for c in compounds
+            ),
+            specific_gravity=np.asarray(
+                [self.specific_gravities[c] for c in compounds]
+            ),
+            alpha=np.asarray([MASS_ACCOMMODATION_COEFFICIENTS[c] for c in compounds]),
+            diffusion_const=np.asarray([DIFFUSION_CONST[c] for c in compounds]),
+        )
+        assert n_failed == 0
+
+    @cached_property
+    def _dissolution_body(self):
+        radius = self.formulae.trivia.radius
+        arrhenius = self.formulae.trivia.arrhenius
+        Md = self.formulae.constants.Md
+        Rd = self.formulae.constants.Rd
+        R_str = self.formulae.constants.R_str
+
+        @njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments,too-many-locals
+            *,
+            n_threads,
+            n_cell,
+            cell_order,
+            cell_start_arg,
+            idx,
+            do_chemistry_flag,
+            mole_amounts,
+            env_mixing_ratio,
+            env_T,
+            env_p,
+            env_rho_d,
+            dissociation_factors,
+            timestep,
+            dv,
+            closed_system,
+            droplet_volume,
+            multiplicity,
+            henry_consts,
+            specific_gravity,
+            alpha,
+            diffusion_const,
+        ):
+            # note: assertions within prange loops prevent parallelisation
+            n_failed = 0
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for i in range(thread_id, n_cell, n_threads):
+                    cell_id = cell_order[i]
+                    cell_start = cell_start_arg[cell_id]
+                    cell_end = cell_start_arg[cell_id + 1]
+                    if cell_end == cell_start:
+                        continue
+                    T = env_T[cell_id]
+                    for c in range(henry_consts.shape[0]):
+                        moles = mole_amounts[c]
+                        mixing_ratio = env_mixing_ratio[c]
+                        dissociation_factor = dissociation_factors[c]
+                        henrys_constant = arrhenius(
+                            henry_consts[c, 0], henry_consts[c, 1], T
+                        )
+                        Mc = specific_gravity[c] * Md
+                        Rc = R_str / Mc
+                        cinf = (
+                            env_p[cell_id] / T / (Rd / mixing_ratio[cell_id] + Rc) / Mc
+                        )
+                        v_avg = np.sqrt(8 * R_str * T / (np.pi * Mc))
+
+                        mole_amount_taken = 0.0
+                        for j in range(cell_start, cell_end):
+                            sd_id = idx[j]
+                            if not do_chemistry_flag[sd_id]:
+                                continue
+                            r_w = radius(volume=droplet_volume[sd_id])
+                            dt_over_scale = timestep / (
+                                4 * r_w / (3 * v_avg * alpha[c])
+                                + r_w**2 / (3 * diffusion_const[c])
+                            )
+                            A_old = moles[sd_id] / droplet_volume[sd_id]
+                            H_eff = henrys_constant * dissociation_factor[sd_id]
+                            A_new = (A_old + dt_over_scale * cinf) / (
+                                1 + dt_over_scale / H_eff / R_str / T
+                            )
+                            new_mole_amount_per_real_droplet = (
+                                A_new * droplet_volume[sd_id]
+                            )
+                            if new_mole_amount_per_real_droplet < 0:
+                                n_failed += 1
+
+                            mole_amount_taken += multiplicity[sd_id] * (
+                                new_mole_amount_per_real_droplet - moles[sd_id]
+                            )
+                            moles[sd_id] = new_mole_amount_per_real_droplet
+                        delta_mr = (
+                            mole_amount_taken * Mc / (dv[cell_id] * env_rho_d[cell_id])
+                        )
+                        if delta_mr > mixing_ratio[cell_id]:
+                            n_failed += 1
+                        if closed_system:
+                            mixing_ratio[cell_id] -= delta_mr
+            return n_failed
+
+        return body
 
     def oxidation(  # pylint: disable=too-many-locals
         self,
@@ -177,12 +227,10 @@ class ChemistryMethods(BackendMethods):
         moles_S_IV,
         moles_S_VI,
     ):
-        ChemistryMethods.oxidation_body(
+        self._oxidation_body(
             n_sd=n_sd,
             cell_ids=cell_ids.data,
             do_chemistry_flag=do_chemistry_flag.data,
-            explicit_euler=self.formulae.trivia.explicit_euler,
-            pH2H=self.formulae.trivia.pH2H,
             k0=k0.data,
             k1=k1.data,
             k2=k2.data,
@@ -200,109 +248,189 @@ class ChemistryMethods(BackendMethods):
             moles_S_VI=moles_S_VI.data,
         )
 
-    @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
-    def oxidation_body(  # pylint: disable=too-many-locals
-        *,
-        n_sd,
-        cell_ids,
-        do_chemistry_flag,
-        explicit_euler,
-        pH2H,
-        k0,
-        k1,
-        k2,
-        k3,
-        K_SO2,
-        K_HSO3,
-        timestep,
-        droplet_volume,
-        pH,
-        dissociation_factor_SO2,
-        # output
-        moles_O3,
-        moles_H2O2,
-        moles_S_IV,
-        moles_S_VI,
-    ):
-        for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
-            if not do_chemistry_flag[i]:
-                continue
-
-            cid = cell_ids[i]
-            H = pH2H(pH[i])
-            SO2aq = moles_S_IV[i] / droplet_volume[i] / dissociation_factor_SO2[i]
-
-            # NB: This might not be entirely correct
-            # https://doi.org/10.1029/JD092iD04p04171
-            # https://doi.org/10.5194/acp-16-1693-2016
-
-            ozone = (
-                (
-                    k0[cid]
-                    + (k1[cid] * K_SO2[cid] / H)
-                    + (k2[cid] * K_SO2[cid] * K_HSO3[cid] / H**2)
+    @cached_property
+    def _oxidation_body(self):
+        explicit_euler = self.formulae.trivia.explicit_euler
+        pH2H = self.formulae.trivia.pH2H
+
+        @njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals
+            *,
+            n_sd,
+            cell_ids,
+            do_chemistry_flag,
+            k0,
+            k1,
+            k2,
+            k3,
+            K_SO2,
+            K_HSO3,
+            timestep,
+            droplet_volume,
+            pH,
+            dissociation_factor_SO2,
+            # output
+            moles_O3,
+            moles_H2O2,
+            moles_S_IV,
+            moles_S_VI,
+        ):
+            for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+                if not do_chemistry_flag[i]:
+                    continue
+
+                cid = cell_ids[i]
+                H = pH2H(pH[i])
+                SO2aq = moles_S_IV[i] / droplet_volume[i] / dissociation_factor_SO2[i]
+
+                # NB: This might not be entirely correct
+                # https://doi.org/10.1029/JD092iD04p04171
+                # https://doi.org/10.5194/acp-16-1693-2016
+
+                ozone = (
+                    (
+                        k0[cid]
+                        + (k1[cid] * K_SO2[cid] / H)
+                        + (k2[cid] * K_SO2[cid] * K_HSO3[cid] / H**2)
+                    )
+                    * (moles_O3[i] / droplet_volume[i])
+                    * SO2aq
+                )
+                peroxide = (
+                    k3[cid]
+                    * K_SO2[cid]
+                    / (1 + k4 * H)
+                    * (moles_H2O2[i] / droplet_volume[i])
+                    * SO2aq
+                )
+                dt_times_volume = timestep * droplet_volume[i]
+
+                dconc_dt_O3 = -ozone
+                dconc_dt_S_IV = -(ozone + peroxide)
+                dconc_dt_H2O2 = -peroxide
+                dconc_dt_S_VI = ozone + peroxide
+
+                if (
+                    moles_O3[i] + dconc_dt_O3 * dt_times_volume < 0
+                    or moles_S_IV[i] + dconc_dt_S_IV * dt_times_volume < 0
+                    or moles_S_VI[i] + dconc_dt_S_VI * dt_times_volume < 0
+                    or moles_H2O2[i] + dconc_dt_H2O2 * dt_times_volume < 0
+                ):
+                    continue
+
+                moles_O3[i] = explicit_euler(moles_O3[i], dt_times_volume, dconc_dt_O3)
+                moles_S_IV[i] = explicit_euler(
+                    moles_S_IV[i], dt_times_volume, dconc_dt_S_IV
+                )
+                moles_S_VI[i] = explicit_euler(
+                    moles_S_VI[i], dt_times_volume, dconc_dt_S_VI
+                )
+                moles_H2O2[i] = explicit_euler(
+                    moles_H2O2[i], dt_times_volume, dconc_dt_H2O2
                 )
-                * (moles_O3[i] / droplet_volume[i])
-                * SO2aq
-            )
-            peroxide = (
-                k3[cid]
-                * K_SO2[cid]
-                / (1 + k4 * H)
-                * (moles_H2O2[i] / droplet_volume[i])
-                * SO2aq
-            )
-            dt_times_volume = timestep * droplet_volume[i]
-
-            dconc_dt_O3 = -ozone
-            dconc_dt_S_IV = -(ozone + peroxide)
-            dconc_dt_H2O2 = -peroxide
-            dconc_dt_S_VI = ozone + peroxide
-
-            if (
-                moles_O3[i] + dconc_dt_O3 * dt_times_volume < 0
-                or moles_S_IV[i] + dconc_dt_S_IV * dt_times_volume < 0
-                or moles_S_VI[i] + dconc_dt_S_VI * dt_times_volume < 0
-                or moles_H2O2[i] + dconc_dt_H2O2 * dt_times_volume < 0
-            ):
-                continue
-
-            moles_O3[i] = explicit_euler(moles_O3[i], dt_times_volume, dconc_dt_O3)
-            moles_S_IV[i] = explicit_euler(
-                moles_S_IV[i], dt_times_volume, dconc_dt_S_IV
-            )
-            moles_S_VI[i] = explicit_euler(
-                moles_S_VI[i], dt_times_volume, dconc_dt_S_VI
-            )
-            moles_H2O2[i] = explicit_euler(
-                moles_H2O2[i], dt_times_volume, dconc_dt_H2O2
-            )
+
+        return body
 
     def chem_recalculate_drop_data(
         self, dissociation_factors, equilibrium_consts, cell_id, pH
     ):
-        for i in range(len(pH)):
-            H = self.formulae.trivia.pH2H(pH.data[i])
-            for key in DIFFUSION_CONST:
-                dissociation_factors[key].data[i] = DISSOCIATION_FACTORS[key](
-                    H, equilibrium_consts, cell_id.data[i]
-                )
+        self._chem_recalculate_drop_data_body(
+            cell_id=cell_id.data,
+            pH=pH.data,
+            K_HNO3=equilibrium_consts["K_HNO3"].data,
+            K_NH3=equilibrium_consts["K_NH3"].data,
+            K_SO2=equilibrium_consts["K_SO2"].data,
+            K_HSO3=equilibrium_consts["K_HSO3"].data,
+            K_CO2=equilibrium_consts["K_CO2"].data,
+            K_HCO3=equilibrium_consts["K_HCO3"].data,
+            # output
+            HNO3=dissociation_factors["HNO3"].data,
+            H2O2=dissociation_factors["H2O2"].data,
+            NH3=dissociation_factors["NH3"].data,
+            SO2=dissociation_factors["SO2"].data,
+            CO2=dissociation_factors["CO2"].data,
+            O3=dissociation_factors["O3"].data,
+        )
+
+    @cached_property
+    def _chem_recalculate_drop_data_body(self):
+        pH2H = self.formulae.trivia.pH2H
+
+        @njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals
+            *,
+            cell_id,
+            pH,
+            K_HNO3,
+            K_NH3,
+            K_SO2,
+            K_HSO3,
+            K_CO2,
+            K_HCO3,
+            HNO3,
+            H2O2,
+            NH3,
+            SO2,
+            CO2,
+            O3,
+        ):
+            """see `PySDM.dynamics.impl.chemistry_utils.DISSOCIATION_FACTORS`"""
+            for i in numba.prange(len(pH)):  # pylint: disable=not-an-iterable
+                H = pH2H(pH[i])
+                cid = cell_id[i]
+                HNO3[i] = 1 + K_HNO3[cid] / H
+                H2O2[i] = 1
+                NH3[i] = 1 + K_NH3[cid] / K_H2O * H
+                SO2[i] = 1 + K_SO2[cid] * (1 / H + K_HSO3[cid] / (H**2))
+                CO2[i] = 1 + K_CO2[cid] * (1 / H + K_HCO3[cid] / (H**2))
+                O3[i] = 1
+
+        return body
 
     def chem_recalculate_cell_data(
         self, equilibrium_consts, kinetic_consts, temperature
     ):
-        for i in range(len(temperature)):
-            for key in equilibrium_consts:
-                equilibrium_consts[key].data[i] = (
-                    self.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST[key].at(
-                        temperature.data[i]
+        self._chem_recalculate_cell_data_body(
+            temperature=temperature.data,
+            equilibrium_params=self._arrhenius_params(
+                self.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST[key]
+                for key in equilibrium_consts
+            ),
+            kinetic_params=self._arrhenius_params(
+                self.KINETIC_CONST.KINETIC_CONST[key] for key in kinetic_consts
+            ),
+            # output
+            equilibrium_consts=tuple(
+                value.data for value in equilibrium_consts.values()
+            ),
+            kinetic_consts=tuple(value.data for value in kinetic_consts.values()),
+        )
+
+    @cached_property
+    def _chem_recalculate_cell_data_body(self):
+        arrhenius = self.formulae.trivia.arrhenius
+
+        @njit(**self.default_jit_flags)
+        def body(
+            *,
+            temperature,
+            equilibrium_params,
+            kinetic_params,
+            equilibrium_consts,
+            kinetic_consts,
+        ):
+            for i in numba.prange(len(temperature)):  # pylint: disable=not-an-iterable
+                T = temperature[i]
+                for k in range(equilibrium_params.shape[0]):
+                    equilibrium_consts[k][i] = arrhenius(
+                        equilibrium_params[k, 0], equilibrium_params[k, 1], T
                     )
-                )
-            for key in kinetic_consts:
-                kinetic_consts[key].data[i] = self.KINETIC_CONST.KINETIC_CONST[key].at(
-                    temperature.data[i]
-                )
+                for k in range(kinetic_params.shape[0]):
+                    kinetic_consts[k][i] = arrhenius(
+                        kinetic_params[k, 0], kinetic_params[k, 1], T
+                    )
+
+        return body
 
     def equilibrate_H(
         self,
@@ -316,11 +444,16 @@ class ChemistryMethods(BackendMethods):
         H_max,
         ionic_strength_threshold,
         rtol,
+        warm_start=False,
     ):
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=self.formulae.trivia.within_tolerance,
-            pH2H=self.formulae.trivia.pH2H,
-            H2pH=self.formulae.trivia.H2pH,
+        """solves the charge balance for hydrogen ion concentration (stored as `pH`)
+        and flags droplets with ionic strength within `ionic_strength_threshold`;
+        if `warm_start` is set, the root is bracketed by widening a narrow interval
+        next to the previous `pH` value (instead of resorting to the full
+        `(H_min, H_max)` range when the previous value is not close);
+        returns the number of droplets for which the root search was done,
+        and the total and maximal number of iterations taken"""
+        n_failed, n_solved, n_iterations, max_iterations = self._equilibrate_H_body(
             cell_id=cell_id.data,
             conc=_conc(
                 N_mIII=conc.N_mIII.data,
@@ -346,91 +479,118 @@ class ChemistryMethods(BackendMethods):
             H_max=H_max,
             ionic_strength_threshold=ionic_strength_threshold,
             rtol=rtol,
+            warm_start=warm_start,
         )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
-    def equilibrate_H_body(  # pylint: disable=too-many-locals
-        *,
-        within_tolerance,
-        pH2H,
-        H2pH,
-        cell_id,
-        conc,
-        K,
-        do_chemistry_flag,
-        pH,
-        # params
-        H_min,
-        H_max,
-        ionic_strength_threshold,
-        rtol,
-    ):
-        for i, pH_i in enumerate(pH):
-            cid = cell_id[i]
-            args = (
-                _conc(
-                    N_mIII=conc.N_mIII[i],
-                    N_V=conc.N_V[i],
-                    C_IV=conc.C_IV[i],
-                    S_IV=conc.S_IV[i],
-                    S_VI=conc.S_VI[i],
-                ),
-                _K(
-                    NH3=K.NH3[cid],
-                    SO2=K.SO2[cid],
-                    HSO3=K.HSO3[cid],
-                    HSO4=K.HSO4[cid],
-                    HCO3=K.HCO3[cid],
-                    CO2=K.CO2[cid],
-                    HNO3=K.HNO3[cid],
-                ),
-            )
-            a = pH2H(pH_i)
-            fa = acidity_minfun(a, *args)
-            if abs(fa) < _REALY_CLOSE_THRESHOLD:
-                continue
-            b = np.nan
-            fb = np.nan
-            use_default_range = False
-            if abs(fa) < _QUITE_CLOSE_THRESHOLD:
-                b = a * _QUITE_CLOSE_MULTIPLIER
-                fb = acidity_minfun(b, *args)
-                if fa * fb > 0:
-                    b = a
-                    fb = fa
-                    a = b / _QUITE_CLOSE_MULTIPLIER / _QUITE_CLOSE_MULTIPLIER
-                    fa = acidity_minfun(a, *args)
-                    if fa * fb > 0:
-                        use_default_range = True
-            else:
-                use_default_range = True
-            if use_default_range:
-                a = H_min
-                b = H_max
+        assert n_failed == 0
+        return n_solved, n_iterations, max_iterations
+
+    @cached_property
+    def _equilibrate_H_body(self):  # pylint: disable=too-many-statements
+        within_tolerance = self.formulae.trivia.within_tolerance
+        pH2H = self.formulae.trivia.pH2H
+        H2pH = self.formulae.trivia.H2pH
+
+        @njit(**{**self.default_jit_flags, "cache": False})
+        def body(  # pylint: disable=too-many-locals
+            *,
+            cell_id,
+            conc,
+            K,
+            do_chemistry_flag,
+            pH,
+            # params
+            H_min,
+            H_max,
+            ionic_strength_threshold,
+            rtol,
+            warm_start,
+        ):
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            conc_N_mIII, conc_N_V, conc_C_IV, conc_S_IV, conc_S_VI = conc
+            K_NH3, K_SO2, K_HSO3, K_HSO4, K_HCO3, K_CO2, K_HNO3 = K
+
+            n_failed = 0
+            n_solved = 0
+            n_iterations = 0
+            max_iterations = 0
+            for i in numba.prange(len(pH)):  # pylint: disable=not-an-iterable
+                cid = cell_id[i]
+                args = (
+                    _conc(
+                        N_mIII=conc_N_mIII[i],
+                        N_V=conc_N_V[i],
+                        C_IV=conc_C_IV[i],
+                        S_IV=conc_S_IV[i],
+                        S_VI=conc_S_VI[i],
+                    ),
+                    _K(
+                        NH3=K_NH3[cid],
+                        SO2=K_SO2[cid],
+                        HSO3=K_HSO3[cid],
+                        HSO4=K_HSO4[cid],
+                        HCO3=K_HCO3[cid],
+                        CO2=K_CO2[cid],
+                        HNO3=K_HNO3[cid],
+                    ),
+                )
+                a = pH2H(pH[i])
                 fa = acidity_minfun(a, *args)
-                fb = acidity_minfun(b, *args)
-                max_iter = _MAX_ITER_DEFAULT
-            else:
-                max_iter = _MAX_ITER_QUITE_CLOSE
-            H, _iters_taken = toms748_solve(
-                acidity_minfun,
-                args,
-                a,
-                b,
-                fa,
-                fb,
-                rtol=rtol,
-                max_iter=max_iter,
-                within_tolerance=within_tolerance,
-            )
-            assert _iters_taken != max_iter
-            pH[i] = H2pH(H)
-            ionic_strength = calc_ionic_strength(H, *args)
-            do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
-
-
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+                if abs(fa) < _REALY_CLOSE_THRESHOLD:
+                    continue
+                b = np.nan
+                fb = np.nan
+                use_default_range = False
+                if warm_start:
+                    a, b, fa, fb = warm_start_bracket(a, fa, H_min, H_max, *args)
+                    use_default_range = fa * fb > 0
+                elif abs(fa) < _QUITE_CLOSE_THRESHOLD:
+                    b = a * _QUITE_CLOSE_MULTIPLIER
+                    fb = acidity_minfun(b, *args)
+                    if fa * fb > 0:
+                        b = a
+                        fb = fa
+                        a = b / _QUITE_CLOSE_MULTIPLIER / _QUITE_CLOSE_MULTIPLIER
+                        fa = acidity_minfun(a, *args)
+                        if fa * fb > 0:
+                            use_default_range = True
+                else:
+                    use_default_range = True
+                if use_default_range:
+                    a = H_min
+                    b = H_max
+                    fa = acidity_minfun(a, *args)
+                    fb = acidity_minfun(b, *args)
+                    max_iter = _MAX_ITER_DEFAULT
+                elif warm_start:
+                    max_iter = _MAX_ITER_DEFAULT
+                else:
+                    max_iter = _MAX_ITER_QUITE_CLOSE
+                H, _iters_taken = toms748_solve(
+                    acidity_minfun,
+                    args,
+                    a,
+                    b,
+                    fa,
+                    fb,
+                    rtol=rtol,
+                    max_iter=max_iter,
+                    within_tolerance=within_tolerance,
+                )
+                if _iters_taken == max_iter:
+                    n_failed += 1
+                n_solved += 1
+                n_iterations += _iters_taken
+                max_iterations = max(max_iterations, _iters_taken)
+                pH[i] = H2pH(H)
+                ionic_strength = calc_ionic_strength(H, *args)
+                do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
+            return n_failed, n_solved, n_iterations, max_iterations
+
+        return body
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def calc_ionic_strength(H, conc, K):
     # Directly adapted
     # https://github.com/igfuw/libcloudphxx/blob/0b4e2455fba4f95c7387623fc21481a85e7b151f/src/impl/particles_impl_chem_strength.ipp#L50
@@ -461,7 +621,35 @@ def calc_ionic_strength(H, conc, K):
     return 0.5 * (water + cz_S_VI + cz_CO2 + cz_SO2 + cz_HNO3 + cz_NH3)
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def warm_start_bracket(H, fH, H_min, H_max, conc, K):
+    """bracket of the charge-balance root obtained by widening (squaring the
+    multiplier at each step) an interval next to `H` in the direction of the root
+    (the `acidity_minfun()` residual increases with H); returns `(a, b, fa, fb)`
+    with `fa * fb > 0` if no sign change was found within `(H_min, H_max)`"""
+    multiplier = _WARM_START_MULTIPLIER
+    if fH > 0:
+        b, fb = H, fH
+        a = max(H / multiplier, H_min)
+        fa = acidity_minfun(a, conc, K)
+        while fa > 0 and a > H_min:
+            b, fb = a, fa
+            multiplier *= multiplier
+            a = max(a / multiplier, H_min)
+            fa = acidity_minfun(a, conc, K)
+    else:
+        a, fa = H, fH
+        b = min(H * multiplier, H_max)
+        fb = acidity_minfun(b, conc, K)
+        while fb < 0 and b < H_max:
+            a, fa = b, fb
+            multiplier *= multiplier
+            b = min(b * multiplier, H_max)
+            fb = acidity_minfun(b, conc, K)
+    return a, b, fa, fb
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def acidity_minfun(H, conc, K):
     ammonia = (conc.N_mIII * H * K.NH3) / (K_H2O + K.NH3 * H)
     nitric = conc.N_V * K.HNO3 / (H + K.HNO3)
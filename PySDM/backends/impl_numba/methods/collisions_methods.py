@@ -2,18 +2,26 @@
 CPU implementation of backend methods for particle collisions
 """
 
-from functools import cached_property
+from functools import cached_property, lru_cache
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
+from PySDM.backends.impl_numba.methods.fragmentation_methods import (
+    fragmentation_limiter,
+)
+from PySDM.backends.impl_numba.philox import uniform
+from PySDM.physics import si
 
+# pylint: disable=too-many-lines
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def pair_indices(i, idx, is_first_in_pair, prob_like):
     """given permutation array `idx` and `is_first_in_pair` flag array,
     returns indices `j` and `k` of droplets within pair `i` and a `skip_pair` flag,
@@ -35,17 +43,23 @@ def pair_indices(i, idx, is_first_in_pair, prob_like):
     return j, k, skip_pair
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def flag_zero_multiplicity(j, k, multiplicity, healthy):
     if multiplicity[k] == 0 or multiplicity[j] == 0:
         healthy[0] = 0
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-def coalesce(
-    i, j, k, cid, multiplicity, gamma, attributes, coalescence_rate
-):  # pylint: disable=too-many-positional-arguments
-    atomic_add(coalescence_rate, cid, gamma[i] * multiplicity[k])
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def chunk_range(chunk, n_chunks, n_items):
+    """returns the range of items processed within `chunk`-th of `n_chunks`
+    contiguous chunks of `n_items` items"""
+    return chunk * n_items // n_chunks, (chunk + 1) * n_items // n_chunks
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def coalesce(i, j, k, multiplicity, gamma, attributes):
+    """returns the contribution to the coalescence rate"""
+    rate = int(gamma[i] * multiplicity[k])
     new_n = multiplicity[j] - gamma[i] * multiplicity[k]
     if new_n > 0:
         multiplicity[j] = new_n
@@ -57,12 +71,44 @@ def coalesce(
         for a in range(len(attributes)):
             attributes[a, j] = gamma[i] * attributes[a, j] + attributes[a, k]
             attributes[a, k] = attributes[a, j]
-
-
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-def compute_transfer_multiplicities(
-    gamma, j, k, multiplicity, particle_mass, fragment_mass_i, max_multiplicity
+    return rate
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def geometric_growth(rate, n):
+    """returns `(1 + rate)**n - 1` and `sum((1 + rate)**i for i in range(n))`
+    evaluated by binary exponentiation, i.e. in O(log(n)) steps and without
+    forming `1 + rate` (hence without cancellation for small `rate`)"""
+    excess, total = 0.0, 0.0
+    base_excess, base_total = rate, 1.0
+    while n > 0:
+        if n & 1:
+            total += (1 + excess) * base_total
+            excess += base_excess + excess * base_excess
+        base_total *= 2 + base_excess
+        base_excess *= 2 + base_excess
+        n >>= 1
+    return excess, total
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def breakup_transfer(m, rate, new_mult_k_0, mult_k):
+    """returns `take_from_j` and `new_mult_k` corresponding to the `m`-th
+    (counting from zero) of consecutive breakups of a pair"""
+    excess, total = geometric_growth(rate, m)
+    return mult_k + new_mult_k_0 * total, new_mult_k_0 + new_mult_k_0 * excess
+
+
+ITERATIVE_TRANSFER_MAX_BREAKUPS = 32
+""" up to this number of breakups in a pair, `compute_transfer_multiplicities()`
+ iterates over breakups (which is cheaper than the closed-form solution) """
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def iterate_transfer_multiplicities(
+    n_breakups, j, k, multiplicity, particle_mass, fragment_mass_i, max_multiplicity
 ):
+    """iterative (one breakup at a time) counterpart of `compute_transfer_multiplicities()`"""
     overflow_flag = False
     gamma_j_k = 0
     take_from_j_test = multiplicity[k]
@@ -71,7 +117,7 @@ def compute_transfer_multiplicities(
         (particle_mass[j] + particle_mass[k]) / fragment_mass_i
     ) * multiplicity[k]
     new_mult_k = multiplicity[k]
-    for m in range(int(gamma)):
+    for m in range(n_breakups):
         # check for overflow of multiplicity
         if new_mult_k_test > max_multiplicity:
             overflow_flag = True
@@ -93,7 +139,81 @@ def compute_transfer_multiplicities(
     return take_from_j, new_mult_k, gamma_j_k, overflow_flag
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def compute_transfer_multiplicities(  # pylint: disable=too-many-locals
+    gamma, j, k, multiplicity, particle_mass, fragment_mass_i, max_multiplicity
+):
+    """returns `take_from_j`, `new_mult_k`, the number `gamma_j_k` of the `int(gamma)`
+    breakups that can be carried out without exceeding `multiplicity[j]` or
+    `max_multiplicity`, and a flag indicating if the latter was the limiting factor;
+    the `m`-th breakup yields `new_mult_k = new_mult_k_0 * (1 + rate)**m` with `rate`
+    being the mass ratio of droplet `j` and a fragment, and takes
+    `take_from_j = multiplicity[k] + new_mult_k_0 * sum((1 + rate)**i for i in range(m))`,
+    hence, for large `gamma`, the number of breakups is estimated in closed form
+    and then checked against the above (and corrected for round-off if needed)"""
+    n_breakups = int(gamma)
+    if n_breakups <= ITERATIVE_TRANSFER_MAX_BREAKUPS:
+        return iterate_transfer_multiplicities(
+            n_breakups,
+            j,
+            k,
+            multiplicity,
+            particle_mass,
+            fragment_mass_i,
+            max_multiplicity,
+        )
+    rate = particle_mass[j] / fragment_mass_i
+    new_mult_k_0 = (
+        (particle_mass[j] + particle_mass[k]) / fragment_mass_i
+    ) * multiplicity[k]
+
+    last = -1
+    if new_mult_k_0 <= max_multiplicity and multiplicity[k] <= multiplicity[j]:
+        estimate = n_breakups - 1.0
+        if rate > 0:
+            log_growth = np.log1p(rate)
+            bounds = (
+                np.log(max_multiplicity / new_mult_k_0) / log_growth,
+                np.log1p(rate * (multiplicity[j] - multiplicity[k]) / new_mult_k_0)
+                / log_growth,
+            )
+        else:
+            bounds = (estimate, (multiplicity[j] - multiplicity[k]) / new_mult_k_0)
+        for bound in bounds:
+            if bound < estimate:  # pylint: disable=consider-using-min-builtin
+                estimate = bound
+        last = int(max(estimate, 0.0))
+        while last > 0:
+            take_from_j, new_mult_k = breakup_transfer(
+                last, rate, new_mult_k_0, multiplicity[k]
+            )
+            if new_mult_k <= max_multiplicity and take_from_j <= multiplicity[j]:
+                break
+            last -= 1
+        while last + 1 < n_breakups:
+            take_from_j, new_mult_k = breakup_transfer(
+                last + 1, rate, new_mult_k_0, multiplicity[k]
+            )
+            if new_mult_k > max_multiplicity or take_from_j > multiplicity[j]:
+                break
+            last += 1
+
+    gamma_j_k = last + 1
+    if gamma_j_k == 0:
+        take_from_j, new_mult_k = 0.0, float(multiplicity[k])
+    else:
+        take_from_j, new_mult_k = breakup_transfer(
+            last, rate, new_mult_k_0, multiplicity[k]
+        )
+    overflow_flag = (
+        gamma_j_k < n_breakups
+        and breakup_transfer(gamma_j_k, rate, new_mult_k_0, multiplicity[k])[1]
+        > max_multiplicity
+    )
+    return take_from_j, new_mult_k, gamma_j_k, overflow_flag
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def get_new_multiplicities_and_update_attributes(
     j, k, attributes, multiplicity, take_from_j, new_mult_k
 ):
@@ -114,7 +234,7 @@ def get_new_multiplicities_and_update_attributes(
     return nj, nk
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def round_multiplicities_to_ints_and_update_attributes(
     j,
     k,
@@ -132,29 +252,27 @@ def round_multiplicities_to_ints_and_update_attributes(
         attributes[a, j] *= factor_j
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def break_up(  # pylint: disable=c,too-many-locals,too-many-positional-arguments
     i,
     j,
     k,
-    cid,
     multiplicity,
     gamma,
     attributes,
-    fragment_mass,
+    fragment_mass_i,
     max_multiplicity,
-    breakup_rate,
-    breakup_rate_deficit,
     warn_overflows,
     particle_mass,
 ):  # breakup0 guarantees take_from_j <= multiplicity[j]
+    """returns the contributions to the breakup rate and breakup rate deficit"""
     take_from_j, new_mult_k, gamma_j_k, overflow_flag = compute_transfer_multiplicities(
         gamma[i],
         j,
         k,
         multiplicity,
         particle_mass,
-        fragment_mass[i],
+        fragment_mass_i,
         max_multiplicity,
     )
     gamma_deficit = gamma[i] - gamma_j_k
@@ -164,8 +282,8 @@ def break_up(  # pylint: disable=c,too-many-locals,too-many-positional-arguments
         j, k, attributes, multiplicity, take_from_j, new_mult_k
     )
 
-    atomic_add(breakup_rate, cid, gamma_j_k * multiplicity[k])
-    atomic_add(breakup_rate_deficit, cid, gamma_deficit * multiplicity[k])
+    rate = int(gamma_j_k * multiplicity[k])
+    rate_deficit = int(gamma_deficit * multiplicity[k])
 
     # breakup2 also guarantees that no multiplicities are set to 0
     round_multiplicities_to_ints_and_update_attributes(
@@ -173,24 +291,25 @@ def break_up(  # pylint: disable=c,too-many-locals,too-many-positional-arguments
     )
     if overflow_flag and warn_overflows:
         warn("overflow", __file__)
+    return rate, rate_deficit
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def break_up_while(
     i,
     j,
     k,
-    cid,
     multiplicity,
     gamma,
     attributes,
-    fragment_mass,
+    fragment_mass_i,
     max_multiplicity,
-    breakup_rate,
-    breakup_rate_deficit,
     warn_overflows,
     particle_mass,
 ):  # pylint: disable=too-many-locals,too-many-positional-arguments
+    """returns the contributions to the breakup rate and breakup rate deficit"""
+    rate = 0
+    rate_deficit = 0
     gamma_deficit = gamma[i]
     overflow_flag = False
     while gamma_deficit > 0:
@@ -198,13 +317,13 @@ def break_up_while(
             take_from_j = multiplicity[j]
             new_mult_k = (
                 (particle_mass[j] + particle_mass[k])
-                / fragment_mass[i]
+                / fragment_mass_i
                 * multiplicity[k]
             )
 
             # check for overflow
             if new_mult_k > max_multiplicity:
-                atomic_add(breakup_rate_deficit, cid, gamma_deficit * multiplicity[k])
+                rate_deficit += int(gamma_deficit * multiplicity[k])
                 overflow_flag = True
                 break
             gamma_j_k = gamma_deficit
@@ -223,7 +342,7 @@ def break_up_while(
                 k,
                 multiplicity,
                 particle_mass,
-                fragment_mass[i],
+                fragment_mass_i,
                 max_multiplicity,
             )
 
@@ -231,16 +350,27 @@ def break_up_while(
             j, k, attributes, multiplicity, take_from_j, new_mult_k
         )
 
-        atomic_add(breakup_rate, cid, gamma_j_k * multiplicity[k])
+        rate += int(gamma_j_k * multiplicity[k])
         gamma_deficit -= gamma_j_k
         round_multiplicities_to_ints_and_update_attributes(
             j, k, nj, nk, attributes, multiplicity
         )
 
-    atomic_add(breakup_rate_deficit, cid, gamma_deficit * multiplicity[k])
+    rate_deficit += int(gamma_deficit * multiplicity[k])
 
     if overflow_flag and warn_overflows:
         warn("overflow", __file__)
+    return rate, rate_deficit
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def store_sort_keys(sorted_keys, cell_start):
+    """records keys at consecutive positions of an index sorted by cell"""
+    for key in range(len(cell_start) - 1):
+        sorted_keys[cell_start[key] : cell_start[key + 1]] = key
+
+
+RADIX_BITS = 8
 
 
 class CollisionsMethods(BackendMethods):
@@ -248,7 +378,7 @@ class CollisionsMethods(BackendMethods):
     def _collision_coalescence_breakup_body(self):
         _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             *,
             multiplicity,
@@ -271,48 +401,62 @@ class CollisionsMethods(BackendMethods):
             particle_mass,
         ):
             # pylint: disable=not-an-iterable,too-many-nested-blocks,too-many-locals
-            for i in numba.prange(length // 2):
-                j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
-                if skip_pair:
-                    continue
-                bouncing = rand[i] - (Ec[i] + (1 - Ec[i]) * (Eb[i])) > 0
-                if bouncing:
-                    continue
-
-                if rand[i] - Ec[i] < 0:
-                    coalesce(
-                        i,
-                        j,
-                        k,
-                        cell_id[j],
-                        multiplicity,
-                        gamma,
-                        attributes,
-                        coalescence_rate,
-                    )
-                else:
-                    _break_up(
-                        i,
-                        j,
-                        k,
-                        cell_id[j],
-                        multiplicity,
-                        gamma,
-                        attributes,
-                        fragment_mass,
-                        max_multiplicity,
-                        breakup_rate,
-                        breakup_rate_deficit,
-                        warn_overflows,
-                        particle_mass,
-                    )
-                flag_zero_multiplicity(j, k, multiplicity, healthy)
+            n_pairs = length // 2
+            n_chunks = max(1, min(numba.get_num_threads(), n_pairs))
+            for chunk in numba.prange(n_chunks):
+                cid = -1
+                coalescence = 0
+                breakup = 0
+                breakup_deficit = 0
+                first, last = chunk_range(chunk, n_chunks, n_pairs)
+                for i in range(first, last):
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+                    if skip_pair:
+                        continue
+                    bouncing = rand[i] - (Ec[i] + (1 - Ec[i]) * (Eb[i])) > 0
+                    if bouncing:
+                        continue
+
+                    if cell_id[j] != cid:
+                        if cid != -1:
+                            atomic_add(coalescence_rate, cid, coalescence)
+                            atomic_add(breakup_rate, cid, breakup)
+                            atomic_add(breakup_rate_deficit, cid, breakup_deficit)
+                        cid = cell_id[j]
+                        coalescence = 0
+                        breakup = 0
+                        breakup_deficit = 0
+
+                    if rand[i] - Ec[i] < 0:
+                        coalescence += coalesce(
+                            i, j, k, multiplicity, gamma, attributes
+                        )
+                    else:
+                        rate, rate_deficit = _break_up(
+                            i,
+                            j,
+                            k,
+                            multiplicity,
+                            gamma,
+                            attributes,
+                            fragment_mass[i],
+                            max_multiplicity,
+                            warn_overflows,
+                            particle_mass,
+                        )
+                        breakup += rate
+                        breakup_deficit += rate_deficit
+                    flag_zero_multiplicity(j, k, multiplicity, healthy)
+                if cid != -1:
+                    atomic_add(coalescence_rate, cid, coalescence)
+                    atomic_add(breakup_rate, cid, breakup)
+                    atomic_add(breakup_rate_deficit, cid, breakup_deficit)
 
         return body
 
     @cached_property
     def _adaptive_sdm_end_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @njit(**{**self.default_jit_flags, "parallel": False})
         def body(dt_left, n_cell, cell_start):
             end = 0
             for i in range(n_cell - 1, -1, -1):
@@ -329,7 +473,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _scale_prob_for_adaptive_sdm_gamma_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             prob,
             idx,
@@ -405,7 +549,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _cell_id_body(self):
-        # @numba.njit(**conf.JIT_FLAGS)  # note: as of Numba 0.51, np.dot() does not support ints
+        # @njit(**conf.JIT_FLAGS)  # note: as of Numba 0.51, np.dot() does not support ints
         def body(cell_id, cell_origin, strides):
             cell_id[:] = np.dot(strides, cell_origin)
 
@@ -416,7 +560,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _collision_coalescence_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             *,
             multiplicity,
@@ -428,26 +572,26 @@ class CollisionsMethods(BackendMethods):
             cell_id,
             coalescence_rate,
             is_first_in_pair,
-        ):
-            for (
-                i
-            ) in numba.prange(  # pylint: disable=not-an-iterable,too-many-nested-blocks
-                length // 2
-            ):
-                j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
-                if skip_pair:
-                    continue
-                coalesce(
-                    i,
-                    j,
-                    k,
-                    cell_id[j],
-                    multiplicity,
-                    gamma,
-                    attributes,
-                    coalescence_rate,
-                )
-                flag_zero_multiplicity(j, k, multiplicity, healthy)
+        ):  # pylint: disable=too-many-locals
+            n_pairs = length // 2
+            n_chunks = max(1, min(numba.get_num_threads(), n_pairs))
+            for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+                cid = -1
+                coalescence = 0
+                first, last = chunk_range(chunk, n_chunks, n_pairs)
+                for i in range(first, last):
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+                    if skip_pair:
+                        continue
+                    if cell_id[j] != cid:
+                        if cid != -1:
+                            atomic_add(coalescence_rate, cid, coalescence)
+                        cid = cell_id[j]
+                        coalescence = 0
+                    coalescence += coalesce(i, j, k, multiplicity, gamma, attributes)
+                    flag_zero_multiplicity(j, k, multiplicity, healthy)
+                if cid != -1:
+                    atomic_add(coalescence_rate, cid, coalescence)
 
         return body
 
@@ -518,9 +662,356 @@ class CollisionsMethods(BackendMethods):
             particle_mass=particle_mass.data,
         )
 
+    @lru_cache()
+    def _pair_coalescence_efficiency(self, coalescence_efficiency):
+        """returns a per-pair equivalent of the given coalescence efficiency class
+        (`ConstEc`, `Straub2010Ec` or `LowList1982Ec`)"""
+        kinetic_energy, surface_energy = self._pair_energies
+        const = self.formulae.constants
+        PI, sgm_w = const.PI, const.sgm_w
+        ll82_a, ll82_b = 0.778, 2.61e6 / si.J**2 * si.m**2
+
+        if coalescence_efficiency == "ConstEc":
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def efficiency(
+                Ec, m_j, m_k, v_j, v_k, r_j, r_k, u_j, u_k
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                return Ec
+
+        elif coalescence_efficiency == "Straub2010Ec":
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def efficiency(
+                Ec, m_j, m_k, v_j, v_k, r_j, r_k, u_j, u_k
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                We = kinetic_energy(v_j, v_k, u_j, u_k)
+                Sc = surface_energy(v_j, v_k)
+                if Sc != 0:
+                    We /= Sc
+                return np.exp(-1.15 * We)
+
+        elif coalescence_efficiency == "LowList1982Ec":
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def efficiency(
+                Ec, m_j, m_k, v_j, v_k, r_j, r_k, u_j, u_k
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                ds = 2 * min(r_j, r_k)
+                dl = 2 * max(r_j, r_k)
+                if dl < 0.4e-3:
+                    return 1.0
+                Sc = surface_energy(m_j, m_k)
+                Et = (
+                    kinetic_energy(m_j, m_k, u_j, u_k)
+                    + PI * sgm_w * (ds**2 + dl**2)
+                    - Sc
+                )
+                # sign-preserving square, as in `LowList1982Ec` (see `Storage.__ipow__`)
+                return (
+                    ll82_a
+                    * (ds / dl + 1.0) ** -2.0
+                    * np.exp(-ll82_b * sgm_w * Et * np.abs(Et) / Sc)
+                )
+
+        else:
+            raise NotImplementedError(coalescence_efficiency)
+        return efficiency
+
+    @lru_cache()
+    def _pair_fragment_volume(self, fragmentation):
+        """returns a per-pair equivalent of the given fragmentation function class
+        (`Straub2010Nf`, `LowList1982Nf`, `Gaussian` or `Exponential`), prior
+        to applying the limiters"""
+        kinetic_energy, surface_energy = self._pair_energies
+        ff = self.formulae_flattened
+        const = self.formulae.constants
+        PI, sgm_w = const.PI, const.sgm_w
+
+        if fragmentation == "Gaussian":
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def fragment_volume(
+                params, v_j, v_k, r_j, r_k, u_j, u_k, rand, tables
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                return params[0] + params[1] * ff.trivia__erfinv_approx(rand)
+
+        elif fragmentation == "Exponential":
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def fragment_volume(
+                params, v_j, v_k, r_j, r_k, u_j, u_k, rand, tables
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                return -params[0] * np.log(max(1 - rand, 1e-5))
+
+        elif fragmentation == "Straub2010Nf":
+            straub = self._straub_fragment_volume  # pylint: disable=no-member
+            uJ = si.uJ
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def fragment_volume(
+                params, v_j, v_k, r_j, r_k, u_j, u_k, rand, tables
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                CKE = kinetic_energy(v_j, v_k, u_j, u_k)
+                Sc = surface_energy(v_j, v_k)
+                We = CKE / Sc if Sc != 0 else CKE
+                r_min, r_max = min(r_j, r_k), max(r_j, r_k)
+                gam = r_max / r_min if r_min != 0 else r_max
+                return straub(
+                    We * CKE / uJ, gam, 2 * r_min, max(v_j, v_k), rand, tables
+                )[0]
+
+        elif fragmentation == "LowList1982Nf":
+            ll82 = self._ll82_fragment_volume  # pylint: disable=no-member
+
+            @njit(**{**self.default_jit_flags, "parallel": False})
+            def fragment_volume(
+                params, v_j, v_k, r_j, r_k, u_j, u_k, rand, tables
+            ):  # pylint: disable=unused-argument,too-many-positional-arguments
+                ds = 2 * min(r_j, r_k)
+                dl = 2 * max(r_j, r_k)
+                CKE = kinetic_energy(v_j, v_k, u_j, u_k)
+                Sc = surface_energy(v_j, v_k)
+                St = PI * sgm_w * (ds**2 + dl**2)
+                return ll82(
+                    CKE,
+                    CKE / Sc if Sc != 0 else CKE,
+                    CKE / St if St != 0 else CKE,
+                    St,
+                    ds,
+                    dl,
+                    ((v_j + v_k) / (PI / 6)) ** (1 / 3),
+                    rand,
+                    1e-8,
+                    tables,
+                )[0]
+
+        else:
+            raise NotImplementedError(fragmentation)
+        return fragment_volume
+
+    @cached_property
+    def _pair_energies(self):
+        const = self.formulae.constants
+        PI, sgm_w, rho_w = const.PI, const.sgm_w, const.rho_w
+
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def kinetic_energy(x_j, x_k, u_j, u_k):
+            """collision kinetic energy (with `x` being volumes or masses)"""
+            cke = x_j * x_k
+            if x_j + x_k != 0:
+                cke /= x_j + x_k
+            return cke * (u_j - u_k) ** 2 * rho_w / 2
+
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def surface_energy(x_j, x_k):
+            """surface energy of the coalesced drop (with `x` being volumes or masses)"""
+            return (x_j + x_k) ** (2 / 3) * PI * sgm_w * (6 / PI) ** (2 / 3)
+
+        return kinetic_energy, surface_energy
+
+    @lru_cache()
+    def _collision_coalescence_breakup_fused_body(
+        self, coalescence_efficiency, fragmentation
+    ):
+        _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
+        efficiency = self._pair_coalescence_efficiency(coalescence_efficiency)
+        fragment_volume = self._pair_fragment_volume(fragmentation)
+        ff = self.formulae_flattened
+
+        @njit(**self.default_jit_flags)
+        def body(
+            *,
+            multiplicity,
+            idx,
+            length,
+            attributes,
+            gamma,
+            rand,
+            rand_frag,
+            Ec,
+            Eb,
+            fragmentation_params,
+            fragmentation_tables,
+            vmin,
+            nfmax,
+            volume,
+            radius,
+            relative_fall_velocity,
+            healthy,
+            cell_id,
+            coalescence_rate,
+            breakup_rate,
+            breakup_rate_deficit,
+            is_first_in_pair,
+            max_multiplicity,
+            warn_overflows,
+            particle_mass,
+        ):
+            # pylint: disable=not-an-iterable,too-many-nested-blocks,too-many-locals,too-many-arguments
+            n_pairs = length // 2
+            n_chunks = max(1, min(numba.get_num_threads(), n_pairs))
+            for chunk in numba.prange(n_chunks):
+                cid = -1
+                coalescence = 0
+                breakup = 0
+                breakup_deficit = 0
+                first, last = chunk_range(chunk, n_chunks, n_pairs)
+                for i in range(first, last):
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+                    if skip_pair:
+                        continue
+                    E_c = efficiency(
+                        Ec,
+                        particle_mass[j],
+                        particle_mass[k],
+                        volume[j],
+                        volume[k],
+                        radius[j],
+                        radius[k],
+                        relative_fall_velocity[j],
+                        relative_fall_velocity[k],
+                    )
+                    bouncing = rand[i] - (E_c + (1 - E_c) * Eb) > 0
+                    if bouncing:
+                        continue
+
+                    if cell_id[j] != cid:
+                        if cid != -1:
+                            atomic_add(coalescence_rate, cid, coalescence)
+                            atomic_add(breakup_rate, cid, breakup)
+                            atomic_add(breakup_rate_deficit, cid, breakup_deficit)
+                        cid = cell_id[j]
+                        coalescence = 0
+                        breakup = 0
+                        breakup_deficit = 0
+
+                    if rand[i] - E_c < 0:
+                        coalescence += coalesce(
+                            i, j, k, multiplicity, gamma, attributes
+                        )
+                    else:
+                        _, frag_volume = fragmentation_limiter(
+                            fragment_volume(
+                                fragmentation_params,
+                                volume[j],
+                                volume[k],
+                                radius[j],
+                                radius[k],
+                                relative_fall_velocity[j],
+                                relative_fall_velocity[k],
+                                rand_frag[i],
+                                fragmentation_tables,
+                            ),
+                            vmin,
+                            nfmax,
+                            volume[j] + volume[k],
+                        )
+                        rate, rate_deficit = _break_up(
+                            i,
+                            j,
+                            k,
+                            multiplicity,
+                            gamma,
+                            attributes,
+                            ff.particle_shape_and_density__volume_to_mass(frag_volume),
+                            max_multiplicity,
+                            warn_overflows,
+                            particle_mass,
+                        )
+                        breakup += rate
+                        breakup_deficit += rate_deficit
+                    flag_zero_multiplicity(j, k, multiplicity, healthy)
+                if cid != -1:
+                    atomic_add(coalescence_rate, cid, coalescence)
+                    atomic_add(breakup_rate, cid, breakup)
+                    atomic_add(breakup_rate_deficit, cid, breakup_deficit)
+
+        return body
+
+    def collision_coalescence_breakup_fused(
+        self,
+        *,
+        multiplicity,
+        idx,
+        attributes,
+        gamma,
+        rand,
+        rand_frag,
+        coalescence_efficiency,
+        Ec,
+        Eb,
+        fragmentation,
+        fragmentation_params,
+        vmin,
+        nfmax,
+        volume,
+        radius,
+        relative_fall_velocity,
+        healthy,
+        cell_id,
+        coalescence_rate,
+        breakup_rate,
+        breakup_rate_deficit,
+        is_first_in_pair,
+        warn_overflows,
+        particle_mass,
+        max_multiplicity,
+        fragmentation_tables=None,
+    ):
+        """as `collision_coalescence_breakup()`, but with the coalescence efficiency
+        and the fragment mass evaluated per pair within the same pass (using random
+        numbers from `rand_frag`) rather than read from pairwise storages;
+        `coalescence_efficiency` and `fragmentation` are names of the supported
+        classes (see `PySDM.dynamics.collisions.collision`), `Ec` is only used with
+        `"ConstEc"` and `fragmentation_params` are `(mu, sigma)` for `"Gaussian"` and
+        `(scale, _)` for `"Exponential"`, while `fragmentation_tables` are the optional
+        lookup tables for `"Straub2010Nf"` and `"LowList1982Nf"` (see
+        `straub_lookup_tables()` and `ll82_lookup_tables()`)"""
+        # pylint: disable=too-many-arguments,too-many-locals
+        if fragmentation == "Straub2010Nf":
+            table_args = self._straub_table_args(  # pylint: disable=no-member
+                fragmentation_tables
+            )
+        elif fragmentation == "LowList1982Nf":
+            table_args = self._ll82_table_args(  # pylint: disable=no-member
+                fragmentation_tables
+            )
+        else:
+            table_args = ()
+        self._collision_coalescence_breakup_fused_body(
+            coalescence_efficiency, fragmentation
+        )(
+            multiplicity=multiplicity.data,
+            idx=idx.data,
+            length=len(idx),
+            attributes=attributes.data,
+            gamma=gamma.data,
+            rand=rand.data,
+            rand_frag=rand_frag.data,
+            Ec=float(Ec),
+            Eb=float(Eb),
+            fragmentation_params=tuple(float(p) for p in fragmentation_params),
+            fragmentation_tables=table_args,
+            vmin=float(vmin),
+            nfmax=None if nfmax is None else float(nfmax),
+            volume=volume.data,
+            radius=radius.data,
+            relative_fall_velocity=relative_fall_velocity.data,
+            healthy=healthy.data,
+            cell_id=cell_id.data,
+            coalescence_rate=coalescence_rate.data,
+            breakup_rate=breakup_rate.data,
+            breakup_rate_deficit=breakup_rate_deficit.data,
+            is_first_in_pair=is_first_in_pair.indicator.data,
+            max_multiplicity=max_multiplicity,
+            warn_overflows=warn_overflows,
+            particle_mass=particle_mass.data,
+        )
+
     @cached_property
     def _compute_gamma_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             prob,
             rand,
@@ -532,7 +1023,11 @@ class CollisionsMethods(BackendMethods):
             collision_rate,
             is_first_in_pair,
             out,
-        ):  # pylint: disable=too-many-locals,too-many-positional-arguments
+            keyed,
+            seed,
+            step,
+            super_droplet_id,
+        ):  # pylint: disable=too-many-locals,too-many-positional-arguments,too-many-arguments
             """
             return in "out" array gamma (see: http://doi.org/10.1002/qj.441, section 5)
             formula:
@@ -541,19 +1036,46 @@ class CollisionsMethods(BackendMethods):
 
             out may point to the same array as prob
             """
-            for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
-                out[i] = np.ceil(prob[i] - rand[i])
-                j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, out)
-                if skip_pair:
-                    continue
-                prop = multiplicity[j] // multiplicity[k]
-                g = min(int(out[i]), prop)
-                cid = cell_id[j]
-                atomic_add(collision_rate, cid, g * multiplicity[k])
-                atomic_add(
-                    collision_rate_deficit, cid, (int(out[i]) - g) * multiplicity[k]
-                )
-                out[i] = g
+            n_pairs = length // 2
+            n_chunks = max(1, min(numba.get_num_threads(), n_pairs))
+            for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+                cid = -1
+                rate = 0
+                rate_deficit = 0
+                first, last = chunk_range(chunk, n_chunks, n_pairs)
+                for i in range(first, last):
+                    if keyed:
+                        j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
+                        u01 = (
+                            0.0
+                            if skip_pair
+                            else uniform(
+                                seed,
+                                step,
+                                min(super_droplet_id[j], super_droplet_id[k]),
+                            )
+                        )
+                    else:
+                        u01 = rand[i]
+                    out[i] = np.ceil(prob[i] - u01)
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, out)
+                    if skip_pair:
+                        continue
+                    if cell_id[j] != cid:
+                        if cid != -1:
+                            atomic_add(collision_rate, cid, rate)
+                            atomic_add(collision_rate_deficit, cid, rate_deficit)
+                        cid = cell_id[j]
+                        rate = 0
+                        rate_deficit = 0
+                    prop = multiplicity[j] // multiplicity[k]
+                    g = min(int(out[i]), prop)
+                    rate += g * multiplicity[k]
+                    rate_deficit += (int(out[i]) - g) * multiplicity[k]
+                    out[i] = g
+                if cid != -1:
+                    atomic_add(collision_rate, cid, rate)
+                    atomic_add(collision_rate_deficit, cid, rate_deficit)
 
         return body
 
@@ -568,10 +1090,18 @@ class CollisionsMethods(BackendMethods):
         collision_rate,
         is_first_in_pair,
         out,
+        super_droplet_id=None,
     ):
+        """if `super_droplet_id` is given, `rand` is expected to be a (seed, step)
+        pair (see `PySDM.backends.impl_numba.random.CounterBasedRandom.reserve_step`)
+        and the random number for each pair is drawn with
+        `PySDM.backends.impl_numba.philox.uniform` keyed on the lower of the ids of
+        the two super-droplets (hence independent of their positions in the index)"""
+        keyed = super_droplet_id is not None
+        seed, step = rand if keyed else (0, 0)
         return self._compute_gamma_body(
             prob.data,
-            rand.data,
+            np.empty(0) if keyed else rand.data,
             multiplicity.idx.data,
             len(multiplicity),
             multiplicity.data,
@@ -580,11 +1110,15 @@ class CollisionsMethods(BackendMethods):
             collision_rate.data,
             is_first_in_pair.indicator.data,
             out.data,
+            keyed,
+            np.uint64(seed),
+            np.uint64(step),
+            super_droplet_id.data if keyed else np.empty(0, dtype=np.int64),
         )
 
     @staticmethod
     def make_cell_caretaker(idx_shape, idx_dtype, cell_start_len, scheme="default"):
-        class CellCaretaker:  # pylint: disable=too-few-public-methods
+        class CellCaretaker:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
             def __init__(self, idx_shape, idx_dtype, cell_start_len, scheme):
                 if scheme == "default":
                     if conf.JIT_FLAGS["parallel"]:
@@ -592,7 +1126,12 @@ class CollisionsMethods(BackendMethods):
                     else:
                         scheme = "counting_sort"
                 self.scheme = scheme
-                if scheme in ("counting_sort", "counting_sort_parallel"):
+                if scheme in (
+                    "counting_sort",
+                    "counting_sort_parallel",
+                    "radix_sort_parallel",
+                    "incremental",
+                ):
                     self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
                 if scheme == "counting_sort_parallel":
                     self.cell_starts = Storage.empty(
@@ -602,9 +1141,57 @@ class CollisionsMethods(BackendMethods):
                         ),
                         dtype=int,
                     )
+                if scheme == "radix_sort_parallel":
+                    self.keys = Storage.empty(idx_shape, dtype=int)
+                    self.tmp_keys = Storage.empty(idx_shape, dtype=int)
+                if scheme == "incremental":
+                    self.sorted_keys = Storage.from_ndarray(
+                        np.full(idx_shape, -1, dtype=np.int64)
+                    )
+                    self.movers = Storage.empty(idx_shape, idx_dtype)
+                    self.is_mover = Storage.empty(idx_shape, bool)
+                    self.cell_fill = Storage.empty(cell_start_len, dtype=int)
 
-            def __call__(self, cell_id, cell_idx, cell_start, idx):
+            def __call__(  # pylint: disable=too-many-arguments
+                self, cell_id, cell_idx, cell_start, idx, *, max_moved_fraction=None
+            ):
+                """sorts `idx` by cell; with the "incremental" scheme, returns
+                the number of relocated super-droplets and whether the index was
+                patched (or fully sorted, if the relocated fraction exceeded
+                `max_moved_fraction`, if given)"""
                 length = len(idx)
+                if self.scheme == "incremental":
+                    max_n_moved = (
+                        length
+                        if max_moved_fraction is None
+                        else int(max_moved_fraction * length)
+                    )
+                    n_moved = CollisionsMethods._incremental_sort_by_cell_id_and_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        length,
+                        cell_start.data,
+                        self.sorted_keys.data,
+                        self.movers.data,
+                        self.is_mover.data,
+                        self.cell_fill.data,
+                        max_n_moved,
+                    )
+                    patched = n_moved <= max_n_moved
+                    if not patched:
+                        CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
+                            self.tmp_idx.data,
+                            idx.data,
+                            cell_id.data,
+                            cell_idx.data,
+                            length,
+                            cell_start.data,
+                        )
+                        store_sort_keys(self.sorted_keys.data, cell_start.data)
+                    idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                    return n_moved, patched
                 if self.scheme == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
@@ -624,13 +1211,40 @@ class CollisionsMethods(BackendMethods):
                         cell_start.data,
                         self.cell_starts.data,
                     )
+                elif self.scheme == "radix_sort_parallel":
+                    CollisionsMethods._radix_sort_by_cell_id_and_update_cell_start(
+                        self.tmp_idx.data,
+                        idx.data,
+                        cell_id.data,
+                        cell_idx.data,
+                        length,
+                        cell_start.data,
+                        self.keys.data,
+                        self.tmp_keys.data,
+                    )
                 idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                return None
 
         return CellCaretaker(idx_shape, idx_dtype, cell_start_len, scheme)
 
+    @staticmethod
+    def choose_sorting_scheme(*, n_sd, n_cell, n_threads=None):
+        """picks the cell-sort scheme for `n_sd` super-droplets in `n_cell` cells:
+        serial counting sort if sorting is not done in parallel, parallel counting
+        sort if its per-thread cell-count scratch (`n_threads * (n_cell + 1)`
+        integers) does not outgrow the super-droplet count, and otherwise
+        the parallel radix sort with scratch memory independent of `n_cell`"""
+        if n_threads is None:
+            n_threads = numba.get_num_threads() if conf.JIT_FLAGS["parallel"] else 1
+        if n_threads == 1:
+            return "counting_sort"
+        if n_threads * (n_cell + 1) <= n_sd:
+            return "counting_sort_parallel"
+        return "radix_sort_parallel"
+
     @cached_property
     def _normalize_body(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv):
             n_cell = cell_start.shape[0] - 1
             for i in range(n_cell):
@@ -661,7 +1275,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def remove_zero_n_or_flagged(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(multiplicity, idx, length) -> int:
             flag = len(idx)
             new_length = length
@@ -678,7 +1292,7 @@ class CollisionsMethods(BackendMethods):
         return body
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @njit(**conf.JIT_FLAGS)
     def _counting_sort_by_cell_id_and_update_cell_start(
         new_idx, idx, cell_id, cell_idx, length, cell_start
     ):
@@ -694,7 +1308,65 @@ class CollisionsMethods(BackendMethods):
             new_idx[cell_end[cell_idx[cell_id[idx[i]]]]] = idx[i]
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    def _incremental_sort_by_cell_id_and_update_cell_start(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        new_idx,
+        idx,
+        cell_id,
+        cell_idx,
+        length,
+        cell_start,
+        sorted_keys,
+        movers,
+        is_mover,
+        cell_fill,
+        max_n_moved,
+    ):
+        """patches `idx` into `new_idx` sorted by current keys given `sorted_keys`
+        (the keys at consecutive index positions as of the previous sort):
+        super-droplets whose key differs from the one recorded for their position
+        (i.e., which changed cell, or were swapped in upon removal of others)
+        are relocated to the end of the range of their cell while the others keep
+        their relative order; returns the number of relocated super-droplets
+        leaving `new_idx` and `cell_start` untouched if it exceeds `max_n_moved`"""
+        cell_end = cell_fill
+        cell_end[:] = 0
+        n_moved = 0
+        last_key = 0
+        for i in range(length):
+            j = idx[i]
+            key = cell_idx[cell_id[j]]
+            is_mover[i] = key != sorted_keys[i] or key < last_key
+            if is_mover[i]:
+                movers[n_moved] = j
+                n_moved += 1
+            else:
+                last_key = key
+            cell_end[key] += 1
+        if n_moved > max_n_moved:
+            return n_moved
+
+        cell_start[0] = 0
+        for i in range(1, len(cell_start)):
+            cell_start[i] = cell_start[i - 1] + cell_end[i - 1]
+
+        cell_fill[:] = cell_start[:]
+        for i in range(length):
+            if not is_mover[i]:
+                key = sorted_keys[i]
+                new_idx[cell_fill[key]] = idx[i]
+                cell_fill[key] += 1
+        for m in range(n_moved):
+            j = movers[m]
+            key = cell_idx[cell_id[j]]
+            new_idx[cell_fill[key]] = j
+            cell_fill[key] += 1
+
+        store_sort_keys(sorted_keys, cell_start)
+        return n_moved
+
+    @staticmethod
+    @njit(**conf.JIT_FLAGS)
     def _parallel_counting_sort_by_cell_id_and_update_cell_start(
         new_idx, idx, cell_id, cell_idx, length, cell_start, cell_start_p
     ):
@@ -736,9 +1408,64 @@ class CollisionsMethods(BackendMethods):
 
         cell_start[:] = cell_end_thread[0, :]
 
+    @staticmethod
+    @njit(**conf.JIT_FLAGS)
+    def _radix_sort_by_cell_id_and_update_cell_start(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-branches
+        new_idx, idx, cell_id, cell_idx, length, cell_start, keys, tmp_keys
+    ):
+        """stable least-significant-digit radix sort of `idx` by cell into
+        `new_idx` (`RADIX_BITS` of the cell key per pass, `idx` and `keys` serve
+        as the ping-pong buffers); scratch memory beyond the `keys` and `tmp_keys`
+        arrays is limited to per-chunk digit histograms, hence does not depend
+        on the number of cells"""
+        radix = 1 << RADIX_BITS
+        n_cell = len(cell_start) - 1
+        for i in numba.prange(length):  # pylint: disable=not-an-iterable
+            keys[i] = cell_idx[cell_id[idx[i]]]
+
+        n_chunks = max(1, min(numba.get_num_threads(), length))
+        offsets = np.empty((n_chunks, radix), dtype=np.int64)
+        src_idx, dst_idx, src_keys, dst_keys = idx, new_idx, keys, tmp_keys
+        n_passes = 0
+        while n_passes == 0 or (n_cell - 1) >> (n_passes * RADIX_BITS) > 0:
+            shift = n_passes * RADIX_BITS
+            for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+                offsets[chunk, :] = 0
+                first, last = chunk_range(chunk, n_chunks, length)
+                for i in range(first, last):
+                    offsets[chunk, (src_keys[i] >> shift) & (radix - 1)] += 1
+            offset = 0
+            for digit in range(radix):
+                for chunk in range(n_chunks):
+                    count = offsets[chunk, digit]
+                    offsets[chunk, digit] = offset
+                    offset += count
+            for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+                first, last = chunk_range(chunk, n_chunks, length)
+                for i in range(first, last):
+                    digit = (src_keys[i] >> shift) & (radix - 1)
+                    dst_keys[offsets[chunk, digit]] = src_keys[i]
+                    dst_idx[offsets[chunk, digit]] = src_idx[i]
+                    offsets[chunk, digit] += 1
+            src_idx, dst_idx, src_keys, dst_keys = dst_idx, src_idx, dst_keys, src_keys
+            n_passes += 1
+
+        if n_passes % 2 == 0:
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                new_idx[i] = idx[i]
+
+        if length == 0:
+            cell_start[:] = 0
+            return
+        for i in numba.prange(1, length):  # pylint: disable=not-an-iterable
+            for key in range(src_keys[i - 1] + 1, src_keys[i] + 1):
+                cell_start[key] = i
+        cell_start[: src_keys[0] + 1] = 0
+        cell_start[src_keys[length - 1] + 1 :] = length
+
     @cached_property
     def _linear_collection_efficiency_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         # pylint: disable=too-many-locals
         def body(params, output, radii, is_first_in_pair, idx, length, unit):
             A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
@@ -12,12 +12,19 @@ import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.backends.impl_numba.warnings import warn
 
 _Counters = namedtuple(
     typename="_Counters",
-    field_names=("n_substeps", "n_activating", "n_deactivating", "n_ripening"),
+    field_names=(
+        "n_substeps",
+        "n_activating",
+        "n_deactivating",
+        "n_ripening",
+        "n_saved_solves",
+    ),
 )
 _Attributes = namedtuple(
     typename="_Attributes",
@@ -50,12 +57,106 @@ _RelativeTolerances = namedtuple(
 )
 
 
+@njit(**{**conf.JIT_FLAGS, "cache": False})
+def activation_events(mass_new, mass_old, mass_cr, multiplicity):
+    """returns multiplicity-weighted increments of the activated-and-growing,
+    activating and deactivating counts for a droplet changing its mass from
+    `mass_old` to `mass_new` given its critical mass `mass_cr`"""
+    return (
+        multiplicity if mass_new > mass_cr and mass_new > mass_old else 0,
+        multiplicity if mass_new > mass_cr > mass_old else 0,
+        multiplicity if mass_new < mass_cr < mass_old else 0,
+    )
+
+
+def _condensation_cells(  # pylint: disable=too-many-locals
+    *,
+    solver,
+    n_threads,
+    n_cell,
+    cell_start_arg,
+    attributes,
+    cell_data,
+    idx,
+    rtols,
+    timestep,
+    counters,
+    cell_order,
+    RH_max,
+    success,
+):
+    # arrays within namedtuples in prange loops do not work
+    # https://github.com/numba/numba/issues/5872
+    cdt_predicted_water_vapour_mixing_ratio = (
+        cell_data.predicted_water_vapour_mixing_ratio
+    )
+    cdt_pthd = cell_data.pthd
+    cnt_n_substeps = counters.n_substeps
+    cnt_n_activating = counters.n_activating
+    cnt_n_deactivating = counters.n_deactivating
+    cnt_n_ripening = counters.n_ripening
+    cnt_n_saved_solves = counters.n_saved_solves
+
+    for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+        for i in range(thread_id, n_cell, n_threads):
+            cell_id = cell_order[i]
+            cell_start = cell_start_arg[cell_id]
+            cell_end = cell_start_arg[cell_id + 1]
+            n_sd_in_cell = cell_end - cell_start
+            if n_sd_in_cell == 0:
+                continue
+
+            (
+                success[cell_id],
+                cdt_predicted_water_vapour_mixing_ratio[cell_id],
+                cdt_pthd[cell_id],
+                cnt_n_substeps[cell_id],
+                cnt_n_activating[cell_id],
+                cnt_n_deactivating[cell_id],
+                cnt_n_ripening[cell_id],
+                cnt_n_saved_solves[cell_id],
+                RH_max[cell_id],
+            ) = solver(
+                attributes=attributes,
+                cell_idx=idx[cell_start:cell_end],
+                thd=cell_data.thd[cell_id],
+                water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[cell_id],
+                rhod=cell_data.rhod[cell_id],
+                dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id]) / timestep,
+                d_water_vapour_mixing_ratio__dt=(
+                    cell_data.predicted_water_vapour_mixing_ratio[cell_id]
+                    - cell_data.water_vapour_mixing_ratio[cell_id]
+                )
+                / timestep,
+                drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
+                / timestep,
+                m_d=(
+                    (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
+                    / 2
+                    * cell_data.dv_mean[cell_id]
+                ),
+                air_density=cell_data.air_density[cell_id],
+                air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
+                rtols=rtols,
+                timestep=timestep,
+                n_substeps=counters.n_substeps[cell_id],
+            )
+
+
 class CondensationMethods(BackendMethods):
     # pylint: disable=unused-argument
     @staticmethod
     def condensation(**kwargs):
-        n_threads = min(numba.get_num_threads(), kwargs["n_cell"])
-        CondensationMethods._condensation(
+        """with a solver spreading particles of a cell across threads (see
+        `make_condensation_solver()`), the loop over cells is run serially so that
+        no nested parallel regions are launched"""
+        if kwargs["solver"].particle_parallel:
+            n_threads = 1
+            condensation = CondensationMethods._condensation_serial_cells
+        else:
+            n_threads = min(numba.get_num_threads(), kwargs["n_cell"])
+            condensation = CondensationMethods._condensation
+        condensation(
             solver=kwargs["solver"],
             n_threads=n_threads,
             n_cell=kwargs["n_cell"],
@@ -74,7 +175,7 @@ class CondensationMethods(BackendMethods):
                 rhod=kwargs["rhod"].data,
                 thd=kwargs["thd"].data,
                 water_vapour_mixing_ratio=kwargs["water_vapour_mixing_ratio"].data,
-                dv_mean=kwargs["dv"],
+                dv_mean=np.full(kwargs["n_cell"], kwargs["dv"]),
                 prhod=kwargs["prhod"].data,
                 pthd=kwargs["pthd"].data,
                 predicted_water_vapour_mixing_ratio=(
@@ -93,87 +194,21 @@ class CondensationMethods(BackendMethods):
                 n_activating=kwargs["counters"]["n_activating"].data,
                 n_deactivating=kwargs["counters"]["n_deactivating"].data,
                 n_ripening=kwargs["counters"]["n_ripening"].data,
+                n_saved_solves=kwargs["counters"]["n_saved_solves"].data,
             ),
             cell_order=kwargs["cell_order"],
             RH_max=kwargs["RH_max"].data,
             success=kwargs["success"].data,
         )
 
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
-    def _condensation(  # pylint: disable=too-many-locals
-        *,
-        solver,
-        n_threads,
-        n_cell,
-        cell_start_arg,
-        attributes,
-        cell_data,
-        idx,
-        rtols,
-        timestep,
-        counters,
-        cell_order,
-        RH_max,
-        success,
-    ):
-        # arrays within namedtuples in prange loops do not work
-        # https://github.com/numba/numba/issues/5872
-        cdt_predicted_water_vapour_mixing_ratio = (
-            cell_data.predicted_water_vapour_mixing_ratio
+    _condensation = staticmethod(
+        njit(**{**conf.JIT_FLAGS, **{"cache": False}})(_condensation_cells)
+    )
+    _condensation_serial_cells = staticmethod(
+        njit(**{**conf.JIT_FLAGS, **{"cache": False, "parallel": False}})(
+            _condensation_cells
         )
-        cdt_pthd = cell_data.pthd
-        cnt_n_substeps = counters.n_substeps
-        cnt_n_activating = counters.n_activating
-        cnt_n_deactivating = counters.n_deactivating
-        cnt_n_ripening = counters.n_ripening
-
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
-
-                (
-                    success[cell_id],
-                    cdt_predicted_water_vapour_mixing_ratio[cell_id],
-                    cdt_pthd[cell_id],
-                    cnt_n_substeps[cell_id],
-                    cnt_n_activating[cell_id],
-                    cnt_n_deactivating[cell_id],
-                    cnt_n_ripening[cell_id],
-                    RH_max[cell_id],
-                ) = solver(
-                    attributes=attributes,
-                    cell_idx=idx[cell_start:cell_end],
-                    thd=cell_data.thd[cell_id],
-                    water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[
-                        cell_id
-                    ],
-                    rhod=cell_data.rhod[cell_id],
-                    dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id])
-                    / timestep,
-                    d_water_vapour_mixing_ratio__dt=(
-                        cell_data.predicted_water_vapour_mixing_ratio[cell_id]
-                        - cell_data.water_vapour_mixing_ratio[cell_id]
-                    )
-                    / timestep,
-                    drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
-                    / timestep,
-                    m_d=(
-                        (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
-                        / 2
-                        * cell_data.dv_mean
-                    ),
-                    air_density=cell_data.air_density[cell_id],
-                    air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
-                    rtols=rtols,
-                    timestep=timestep,
-                    n_substeps=counters.n_substeps[cell_id],
-                )
+    )
 
     @staticmethod
     def make_adapt_substeps(
@@ -188,9 +223,15 @@ class CondensationMethods(BackendMethods):
         n_substeps_max = math.floor(timestep / dt_range[0])
         n_substeps_min = math.ceil(timestep / dt_range[1])
 
-        @numba.njit(**jit_flags)
-        def adapt_substeps(step_impl_args, n_substeps, thd, rtol_thd):
+        @njit(**jit_flags)
+        def adapt_substeps(step_impl_args, n_substeps, thd, rtol_thd, trial_mass):
+            """returns the number of substeps, success flag and the outcome of the
+            trial step of `timestep / n_substeps` (a reusability flag, row of
+            `trial_mass` with the new droplet masses, the resultant thermodynamic
+            state, liquid water mass and RH_max) for committing it as the first
+            substep"""
             n_substeps = np.maximum(n_substeps_min, n_substeps // multiplier)
+            no_trial = (False, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
             success = False
             for burnout in range(fuse + 1):
                 if burnout == fuse:
@@ -201,60 +242,156 @@ class CondensationMethods(BackendMethods):
                             "thd",
                             thd,
                         ),
-                        return_value=(0, False),
+                        return_value=(0, False, no_trial),
                     )
-                thd_new_long, success = step_fake(step_impl_args, timestep, n_substeps)
+                trial_long = step_fake(
+                    step_impl_args, timestep, n_substeps, trial_mass[0]
+                )
+                success = trial_long[5]
                 if success:
                     break
                 n_substeps *= multiplier
+            slot_long = 0
             for burnout in range(fuse + 1):
                 if burnout == fuse:
-                    return warn("burnout (short)", __file__, return_value=(0, False))
-                thd_new_short, success = step_fake(
-                    step_impl_args, timestep, n_substeps * multiplier
+                    return warn(
+                        "burnout (short)", __file__, return_value=(0, False, no_trial)
+                    )
+                trial_short = step_fake(
+                    step_impl_args,
+                    timestep,
+                    n_substeps * multiplier,
+                    trial_mass[1 - slot_long],
                 )
-                if not success:
-                    return warn("short failed", __file__, return_value=(0, False))
-                dthd_long = thd_new_long - thd
-                dthd_short = thd_new_short - thd
+                if not trial_short[5]:
+                    return warn(
+                        "short failed", __file__, return_value=(0, False, no_trial)
+                    )
+                dthd_long = trial_long[1] - thd
+                dthd_short = trial_short[1] - thd
                 error_estimate = np.abs(dthd_long - multiplier * dthd_short)
-                thd_new_long = thd_new_short
                 if formulae.trivia__within_tolerance(error_estimate, thd, rtol_thd):
                     break
+                trial_long = trial_short
+                slot_long = 1 - slot_long
                 n_substeps *= multiplier
                 if n_substeps > n_substeps_max:
                     break
-            return np.minimum(n_substeps_max, n_substeps), success
+            return (
+                np.minimum(n_substeps_max, n_substeps),
+                success,
+                (
+                    n_substeps <= n_substeps_max,
+                    slot_long,
+                    trial_long[0],
+                    trial_long[1],
+                    trial_long[2],
+                    trial_long[3],
+                    trial_long[4],
+                ),
+            )
 
         return adapt_substeps
 
     @staticmethod
-    def make_step_fake(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
-        def step_fake(step_impl_args, dt, n_substeps):
-            dt /= n_substeps
-            _, thd_new, _, _, _, _, success = step_impl(*step_impl_args, dt, 1, True)
-            return thd_new, success
+    def make_step_fake(jit_flags, step_impl, calculate_ml_old):
+        @njit(**jit_flags)
+        def step_fake(step_impl_args, dt, n_substeps, trial_mass):
+            """performs the first of `n_substeps` substeps without altering droplet
+            attributes (new masses are stored in `trial_mass`), returns water
+            vapour mixing ratio, thd, rhod, liquid water mass, RH_max and success flag
+            """
+            attributes, cell_idx = step_impl_args[0], step_impl_args[1]
+            ml_old = calculate_ml_old(
+                attributes.signed_water_mass, attributes.multiplicity, cell_idx
+            )
+            (
+                water_vapour_mixing_ratio,
+                thd_new,
+                rhod_new,
+                ml_new,
+                _,
+                _,
+                _,
+                RH_max,
+                success,
+            ) = step_impl(*step_impl_args, ml_old, dt / n_substeps, 1, True, trial_mass)
+            return (
+                water_vapour_mixing_ratio,
+                thd_new,
+                rhod_new,
+                ml_new,
+                RH_max,
+                success,
+            )
 
         return step_fake
 
     @staticmethod
-    def make_step(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
-        def step(step_impl_args, dt, n_substeps):
-            return step_impl(*step_impl_args, dt, n_substeps, False)
+    def make_step(jit_flags, step_impl, calculate_ml_old):
+        @njit(**jit_flags)
+        def step(step_impl_args, dt, n_substeps, trial_mass):
+            attributes, cell_idx = step_impl_args[0], step_impl_args[1]
+            ml_old = calculate_ml_old(
+                attributes.signed_water_mass, attributes.multiplicity, cell_idx
+            )
+            return step_impl(
+                *step_impl_args,
+                ml_old,
+                dt / n_substeps,
+                n_substeps,
+                False,
+                trial_mass,
+            )
 
         return step
 
+    @staticmethod
+    def make_commit_trial(jit_flags, formulae, parallel=False):
+        @njit(**{**jit_flags, "parallel": parallel})
+        def commit_trial(
+            attributes, cell_idx, trial_mass
+        ):  # pylint: disable=too-many-locals
+            """sets droplet masses to the ones obtained in a trial (fake) substep,
+            returns activation counters and the number of droplets updated"""
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            signed_water_mass = attributes.signed_water_mass
+            multiplicity = attributes.multiplicity
+            v_cr = attributes.v_cr
+
+            n_activating = 0
+            n_deactivating = 0
+            n_activated_and_growing = 0
+            n_committed = 0
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                if signed_water_mass[drop] <= 0:
+                    continue
+                activated_and_growing, activating, deactivating = activation_events(
+                    trial_mass[i],
+                    signed_water_mass[drop],
+                    formulae.particle_shape_and_density__volume_to_mass(v_cr[drop]),
+                    multiplicity[drop],
+                )
+                n_activated_and_growing += activated_and_growing
+                n_activating += activating
+                n_deactivating += deactivating
+                n_committed += 1
+                signed_water_mass[drop] = trial_mass[i]
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return n_activating, n_deactivating, n_ripening, n_committed
+
+        return commit_trial
+
     @staticmethod
     def make_step_impl(
         *,
         jit_flags,
         formulae,
-        calculate_ml_old,
         calculate_ml_new,
     ):
-        @numba.njit(**jit_flags)
+        @njit(**jit_flags)
         def step_impl(  # pylint: disable=too-many-positional-arguments,too-many-locals
             attributes,
             cell_idx,
@@ -268,14 +405,16 @@ class CondensationMethods(BackendMethods):
             air_density,
             air_dynamic_viscosity,
             rtol_x,
+            ml_old,
             timestep,
             n_substeps,
             fake,
+            trial_mass,
         ):
-            timestep /= n_substeps
-            ml_old = calculate_ml_old(
-                attributes.signed_water_mass, attributes.multiplicity, cell_idx
-            )
+            """performs `n_substeps` substeps of length `timestep` starting from
+            liquid water mass `ml_old`; with `fake`, droplet attributes are left
+            intact and the new masses are stored in `trial_mass` (assumes
+            `n_substeps == 1`)"""
             count_activating, count_deactivating, count_ripening = 0, 0, 0
             RH_max = 0
             success = True
@@ -321,6 +460,7 @@ class CondensationMethods(BackendMethods):
                     DTp,
                     KTp,
                     rtol_x,
+                    trial_mass,
                 )
                 dml_dt = (ml_new - ml_old) / timestep
                 d_water_vapour_mixing_ratio__dt_corrected = -dml_dt / m_d
@@ -347,6 +487,8 @@ class CondensationMethods(BackendMethods):
             return (
                 water_vapour_mixing_ratio,
                 thd,
+                rhod,
+                ml_old,
                 count_activating,
                 count_deactivating,
                 count_ripening,
@@ -357,11 +499,12 @@ class CondensationMethods(BackendMethods):
         return step_impl
 
     @staticmethod
-    def make_calculate_ml_old(jit_flags):
-        @numba.njit(**jit_flags)
+    def make_calculate_ml_old(jit_flags, parallel=False):
+        @njit(**{**jit_flags, "parallel": parallel})
         def calculate_ml_old(signed_water_mass, multiplicity, cell_idx):
             result = 0
-            for drop in cell_idx:
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
                 if signed_water_mass[drop] > 0:
                     result += multiplicity[drop] * signed_water_mass[drop]
             return result
@@ -375,8 +518,9 @@ class CondensationMethods(BackendMethods):
         jit_flags,
         max_iters,
         RH_rtol,
+        parallel=False,
     ):
-        @numba.njit(**jit_flags)
+        @njit(**jit_flags)
         def minfun(  # pylint: disable=too-many-positional-arguments,too-many-locals
             x_new, x_old, timestep, kappa, f_org, rd3, temperature, RH, Fk, Fd
         ):
@@ -406,7 +550,139 @@ class CondensationMethods(BackendMethods):
                 + timestep * formulae.diffusion_coordinate__dx_dt(mass_new, dm_dt)
             )
 
-        @numba.njit(**jit_flags)
+        @njit(**jit_flags)
+        def calculate_mass_new(  # pylint: disable=too-many-branches,too-many-positional-arguments,too-many-locals
+            mass_old,
+            vdry,
+            kappa,
+            f_org,
+            reynolds_number,
+            timestep,
+            fake,
+            T,
+            p,
+            RH,
+            Sc,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            lambdaK,
+            lambdaD,
+            rtol_x,
+        ):
+            """implicit-in-x Euler step for a single droplet, returns the new
+            mass and a success flag"""
+            v_drop = formulae.particle_shape_and_density__mass_to_volume(mass_old)
+            x_old = formulae.diffusion_coordinate__x(mass_old)
+            r_old = formulae.trivia__radius(v_drop)
+            x_insane = formulae.diffusion_coordinate__x(
+                formulae.particle_shape_and_density__volume_to_mass(vdry / 100)
+            )
+            rd3 = vdry / formulae.constants.PI_4_3
+            sgm = formulae.surface_tension__sigma(T, v_drop, vdry, f_org)
+            RH_eq = formulae.hygroscopicity__RH_eq(r_old, T, kappa, rd3, sgm)
+            if not formulae.trivia__within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+                Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
+                Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
+                mass_ventilation_factor = formulae.ventilation__ventilation_coefficient(
+                    sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
+                        Re=reynolds_number,
+                        Sc=Sc,
+                    )
+                )
+                heat_ventilation_factor = mass_ventilation_factor  # TODO #1588
+                Fk = formulae.drop_growth__Fk(
+                    T=T, K=Kr * heat_ventilation_factor, lv=lv
+                )
+                Fd = formulae.drop_growth__Fd(
+                    T=T, D=Dr * mass_ventilation_factor, pvs=pvs
+                )
+                minfun_args = (
+                    x_old,
+                    timestep,
+                    kappa,
+                    f_org,
+                    rd3,
+                    T,
+                    RH,
+                    Fk,
+                    Fd,
+                )
+                r_dr_dt_old = formulae.drop_growth__r_dr_dt(
+                    RH_eq=RH_eq, RH=RH, Fk=Fk, Fd=Fd
+                )
+                mass_old = formulae.diffusion_coordinate__mass(x_old)
+                dm_dt_old = formulae.particle_shape_and_density__dm_dt(
+                    r=r_old, r_dr_dt=r_dr_dt_old
+                )
+                dx_old = timestep * formulae.diffusion_coordinate__dx_dt(
+                    mass_old, dm_dt_old
+                )
+            else:
+                dx_old = 0.0
+            if dx_old == 0:
+                x_new = x_old
+            else:
+                a = x_old
+                b = max(x_insane, a + dx_old)
+                fa = minfun(a, *minfun_args)
+                fb = minfun(b, *minfun_args)
+
+                counter = 0
+                while not fa * fb < 0:
+                    counter += 1
+                    if counter > max_iters:
+                        if not fake:
+                            warn(
+                                "failed to find interval",
+                                __file__,
+                                context=(
+                                    "T",
+                                    T,
+                                    "p",
+                                    p,
+                                    "RH",
+                                    RH,
+                                    "a",
+                                    a,
+                                    "b",
+                                    b,
+                                    "fa",
+                                    fa,
+                                    "fb",
+                                    fb,
+                                ),
+                            )
+                        return 0.0, False
+                    b = max(x_insane, a + math.ldexp(dx_old, counter))
+                    fb = minfun(b, *minfun_args)
+
+                if a != b:
+                    if a > b:
+                        a, b = b, a
+                        fa, fb = fb, fa
+
+                    x_new, iters_taken = toms748_solve(
+                        minfun,
+                        minfun_args,
+                        a,
+                        b,
+                        fa,
+                        fb,
+                        rtol=rtol_x,
+                        max_iter=max_iters,
+                        within_tolerance=formulae.trivia__within_tolerance,
+                    )
+                    if iters_taken in (-1, max_iters):
+                        if not fake:
+                            warn("TOMS failed", __file__)
+                        return 0.0, False
+                else:
+                    x_new = x_old
+            return formulae.diffusion_coordinate__mass(x_new), True
+
+        @njit(**{**jit_flags, "parallel": parallel})
         def calculate_ml_new(  # pylint: disable=too-many-branches,too-many-positional-arguments,too-many-locals
             attributes,
             timestep,
@@ -421,159 +697,73 @@ class CondensationMethods(BackendMethods):
             DTp,
             KTp,
             rtol_x,
+            trial_mass,
         ):
+            """with `parallel`, droplets are spread across threads with the sums
+            and counters combined through prange reductions; a failed solve for one
+            droplet does not stop the loop (in both variants), the remaining droplets
+            are still updated and the failure is reported through the returned flag"""
+            # arrays within namedtuples in prange loops do not work
+            # https://github.com/numba/numba/issues/5872
+            signed_water_mass = attributes.signed_water_mass
+            multiplicity = attributes.multiplicity
+            v_cr = attributes.v_cr
+            vdry = attributes.vdry
+            kappa = attributes.kappa
+            f_org = attributes.f_org
+            reynolds_number = attributes.reynolds_number
+
             result = 0
             n_activating = 0
             n_deactivating = 0
             n_activated_and_growing = 0
-            success = True
+            n_failed = 0
             lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
             lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
-            for drop in cell_idx:
-                if attributes.signed_water_mass[drop] <= 0:
+            for i in numba.prange(len(cell_idx)):  # pylint: disable=not-an-iterable
+                drop = cell_idx[i]
+                if signed_water_mass[drop] <= 0:
                     continue
-                v_drop = formulae.particle_shape_and_density__mass_to_volume(
-                    attributes.signed_water_mass[drop]
-                )
-                x_old = formulae.diffusion_coordinate__x(
-                    attributes.signed_water_mass[drop]
-                )
-                r_old = formulae.trivia__radius(v_drop)
-                x_insane = formulae.diffusion_coordinate__x(
-                    formulae.particle_shape_and_density__volume_to_mass(
-                        attributes.vdry[drop] / 100
-                    )
-                )
-                rd3 = attributes.vdry[drop] / formulae.constants.PI_4_3
-                sgm = formulae.surface_tension__sigma(
-                    T, v_drop, attributes.vdry[drop], attributes.f_org[drop]
-                )
-                RH_eq = formulae.hygroscopicity__RH_eq(
-                    r_old, T, attributes.kappa[drop], rd3, sgm
+                mass_new, success = calculate_mass_new(
+                    signed_water_mass[drop],
+                    vdry[drop],
+                    kappa[drop],
+                    f_org[drop],
+                    reynolds_number[drop],
+                    timestep,
+                    fake,
+                    T,
+                    p,
+                    RH,
+                    Sc,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    lambdaK,
+                    lambdaD,
+                    rtol_x,
                 )
-                if not formulae.trivia__within_tolerance(
-                    np.abs(RH - RH_eq), RH, RH_rtol
-                ):
-                    Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
-                    Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
-                    mass_ventilation_factor = formulae.ventilation__ventilation_coefficient(
-                        sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
-                            Re=attributes.reynolds_number[drop],
-                            Sc=Sc,
-                        )
-                    )
-                    heat_ventilation_factor = mass_ventilation_factor  # TODO #1588
-                    Fk = formulae.drop_growth__Fk(
-                        T=T, K=Kr * heat_ventilation_factor, lv=lv
-                    )
-                    Fd = formulae.drop_growth__Fd(
-                        T=T, D=Dr * mass_ventilation_factor, pvs=pvs
-                    )
-                    minfun_args = (
-                        x_old,
-                        timestep,
-                        attributes.kappa[drop],
-                        attributes.f_org[drop],
-                        rd3,
-                        T,
-                        RH,
-                        Fk,
-                        Fd,
-                    )
-                    r_dr_dt_old = formulae.drop_growth__r_dr_dt(
-                        RH_eq=RH_eq, RH=RH, Fk=Fk, Fd=Fd
-                    )
-                    mass_old = formulae.diffusion_coordinate__mass(x_old)
-                    dm_dt_old = formulae.particle_shape_and_density__dm_dt(
-                        r=r_old, r_dr_dt=r_dr_dt_old
-                    )
-                    dx_old = timestep * formulae.diffusion_coordinate__dx_dt(
-                        mass_old, dm_dt_old
-                    )
-                else:
-                    dx_old = 0.0
-                if dx_old == 0:
-                    x_new = x_old
-                else:
-                    a = x_old
-                    b = max(x_insane, a + dx_old)
-                    fa = minfun(a, *minfun_args)
-                    fb = minfun(b, *minfun_args)
+                if not success:
+                    n_failed += 1
+                    continue
 
-                    counter = 0
-                    while not fa * fb < 0:
-                        counter += 1
-                        if counter > max_iters:
-                            if not fake:
-                                warn(
-                                    "failed to find interval",
-                                    __file__,
-                                    context=(
-                                        "T",
-                                        T,
-                                        "p",
-                                        p,
-                                        "RH",
-                                        RH,
-                                        "a",
-                                        a,
-                                        "b",
-                                        b,
-                                        "fa",
-                                        fa,
-                                        "fb",
-                                        fb,
-                                    ),
-                                )
-                            success = False
-                            break
-                        b = max(x_insane, a + math.ldexp(dx_old, counter))
-                        fb = minfun(b, *minfun_args)
-
-                    if not success:
-                        break
-                    if a != b:
-                        if a > b:
-                            a, b = b, a
-                            fa, fb = fb, fa
-
-                        x_new, iters_taken = toms748_solve(
-                            minfun,
-                            minfun_args,
-                            a,
-                            b,
-                            fa,
-                            fb,
-                            rtol=rtol_x,
-                            max_iter=max_iters,
-                            within_tolerance=formulae.trivia__within_tolerance,
-                        )
-                        if iters_taken in (-1, max_iters):
-                            if not fake:
-                                warn("TOMS failed", __file__)
-                            success = False
-                            break
-                    else:
-                        x_new = x_old
-
-                mass_new = formulae.diffusion_coordinate__mass(x_new)
                 mass_cr = formulae.particle_shape_and_density__volume_to_mass(
-                    attributes.v_cr[drop]
+                    v_cr[drop]
                 )
-                result += attributes.multiplicity[drop] * mass_new
-                if not fake:
-                    if (
-                        mass_new > mass_cr
-                        and mass_new > attributes.signed_water_mass[drop]
-                    ):
-                        n_activated_and_growing += attributes.multiplicity[drop]
-                    if mass_new > mass_cr > attributes.signed_water_mass[drop]:
-                        n_activating += attributes.multiplicity[drop]
-                    if mass_new < mass_cr < attributes.signed_water_mass[drop]:
-                        n_deactivating += attributes.multiplicity[drop]
-                    attributes.signed_water_mass[drop] = mass_new
+                result += multiplicity[drop] * mass_new
+                if fake:
+                    trial_mass[i] = mass_new
+                else:
+                    activated_and_growing, activating, deactivating = activation_events(
+                        mass_new, signed_water_mass[drop], mass_cr, multiplicity[drop]
+                    )
+                    n_activated_and_growing += activated_and_growing
+                    n_activating += activating
+                    n_deactivating += deactivating
+                    signed_water_mass[drop] = mass_new
             n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
-            return result, success, n_activating, n_deactivating, n_ripening
+            return result, n_failed == 0, n_activating, n_deactivating, n_ripening
 
         return calculate_ml_new
 
@@ -590,6 +780,8 @@ class CondensationMethods(BackendMethods):
         RH_rtol,
         max_iters,
     ):
+        """with fewer cells than threads (e.g., in `Parcel` or `Box` runs), returns
+        a solver in which particles within a cell are spread across threads"""
         return CondensationMethods.make_condensation_solver_impl(
             formulae=self.formulae_flattened,
             timestep=timestep,
@@ -599,11 +791,13 @@ class CondensationMethods(BackendMethods):
             multiplier=multiplier,
             RH_rtol=RH_rtol,
             max_iters=max_iters,
+            particle_parallel=self.default_jit_flags["parallel"]
+            and n_cell < numba.get_num_threads(),
         )
 
     @staticmethod
     @lru_cache()
-    def make_condensation_solver_impl(
+    def make_condensation_solver_impl(  # pylint: disable=too-many-locals
         *,
         formulae,
         timestep,
@@ -613,24 +807,30 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        particle_parallel=False,
     ):
         jit_flags = {
             **conf.JIT_FLAGS,
             **{"parallel": False, "cache": False, "fastmath": formulae.fastmath},
         }
 
+        calculate_ml_old = CondensationMethods.make_calculate_ml_old(
+            jit_flags, parallel=particle_parallel
+        )
         step_impl = CondensationMethods.make_step_impl(
             jit_flags=jit_flags,
             formulae=formulae,
-            calculate_ml_old=CondensationMethods.make_calculate_ml_old(jit_flags),
             calculate_ml_new=CondensationMethods.make_calculate_ml_new(
                 jit_flags=jit_flags,
                 formulae=formulae,
                 max_iters=max_iters,
                 RH_rtol=RH_rtol,
+                parallel=particle_parallel,
             ),
         )
-        step_fake = CondensationMethods.make_step_fake(jit_flags, step_impl)
+        step_fake = CondensationMethods.make_step_fake(
+            jit_flags, step_impl, calculate_ml_old
+        )
         adapt_substeps = CondensationMethods.make_adapt_substeps(
             jit_flags=jit_flags,
             formulae=formulae,
@@ -640,9 +840,12 @@ class CondensationMethods(BackendMethods):
             fuse=fuse,
             multiplier=multiplier,
         )
-        step = CondensationMethods.make_step(jit_flags, step_impl)
+        step = CondensationMethods.make_step(jit_flags, step_impl, calculate_ml_old)
+        commit_trial = CondensationMethods.make_commit_trial(
+            jit_flags, formulae, parallel=particle_parallel
+        )
 
-        @numba.njit(**jit_flags)
+        @njit(**jit_flags)
         def solve(  # pylint: disable=too-many-positional-arguments,too-many-locals
             attributes,
             cell_idx,
@@ -673,23 +876,69 @@ class CondensationMethods(BackendMethods):
                 air_dynamic_viscosity,
                 rtols.x,
             )
+            trial_mass = np.empty((2, len(cell_idx) if adaptive else 0))
             success = True
+            trial = (False, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
             if adaptive:
-                n_substeps, success = adapt_substeps(
-                    step_impl_args, n_substeps, thd, rtols.thd
+                n_substeps, success, trial = adapt_substeps(
+                    step_impl_args, n_substeps, thd, rtols.thd, trial_mass
+                )
+            n_saved_solves = 0
+            if success and trial[0]:
+                # the accepted trial step is the first of the substeps: droplet masses
+                # are taken from it and only the remaining substeps are solved for
+                _, slot, water_vapour_mixing_ratio, thd, rhod, ml, RH_max_trial = trial
+                n_activating, n_deactivating, n_ripening, n_saved_solves = commit_trial(
+                    attributes, cell_idx, trial_mass[slot]
+                )
+                (
+                    water_vapour_mixing_ratio,
+                    thd,
+                    _,
+                    _,
+                    n_activating_rest,
+                    n_deactivating_rest,
+                    n_ripening_rest,
+                    RH_max,
+                    success,
+                ) = step_impl(
+                    attributes,
+                    cell_idx,
+                    thd,
+                    water_vapour_mixing_ratio,
+                    rhod,
+                    dthd_dt,
+                    d_water_vapour_mixing_ratio__dt,
+                    drhod_dt,
+                    m_d,
+                    air_density,
+                    air_dynamic_viscosity,
+                    rtols.x,
+                    ml,
+                    timestep / n_substeps,
+                    n_substeps - 1,
+                    False,
+                    trial_mass[slot],
                 )
-            if success:
+                n_activating += n_activating_rest
+                n_deactivating += n_deactivating_rest
+                n_ripening += n_ripening_rest
+                RH_max = max(RH_max_trial, RH_max)
+            elif success:
                 (
                     water_vapour_mixing_ratio,
                     thd,
+                    _,
+                    _,
                     n_activating,
                     n_deactivating,
                     n_ripening,
                     RH_max,
                     success,
-                ) = step(step_impl_args, timestep, n_substeps)
+                ) = step(step_impl_args, timestep, n_substeps, trial_mass[0])
             else:
                 n_activating, n_deactivating, n_ripening, RH_max = -1, -1, -1, -1
+                n_saved_solves = -1
             return (
                 success,
                 water_vapour_mixing_ratio,
@@ -698,7 +947,9 @@ class CondensationMethods(BackendMethods):
                 n_activating,
                 n_deactivating,
                 n_ripening,
+                n_saved_solves,
                 RH_max,
             )
 
+        solve.particle_parallel = particle_parallel
         return solve
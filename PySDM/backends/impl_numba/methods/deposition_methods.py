@@ -3,10 +3,10 @@
 """
 
 from functools import cached_property
-import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 # TODO #1524
 # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
@@ -23,7 +23,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         rel_tol_rh = 1e-2
         fuse = 16
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def calc_saturation_ratio_ice_temperature_and_pressure(
             vapour_mixing_ratio, dry_air_potential_temperature, dry_air_density
         ):
@@ -46,7 +46,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             )
             return saturation_ratio_ice, temperature, total_pressure
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def mass_deposition_rate_per_droplet(
             temperature: float,
             rho_d: float,
@@ -112,7 +112,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                 assert False
             return mass_deposition_rate
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def _loop(
             fake,
             temperature,
@@ -170,7 +170,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                 assert (delta_rv < 0 < delta_thd) or (delta_rv > 0 > delta_thd)
             return delta_rv, delta_thd
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(  # pylint: disable=too-many-arguments
             *,
             adaptive,
@@ -6,13 +6,15 @@ CPU implementation of backend methods for particle displacement (advection and s
 from functools import cached_property
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 from ...impl_common.backend_methods import BackendMethods
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def calculate_displacement_body_common(
     dim, droplet, scheme, _l, _r, displacement, courant, position_in_cell, n_substeps
 ):
@@ -25,7 +27,7 @@ def calculate_displacement_body_common(
 
 class DisplacementMethods(BackendMethods):
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     def calculate_displacement_body_1d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
     ):
@@ -47,7 +49,7 @@ class DisplacementMethods(BackendMethods):
             )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     def calculate_displacement_body_2d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
     ):
@@ -75,7 +77,7 @@ class DisplacementMethods(BackendMethods):
             )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
     def calculate_displacement_body_3d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
     ):
@@ -144,7 +146,7 @@ class DisplacementMethods(BackendMethods):
 
     @cached_property
     def _flag_precipitated_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @njit(**{**self.default_jit_flags, "parallel": False})
         def body(
             cell_origin,
             position_in_cell,
@@ -178,7 +180,7 @@ class DisplacementMethods(BackendMethods):
 
     @cached_property
     def _flag_out_of_column_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @njit(**{**self.default_jit_flags, "parallel": False})
         def body(
             cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
         ):
@@ -240,3 +242,151 @@ class DisplacementMethods(BackendMethods):
             healthy.data,
             domain_top_level_index,
         )
+
+    @cached_property
+    def _advect_particles_body(self):
+        ff = self.formulae_flattened
+
+        @njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+            displacement,
+            courant,
+            cell_id,
+            cell_origin,
+            position_in_cell,
+            idx,
+            length,
+            healthy,
+            grid,
+            strides,
+            n_substeps,
+            relative_fall_velocity,
+            dt_over_dz,
+            water_mass,
+            multiplicity,
+            precipitation_counting_level_index,
+        ):
+            n_dims = len(grid)
+            flag = len(idx)
+
+            # Arakawa-C grid: component `dim` of the Courant field is staggered in `dim`
+            courant_strides = np.empty((n_dims, n_dims), dtype=np.int64)
+            for dim in range(n_dims):
+                stride = 1
+                for k in range(n_dims - 1, -1, -1):
+                    courant_strides[dim, k] = stride
+                    stride *= grid[k] + 1 * (dim == k)
+
+            # time is counted in ticks of the shortest substep (substep counts are
+            #  powers of two), so that each super-droplet takes the substeps of the
+            #  cell it is in
+            max_n_substeps = np.amax(n_substeps)
+
+            rainfall_mass = 0.0
+            n_flagged = 0
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                j = idx[i]
+                ticks_left = max_n_substeps
+                flagged = False
+                while ticks_left > 0 and not flagged:
+                    ticks = min(max_n_substeps // n_substeps[cell_id[j]], ticks_left)
+                    ticks_left -= ticks
+                    fraction = ticks / max_n_substeps
+                    for dim in range(n_dims):
+                        _l = 0
+                        for k in range(n_dims):
+                            _l += cell_origin[k, j] * courant_strides[dim, k]
+                        _r = _l + courant_strides[dim, dim]
+                        displacement[dim, j] = ff.particle_advection__displacement(
+                            position_in_cell[dim, j],
+                            courant[dim][_l] * fraction,
+                            courant[dim][_r] * fraction,
+                        )
+                    if relative_fall_velocity is not None:
+                        displacement[-1, j] = (
+                            displacement[-1, j] * (1 / (dt_over_dz * fraction))
+                            - relative_fall_velocity[j]
+                        ) * (dt_over_dz * fraction)
+                    for dim in range(n_dims):
+                        position_in_cell[dim, j] += displacement[dim, j]
+
+                    position_within_column = (
+                        cell_origin[-1, j] + position_in_cell[-1, j]
+                    )
+                    if relative_fall_velocity is not None:
+                        if (
+                            # falling
+                            displacement[-1, j] < 0
+                            and
+                            # and crossed precip-counting level
+                            position_within_column < precipitation_counting_level_index
+                        ):
+                            rainfall_mass += abs(water_mass[j]) * multiplicity[j]
+                            flagged = True
+                            continue
+                    if position_within_column < 0 or position_within_column > grid[-1]:
+                        flagged = True
+                        continue
+
+                    cell_id[j] = 0
+                    for dim in range(n_dims):
+                        floor_of_position = np.floor(position_in_cell[dim, j])
+                        cell_origin[dim, j] += np.int64(floor_of_position)
+                        position_in_cell[dim, j] -= floor_of_position
+                        cell_origin[dim, j] %= grid[dim]
+                        cell_id[j] += strides[0, dim] * cell_origin[dim, j]
+                if flagged:
+                    idx[i] = flag
+                    n_flagged += 1
+            if n_flagged > 0:
+                healthy[0] = 0
+            return rainfall_mass
+
+        return body
+
+    def advect_particles(  # pylint: disable=too-many-locals
+        self,
+        *,
+        displacement,
+        courant,
+        cell_id,
+        cell_origin,
+        position_in_cell,
+        idx,
+        length,
+        healthy,
+        grid,
+        strides,
+        n_substeps,
+        relative_fall_velocity=None,
+        dt_over_dz=None,
+        water_mass=None,
+        multiplicity=None,
+        precipitation_counting_level_index=None,
+    ) -> float:
+        """single-pass equivalent of `calculate_displacement` (for all dimensions),
+        of the sedimentation adjustment of the displacement (if `relative_fall_velocity`
+        is given), position update, `flag_precipitated` (ditto), `flag_out_of_column`,
+        cell-origin carry, periodic boundary condition and cell-id recomputation;
+        each super-droplet is advanced through a whole timestep taking, at each substep,
+        the number of substeps (power of two) set in `n_substeps` for the cell it is in,
+        with `dt_over_dz` corresponding to the whole timestep;
+        returns the mass of water that crossed the precipitation-counting level"""
+        return self._advect_particles_body(
+            displacement.data,
+            tuple(component.data.reshape(-1) for component in courant),
+            cell_id.data,
+            cell_origin.data,
+            position_in_cell.data,
+            idx.data,
+            length,
+            healthy.data,
+            grid.data,
+            strides.data,
+            n_substeps.data,
+            None if relative_fall_velocity is None else relative_fall_velocity.data,
+            dt_over_dz,
+            None if water_mass is None else water_mass.data,
+            None if multiplicity is None else multiplicity.data,
+            precipitation_counting_level_index,
+        )
@@ -6,91 +6,112 @@ from functools import cached_property
 import numba
 import numpy as np
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
+from PySDM.backends.impl_numba.lookup_table import LookupTable, interpolate, lookup
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-def straub_Nr(  # pylint: disable=too-many-positional-arguments
-    i,
-    Nr1,
-    Nr2,
-    Nr3,
-    Nr4,
-    Nrt,
-    CW,
-    gam,
-):
-    if gam[i] * CW[i] >= 7.0:
-        Nr1[i] = 0.088 * (gam[i] * CW[i] - 7.0)
-    if CW[i] >= 21.0:
-        Nr2[i] = 0.22 * (CW[i] - 21.0)
-        if CW[i] <= 46.0:
-            Nr3[i] = 0.04 * (46.0 - CW[i])
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def straub_Nr(CW, gam):
+    """returns the numbers of fragments in the four modes (and their total)"""
+    Nr1 = 0.0
+    Nr2 = 0.0
+    Nr3 = 0.0
+    if gam * CW >= 7.0:
+        Nr1 = 0.088 * (gam * CW - 7.0)
+    if CW >= 21.0:
+        Nr2 = 0.22 * (CW - 21.0)
+        if CW <= 46.0:
+            Nr3 = 0.04 * (46.0 - CW)
     else:
-        Nr3[i] = 1.0
-    Nr4[i] = 1.0
-    Nrt[i] = Nr1[i] + Nr2[i] + Nr3[i] + Nr4[i]
+        Nr3 = 1.0
+    Nr4 = 1.0
+    return Nr1, Nr2, Nr3, Nr4, Nr1 + Nr2 + Nr3 + Nr4
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def straub_moment1(mu1, sigma1):
+    """returns the third moment of the (lognormal) first mode"""
+    return np.exp(3 * mu1 + 9 * np.power(sigma1, 2) / 2)
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def straub_mass_remainder(  # pylint: disable=too-many-positional-arguments
-    i, vl, ds, mu1, sigma1, mu2, sigma2, mu3, sigma3, d34, Nr1, Nr2, Nr3, Nr4
+    vl, ds, moment1, mu2, sigma2, mu3, sigma3, Nr1, Nr2, Nr3
 ):
-    # pylint: disable=too-many-arguments, too-many-locals
-    Nr1[i] = Nr1[i] * np.exp(3 * mu1 + 9 * np.power(sigma1, 2) / 2)
-    Nr2[i] = Nr2[i] * (mu2**3 + 3 * mu2 * sigma2**2)
-    Nr3[i] = Nr3[i] * (mu3**3 + 3 * mu3 * sigma3**2)
-    Nr4[i] = vl[i] * 6 / np.pi + ds[i] ** 3 - Nr1[i] - Nr2[i] - Nr3[i]
-    if Nr4[i] <= 0.0:
-        d34[i] = 0
-        Nr4[i] = 0
+    """returns the mode contributions (and the remainder diameter `d34`)"""
+    # pylint: disable=too-many-arguments
+    Nr1 = Nr1 * moment1
+    Nr2 = Nr2 * (mu2**3 + 3 * mu2 * sigma2**2)
+    Nr3 = Nr3 * (mu3**3 + 3 * mu3 * sigma3**2)
+    Nr4 = vl * 6 / np.pi + ds**3 - Nr1 - Nr2 - Nr3
+    if Nr4 <= 0.0:
+        d34 = 0.0
+        Nr4 = 0.0
     else:
-        d34[i] = np.exp(np.log(Nr4[i]) / 3)
-
-
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-def ll82_Nr(
-    i,
-    Rf,
-    Rs,
-    Rd,
-    CKE,
-    W,
-    W2,
-):  # pylint: disable=too-many-branches`
-    if CKE[i] >= 0.893e-6:
-        Rf[i] = 1.11e-4 * CKE[i] ** (-0.654)
+        d34 = np.exp(np.log(Nr4) / 3)
+    return Nr1, Nr2, Nr3, Nr4, d34
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def ll82_Rf(CKE):
+    """returns the filament breakup fraction"""
+    if CKE >= 0.893e-6:
+        return 1.11e-4 * CKE ** (-0.654)
+    return 1.0
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def ll82_Rs(W2):
+    """returns the sheet breakup fraction (applicable for Weber number above 0.86)"""
+    return 0.685 * (1 - np.exp(-1.63 * (W2 - 0.86)))
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def ll82_Nr(CKE, W, W2, tables):
+    """returns the filament, sheet and disk breakup fractions (interpolating
+    `ll82_Rf()` and `ll82_Rs()` from `tables`, see `ll82_lookup_tables()`)"""
+    cke_table, w2_table = tables
+    i, weight = lookup(cke_table, CKE)
+    Rf = ll82_Rf(CKE) if i < 0 else interpolate(cke_table, 0, i, weight)
+    if W >= 0.86:
+        i, weight = lookup(w2_table, W2)
+        Rs = ll82_Rs(W2) if i < 0 else interpolate(w2_table, 0, i, weight)
     else:
-        Rf[i] = 1.0
-    if W[i] >= 0.86:
-        Rs[i] = 0.685 * (1 - np.exp(-1.63 * (W2[i] - 0.86)))
+        Rs = 0.0
+    if (Rs + Rf) > 1.0:
+        Rd = 0.0
     else:
-        Rs[i] = 0.0
-    if (Rs[i] + Rf[i]) > 1.0:
-        Rd[i] = 0.0
-    else:
-        Rd[i] = 1.0 - Rs[i] - Rf[i]
+        Rd = 1.0 - Rs - Rf
+    return Rf, Rs, Rd
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def fragmentation_limiter(frag_volume, vmin, nfmax, x_plus_y):
+    """returns the number of fragments and the fragment volume limited
+    by `vmin`, `nfmax` and the volume of the colliding pair `x_plus_y`"""
+    if x_plus_y == 0.0:
+        return 1.0, 0.0
+    if np.isnan(frag_volume) or frag_volume == 0.0:
+        frag_volume = x_plus_y
+    frag_volume = min(frag_volume, x_plus_y)
+    if nfmax is not None and x_plus_y / frag_volume > nfmax:
+        frag_volume = x_plus_y / nfmax
+    elif frag_volume < vmin:
+        frag_volume = x_plus_y
+    return x_plus_y / frag_volume, frag_volume
 
 
 class FragmentationMethods(BackendMethods):
     @cached_property
     def _fragmentation_limiters_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(n_fragment, frag_volume, vmin, nfmax, x_plus_y):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
-                if x_plus_y[i] == 0.0:
-                    frag_volume[i] = 0.0
-                    n_fragment[i] = 1.0
-                else:
-                    if np.isnan(frag_volume[i]) or frag_volume[i] == 0.0:
-                        frag_volume[i] = x_plus_y[i]
-                    frag_volume[i] = min(frag_volume[i], x_plus_y[i])
-                    if nfmax is not None and x_plus_y[i] / frag_volume[i] > nfmax:
-                        frag_volume[i] = x_plus_y[i] / nfmax
-                    elif frag_volume[i] < vmin:
-                        frag_volume[i] = x_plus_y[i]
-                    n_fragment[i] = x_plus_y[i] / frag_volume[i]
+                n_fragment[i], frag_volume[i] = fragmentation_limiter(
+                    frag_volume[i], vmin, nfmax, x_plus_y[i]
+                )
 
         return body
 
@@ -105,16 +126,19 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _slams_fragmentation_body(self):
-        @numba.njit(**self.default_jit_flags)
+        # cumulative probabilities of 2, 3, ..., 23 fragments
+        cdf = np.cumsum(0.91 * np.arange(2, 24, dtype=float) ** (-1.56))
+
+        @njit(**self.default_jit_flags)
         def body(n_fragment, frag_volume, x_plus_y, probs, rand):
             for i in numba.prange(len(n_fragment)):  # pylint: disable=not-an-iterable
-                probs[i] = 0.0
-                n_fragment[i] = 1
-                for n in range(22):
-                    probs[i] += 0.91 * (n + 2) ** (-1.56)
-                    if rand[i] < probs[i]:
-                        n_fragment[i] = n + 2
-                        break
+                n = np.searchsorted(cdf, rand[i], side="right")
+                if n < len(cdf):
+                    probs[i] = cdf[n]
+                    n_fragment[i] = n + 2
+                else:
+                    probs[i] = cdf[-1]
+                    n_fragment[i] = 1
                 frag_volume[i] = x_plus_y[i] / n_fragment[i]
 
         return body
@@ -139,7 +163,7 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _exp_fragmentation_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(*, scale, frag_volume, rand, tol=1e-5):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
@@ -238,6 +262,7 @@ class FragmentationMethods(BackendMethods):
         Nr4,
         Nrt,
         d34,
+        tables=None,
     ):
         self._straub_fragmentation_body(
             CW=CW.data,
@@ -252,6 +277,7 @@ class FragmentationMethods(BackendMethods):
             Nr4=Nr4.data,
             Nrt=Nrt.data,
             d34=d34.data,
+            tables=self._straub_table_args(tables),
         )
         self._fragmentation_limiters_body(
             n_fragment=n_fragment.data,
@@ -282,6 +308,7 @@ class FragmentationMethods(BackendMethods):
         Rs,
         Rd,
         tol=1e-8,
+        tables=None,
     ):
         self._ll82_fragmentation_body(
             CKE=CKE.data,
@@ -297,6 +324,7 @@ class FragmentationMethods(BackendMethods):
             Rs=Rs.data,
             Rd=Rd.data,
             tol=tol,
+            tables=self._ll82_table_args(tables),
         )
         self._fragmentation_limiters_body(
             n_fragment=n_fragment.data,
@@ -308,7 +336,7 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _ll82_coalescence_check_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(*, Ec, dl):
             for i in numba.prange(len(Ec)):  # pylint: disable=not-an-iterable
                 if dl[i] < 0.4e-3:
@@ -323,159 +351,259 @@ class FragmentationMethods(BackendMethods):
         )
 
     @cached_property
-    def _straub_fragmentation_body(self):
+    def _erfinv(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
-        def body(
-            CW, gam, ds, v_max, frag_volume, rand, Nr1, Nr2, Nr3, Nr4, Nrt, d34
-        ):  # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
-            for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
-                straub_Nr(
-                    i, Nr1=Nr1, Nr2=Nr2, Nr3=Nr3, Nr4=Nr4, Nrt=Nrt, CW=CW, gam=gam
-                )
-                sigma1 = ff.fragmentation_function__params_sigma1(CW[i])
-                mu1 = ff.fragmentation_function__params_mu1(sigma1)
-                sigma2 = ff.fragmentation_function__params_sigma2(CW[i])
-                mu2 = ff.fragmentation_function__params_mu2(ds[i])
-                sigma3 = ff.fragmentation_function__params_sigma3(CW[i])
-                mu3 = ff.fragmentation_function__params_mu3(ds[i])
-                straub_mass_remainder(
-                    i,
-                    vl=v_max,
-                    ds=ds,
-                    mu1=mu1,
-                    sigma1=sigma1,
-                    mu2=mu2,
-                    sigma2=sigma2,
-                    mu3=mu3,
-                    sigma3=sigma3,
-                    d34=d34,
-                    Nr1=Nr1,
-                    Nr2=Nr2,
-                    Nr3=Nr3,
-                    Nr4=Nr4,
-                )
-                Nrt[i] = Nr1[i] + Nr2[i] + Nr3[i] + Nr4[i]
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def erfinv(X, table):
+            """returns `erfinv_approx(X)` (interpolated from `table` if within its range)"""
+            i, weight = lookup(table, X)
+            if i < 0:
+                return ff.trivia__erfinv_approx(X)
+            return interpolate(table, 0, i, weight)
+
+        return erfinv
+
+    def _erfinv_lookup_table(self, n_points):
+        return LookupTable(
+            functions=(self.formulae.trivia.erfinv_approx,),
+            x_range=(-0.98, 0.98),
+            n_points=n_points,
+        )
+
+    def straub_lookup_tables(self, *, n_points=4096):
+        """returns lookup tables for `straub_fragmentation()`: of the parameters
+        of the first and third modes as functions of `CW` (for `CW` from 1e-6 to 1e4,
+        on a logarithmic grid), and of `erfinv_approx()` used for sampling the modes"""
+        ff = self.formulae.fragmentation_function
+
+        def mu1(CW):
+            return ff.params_mu1(ff.params_sigma1(CW))
+
+        def moment1(CW):
+            return straub_moment1(mu1(CW), ff.params_sigma1(CW))
+
+        return {
+            "CW": LookupTable(
+                functions=(ff.params_sigma1, mu1, moment1, ff.params_sigma3),
+                x_range=(1e-6, 1e4),
+                n_points=n_points,
+                log_grid=True,
+            ),
+            "erfinv": self._erfinv_lookup_table(n_points),
+        }
+
+    @staticmethod
+    def _straub_table_args(tables):
+        if tables is None:
+            return LookupTable.disabled(4), LookupTable.disabled(1)
+        return tables["CW"].data, tables["erfinv"].data
+
+    def ll82_lookup_tables(self, *, n_points=4096):
+        """returns lookup tables for `ll82_fragmentation()`: of `ll82_Rf()` (for
+        `CKE` from its threshold of 0.893 uJ to 1 J, on a logarithmic grid), of
+        `ll82_Rs()` (for `W2` from 0.86 to 10) and of `erfinv_approx()` used
+        for sampling the modes"""
+        return {
+            "CKE": LookupTable(
+                functions=(ll82_Rf,),
+                x_range=(0.893e-6, 1.0),
+                n_points=n_points,
+                log_grid=True,
+            ),
+            "W2": LookupTable(
+                functions=(ll82_Rs,), x_range=(0.86, 10.0), n_points=n_points
+            ),
+            "erfinv": self._erfinv_lookup_table(n_points),
+        }
+
+    @staticmethod
+    def _ll82_table_args(tables):
+        if tables is None:
+            return (
+                LookupTable.disabled(1),
+                LookupTable.disabled(1),
+                LookupTable.disabled(1),
+            )
+        return tables["CKE"].data, tables["W2"].data, tables["erfinv"].data
 
-                if Nrt[i] == 0.0:
-                    diameter = 0.0
+    @cached_property
+    def _straub_fragment_volume(self):
+        ff = self.formulae_flattened
+        erfinv = self._erfinv
+
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def fragment_volume(
+            CW, gam, ds, v_max, rand, tables
+        ):  # pylint: disable=too-many-locals,too-many-positional-arguments
+            """returns the fragment volume for a single pair (followed by the mode
+            contributions and their total, and the remainder diameter)"""
+            cw_table, erfinv_table = tables
+            Nr1, Nr2, Nr3, _, _ = straub_Nr(CW, gam)
+            i, weight = lookup(cw_table, CW)
+            if i < 0:
+                sigma1 = ff.fragmentation_function__params_sigma1(CW)
+                mu1 = ff.fragmentation_function__params_mu1(sigma1)
+                moment1 = straub_moment1(mu1, sigma1)
+                sigma3 = ff.fragmentation_function__params_sigma3(CW)
+            else:
+                sigma1 = interpolate(cw_table, 0, i, weight)
+                mu1 = interpolate(cw_table, 1, i, weight)
+                moment1 = interpolate(cw_table, 2, i, weight)
+                sigma3 = interpolate(cw_table, 3, i, weight)
+            sigma2 = ff.fragmentation_function__params_sigma2(CW)
+            mu2 = ff.fragmentation_function__params_mu2(ds)
+            mu3 = ff.fragmentation_function__params_mu3(ds)
+            Nr1, Nr2, Nr3, Nr4, d34 = straub_mass_remainder(
+                v_max, ds, moment1, mu2, sigma2, mu3, sigma3, Nr1, Nr2, Nr3
+            )
+            Nrt = Nr1 + Nr2 + Nr3 + Nr4
+
+            if Nrt == 0.0:
+                diameter = 0.0
+            else:
+                if rand < Nr1 / Nrt:
+                    X = rand * Nrt / Nr1
+                    lnarg = mu1 + np.sqrt(2) * sigma1 * erfinv(X, erfinv_table)
+                    diameter = np.exp(lnarg)
+                elif rand < (Nr2 + Nr1) / Nrt:
+                    X = (rand * Nrt - Nr1) / Nr2
+                    diameter = mu2 + np.sqrt(2) * sigma2 * erfinv(X, erfinv_table)
+                elif rand < (Nr3 + Nr2 + Nr1) / Nrt:
+                    X = (rand * Nrt - Nr1 - Nr2) / Nr3
+                    diameter = mu3 + np.sqrt(2) * sigma3 * erfinv(X, erfinv_table)
                 else:
-                    if rand[i] < Nr1[i] / Nrt[i]:
-                        X = rand[i] * Nrt[i] / Nr1[i]
-                        lnarg = mu1 + np.sqrt(2) * sigma1 * ff.trivia__erfinv_approx(X)
-                        diameter = np.exp(lnarg)
-                    elif rand[i] < (Nr2[i] + Nr1[i]) / Nrt[i]:
-                        X = (rand[i] * Nrt[i] - Nr1[i]) / Nr2[i]
-                        diameter = mu2 + np.sqrt(2) * sigma2 * ff.trivia__erfinv_approx(
-                            X
-                        )
-                    elif rand[i] < (Nr3[i] + Nr2[i] + Nr1[i]) / Nrt[i]:
-                        X = (rand[i] * Nrt[i] - Nr1[i] - Nr2[i]) / Nr3[i]
-                        diameter = mu3 + np.sqrt(2) * sigma3 * ff.trivia__erfinv_approx(
-                            X
-                        )
-                    else:
-                        diameter = d34[i]
-
-                frag_volume[i] = diameter**3 * ff.constants.PI / 6
+                    diameter = d34
+
+            return diameter**3 * ff.constants.PI / 6, Nr1, Nr2, Nr3, Nr4, Nrt, d34
+
+        return fragment_volume
+
+    @cached_property
+    def _straub_fragmentation_body(self):
+        fragment_volume = self._straub_fragment_volume
+
+        @njit(**self.default_jit_flags)
+        def body(
+            CW, gam, ds, v_max, frag_volume, rand, Nr1, Nr2, Nr3, Nr4, Nrt, d34, tables
+        ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
+                (
+                    frag_volume[i],
+                    Nr1[i],
+                    Nr2[i],
+                    Nr3[i],
+                    Nr4[i],
+                    Nrt[i],
+                    d34[i],
+                ) = fragment_volume(CW[i], gam[i], ds[i], v_max[i], rand[i], tables)
 
         return body
 
     @cached_property
-    def _ll82_fragmentation_body(self):  # pylint: disable=too-many-statements
+    def _ll82_fragment_volume(self):  # pylint: disable=too-many-statements
         ff = self.formulae_flattened
+        erfinv = self._erfinv
 
-        @numba.njit(**self.default_jit_flags)
-        def body(
-            CKE, W, W2, St, ds, dl, dcoal, frag_volume, rand, Rf, Rs, Rd, tol
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def fragment_volume(
+            CKE, W, W2, St, ds, dl, dcoal, rand, tol, tables
         ):  # pylint: disable=too-many-branches,too-many-locals,too-many-statements,too-many-positional-arguments
-            for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
-                if dl[i] <= 0.4e-3:
-                    frag_volume[i] = dcoal[i] ** 3 * ff.constants.PI / 6
-                elif ds[i] == 0.0 or dl[i] == 0.0:
-                    frag_volume[i] = 1e-18
+            """returns the fragment volume for a single pair (followed by the
+            filament, sheet and disk breakup fractions)"""
+            Rf, Rs, Rd = 0.0, 0.0, 0.0
+            if dl <= 0.4e-3:
+                return dcoal**3 * ff.constants.PI / 6, Rf, Rs, Rd
+            if ds == 0.0 or dl == 0.0:
+                return 1e-18, Rf, Rs, Rd
+
+            cke_table, w2_table, erfinv_table = tables
+            Rf, Rs, Rd = ll82_Nr(CKE, W, W2, (cke_table, w2_table))
+            if rand <= Rf:  # filament breakup
+                H1, mu1, sigma1 = ff.fragmentation_function__params_f1(dl, dcoal)
+                H2, mu2, sigma2 = ff.fragmentation_function__params_f2(ds)
+                H3, mu3, sigma3 = ff.fragmentation_function__params_f3(ds, dl)
+                H1 = H1 * mu1
+                H2 = H2 * mu2
+                H3 = H3 * np.exp(mu3)
+                Hsum = H1 + H2 + H3
+                rand = rand / Rf
+                if rand <= H1 / Hsum:
+                    X = max(rand * Hsum / H1, tol)
+                    diameter = mu1 + np.sqrt(2) * sigma1 * erfinv(
+                        2 * X - 1, erfinv_table
+                    )
+                elif rand <= (H1 + H2) / Hsum:
+                    X = (rand * Hsum - H1) / H2
+                    diameter = mu2 + np.sqrt(2) * sigma2 * erfinv(
+                        2 * X - 1, erfinv_table
+                    )
+                else:
+                    X = min((rand * Hsum - H1 - H2) / H3, 1.0 - tol)
+                    lnarg = mu3 + np.sqrt(2) * sigma3 * erfinv(2 * X - 1, erfinv_table)
+                    diameter = np.exp(lnarg)
+
+            elif rand <= Rf + Rs:  # sheet breakup
+                H1, mu1, sigma1 = ff.fragmentation_function__params_s1(dl, ds, dcoal)
+                H2, mu2, sigma2 = ff.fragmentation_function__params_s2(dl, ds, St)
+                H1 = H1 * mu1
+                H2 = H2 * np.exp(mu2)
+                Hsum = H1 + H2
+                rand = (rand - Rf) / (Rs)
+                if rand <= H1 / Hsum:
+                    X = max(rand * Hsum / H1, tol)
+                    diameter = mu1 + np.sqrt(2) * sigma1 * erfinv(
+                        2 * X - 1, erfinv_table
+                    )
                 else:
-                    ll82_Nr(i, Rf, Rs, Rd, CKE, W, W2)
-                    if rand[i] <= Rf[i]:  # filament breakup
-                        H1, mu1, sigma1 = ff.fragmentation_function__params_f1(
-                            dl[i], dcoal[i]
-                        )
-                        H2, mu2, sigma2 = ff.fragmentation_function__params_f2(ds[i])
-                        H3, mu3, sigma3 = ff.fragmentation_function__params_f3(
-                            ds[i], dl[i]
-                        )
-                        H1 = H1 * mu1
-                        H2 = H2 * mu2
-                        H3 = H3 * np.exp(mu3)
-                        Hsum = H1 + H2 + H3
-                        rand[i] = rand[i] / Rf[i]
-                        if rand[i] <= H1 / Hsum:
-                            X = max(rand[i] * Hsum / H1, tol)
-                            frag_volume[i] = mu1 + np.sqrt(
-                                2
-                            ) * sigma1 * ff.trivia__erfinv_approx(2 * X - 1)
-                        elif rand[i] <= (H1 + H2) / Hsum:
-                            X = (rand[i] * Hsum - H1) / H2
-                            frag_volume[i] = mu2 + np.sqrt(
-                                2
-                            ) * sigma2 * ff.trivia__erfinv_approx(2 * X - 1)
-                        else:
-                            X = min((rand[i] * Hsum - H1 - H2) / H3, 1.0 - tol)
-                            lnarg = mu3 + np.sqrt(
-                                2
-                            ) * sigma3 * ff.trivia__erfinv_approx(2 * X - 1)
-                            frag_volume[i] = np.exp(lnarg)
-
-                    elif rand[i] <= Rf[i] + Rs[i]:  # sheet breakup
-                        H1, mu1, sigma1 = ff.fragmentation_function__params_s1(
-                            dl[i], ds[i], dcoal[i]
-                        )
-                        H2, mu2, sigma2 = ff.fragmentation_function__params_s2(
-                            dl[i], ds[i], St[i]
-                        )
-                        H1 = H1 * mu1
-                        H2 = H2 * np.exp(mu2)
-                        Hsum = H1 + H2
-                        rand[i] = (rand[i] - Rf[i]) / (Rs[i])
-                        if rand[i] <= H1 / Hsum:
-                            X = max(rand[i] * Hsum / H1, tol)
-                            frag_volume[i] = mu1 + np.sqrt(
-                                2
-                            ) * sigma1 * ff.trivia__erfinv_approx(2 * X - 1)
-                        else:
-                            X = min((rand[i] * Hsum - H1) / H2, 1.0 - tol)
-                            lnarg = mu2 + np.sqrt(
-                                2
-                            ) * sigma2 * ff.trivia__erfinv_approx(2 * X - 1)
-                            frag_volume[i] = np.exp(lnarg)
-
-                    else:  # disk breakup
-                        H1, mu1, sigma1 = ff.fragmentation_function__params_d1(
-                            W[i], dl[i], dcoal[i], CKE[i]
-                        )
-                        H2, mu2, sigma2 = ff.fragmentation_function__params_d2(
-                            ds[i], dl[i], CKE[i]
-                        )
-                        H1 = H1 * mu1
-                        Hsum = H1 + H2
-                        rand[i] = (rand[i] - Rf[i] - Rs[i]) / Rd[i]
-                        if rand[i] <= H1 / Hsum:
-                            X = max(rand[i] * Hsum / H1, tol)
-                            frag_volume[i] = mu1 + np.sqrt(
-                                2
-                            ) * sigma1 * ff.trivia__erfinv_approx(2 * X - 1)
-                        else:
-                            X = min((rand[i] * Hsum - H1) / H2, 1 - tol)
-                            lnarg = mu2 + np.sqrt(
-                                2
-                            ) * sigma2 * ff.trivia__erfinv_approx(2 * X - 1)
-                            frag_volume[i] = np.exp(lnarg)
-
-                    frag_volume[i] = (
-                        frag_volume[i] * 0.01
-                    )  # diameter in cm; convert to m
-                    frag_volume[i] = frag_volume[i] ** 3 * ff.constants.PI / 6
+                    X = min((rand * Hsum - H1) / H2, 1.0 - tol)
+                    lnarg = mu2 + np.sqrt(2) * sigma2 * erfinv(2 * X - 1, erfinv_table)
+                    diameter = np.exp(lnarg)
+
+            else:  # disk breakup
+                H1, mu1, sigma1 = ff.fragmentation_function__params_d1(
+                    W, dl, dcoal, CKE
+                )
+                H2, mu2, sigma2 = ff.fragmentation_function__params_d2(ds, dl, CKE)
+                H1 = H1 * mu1
+                Hsum = H1 + H2
+                rand = (rand - Rf - Rs) / Rd
+                if rand <= H1 / Hsum:
+                    X = max(rand * Hsum / H1, tol)
+                    diameter = mu1 + np.sqrt(2) * sigma1 * erfinv(
+                        2 * X - 1, erfinv_table
+                    )
+                else:
+                    X = min((rand * Hsum - H1) / H2, 1 - tol)
+                    lnarg = mu2 + np.sqrt(2) * sigma2 * erfinv(2 * X - 1, erfinv_table)
+                    diameter = np.exp(lnarg)
+
+            diameter = diameter * 0.01  # diameter in cm; convert to m
+            return diameter**3 * ff.constants.PI / 6, Rf, Rs, Rd
+
+        return fragment_volume
+
+    @cached_property
+    def _ll82_fragmentation_body(self):
+        fragment_volume = self._ll82_fragment_volume
+
+        @njit(**self.default_jit_flags)
+        def body(
+            CKE, W, W2, St, ds, dl, dcoal, frag_volume, rand, Rf, Rs, Rd, tol, tables
+        ):  # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
+            for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
+                frag_volume[i], Rf[i], Rs[i], Rd[i] = fragment_volume(
+                    CKE[i],
+                    W[i],
+                    W2[i],
+                    St[i],
+                    ds[i],
+                    dl[i],
+                    dcoal[i],
+                    rand[i],
+                    tol,
+                    tables,
+                )
 
         return body
 
@@ -483,7 +611,7 @@ class FragmentationMethods(BackendMethods):
     def _gauss_fragmentation_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(mu, sigma, frag_volume, rand):  # pylint: disable=too-many-arguments
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
                 frag_volume[i] = mu + sigma * ff.trivia__erfinv_approx(rand[i])
@@ -494,7 +622,7 @@ class FragmentationMethods(BackendMethods):
     def _feingold1988_fragmentation_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(scale, frag_volume, x_plus_y, rand, fragtol):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
@@ -5,14 +5,16 @@ CPU implementation of shuffling and sorting backend methods
 from functools import cached_property
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class IndexMethods(BackendMethods):
     @cached_property
     def identity_index(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(idx):
             for i in numba.prange(len(idx)):  # pylint: disable=not-an-iterable
                 idx[i] = i
@@ -21,7 +23,7 @@ class IndexMethods(BackendMethods):
 
     @cached_property
     def shuffle_global(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @njit(**{**self.default_jit_flags, "parallel": False})
         def body(idx, length, u01):
             for i in range(length - 1, 0, -1):
                 j = int(u01[i] * (i + 1))
@@ -31,7 +33,7 @@ class IndexMethods(BackendMethods):
 
     @cached_property
     def shuffle_local(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(idx, u01, cell_start):
             # pylint: disable=not-an-iterable
             for c in numba.prange(len(cell_start) - 1):
@@ -43,6 +45,47 @@ class IndexMethods(BackendMethods):
 
         return body
 
+    @cached_property
+    def _compact_body(self):
+        @njit(**self.default_jit_flags)
+        def body(data, idx, length):
+            # pylint: disable=not-an-iterable
+            buffer = np.empty_like(data[:, :length])
+            for i in numba.prange(length):
+                for c in range(data.shape[0]):
+                    buffer[c, i] = data[c, idx[i]]
+            for i in numba.prange(data.shape[1]):
+                for c in range(data.shape[0]):
+                    data[c, i] = buffer[c, i] if i < length else 0
+
+        return body
+
+    def compact(self, *, data, idx, length):
+        """gathers values of `length` first super-droplets pointed to by `idx`
+        into the leading slots of `data` (zeroing the remaining ones)"""
+        self._compact_body(data.data.reshape(-1, data.shape[-1]), idx.data, length)
+
+    @cached_property
+    def _count_out_of_cell_range_body(self):
+        @njit(**self.default_jit_flags)
+        def body(idx, length, cell_id, cell_idx, cell_start):
+            count = 0
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                cell = cell_idx[cell_id[idx[i]]]
+                if not cell_start[cell] <= idx[i] < cell_start[cell + 1]:
+                    count += 1
+            return count
+
+        return body
+
+    def count_out_of_cell_range(self, *, idx, length, cell_id, cell_idx, cell_start):
+        """counts super-droplets (among `length` first ones pointed to by `idx`)
+        with their slot index outside of the `cell_start`-defined index range
+        of their cell"""
+        return self._count_out_of_cell_range_body(
+            idx.data, length, cell_id.data, cell_idx.data, cell_start.data
+        )
+
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
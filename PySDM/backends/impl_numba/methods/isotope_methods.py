@@ -7,6 +7,7 @@ from functools import cached_property, lru_cache
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class IsotopeMethods(BackendMethods):
@@ -24,7 +25,7 @@ class IsotopeMethods(BackendMethods):
         """Numba kernel to convert isotopic ratios to delta values."""
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(output, ratio, reference_ratio):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = ff.trivia__isotopic_ratio_2_delta(ratio[i], reference_ratio)
@@ -51,7 +52,7 @@ class IsotopeMethods(BackendMethods):
         - molality of heavy isotope in dry air.
         """
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(
             *,
             cell_id,
@@ -126,7 +127,7 @@ class IsotopeMethods(BackendMethods):
         """
         ff = self.formulae_flattened
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(
             *,
             output,
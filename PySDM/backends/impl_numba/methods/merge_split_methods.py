@@ -0,0 +1,198 @@
+"""CPU implementation of backend methods for merging and splitting super-droplets"""
+
+from functools import cached_property
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
+
+
+class MergeSplitMethods(BackendMethods):
+    @cached_property
+    def _merge_super_droplets_body(self):
+        @njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+            idx,
+            cell_start,
+            multiplicity,
+            extensive_attributes,
+            healthy,
+            multiplicity_threshold,
+            rtol,
+            min_count_per_cell,
+        ):
+            n_merged = 0
+            n_attrs = extensive_attributes.shape[0]
+            n_cell = len(cell_start) - 1
+            for cell in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+                count = cell_start[cell + 1] - cell_start[cell]
+                if count <= min_count_per_cell:
+                    continue
+                candidates = np.empty(count, dtype=np.int64)
+                n_candidates = 0
+                for i in range(cell_start[cell], cell_start[cell + 1]):
+                    if 0 < multiplicity[idx[i]] <= multiplicity_threshold:
+                        candidates[n_candidates] = idx[i]
+                        n_candidates += 1
+                candidates = candidates[:n_candidates]
+                if n_attrs > 0:
+                    candidates = candidates[
+                        np.argsort(
+                            extensive_attributes[0, candidates], kind="mergesort"
+                        )
+                    ]
+
+                k = 0
+                while k + 1 < n_candidates and count > min_count_per_cell:
+                    j, l = candidates[k], candidates[k + 1]
+                    near_identical = True
+                    for a in range(n_attrs):
+                        if abs(
+                            extensive_attributes[a, j] - extensive_attributes[a, l]
+                        ) > rtol * max(
+                            abs(extensive_attributes[a, j]),
+                            abs(extensive_attributes[a, l]),
+                        ):
+                            near_identical = False
+                            break
+                    if not near_identical:
+                        k += 1
+                        continue
+                    new_multiplicity = multiplicity[j] + multiplicity[l]
+                    for a in range(n_attrs):
+                        extensive_attributes[a, j] = (
+                            multiplicity[j] * extensive_attributes[a, j]
+                            + multiplicity[l] * extensive_attributes[a, l]
+                        ) / new_multiplicity
+                    multiplicity[j] = new_multiplicity
+                    multiplicity[l] = 0
+                    count -= 1
+                    n_merged += 1
+                    k += 2
+            if n_merged > 0:
+                healthy[0] = 0
+            return n_merged
+
+        return body
+
+    def merge_super_droplets(
+        self,
+        *,
+        idx,
+        cell_start,
+        multiplicity,
+        extensive_attributes,
+        healthy,
+        multiplicity_threshold,
+        rtol,
+        min_count_per_cell,
+    ):
+        """within each cell holding more than `min_count_per_cell` super-droplets,
+        merges pairs of super-droplets of multiplicity not exceeding
+        `multiplicity_threshold` and with all extensive attributes equal within
+        `rtol` (looking for pairs among neighbours in the order of the first
+        extensive attribute); the merged super-droplet gets the sum of
+        multiplicities and multiplicity-weighted means of extensive attributes
+        (thus conserving their totals) while the other one gets zero multiplicity;
+        returns the number of merges"""
+        return self._merge_super_droplets_body(
+            idx.data,
+            cell_start.data,
+            multiplicity.data,
+            extensive_attributes.data,
+            healthy.data,
+            multiplicity_threshold,
+            rtol,
+            min_count_per_cell,
+        )
+
+    @cached_property
+    def _split_super_droplets_body(self):
+        @njit(**{**self.default_jit_flags, "parallel": False})
+        def body(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+            idx,
+            length,
+            cell_start,
+            multiplicity,
+            source,
+            destination,
+            multiplicity_threshold,
+            max_count_per_cell,
+        ):
+            occupied = np.zeros(len(multiplicity), dtype=np.bool_)
+            for i in range(length):
+                occupied[idx[i]] = True
+
+            n_split = 0
+            free_slot = 0
+            for cell in range(len(cell_start) - 1):
+                count = cell_start[cell + 1] - cell_start[cell]
+                for i in range(cell_start[cell], cell_start[cell + 1]):
+                    if count >= max_count_per_cell:
+                        break
+                    if multiplicity[idx[i]] <= max(1, multiplicity_threshold):
+                        continue
+                    while free_slot < len(occupied) and occupied[free_slot]:
+                        free_slot += 1
+                    if free_slot == len(occupied):
+                        return n_split
+                    occupied[free_slot] = True
+                    source[n_split] = idx[i]
+                    destination[n_split] = free_slot
+                    idx[length + n_split] = free_slot
+                    multiplicity[free_slot] = multiplicity[idx[i]] // 2
+                    multiplicity[idx[i]] -= multiplicity[free_slot]
+                    count += 1
+                    n_split += 1
+            return n_split
+
+        return body
+
+    def split_super_droplets(
+        self,
+        *,
+        idx,
+        length,
+        cell_start,
+        multiplicity,
+        source,
+        destination,
+        multiplicity_threshold,
+        max_count_per_cell,
+    ):
+        """within each cell holding less than `max_count_per_cell` super-droplets,
+        splits super-droplets of multiplicity exceeding `multiplicity_threshold`
+        into two halves, the new one stored in a slot not referenced by
+        the first `length` elements of `idx` and appended to it; multiplicities
+        are updated while the slots of the split (`source`) and of the new
+        (`destination`) super-droplets are recorded for the remaining attributes
+        to be copied; returns the number of splits"""
+        return self._split_super_droplets_body(
+            idx.data,
+            length,
+            cell_start.data,
+            multiplicity.data,
+            source.data,
+            destination.data,
+            multiplicity_threshold,
+            max_count_per_cell,
+        )
+
+    @cached_property
+    def _copy_slots_body(self):
+        @njit(**self.default_jit_flags)
+        def body(data, source, destination, count):
+            for i in numba.prange(count):  # pylint: disable=not-an-iterable
+                for c in range(data.shape[0]):
+                    data[c, destination[i]] = data[c, source[i]]
+
+        return body
+
+    def copy_slots(self, *, data, source, destination, count):
+        """copies values of `data` from slots `source[:count]` into slots
+        `destination[:count]`"""
+        self._copy_slots_body(
+            data.data.reshape(-1, data.shape[-1]), source.data, destination.data, count
+        )
@@ -7,13 +7,44 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def power(base, exponent):
+    """`base ** exponent` sparing the call to `pow()` for small integer exponents"""
+    if exponent == 0:
+        return 1.0
+    if exponent == 1:
+        return base
+    if exponent == 2:
+        return base * base
+    return base**exponent
+
+
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def bin_index(bin_edges, first, last, value):
+    """returns the index `k` (counting from `first`) of the bin such that
+    `bin_edges[k] <= value < bin_edges[k + 1]` among the bins spanned by
+    `bin_edges[first : last + 1]`, or -1 if `value` falls outside of them"""
+    if not bin_edges[first] <= value < bin_edges[last]:
+        return -1
+    lower = first
+    while last - lower > 1:
+        middle = (lower + last) // 2
+        if value < bin_edges[middle]:
+            last = middle
+        else:
+            lower = middle
+    return lower - first
+
+
 class MomentsMethods(BackendMethods):
     @cached_property
     def _moments_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             *,
             moment_0,
@@ -100,7 +131,7 @@ class MomentsMethods(BackendMethods):
 
     @cached_property
     def _spectrum_moments_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(
             *,
             moment_0,
@@ -180,3 +211,103 @@ class MomentsMethods(BackendMethods):
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
         )
+
+    @cached_property
+    def _fused_moments_body(self):
+        @njit(**self.default_jit_flags)
+        def body(
+            *,
+            moment_0,
+            moments,
+            multiplicity,
+            attr_data,
+            cell_id,
+            idx,
+            length,
+            bin_edges,
+            group_edges_start,
+            group_rows_start,
+            group_x_attr,
+            group_weighting_attr,
+            group_weighting_rank,
+            group_moments_start,
+            moment_attr,
+            moment_rank,
+            moment_rows_start,
+        ):
+            # pylint: disable=too-many-locals
+            moment_0[:, :] = 0
+            moments[:, :] = 0
+            for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = idx[idx_i]
+                for g in range(group_x_attr.shape[0]):
+                    k = bin_index(
+                        bin_edges,
+                        group_edges_start[g],
+                        group_edges_start[g + 1] - 1,
+                        attr_data[group_x_attr[g]][i],
+                    )
+                    if k < 0:
+                        continue
+                    weight = multiplicity[i] * power(
+                        attr_data[group_weighting_attr[g]][i], group_weighting_rank[g]
+                    )
+                    atomic_add(moment_0, (group_rows_start[g] + k, cell_id[i]), weight)
+                    for m in range(group_moments_start[g], group_moments_start[g + 1]):
+                        atomic_add(
+                            moments,
+                            (moment_rows_start[m] + k, cell_id[i]),
+                            weight
+                            * power(attr_data[moment_attr[m]][i], moment_rank[m]),
+                        )
+
+        return body
+
+    def fused_moments(  # pylint: disable=too-many-locals
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attr_data,
+        cell_id,
+        idx,
+        length,
+        bin_edges,
+        group_edges_start,
+        group_rows_start,
+        group_x_attr,
+        group_weighting_attr,
+        group_weighting_rank,
+        group_moments_start,
+        moment_attr,
+        moment_rank,
+        moment_rows_start,
+    ):
+        """computes, in a single pass over super-droplets, the (undivided) moments
+        of many groups of moment specifications, each group sharing a filter
+        attribute binned by its own edges and a weighting; `attr_data` is a sequence
+        of attribute storages referred to by position in `group_x_attr`,
+        `group_weighting_attr` and `moment_attr`; for bin `k` of group `g`,
+        the zero-th moment is stored in row `group_rows_start[g] + k` of `moment_0`
+        and the moments of the group's specs `m` in rows `moment_rows_start[m] + k`
+        of `moments`"""
+        return self._fused_moments_body(
+            moment_0=moment_0.data,
+            moments=moments.data,
+            multiplicity=multiplicity.data,
+            attr_data=tuple(attr.data.astype(float, copy=False) for attr in attr_data),
+            cell_id=cell_id.data,
+            idx=idx.data,
+            length=length,
+            bin_edges=bin_edges.data,
+            group_edges_start=group_edges_start.data,
+            group_rows_start=group_rows_start.data,
+            group_x_attr=group_x_attr.data,
+            group_weighting_attr=group_weighting_attr.data,
+            group_weighting_rank=group_weighting_rank.data,
+            group_moments_start=group_moments_start.data,
+            moment_attr=moment_attr.data,
+            moment_rank=moment_rank.data,
+            moment_rows_start=moment_rows_start.data,
+        )
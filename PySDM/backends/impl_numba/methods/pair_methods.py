@@ -8,12 +8,13 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class PairMethods(BackendMethods):
     @cached_property
     def _distance_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -33,7 +34,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _find_pairs_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(*, cell_start, is_first_in_pair, cell_id, cell_idx, idx, length):
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
                 is_in_same_cell = cell_id[idx[i]] == cell_id[idx[i + 1]]
@@ -56,7 +57,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _max_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -76,7 +77,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _min_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -96,7 +97,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _sort_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -125,7 +126,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _sort_within_pair_by_attr_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(idx, length, is_first_in_pair, attr):
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
                 if is_first_in_pair[i]:
@@ -141,7 +142,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _sum_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -161,7 +162,7 @@ class PairMethods(BackendMethods):
 
     @cached_property
     def _multiply_pair_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(data_out, data_in, is_first_in_pair, idx, length):
             data_out[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -8,6 +8,7 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class SedimentationRemoval0DMethods(BackendMethods):
@@ -15,7 +16,7 @@ class SedimentationRemoval0DMethods(BackendMethods):
     @cached_property
     def _sedimentation_removal_deterministic_body(self):
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(relative_fall_velocity, multiplicity, length_scale, timestep):
             n_sd = len(relative_fall_velocity)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -33,7 +34,7 @@ class SedimentationRemoval0DMethods(BackendMethods):
 
         prob_zero_events = self.formulae.trivia.poissonian_avoidance_function
 
-        @numba.njit(**self.default_jit_flags)
+        @njit(**self.default_jit_flags)
         def body(relative_fall_velocity, multiplicity, length_scale, timestep):
             n_sd = len(relative_fall_velocity)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
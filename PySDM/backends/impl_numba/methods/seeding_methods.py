@@ -2,15 +2,15 @@
 
 from functools import cached_property
 
-import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class SeedingMethods(BackendMethods):  # pylint: disable=too-few-public-methods
     @cached_property
     def _seeding(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @njit(**{**self.default_jit_flags, "parallel": False})
         def body(  # pylint: disable=too-many-positional-arguments
             idx,
             multiplicity,
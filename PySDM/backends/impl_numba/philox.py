@@ -0,0 +1,62 @@
+"""
+counter-based Philox-4x32-10 pseudo-random number generator
+ ([Salmon et al. 2011](https://doi.org/10.1145/2063384.2063405)) callable from
+ within Numba kernels: each number is a pure function of the key (seed) and of
+ the counter (here: the generator step and the element index), hence numbers can
+ be generated in parallel (or on demand within other kernels) with results
+ independent of the thread count or of the order of evaluation
+"""
+
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
+
+MASK32 = np.uint64(0xFFFFFFFF)
+SHIFT32 = np.uint64(32)
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = np.uint64(0x9E3779B9)
+PHILOX_W1 = np.uint64(0xBB67AE85)
+N_ROUNDS = 10
+
+TWO_TO_MINUS_53 = 2.0**-53
+
+
+@njit(**{**conf.JIT_FLAGS, "cache": False})
+def philox4x32(c0, c1, c2, c3, k0, k1):  # pylint: disable=too-many-arguments
+    """returns the four 32-bit words (held in uint64 integers) of the Philox-4x32-10
+    output block for the 128-bit counter `(c0, c1, c2, c3)` and 64-bit key `(k0, k1)`
+    """
+    c0, c1, c2, c3 = np.uint64(c0), np.uint64(c1), np.uint64(c2), np.uint64(c3)
+    k0, k1 = np.uint64(k0), np.uint64(k1)
+    for round_index in range(N_ROUNDS):
+        if round_index > 0:
+            k0 = (k0 + PHILOX_W0) & MASK32
+            k1 = (k1 + PHILOX_W1) & MASK32
+        product0 = PHILOX_M0 * c0
+        product1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = (
+            (product1 >> SHIFT32) ^ c1 ^ k0,
+            product1 & MASK32,
+            (product0 >> SHIFT32) ^ c3 ^ k1,
+            product0 & MASK32,
+        )
+    return c0, c1, c2, c3
+
+
+@njit(**{**conf.JIT_FLAGS, "cache": False})
+def uniform(seed, step, index):
+    """returns a number uniformly distributed in [0, 1) with 53 random bits for
+    the given seed (key), step and index (counter) - all non-negative integers;
+    `index` being, e.g., a position in an array or a `super droplet id`"""
+    seed, step, index = np.uint64(seed), np.uint64(step), np.uint64(index)
+    r0, r1, _, _ = philox4x32(
+        index & MASK32,
+        index >> SHIFT32,
+        step & MASK32,
+        step >> SHIFT32,
+        seed & MASK32,
+        seed >> SHIFT32,
+    )
+    return ((r0 << np.uint64(21)) | (r1 >> np.uint64(11))) * TWO_TO_MINUS_53
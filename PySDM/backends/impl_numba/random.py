@@ -1,19 +1,81 @@
 """
-random number generator class for Numba backend
+random number generator classes for Numba backend
 """
 
+from functools import lru_cache
+
+import numba
 import numpy as np
 
 from ..impl_common.random_common import RandomCommon
+from . import conf
+from .kernel_cache import njit
+from .philox import uniform
 
 #  TIP: can be called asynchronously
 #  TIP: sometimes only half array is needed
 
 
-class Random(RandomCommon):  # pylint: disable=too-few-public-methods
+class Random(RandomCommon):
     def __init__(self, size, seed):
         super().__init__(size, seed)
         self.generator = np.random.default_rng(seed)
 
     def __call__(self, storage):
         storage.data[:] = self.generator.uniform(0, 1, storage.shape)
+
+    def get_state(self):
+        return self.generator.bit_generator.state
+
+    def set_state(self, state):
+        self.generator.bit_generator.state = state
+
+
+@lru_cache()
+def _make_fill(parallel):
+    @njit(**{**conf.JIT_FLAGS, "parallel": parallel})
+    def fill(data, seed, step):
+        for i in numba.prange(len(data)):  # pylint: disable=not-an-iterable
+            data[i] = uniform(seed, step, i)
+
+    return fill
+
+
+class CounterBasedRandom(RandomCommon):
+    """Philox-based generator in which the i-th element of the array filled in the
+    n-th call is a function of (seed, n, i) only - numbers are generated in
+    parallel and are identical regardless of the thread count or of the array
+    length (filling a shorter array yields a prefix of the longer one);
+    the same numbers can be obtained within Numba kernels using
+    `PySDM.backends.impl_numba.philox.uniform(seed, step, index)`.
+
+    Note that the counter of numbers filled into arrays is keyed on the array
+    position (and not on any super-droplet identity): results are reproducible for
+    a given seed and sequence of calls, but the number drawn for a given
+    super-droplet changes whenever its position in the consuming array does;
+    kernels drawing numbers keyed on the `super droplet id` attribute instead
+    (e.g., the one computing gamma in collisions) obtain a step from
+    `reserve_step()`"""
+
+    def __init__(self, size, seed, *, parallel=False):
+        super().__init__(size, seed)
+        self.seed = seed % 2**64
+        self.step = 0
+        self.fill = _make_fill(parallel)
+
+    def __call__(self, storage):
+        self.fill(storage.data.reshape(-1), self.seed, self.step)
+        self.step += 1
+
+    def reserve_step(self):
+        """returns the seed and a step to be used with `philox.uniform()` within
+        kernels (and not used by subsequent calls)"""
+        self.step += 1
+        return self.seed, self.step - 1
+
+    def get_state(self):
+        return {"seed": self.seed, "step": self.step}
+
+    def set_state(self, state):
+        self.seed = state["seed"]
+        self.step = state["step"]
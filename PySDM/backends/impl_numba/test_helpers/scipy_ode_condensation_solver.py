@@ -57,7 +57,7 @@ def _condensation(
             water_vapour_mixing_ratio=particulator.environment[
                 "water_vapour_mixing_ratio"
             ].data,
-            dv_mean=particulator.environment.dv,
+            dv_mean=np.full(particulator.mesh.n_cell, particulator.environment.dv),
             prhod=particulator.environment.get_predicted("rhod").data,
             pthd=particulator.environment.get_predicted("thd").data,
             predicted_water_vapour_mixing_ratio=particulator.environment.get_predicted(
@@ -78,6 +78,7 @@ def _condensation(
             n_activating=counters["n_activating"],
             n_deactivating=counters["n_deactivating"],
             n_ripening=counters["n_ripening"],
+            n_saved_solves=counters["n_saved_solves"],
         ),
         cell_order=cell_order,
         RH_max=RH_max.data,
@@ -304,6 +305,7 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
             1,
             1,
             1,
+            0,
             np.nan,
         )
 
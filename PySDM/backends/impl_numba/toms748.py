@@ -9,10 +9,10 @@ https://github.com/igfuw/libcloudphxx/blob/master/include/libcloudph%2B%2B/commo
 
 from sys import float_info
 
-import numba
 from numpy import nan
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.warnings import warn
 
 float_info_epsilon = float_info.epsilon
@@ -20,7 +20,7 @@ float_info_max = float_info.max
 float_info_min = float_info.min
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False, "cache": False}})
 def bracket(f, args, a, b, c, fa, fb):
     tol = float_info_epsilon * 2
     if (b - a) < 2 * tol * a:
@@ -49,7 +49,7 @@ def bracket(f, args, a, b, c, fa, fb):
     return a, b, fa, fb, d, fd
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def safe_div(num, denom, r):
     if abs(denom) < 1:
         if abs(denom * float_info_max) <= abs(num):
@@ -57,7 +57,7 @@ def safe_div(num, denom, r):
     return num / denom
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def secant_interpolate(a, b, fa, fb):
     tol = float_info_epsilon * 5
     c = a - (fa / (fb - fa)) * (b - a)
@@ -66,7 +66,7 @@ def secant_interpolate(a, b, fa, fb):
     return c
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def quadratic_interpolate(a, b, d, fa, fb, fd, count):
     B = safe_div(fb - fa, b - a, float_info_max)
     A = safe_div(fd - fb, d - b, float_info_max)
@@ -87,7 +87,7 @@ def quadratic_interpolate(a, b, d, fa, fb, fd, count):
     return c
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def cubic_interpolate(
     a, b, d, e, fa, fb, fd, fe
 ):  # pylint: disable=too-many-positional-arguments
@@ -108,12 +108,12 @@ def cubic_interpolate(
     return c
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def tol_check(a, b, rtol, within_tolerance):
     return within_tolerance(abs(a - b), min(abs(a), abs(b)), rtol)
 
 
-@numba.njit(**{**JIT_FLAGS, **{"parallel": False}})
+@njit(**{**JIT_FLAGS, **{"parallel": False}})
 def toms748_solve(
     f, args, ax, bx, fax, fbx, rtol, max_iter, within_tolerance
 ):  # pylint: disable=too-many-positional-arguments
@@ -8,9 +8,10 @@ import sys
 import numba
 
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def warn(msg, file, context=None, return_value=None):
     with numba.objmode():
         print(msg, file=sys.stderr)
@@ -907,6 +907,13 @@ class CollisionsMethods(
             raise NotImplementedError()
         return self._sort_by_cell_id_and_update_cell_start
 
+    @staticmethod
+    def choose_sorting_scheme(
+        *, n_sd, n_cell, n_threads=None
+    ):  # pylint: disable=unused-argument
+        """the GPU backend offers a single (default) cell-sort scheme"""
+        return "default"
+
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def normalize(
@@ -1091,7 +1098,10 @@ class CollisionsMethods(
         Nr4,
         Nrt,
         d34,
+        tables=None,
     ):
+        if tables is not None:
+            raise NotImplementedError("lookup tables are not supported")
         self.__straub_fragmentation_body.launch_n(
             n=len(frag_volume),
             args=(
@@ -5,6 +5,8 @@ GPU implementation of backend methods for water condensation/evaporation
 from functools import cached_property
 from typing import Dict, Optional
 
+import numpy as np
+
 from PySDM.backends.impl_common.storage_utils import StorageBase
 from PySDM.backends.impl_thrust_rtc.bisection import BISECTION
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
@@ -425,6 +427,8 @@ class CondensationMethods(
         air_dynamic_viscosity,
     ):
         assert solver is None
+        if np.ndim(dv) != 0:
+            raise NotImplementedError("per-cell volumes are not supported")
 
         if self.adaptive:
             counters["n_substeps"][:] = 1  # TODO #527
@@ -58,6 +58,66 @@ class IndexMethods(ThrustRTCBackendMethods):
             cell_start.size() - 1, [cell_start, u01, idx]
         )
 
+    @cached_property
+    def __compact_body(self):
+        return trtc.For(
+            param_names=("data", "buffer", "idx", "length", "n_sd", "n_components"),
+            name_iter="i",
+            body="""
+            for (auto c = 0; c < n_components; c += 1) {
+                if (i < length) {
+                    data[c * n_sd + i] = buffer[c * n_sd + idx[i]];
+                }
+                else {
+                    data[c * n_sd + i] = 0;
+                }
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def compact(self, *, data, idx, length):
+        buffer, _, _ = data._get_empty_data(  # pylint: disable=protected-access
+            data.shape, data.dtype
+        )
+        trtc.Copy(data.data, buffer)
+        n_sd = data.shape[-1]
+        self.__compact_body.launch_n(
+            n_sd,
+            (
+                data.data,
+                buffer,
+                idx.data,
+                trtc.DVInt64(length),
+                trtc.DVInt64(n_sd),
+                trtc.DVInt64(data.data.size() // n_sd),
+            ),
+        )
+
+    @cached_property
+    def __count_out_of_cell_range_body(self):
+        return trtc.For(
+            param_names=("flags", "idx", "cell_id", "cell_idx", "cell_start"),
+            name_iter="i",
+            body="""
+            auto cell = cell_idx[cell_id[idx[i]]];
+            if (idx[i] < cell_start[cell] || idx[i] >= cell_start[cell + 1]) {
+                flags[i] = 1;
+            }
+            else {
+                flags[i] = 0;
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def count_out_of_cell_range(self, *, idx, length, cell_id, cell_idx, cell_start):
+        flags = trtc.device_vector("int64_t", length)
+        self.__count_out_of_cell_range_body.launch_n(
+            length, (flags, idx.data, cell_id.data, cell_idx.data, cell_start.data)
+        )
+        return int(trtc.Reduce(flags, trtc.DVInt64(0), trtc.Plus()))
+
     @staticmethod
     @nice_thrust(**NICE_THRUST_FLAGS)
     def sort_by_key(idx, attr):
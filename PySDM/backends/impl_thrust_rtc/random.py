@@ -11,7 +11,7 @@ from .conf import rndrtc, trtc
 #  TIP: sometimes only half array is needed
 
 
-class Random(RandomCommon):  # pylint: disable=too-few-public-methods
+class Random(RandomCommon):
     __urand_init_rng_state_body = trtc.For(
         ["rng", "states", "seed"],
         "i",
@@ -39,3 +39,9 @@ class Random(RandomCommon):  # pylint: disable=too-few-public-methods
     def __call__(self, storage):
         assert len(storage) <= self.size
         Random.__urand_body.launch_n(len(storage), [self.generator, storage.data])
+
+    def get_state(self):
+        raise NotImplementedError("CURandRTC generator state cannot be retrieved")
+
+    def set_state(self, state):
+        raise NotImplementedError("CURandRTC generator state cannot be set")
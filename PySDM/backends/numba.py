@@ -4,6 +4,7 @@ Multi-threaded CPU backend using LLVM-powered just-in-time compilation
 
 import os
 import platform
+from functools import partial
 import warnings
 
 import numba
@@ -11,10 +12,12 @@ from numba import prange
 import numpy as np
 
 from PySDM.backends.impl_numba import methods
+from PySDM.backends.impl_numba.random import CounterBasedRandom
 from PySDM.backends.impl_numba.random import Random as ImportedRandom
 from PySDM.backends.impl_numba.storage import Storage as ImportedStorage
 from PySDM.formulae import Formulae
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.kernel_cache import njit
 
 
 class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
@@ -33,6 +36,7 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     methods.SeedingMethods,
     methods.DepositionMethods,
     methods.SedimentationRemoval0DMethods,
+    methods.MergeSplitMethods,
 ):
     Storage = ImportedStorage
     Random = ImportedRandom
@@ -40,7 +44,12 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     default_croupier = "local"
 
     def __init__(
-        self, formulae=None, *, double_precision=True, override_jit_flags=None
+        self,
+        formulae=None,
+        *,
+        double_precision=True,
+        override_jit_flags=None,
+        counter_based_random=False,
     ):
         if not double_precision:
             raise NotImplementedError()
@@ -71,7 +80,7 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
 
             if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
 
-                @numba.jit(parallel=True, nopython=True)
+                @njit(parallel=True)
                 def fill_array_with_thread_id(arr):
                     """writes thread id to corresponding array element"""
                     for i in prange(  # pylint: disable=not-an-iterable
@@ -93,6 +102,12 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
             **(override_jit_flags or {}),
         }
 
+        self.counter_based_random = counter_based_random
+        if counter_based_random:
+            self.Random = partial(  # pylint: disable=invalid-name
+                CounterBasedRandom, parallel=self.default_jit_flags["parallel"]
+            )
+
         methods.CollisionsMethods.__init__(self)
         methods.FragmentationMethods.__init__(self)
         methods.PairMethods.__init__(self)
@@ -107,3 +122,4 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
         methods.IsotopeMethods.__init__(self)
         methods.SeedingMethods.__init__(self)
         methods.DepositionMethods.__init__(self)
+        methods.MergeSplitMethods.__init__(self)
@@ -7,6 +7,7 @@ import inspect
 import numpy as np
 
 from PySDM.attributes.impl.attribute_registry import get_attribute_class
+from PySDM.impl.checkpoint import load_checkpoint
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
 from PySDM.impl.wall_timer import WallTimer
 from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
@@ -119,10 +120,20 @@ class Builder:
                 )
             )
         attributes["multiplicity"] = int_caster(attributes["multiplicity"])
-        if self.particulator.mesh.dimension == 0:
+        if self.particulator.mesh.dimension == 0 and "cell id" not in attributes:
             attributes["cell id"] = np.zeros_like(
                 attributes["multiplicity"], dtype=np.int64
             )
+        if "super droplet id" in self.req_attr and "super droplet id" not in attributes:
+            attributes["super droplet id"] = np.arange(
+                len(attributes["multiplicity"]), dtype=np.int64
+            )
+        if self.particulator.sorting_scheme == "default":
+            self.particulator.sorting_scheme = (
+                self.particulator.backend.choose_sorting_scheme(
+                    n_sd=self.particulator.n_sd, n_cell=self.particulator.mesh.n_cell
+                )
+            )
         self.particulator.attributes = ParticleAttributesFactory.attributes(
             self.particulator, self.req_attr, attributes
         )
@@ -136,3 +147,26 @@ class Builder:
             self.particulator.attributes.sanitize()
 
         return self.particulator
+
+    def from_checkpoint(self, path, products: tuple = ()):
+        """builds a `PySDM.particulator.Particulator` with the state restored from
+        a checkpoint saved with `PySDM.particulator.Particulator.save_checkpoint()`;
+        the builder is expected to be set up (environment, dynamics) as the one
+        used for the checkpointed simulation"""
+        state = load_checkpoint(path)
+        if state["n_sd"] != self.particulator.n_sd:
+            raise ValueError(
+                f"checkpoint n_sd ({state['n_sd']}) does not match"
+                f" the one of the builder ({self.particulator.n_sd})"
+            )
+        if state["dynamics"].keys() - self.particulator.dynamics.keys():
+            raise ValueError("checkpoint dynamics do not match those of the builder")
+        particulator = self.build(
+            attributes=dict(state["attributes"]["base attributes"]),
+            products=products,
+            int_caster=np.asarray,
+        )
+        particulator._restore_checkpoint_state(  # pylint: disable=protected-access
+            state
+        )
+        return particulator
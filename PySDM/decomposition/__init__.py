@@ -0,0 +1,12 @@
+"""
+Domain decomposition for running a single simulation across multiple processes:
+`PySDM.decomposition.slab.SlabDecomposition` splitting the domain into slabs
+(each handled by a separate particulator) with super-droplets migrated between
+slabs by `PySDM.decomposition.slab.SlabDisplacement` and with halos of Eulerian
+fields exchanged by `PySDM.decomposition.slab.SlabEulerianAdvection`, using
+a pluggable transport (`PySDM.decomposition.transports.PipeTransport` or
+`PySDM.decomposition.transports.MPITransport`)
+"""
+
+from .slab import SlabDecomposition, SlabDisplacement, SlabEulerianAdvection
+from .transports import MPITransport, PipeTransport
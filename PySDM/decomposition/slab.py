@@ -0,0 +1,235 @@
+"""
+slab decomposition of a (periodic in the first dimension) domain, with each worker
+ owning a contiguous range of cells in the first dimension, with super-droplets
+ migrating between neighbouring slabs (see `SlabDisplacement`) and with halos of
+ Eulerian fields exchanged between them (see `SlabEulerianAdvection`)
+"""
+
+import numpy as np
+
+from PySDM.dynamics.displacement import Displacement
+from PySDM.dynamics.eulerian_advection import EulerianAdvection
+from PySDM.dynamics.impl import register_dynamic
+
+
+class SlabDecomposition:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, *, grid, size, transport):
+        n_slabs = transport.size
+        if grid[0] < n_slabs:
+            raise ValueError(f"cannot split {grid[0]} columns into {n_slabs} slabs")
+        widths = np.full(n_slabs, grid[0] // n_slabs)
+        widths[: grid[0] % n_slabs] += 1
+        offsets = np.concatenate(((0,), np.cumsum(widths)[:-1]))
+
+        self.transport = transport
+        self.grid = tuple(grid)
+        self.size = tuple(size)
+        self.left = (transport.rank - 1) % n_slabs
+        self.right = (transport.rank + 1) % n_slabs
+        self.offset = int(offsets[transport.rank])
+        self.width = int(widths[transport.rank])
+        self.left_width = int(widths[self.left])
+        self.local_grid = (self.width, *self.grid[1:])
+        self.local_size = (self.size[0] * self.width / self.grid[0], *self.size[1:])
+
+    def subdomain(self, array, staggered=False):
+        """returns the part of a global `array` (indexed with cells or, if
+        `staggered`, with cell edges in the first dimension) covered by the slab"""
+        return array[self.offset : self.offset + self.width + (1 if staggered else 0)]
+
+    def halo_window(self, array, n_halo, staggered=False):
+        """returns the part of a global periodic `array` (see `subdomain`) covered by
+        the slab extended by `n_halo` rows on each side in the first dimension"""
+        n_rows = array.shape[0] - (1 if staggered else 0)
+        rows = np.arange(
+            self.offset - n_halo,
+            self.offset + self.width + n_halo + (1 if staggered else 0),
+        )
+        return array[rows % n_rows]
+
+    def courant_field(self, courant_field):
+        """returns slab parts of the Arakawa-C staggered components of a global field"""
+        return tuple(
+            self.subdomain(component, staggered=dim == 0)
+            for dim, component in enumerate(courant_field)
+        )
+
+    def local_positions(self, positions):
+        """given global positions (in grid coordinates, with the first dimension
+        along the first axis), returns a mask selecting super-droplets within the slab
+        and their positions in slab coordinates"""
+        positions = np.asarray(positions)
+        mask = (self.offset <= positions[0]) & (positions[0] < self.offset + self.width)
+        local = positions[:, mask].copy()
+        local[0] -= self.offset
+        return mask, local
+
+    @staticmethod
+    def pad_attributes(attributes, n_sd):
+        """pads attribute arrays to length `n_sd` with zero-multiplicity super-droplets
+        providing room for super-droplets migrating from other slabs"""
+        result = {}
+        for key, array in attributes.items():
+            array = np.asarray(array)
+            pad = [(0, 0)] * (array.ndim - 1) + [(0, n_sd - array.shape[-1])]
+            result[key] = np.pad(array, pad, mode="edge")
+        result["multiplicity"][len(attributes["multiplicity"]) :] = 0
+        return result
+
+    def allreduce_max(self, value):
+        for _ in range(self.transport.size - 1):
+            value = max(
+                value,
+                self.transport.sendrecv(value, dest=self.right, source=self.left),
+            )
+        return value
+
+    def exchange_halos(self, field, n_halo):
+        """fills `n_halo` outermost rows (in the first dimension) of `field` with
+        values from the inner rows of neighbouring slabs"""
+        field[-n_halo:] = self.transport.sendrecv(
+            field[n_halo : 2 * n_halo], dest=self.left, source=self.right
+        )
+        field[:n_halo] = self.transport.sendrecv(
+            field[-2 * n_halo : -n_halo], dest=self.right, source=self.left
+        )
+
+    @staticmethod
+    def __storages(attributes):
+        storages = {
+            key: attributes[key] for key in attributes.get_base_attribute_keys()
+        }
+        storages["extensive"] = attributes.get_extensive_attribute_storage()
+        return storages
+
+    def migrate(self, particulator):  # pylint: disable=too-many-locals
+        """sends away super-droplets with `cell origin` outside of the slab (in the
+        first dimension) and inserts the ones received from the neighbours into
+        free slots (ones unused or occupied by super-droplets removed earlier),
+        with values of all base attributes carried along"""
+        attributes = particulator.attributes
+        storages = self.__storages(attributes)
+        data = {key: storage.to_ndarray(raw=True) for key, storage in storages.items()}
+        idx = attributes._ParticleAttributes__idx  # pylint: disable=protected-access
+        valid = idx.to_ndarray()[: attributes.super_droplet_count]
+
+        origin = data["cell origin"][0, valid]
+        to_left = valid[origin < 0]
+        to_right = valid[origin >= self.width]
+        outgoing = []
+        for selection, shift in ((to_left, self.left_width), (to_right, -self.width)):
+            payload = {key: array[..., selection] for key, array in data.items()}
+            payload["cell origin"][0] += shift
+            outgoing.append(payload)
+        incoming = (
+            self.transport.sendrecv(outgoing[0], dest=self.left, source=self.right),
+            self.transport.sendrecv(outgoing[1], dest=self.right, source=self.left),
+        )
+
+        free = np.ones(particulator.n_sd, dtype=bool)
+        free[valid] = False
+        free[to_left] = True
+        free[to_right] = True
+        free = np.flatnonzero(free)
+        n_incoming = sum(len(payload["multiplicity"]) for payload in incoming)
+        if n_incoming > len(free):
+            raise ValueError(
+                f"no room for {n_incoming} incoming super-droplets"
+                f" ({len(free)} free slots, consider padding attributes)"
+            )
+        data["multiplicity"][free] = 0
+        start = 0
+        for payload in incoming:
+            slots = free[start : start + len(payload["multiplicity"])]
+            for key, array in data.items():
+                array[..., slots] = payload[key]
+            start += len(slots)
+
+        for key, storage in storages.items():
+            storage.upload(data[key])
+        attributes.reset_idx()
+        attributes.sanitize()
+        for key in (
+            *attributes.get_base_attribute_keys(),
+            *attributes.get_extensive_attribute_keys(),
+        ):
+            attributes.mark_updated(key)
+
+
+@register_dynamic()
+class SlabDisplacement(Displacement):
+    """`PySDM.dynamics.displacement.Displacement` variant for use within a slab of
+    `SlabDecomposition`: super-droplets leaving the slab through its boundaries in the
+    first dimension are migrated to the neighbouring slabs (instead of being wrapped
+    around periodically); number of substeps is agreed upon among all slabs"""
+
+    def __init__(self, *, decomposition: SlabDecomposition, **kwargs):
+        # migration happens between cell-origin update and boundary condition
+        super().__init__(fused=False, **kwargs)
+        self.decomposition = decomposition
+
+    def upload_courant_field(self, courant_field):
+        super().upload_courant_field(courant_field)
+        self._n_substeps = self.decomposition.allreduce_max(self._n_substeps)
+        self.n_substeps_per_cell[:] = self._n_substeps
+
+    def boundary_condition(self, cell_origin):
+        self.decomposition.migrate(self.particulator)
+        super().boundary_condition(cell_origin)
+
+
+class _SlabSolvers:
+    """exposes slab-extended `solvers` (see `SlabEulerianAdvection`) without the halo
+    and exchanges the halo rows of their advectees prior to each step"""
+
+    def __init__(self, solvers, *, decomposition, n_halo):
+        self.solvers = solvers
+        self.decomposition = decomposition
+        self.n_halo = n_halo
+        self.displacement = None
+
+    def __interior(self, array):
+        return array[self.n_halo : -self.n_halo]
+
+    def __getitem__(self, key):
+        return self.__interior(self.solvers[key])
+
+    def upload_courant_field(self, courant_field):
+        self.displacement.upload_courant_field(
+            tuple(self.__interior(component) for component in courant_field)
+        )
+
+    def __call__(self, displacement):
+        for key in self.solvers.advectees:
+            self.decomposition.exchange_halos(self.solvers[key], self.n_halo)
+        self.displacement = displacement
+        self.solvers(self)
+
+    def wait(self):
+        self.solvers.wait()
+
+    def checkpoint_state(self):
+        return self.solvers.checkpoint_state()
+
+    def restore_checkpoint_state(self, state):
+        self.solvers.restore_checkpoint_state(state)
+
+
+@register_dynamic()
+class SlabEulerianAdvection(EulerianAdvection):
+    """`PySDM.dynamics.eulerian_advection.EulerianAdvection` variant for use within a
+    slab of `SlabDecomposition`: `solvers` operate on the slab extended with `n_halo`
+    rows on each side in the first dimension (see `SlabDecomposition.halo_window`)
+    which are filled with values from the neighbouring slabs prior to each step;
+    the environment and `SlabDisplacement` are given the fields without the halo
+    (for MPDATA, `n_halo` of `n_iters` times the halo width of the scheme yields
+    results matching those obtained without decomposition)"""
+
+    def __init__(self, solvers, *, decomposition: SlabDecomposition, n_halo: int):
+        if not 0 < n_halo <= decomposition.width:
+            raise ValueError(
+                f"halo of {n_halo} rows not supported by slab of {decomposition.width}"
+            )
+        super().__init__(
+            _SlabSolvers(solvers, decomposition=decomposition, n_halo=n_halo)
+        )
@@ -0,0 +1,73 @@
+"""
+transports used for exchanging data between subdomains: `PipeTransport` based on
+ [multiprocessing](https://docs.python.org/3/library/multiprocessing.html) pipes
+ (for workers on a single node) and `MPITransport` based on
+ [mpi4py](https://mpi4py.readthedocs.io/) (optional dependency, imported lazily)
+"""
+
+import multiprocessing
+from abc import abstractmethod
+from threading import Thread
+
+
+class Transport:
+    """common interface of transports: `rank` and `size` attributes plus
+    a deadlock-free `sendrecv()` (send to `dest` while receiving from `source`)"""
+
+    def __init__(self, *, rank, size):
+        self.rank = rank
+        self.size = size
+
+    def __deepcopy__(self, memo):
+        # transports wrap process-wide communication resources and are shared
+        #  among all (deep-copied upon builder registration) dynamics instances
+        return self
+
+    @abstractmethod
+    def sendrecv(self, payload, *, dest, source):
+        raise NotImplementedError()
+
+
+class PipeTransport(Transport):
+    def __init__(self, *, rank, size, senders, receivers):
+        super().__init__(rank=rank, size=size)
+        self._senders = senders
+        self._receivers = receivers
+
+    @staticmethod
+    def create(size, mp_context=None):
+        """returns a list of `size` transports (one to be passed to each worker)
+        interconnected with unidirectional pipes (incl. ones from each rank to itself)
+        """
+        mp_context = mp_context or multiprocessing.get_context()
+        pipes = [
+            [mp_context.Pipe(duplex=False) for _ in range(size)] for _ in range(size)
+        ]
+        return [
+            PipeTransport(
+                rank=rank,
+                size=size,
+                senders=[pipes[rank][dest][1] for dest in range(size)],
+                receivers=[pipes[source][rank][0] for source in range(size)],
+            )
+            for rank in range(size)
+        ]
+
+    def sendrecv(self, payload, *, dest, source):
+        sender = Thread(target=self._senders[dest].send, args=(payload,))
+        sender.start()
+        result = self._receivers[source].recv()
+        sender.join()
+        return result
+
+
+class MPITransport(Transport):  # pylint: disable=too-few-public-methods
+    def __init__(self, comm=None):
+        # pylint: disable=import-outside-toplevel,import-error
+        from mpi4py import MPI
+
+        self._comm = comm or MPI.COMM_WORLD
+        super().__init__(rank=self._comm.Get_rank(), size=self._comm.Get_size())
+
+    def sendrecv(self, payload, *, dest, source):
+        return self._comm.sendrecv(payload, dest=dest, source=source)
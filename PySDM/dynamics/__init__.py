@@ -15,6 +15,8 @@ from PySDM.dynamics.displacement import Displacement
 from PySDM.dynamics.eulerian_advection import EulerianAdvection
 from PySDM.dynamics.freezing import Freezing
 from PySDM.dynamics.relaxed_velocity import RelaxedVelocity
+from PySDM.dynamics.merge_split import MergeSplit
+from PySDM.dynamics.rebalancing import Rebalancing
 from PySDM.dynamics.seeding import Seeding
 from PySDM.dynamics.vapour_deposition_on_ice import VapourDepositionOnIce
 from PySDM.dynamics.sedimentation_removal_0d import SedimentationRemoval0D
@@ -34,7 +34,13 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         pH_H_min=None,
         pH_H_max=None,
         pH_rtol=DEFAULTS.pH_rtol,
+        pH_warm_start=False,
     ):
+        """if `pH_warm_start` is set, the pH equilibration root search is seeded
+        with a narrow bracket next to the previous pH value of each droplet
+        (instead of resorting to the full `(pH_H_min, pH_H_max)` range whenever
+        the previous value is not close); numbers of root searches and of their
+        iterations are kept in `counters`"""
         self.environment_mole_fractions = environment_mole_fractions
         self.environment_mixing_ratios = {}
         self.particulator = None
@@ -49,6 +55,8 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.pH_H_max = pH_H_max
         self.pH_H_min = pH_H_min
         self.pH_rtol = pH_rtol
+        self.pH_warm_start = pH_warm_start
+        self.counters = {"pH solves": 0, "pH iterations": 0, "pH max iterations": 0}
 
         self.kinetic_consts = {}
         self.equilibrium_consts = {}
@@ -63,7 +71,7 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         )
 
         for key, compound in GASEOUS_COMPOUNDS.items():
-            shape = (1,)
+            shape = (self.particulator.mesh.n_cell,)
             self.environment_mixing_ratios[compound] = np.full(
                 shape,
                 self.particulator.formulae.trivia.mole_fraction_2_mixing_ratio(
@@ -6,6 +6,7 @@ Base class for volume-based fragmentation functions
 class VolumeBasedFragmentationFunction:
     def __init__(self):
         self.particulator = None
+        self.tables = None
 
     def __call__(self, nf, frag_mass, u01, is_first_in_pair):
         frag_volume_aliased_to_mass = frag_mass
@@ -24,3 +25,8 @@ class VolumeBasedFragmentationFunction:
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
+
+    def lookup_tables(self, backend):  # pylint: disable=unused-argument
+        """returns backend lookup tables used in place of evaluating the per-pair
+        parameters of the fragmentation function (or `None` if not applicable)"""
+        return None
@@ -7,10 +7,15 @@ from .impl import VolumeBasedFragmentationFunction
 
 class LowList1982Nf(VolumeBasedFragmentationFunction):
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, vmin=0.0, nfmax=None):
+    def __init__(self, vmin=0.0, nfmax=None, tabulate=False):
+        """`tabulate` enables (if supported by the backend) sampling fragment sizes
+        using lookup tables, built at `register()` time, of the transcendental
+        functions involved (see `ll82_lookup_tables()` backend method for the ranges covered
+        and `PySDM.backends.impl_numba.lookup_table.LookupTable` for error estimates)"""
         super().__init__()
         self.vmin = vmin
         self.nfmax = nfmax
+        self.tabulate = tabulate
         self.arrays = {}
         self.ll82_tmp = {}
         self.sum_of_volumes = None
@@ -18,6 +23,7 @@ class LowList1982Nf(VolumeBasedFragmentationFunction):
 
     def register(self, builder):
         super().register(builder)
+        self.tables = self.lookup_tables(self.particulator.backend)
         self.sum_of_volumes = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
@@ -33,6 +39,11 @@ class LowList1982Nf(VolumeBasedFragmentationFunction):
                 self.particulator.n_sd // 2, dtype=float
             )
 
+    def lookup_tables(self, backend):
+        if self.tabulate and hasattr(backend, "ll82_lookup_tables"):
+            return backend.ll82_lookup_tables()
+        return None
+
     def compute_fragment_number_and_volumes(
         self, nf, frag_volume, u01, is_first_in_pair
     ):
@@ -102,4 +113,5 @@ class LowList1982Nf(VolumeBasedFragmentationFunction):
             Rf=self.ll82_tmp["Rf"],
             Rs=self.ll82_tmp["Rs"],
             Rd=self.ll82_tmp["Rd"],
+            tables=self.tables,
         )
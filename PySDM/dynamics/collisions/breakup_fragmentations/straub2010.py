@@ -9,10 +9,15 @@ from .impl import VolumeBasedFragmentationFunction
 
 class Straub2010Nf(VolumeBasedFragmentationFunction):
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, vmin=0.0, nfmax=None):
+    def __init__(self, vmin=0.0, nfmax=None, tabulate=False):
+        """`tabulate` enables (if supported by the backend) sampling fragment sizes
+        using lookup tables, built at `register()` time, of the transcendental
+        functions involved (see `straub_lookup_tables()` backend method for the ranges covered
+        and `PySDM.backends.impl_numba.lookup_table.LookupTable` for error estimates)"""
         super().__init__()
         self.vmin = vmin
         self.nfmax = nfmax
+        self.tabulate = tabulate
         self.arrays = {}
         self.straub_tmp = {}
         self.max_size = None
@@ -21,6 +26,7 @@ class Straub2010Nf(VolumeBasedFragmentationFunction):
 
     def register(self, builder):
         super().register(builder)
+        self.tables = self.lookup_tables(self.particulator.backend)
         self.max_size = self.particulator.PairwiseStorage.empty(
             self.particulator.n_sd // 2, dtype=float
         )
@@ -39,6 +45,11 @@ class Straub2010Nf(VolumeBasedFragmentationFunction):
                 self.particulator.n_sd // 2, dtype=float
             )
 
+    def lookup_tables(self, backend):
+        if self.tabulate and hasattr(backend, "straub_lookup_tables"):
+            return backend.straub_lookup_tables()
+        return None
+
     def compute_fragment_number_and_volumes(
         self, nf, frag_volume, u01, is_first_in_pair
     ):
@@ -98,4 +109,5 @@ class Straub2010Nf(VolumeBasedFragmentationFunction):
             Nr4=self.straub_tmp["Nr4"],
             Nrt=self.straub_tmp["Nrt"],
             d34=self.straub_tmp["d34"],
+            tables=self.tables,
         )
@@ -16,9 +16,20 @@ import numpy as np
 
 from PySDM.attributes.impl import get_attribute_class
 from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
-from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
-from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.breakup_fragmentations import (
+    AlwaysN,
+    Exponential,
+    Gaussian,
+    LowList1982Nf,
+    Straub2010Nf,
+)
+from PySDM.dynamics.collisions.coalescence_efficiencies import (
+    ConstEc,
+    LowList1982Ec,
+    Straub2010Ec,
+)
 from PySDM.dynamics.impl.random_generator_optimizer import RandomGeneratorOptimizer
+from PySDM.impl import checkpoint
 from PySDM.dynamics.impl.random_generator_optimizer_nopair import (
     RandomGeneratorOptimizerNoPair,
 )
@@ -36,6 +47,32 @@ DEFAULTS = namedtuple(
     max_multiplicity=get_attribute_class("multiplicity").MAX_VALUE // int(2e5),
 )
 
+FUSED_COALESCENCE_EFFICIENCIES = {
+    ConstEc: (),
+    Straub2010Ec: ("relative fall velocity",),
+    LowList1982Ec: ("radius", "relative fall velocity"),
+}
+""" coalescence efficiencies supported by the fused breakup pass (mapped onto
+the attributes they depend on other than volume and water mass) """
+
+FUSED_FRAGMENTATIONS = {
+    Gaussian: (),
+    Exponential: (),
+    Straub2010Nf: ("radius", "relative fall velocity"),
+    LowList1982Nf: ("radius", "relative fall velocity"),
+}
+""" fragmentation functions supported by the fused breakup pass (mapped onto
+the attributes they depend on other than volume and water mass) """
+
+
+def fused_variant(component, variants):
+    """returns the key of `variants` (e.g., `FUSED_COALESCENCE_EFFICIENCIES` or
+    `FUSED_FRAGMENTATIONS`) which is the class of `component`, or `None` if the
+    fused breakup pass does not support it; subclasses are not matched as the
+    fused pass would not run their overridden methods"""
+    cls = type(component)
+    return cls if cls in variants else None
+
 
 @register_dynamic()
 class Collision:  # pylint: disable=too-many-instance-attributes
@@ -53,7 +90,14 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         dt_coal_range=DEFAULTS.dt_coal_range,
         enable_breakup: bool = True,
         warn_overflows: bool = True,
+        fused: bool = True,
     ):
+        """with `fused=True`, coalescence efficiencies and fragment masses are evaluated
+        per pair within the coalescence/breakup pass (see
+        `PySDM.particulator.Particulator.collision_coalescence_breakup_fused`), where
+        supported by the backend and by the chosen efficiencies and fragmentation
+        function (see `FUSED_COALESCENCE_EFFICIENCIES` and `FUSED_FRAGMENTATIONS`),
+        skipping the pairwise temporary storages"""
         assert substeps == 1 or adaptive is False
 
         self.particulator = None
@@ -61,6 +105,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.enable = True
         self.enable_breakup = enable_breakup
         self.warn_overflows = warn_overflows
+        self.fused = fused
+        self.fused_args = None
         self.max_multiplicity = DEFAULTS.max_multiplicity
 
         self.collision_kernel = collision_kernel
@@ -72,6 +118,7 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.rnd_opt_coll = None
         self.rnd_opt_proc = None
         self.optimised_random = None
+        self.keyed_rand = None
 
         assert dt_coal_range[0] > 0
         self.croupier = croupier
@@ -98,14 +145,22 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.breakup_rate = None
         self.breakup_rate_deficit = None
 
-    def register(self, builder):
+    def register(self, builder):  # pylint: disable=too-many-statements
         self.particulator = builder.particulator
         rnd_args = {
             "optimized_random": self.optimized_random,
             "dt_min": self.dt_coal_range[0],
             "seed": builder.formulae.seed,
         }
-        self.rnd_opt_coll = RandomGeneratorOptimizer(**rnd_args)
+        # with counter-based random numbers, gamma is drawn keyed on super-droplet ids
+        self.keyed_rand = getattr(
+            self.particulator.backend, "counter_based_random", False
+        )
+        if self.keyed_rand:
+            builder.request_attribute("super droplet id")
+        self.rnd_opt_coll = RandomGeneratorOptimizer(
+            **rnd_args, keyed_rand=self.keyed_rand
+        )
         if self.enable_breakup:
             self.rnd_opt_proc = RandomGeneratorOptimizerNoPair(**rnd_args)
             self.rnd_opt_frag = RandomGeneratorOptimizerNoPair(**rnd_args)
@@ -148,7 +203,29 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         )
         self.coalescence_rate = self.particulator.Storage.from_ndarray(*counter_args)
 
-        if self.enable_breakup:
+        self.fused = (
+            self.fused
+            and self.enable_breakup
+            and hasattr(
+                self.particulator.backend, "collision_coalescence_breakup_fused"
+            )
+            and fused_variant(
+                self.compute_coalescence_efficiency, FUSED_COALESCENCE_EFFICIENCIES
+            )
+            is not None
+            and fused_variant(self.compute_breakup_efficiency, (ConstEb,)) is not None
+            and fused_variant(self.compute_number_of_fragments, FUSED_FRAGMENTATIONS)
+            is not None
+        )
+        if self.fused:
+            self.fused_args = self.__make_fused_args(builder)
+            self.rnd_opt_proc.register(builder)
+            self.rnd_opt_frag.register(builder)
+            self.breakup_rate = self.particulator.Storage.from_ndarray(*counter_args)
+            self.breakup_rate_deficit = self.particulator.Storage.from_ndarray(
+                *counter_args
+            )
+        elif self.enable_breakup:
             self.n_fragment = self.particulator.PairwiseStorage.empty(
                 **empty_args_pairwise
             )
@@ -171,6 +248,76 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 *counter_args
             )
 
+    def __make_fused_args(self, builder):
+        efficiency = self.compute_coalescence_efficiency
+        fragmentation = self.compute_number_of_fragments
+        efficiency_variant = fused_variant(efficiency, FUSED_COALESCENCE_EFFICIENCIES)
+        fragmentation_variant = fused_variant(fragmentation, FUSED_FRAGMENTATIONS)
+        attributes = (
+            "volume",
+            *FUSED_COALESCENCE_EFFICIENCIES[efficiency_variant],
+            *FUSED_FRAGMENTATIONS[fragmentation_variant],
+        )
+        for attribute in attributes:
+            builder.request_attribute(attribute)
+        # in place of `fragmentation.register()` which is not called in the fused mode
+        fragmentation.tables = fragmentation.lookup_tables(self.particulator.backend)
+        if isinstance(fragmentation, Gaussian):
+            fragmentation_params = (fragmentation.mu, fragmentation.sigma)
+        elif isinstance(fragmentation, Exponential):
+            fragmentation_params = (fragmentation.scale, 0.0)
+        else:
+            fragmentation_params = (0.0, 0.0)
+        return {
+            "coalescence_efficiency": efficiency_variant.__name__,
+            "Ec": efficiency.Ec if isinstance(efficiency, ConstEc) else np.nan,
+            "Eb": self.compute_breakup_efficiency.Eb,
+            "fragmentation": fragmentation_variant.__name__,
+            "fragmentation_params": fragmentation_params,
+            "fragmentation_tables": fragmentation.tables,
+            "vmin": fragmentation.vmin,
+            "nfmax": fragmentation.nfmax,
+            "pair_attributes": {
+                # attributes not used by the chosen formulae are substituted with volume
+                key: name if name in attributes else "volume"
+                for key, name in (
+                    ("volume", "volume"),
+                    ("radius", "radius"),
+                    ("relative_fall_velocity", "relative fall velocity"),
+                )
+            },
+        }
+
+    def __checkpointed(self):
+        storages = {
+            "dt_left": self.dt_left,
+            "stats_n_substep": self.stats_n_substep,
+            "stats_dt_min": self.stats_dt_min,
+            "collision_rate": self.collision_rate,
+            "collision_rate_deficit": self.collision_rate_deficit,
+            "coalescence_rate": self.coalescence_rate,
+        }
+        generators = {"coll": self.rnd_opt_coll.rnd}
+        if self.enable_breakup:
+            storages["breakup_rate"] = self.breakup_rate
+            storages["breakup_rate_deficit"] = self.breakup_rate_deficit
+            generators["proc"] = self.rnd_opt_proc.rnd
+            generators["frag"] = self.rnd_opt_frag.rnd
+        return storages, generators
+
+    def checkpoint_state(self):
+        storages, generators = self.__checkpointed()
+        return {
+            "storages": checkpoint.download(storages),
+            "generators": {key: rnd.get_state() for key, rnd in generators.items()},
+        }
+
+    def restore_checkpoint_state(self, state):
+        storages, generators = self.__checkpointed()
+        checkpoint.upload(storages, state["storages"])
+        for key, rnd in generators.items():
+            rnd.set_state(state["generators"][key])
+
     def __call__(self):
         if self.enable:
             if not self.adaptive:
@@ -194,44 +341,73 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 self.rnd_opt_frag.reset()
 
     def step(self):
+        profiler = self.particulator.profiler
         pairs_rand, rand = self.rnd_opt_coll.get_random_arrays()
 
-        self.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
-            self.is_first_in_pair, pairs_rand
-        )
+        with profiler.span("permutation"):
+            self.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
+                self.is_first_in_pair, pairs_rand
+            )
 
         prob = self.gamma
-        self.compute_probabilities_of_collision(self.is_first_in_pair, out=prob)
+        with profiler.span("kernel"):
+            self.compute_probabilities_of_collision(self.is_first_in_pair, out=prob)
 
         if self.enable_breakup:
             proc_rand = self.rnd_opt_proc.get_random_arrays()
             rand_frag = self.rnd_opt_frag.get_random_arrays()
-            self.compute_coalescence_efficiency(self.Ec_temp, self.is_first_in_pair)
-            self.compute_breakup_efficiency(self.Eb_temp, self.is_first_in_pair)
-            self.compute_number_of_fragments(
-                self.n_fragment, self.fragment_mass, rand_frag, self.is_first_in_pair
-            )
-        else:
+        if self.enable_breakup and not self.fused:
+            with profiler.span("efficiencies and fragmentation"):
+                self.compute_coalescence_efficiency(self.Ec_temp, self.is_first_in_pair)
+                self.compute_breakup_efficiency(self.Eb_temp, self.is_first_in_pair)
+                self.compute_number_of_fragments(
+                    self.n_fragment,
+                    self.fragment_mass,
+                    rand_frag,
+                    self.is_first_in_pair,
+                )
+        elif not self.enable_breakup:
             proc_rand = None
 
-        self.compute_gamma(
-            prob=prob, rand=rand, is_first_in_pair=self.is_first_in_pair, out=self.gamma
-        )
+        with profiler.span("gamma"):
+            self.compute_gamma(
+                prob=prob,
+                rand=rand,
+                is_first_in_pair=self.is_first_in_pair,
+                out=self.gamma,
+            )
 
-        self.particulator.collision_coalescence_breakup(
-            enable_breakup=self.enable_breakup,
-            gamma=self.gamma,
-            rand=proc_rand,
-            Ec=self.Ec_temp,
-            Eb=self.Eb_temp,
-            fragment_mass=self.fragment_mass,
-            coalescence_rate=self.coalescence_rate,
-            breakup_rate=self.breakup_rate,
-            breakup_rate_deficit=self.breakup_rate_deficit,
-            is_first_in_pair=self.is_first_in_pair,
-            warn_overflows=self.warn_overflows,
-            max_multiplicity=self.max_multiplicity,
-        )
+        if self.fused:
+            with profiler.span("coalescence/breakup"):
+                self.particulator.collision_coalescence_breakup_fused(
+                    gamma=self.gamma,
+                    rand=proc_rand,
+                    rand_frag=rand_frag,
+                    coalescence_rate=self.coalescence_rate,
+                    breakup_rate=self.breakup_rate,
+                    breakup_rate_deficit=self.breakup_rate_deficit,
+                    is_first_in_pair=self.is_first_in_pair,
+                    warn_overflows=self.warn_overflows,
+                    max_multiplicity=self.max_multiplicity,
+                    **self.fused_args,
+                )
+            return
+
+        with profiler.span("coalescence/breakup"):
+            self.particulator.collision_coalescence_breakup(
+                enable_breakup=self.enable_breakup,
+                gamma=self.gamma,
+                rand=proc_rand,
+                Ec=self.Ec_temp,
+                Eb=self.Eb_temp,
+                fragment_mass=self.fragment_mass,
+                coalescence_rate=self.coalescence_rate,
+                breakup_rate=self.breakup_rate,
+                breakup_rate_deficit=self.breakup_rate_deficit,
+                is_first_in_pair=self.is_first_in_pair,
+                warn_overflows=self.warn_overflows,
+                max_multiplicity=self.max_multiplicity,
+            )
 
     def toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
         self, is_first_in_pair, u01
@@ -287,6 +463,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             collision_rate=self.collision_rate,
             is_first_in_pair=is_first_in_pair,
             out=out,
+            **(
+                {"super_droplet_id": self.particulator.attributes["super droplet id"]}
+                if self.keyed_rand
+                else {}
+            ),
         )
 
 
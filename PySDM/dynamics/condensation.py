@@ -8,6 +8,7 @@ from collections import namedtuple
 
 import numpy as np
 
+from PySDM.impl import checkpoint
 from PySDM.physics import si
 from PySDM.dynamics.impl import register_dynamic
 
@@ -74,7 +75,12 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         builder.request_attribute("dry volume organic fraction")
         builder.request_attribute("Reynolds number")
 
-        for counter in ("n_substeps", "n_activating", "n_deactivating", "n_ripening"):
+        for counter in (
+            "n_substeps",
+            "n_activating",
+            "n_deactivating",
+            "n_ripening",
+        ):
             self.counters[counter] = self.particulator.Storage.empty(
                 self.particulator.mesh.n_cell, dtype=int
             )
@@ -82,6 +88,10 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 self.counters[counter][:] = self.__substeps if not self.adaptive else -1
             else:
                 self.counters[counter][:] = -1
+        # note: only written to by the Numba backend (zero solves saved otherwise)
+        self.counters["n_saved_solves"] = self.particulator.Storage.from_ndarray(
+            np.zeros(self.particulator.mesh.n_cell, dtype=int)
+        )
 
         self.rh_max = self.particulator.Storage.empty(
             self.particulator.mesh.n_cell, dtype=float
@@ -93,6 +103,18 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.success[:] = False
         self.cell_order = np.arange(self.particulator.mesh.n_cell)
 
+    def checkpoint_state(self):
+        return {
+            "counters": checkpoint.download(self.counters),
+            "rh_max": self.rh_max.to_ndarray(),
+            "success": self.success.to_ndarray(),
+        }
+
+    def restore_checkpoint_state(self, state):
+        checkpoint.upload(self.counters, state["counters"])
+        self.rh_max.upload(np.asarray(state["rh_max"]))
+        self.success.upload(np.asarray(state["success"]))
+
     def __call__(self):
         if self.enable:
             if self.schedule == "dynamic":
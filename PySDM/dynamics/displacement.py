@@ -4,7 +4,10 @@ particle displacement due to advection by the flow & sedimentation
 adaptive time-stepping controlled by comparing implicit-Euler (I)
 and explicit-Euler (E) maximal displacements with:
 rtol > |(I - E) / E|
-(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015))
+(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015)),
+with the number of substeps evaluated for each cell, and used either as the
+domain-wide maximum (default) or, with `substeps_per_cell=True`, as such (supported
+by the fused backend implementation only)
 """
 
 from collections import namedtuple
@@ -13,7 +16,9 @@ import numpy as np
 
 from PySDM.dynamics.impl import register_dynamic
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "fused", "substeps_per_cell"))(
+    rtol=1e-2, adaptive=True, fused=False, substeps_per_cell=False
+)
 
 
 @register_dynamic()
@@ -24,11 +29,20 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        fused=DEFAULTS.fused,
+        substeps_per_cell=DEFAULTS.substeps_per_cell,
     ):  # pylint: disable=too-many-arguments
+        """with `fused=True` (opt-in), each substep is carried out by a single backend
+        pass over super-droplets (see `PySDM.particulator.Particulator.advect_particles`),
+        where supported by the backend; with `substeps_per_cell=True` (requires the
+        fused pass), each super-droplet takes the number of substeps evaluated for the
+        cell it is in, otherwise the domain-wide maximum is used in all cells (and both
+        implementations yield the same results)"""
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
         self.dimension = None
         self.grid = None
+        self.strides = None
         self.courant = None
         self.displacement = None
         self.temp = None
@@ -38,6 +52,9 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.adaptive = adaptive
         self.rtol = rtol
         self._n_substeps = 1
+        self.n_substeps_per_cell = None
+        self.fused = fused
+        self.substeps_per_cell = substeps_per_cell
 
     def register(self, builder):
         builder.request_attribute("relative fall velocity")
@@ -46,6 +63,17 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.grid = self.particulator.Storage.from_ndarray(
             np.array(builder.particulator.environment.mesh.grid, dtype=np.int64)
         )
+        self.strides = self.particulator.Storage.from_ndarray(
+            np.asarray(builder.particulator.environment.mesh.strides, dtype=np.int64)
+        )
+        self.fused = self.fused and hasattr(
+            self.particulator.backend, "advect_particles"
+        )
+        if self.substeps_per_cell and not self.fused:
+            raise NotImplementedError(
+                "substeps_per_cell=True requires the fused implementation"
+                " (fused=True and a backend providing advect_particles)"
+            )
         if self.dimension == 1:
             courant_field = (np.full(self.grid[0] + 1, np.nan),)
         elif self.dimension == 2:
@@ -71,31 +99,57 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.temp = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
         )
+        self.n_substeps_per_cell = self.particulator.Storage.from_ndarray(
+            np.full(self.particulator.mesh.n_cell, self._n_substeps, dtype=np.int64)
+        )
+
+    def checkpoint_state(self):
+        return {
+            "courant": {
+                str(i): component.to_ndarray()
+                for i, component in enumerate(self.courant)
+            },
+            "n_substeps": self._n_substeps,
+            "n_substeps_per_cell": self.n_substeps_per_cell.to_ndarray(),
+            "precipitation_mass_in_last_step": self.precipitation_mass_in_last_step,
+        }
+
+    def restore_checkpoint_state(self, state):
+        for i, component in enumerate(self.courant):
+            component.upload(np.asarray(state["courant"][str(i)]))
+        self._n_substeps = state["n_substeps"]
+        self.n_substeps_per_cell.upload(np.asarray(state["n_substeps_per_cell"]))
+        self.precipitation_mass_in_last_step = state["precipitation_mass_in_last_step"]
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
         if self.adaptive:
-            error_estimate = self.rtol
-            self._n_substeps = 0.5
-            while error_estimate >= self.rtol:
-                self._n_substeps = int(self._n_substeps * 2)
-                error_estimate = 0
-                for i, courant_component in enumerate(courant_field):
-                    max_abs_delta_courant = np.amax(
-                        np.abs(np.diff(courant_component, axis=i))
-                    )
-                    max_abs_delta_courant /= self._n_substeps
-                    error_estimate = max(
-                        error_estimate,
-                        (
-                            0
-                            if max_abs_delta_courant == 0
-                            else 1 / (1 / max_abs_delta_courant - 1)
-                        ),
+            max_abs_delta_courant = np.amax(
+                [
+                    np.abs(np.diff(courant_component, axis=i))
+                    for i, courant_component in enumerate(courant_field)
+                ],
+                axis=0,
+            )
+            n_substeps = np.ones(max_abs_delta_courant.shape, dtype=np.int64)
+            while True:
+                with np.errstate(divide="ignore"):
+                    error_estimate = np.where(
+                        max_abs_delta_courant == 0,
+                        0,
+                        1 / (1 / (max_abs_delta_courant / n_substeps) - 1),
                     )
+                too_coarse = error_estimate >= self.rtol
+                if not too_coarse.any():
+                    break
+                n_substeps[too_coarse] *= 2
+            self._n_substeps = int(np.amax(n_substeps))
+            if self.substeps_per_cell:
+                self.n_substeps_per_cell.upload(n_substeps.ravel())
+            else:
+                self.n_substeps_per_cell[:] = self._n_substeps
 
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
@@ -103,20 +157,31 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         position_in_cell = self.particulator.attributes["position in cell"]
 
         self.precipitation_mass_in_last_step = 0.0
-        for _ in range(self._n_substeps):
-            self.calculate_displacement(
-                self.displacement, self.courant, cell_origin, position_in_cell
+        if self.fused:
+            self.precipitation_mass_in_last_step = self.particulator.advect_particles(
+                displacement=self.displacement,
+                courant=self.courant,
+                n_substeps=self.n_substeps_per_cell,
+                grid=self.grid,
+                strides=self.strides,
+                enable_sedimentation=self.enable_sedimentation,
+                precipitation_counting_level_index=self.precipitation_counting_level_index,
             )
-            self.update_position(position_in_cell, self.displacement)
-            if self.enable_sedimentation:
-                self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
-                    displacement=self.displacement,
-                    precipitation_counting_level_index=self.precipitation_counting_level_index,
+        else:
+            for _ in range(self._n_substeps):
+                self.calculate_displacement(
+                    self.displacement, self.courant, cell_origin, position_in_cell
                 )
-            self.particulator.flag_out_of_column()
-            self.update_cell_origin(cell_origin, position_in_cell)
-            self.boundary_condition(cell_origin)
-            self.particulator.recalculate_cell_id()
+                self.update_position(position_in_cell, self.displacement)
+                if self.enable_sedimentation:
+                    self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
+                        displacement=self.displacement,
+                        precipitation_counting_level_index=self.precipitation_counting_level_index,
+                    )
+                self.particulator.flag_out_of_column()
+                self.update_cell_origin(cell_origin, position_in_cell)
+                self.boundary_condition(cell_origin)
+                self.particulator.recalculate_cell_id()
 
         for key in ("position in cell", "cell origin", "cell id"):
             self.particulator.attributes.mark_updated(key)
@@ -14,6 +14,12 @@ class EulerianAdvection:
     def register(self, builder):
         self.particulator = builder.particulator
 
+    def checkpoint_state(self):
+        return {"solvers": self.solvers.checkpoint_state()}
+
+    def restore_checkpoint_state(self, state):
+        self.solvers.restore_checkpoint_state(state["solvers"])
+
     def __call__(self):
         for field in ("water_vapour_mixing_ratio", "thd"):
             self.particulator.environment.get_predicted(field).download(
@@ -74,6 +74,13 @@ class Freezing:  # pylint: disable=too-many-instance-attributes
                 self.particulator.n_sd, self.particulator.formulae.seed
             )
 
+    def checkpoint_state(self):
+        return {"generator": None if self.rng is None else self.rng.get_state()}
+
+    def restore_checkpoint_state(self, state):
+        if self.rng is not None:
+            self.rng.set_state(state["generator"])
+
     def __call__(self):
         if "Coalescence" in self.particulator.dynamics:
             # TODO #594
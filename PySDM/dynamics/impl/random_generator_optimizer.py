@@ -6,9 +6,13 @@ import math
 
 
 class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
-    def __init__(self, optimized_random, dt_min, seed):
+    def __init__(self, optimized_random, dt_min, seed, keyed_rand=False):
+        """with `keyed_rand`, instead of the `rand` array, a (seed, step) pair
+        is returned for drawing numbers within kernels keyed on super-droplet ids
+        (requires a backend `Random` class offering `reserve_step()`)"""
         self.particulator = None
         self.optimized_random = optimized_random
+        self.keyed_rand = keyed_rand
         self.dt_min = dt_min
         self.seed = seed
         self.substep = 0
@@ -26,9 +30,10 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
         self.pairs_rand = self.particulator.Storage.empty(
             self.particulator.n_sd + shift, dtype=float
         )
-        self.rand = self.particulator.Storage.empty(
-            self.particulator.n_sd // 2, dtype=float
-        )
+        if not self.keyed_rand:
+            self.rand = self.particulator.Storage.empty(
+                self.particulator.n_sd // 2, dtype=float
+            )
         self.rnd = self.particulator.Random(self.particulator.n_sd + shift, self.seed)
 
     def reset(self):
@@ -39,10 +44,13 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
             shift = self.substep
             if self.substep == 0:
                 self.pairs_rand.urand(self.rnd)
-                self.rand.urand(self.rnd)
+                if not self.keyed_rand:
+                    self.rand.urand(self.rnd)
         else:
             shift = 0
             self.pairs_rand.urand(self.rnd)
-            self.rand.urand(self.rnd)
+            if not self.keyed_rand:
+                self.rand.urand(self.rnd)
         self.substep += 1
-        return self.pairs_rand[shift : self.particulator.n_sd + shift], self.rand
+        rand = self.rnd.reserve_step() if self.keyed_rand else self.rand
+        return self.pairs_rand[shift : self.particulator.n_sd + shift], rand
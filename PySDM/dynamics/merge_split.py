@@ -0,0 +1,74 @@
+"""super-droplet merge/split management: periodically merges near-identical
+ low-multiplicity super-droplets and splits high-multiplicity ones into unused
+ slots (e.g., freed by coalescence or removal), keeping the number of
+ super-droplets (and hence the cost of a step) within user-set bounds"""
+
+import numpy as np
+
+from PySDM.dynamics.impl import register_dynamic
+
+
+@register_dynamic()
+class MergeSplit:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        *,
+        merge_multiplicity_threshold: int,
+        split_multiplicity_threshold: int,
+        rtol: float = 0.01,
+        count_per_cell_range: tuple = (0, np.inf),
+        interval: int = 1,
+    ):
+        """super-droplets with multiplicity not exceeding `merge_multiplicity_threshold`
+        and with all extensive attributes equal within `rtol` are merged pairwise
+        (in cells holding more than `count_per_cell_range[0]` super-droplets),
+        super-droplets with multiplicity exceeding `split_multiplicity_threshold`
+        are split into two halves (in cells holding less than
+        `count_per_cell_range[1]` super-droplets, and as long as there are unused
+        slots among the `n_sd` ones); done every `interval` steps; merging and
+        splitting conserve the totals of multiplicity and of extensive attributes
+        """
+        assert merge_multiplicity_threshold < split_multiplicity_threshold
+        assert count_per_cell_range[0] < count_per_cell_range[1]
+        assert interval > 0
+        self.merge_multiplicity_threshold = merge_multiplicity_threshold
+        self.split_multiplicity_threshold = split_multiplicity_threshold
+        self.rtol = rtol
+        self.count_per_cell_range = count_per_cell_range
+        self.interval = interval
+        self.particulator = None
+        self.source = None
+        self.destination = None
+        self.counters = {"merges": 0, "splits": 0}
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+        self.source = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=np.int64
+        )
+        self.destination = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=np.int64
+        )
+
+    def checkpoint_state(self):
+        return {"counters": dict(self.counters)}
+
+    def restore_checkpoint_state(self, state):
+        self.counters.update(state["counters"])
+
+    def __call__(self):
+        if self.particulator.n_steps % self.interval != 0:
+            return
+        self.counters["merges"] += self.particulator.merge_super_droplets(
+            multiplicity_threshold=self.merge_multiplicity_threshold,
+            rtol=self.rtol,
+            min_count_per_cell=self.count_per_cell_range[0],
+        )
+        self.counters["splits"] += self.particulator.split_super_droplets(
+            multiplicity_threshold=self.split_multiplicity_threshold,
+            max_count_per_cell=min(
+                self.count_per_cell_range[1], np.iinfo(np.int64).max
+            ),
+            source=self.source,
+            destination=self.destination,
+        )
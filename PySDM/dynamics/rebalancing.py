@@ -0,0 +1,83 @@
+"""per-cell super-droplet count rebalancing: periodically merges super-droplets
+ in cells holding more than a target count and splits them in cells holding
+ fewer (see `PySDM.products.housekeeping.super_droplet_count_imbalance` for
+ a measure of the resultant balance)"""
+
+import math
+
+import numpy as np
+
+from PySDM.attributes.impl import get_attribute_class
+from PySDM.dynamics.impl import register_dynamic
+
+
+@register_dynamic()
+class Rebalancing:  # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        *,
+        target_count_per_cell: int,
+        tolerance: float = 0.25,
+        rtol: float = 0.01,
+        interval: int = 1,
+    ):
+        """in cells with more than `(1 + tolerance) * target_count_per_cell`
+        super-droplets, pairs of super-droplets neighbouring in the order of the
+        first extensive attribute (and with all extensive attributes equal within
+        `rtol`, and with multiplicities small enough for their sum not to overflow)
+        are merged until the count drops to that bound; in cells with less
+        than `(1 - tolerance) * target_count_per_cell` super-droplets, ones with
+        multiplicity greater than one are split in halves (each at most once per
+        call, i.e., at most doubling the count) into unused slots until the count
+        reaches that bound; empty cells cannot be populated; done every `interval`
+        steps conserving totals of multiplicity and of extensive attributes
+        (see `PySDM.dynamics.merge_split.MergeSplit`)"""
+        assert target_count_per_cell > 0
+        assert 0 <= tolerance < 1
+        assert interval > 0
+        self.target_count_per_cell = target_count_per_cell
+        self.tolerance = tolerance
+        self.rtol = rtol
+        self.interval = interval
+        self.particulator = None
+        self.source = None
+        self.destination = None
+        self.counters = {"merges": 0, "splits": 0}
+
+    @property
+    def count_per_cell_range(self):
+        return (
+            math.ceil((1 - self.tolerance) * self.target_count_per_cell),
+            math.floor((1 + self.tolerance) * self.target_count_per_cell),
+        )
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+        self.source = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=np.int64
+        )
+        self.destination = self.particulator.Storage.empty(
+            self.particulator.n_sd, dtype=np.int64
+        )
+
+    def checkpoint_state(self):
+        return {"counters": dict(self.counters)}
+
+    def restore_checkpoint_state(self, state):
+        self.counters.update(state["counters"])
+
+    def __call__(self):
+        if self.particulator.n_steps % self.interval != 0:
+            return
+        min_count, max_count = self.count_per_cell_range
+        self.counters["merges"] += self.particulator.merge_super_droplets(
+            multiplicity_threshold=get_attribute_class("multiplicity").MAX_VALUE // 2,
+            rtol=self.rtol,
+            min_count_per_cell=max_count,
+        )
+        self.counters["splits"] += self.particulator.split_super_droplets(
+            multiplicity_threshold=1,
+            max_count_per_cell=min_count,
+            source=self.source,
+            destination=self.destination,
+        )
@@ -67,6 +67,18 @@ class Seeding:
             )
         )
 
+    def checkpoint_state(self):
+        return {
+            "set up": self.index is not None,
+            "generator": None if self.rnd is None else self.rnd.get_state(),
+        }
+
+    def restore_checkpoint_state(self, state):
+        if state["set up"]:
+            self.post_register_setup_when_attributes_are_known()
+        if self.rnd is not None:
+            self.rnd.set_state(state["generator"])
+
     def __call__(self):
         if self.particulator.n_steps == 0:
             self.post_register_setup_when_attributes_are_known()
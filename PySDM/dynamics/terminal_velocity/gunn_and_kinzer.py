@@ -9,6 +9,7 @@ import numpy as np
 from scipy.interpolate import Rbf
 
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.physics import constants as const
 
 
@@ -169,7 +170,7 @@ class TpDependent:
 
         c4 = np.array([10.5035, 1.08750, -0.133245, -0.00659969])
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
+        @njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
         def f4(r):
             return (n0 / n) * (1 + 1.255 * l / r) / (1 + 1.255 * l0 / r)
 
@@ -186,7 +187,7 @@ class TpDependent:
             )
         )
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
+        @njit(**{**conf.JIT_FLAGS, "cache": False, "parallel": False})
         def f8(r):
             result = 1.058 * ec - 1.104 * es
             result *= (6.21 + np.log(r)) / 5.01
@@ -194,7 +195,7 @@ class TpDependent:
             result += 1
             return result
 
-        @numba.njit(**{**conf.JIT_FLAGS, "cache": False})
+        @njit(**{**conf.JIT_FLAGS, "cache": False})
         def terminal_velocity(values, radius, threshold):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 if radius[i] < 0:
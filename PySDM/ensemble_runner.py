@@ -0,0 +1,153 @@
+"""
+The EnsembleRunner class fanning out independent simulations (e.g., differing in
+ random seeds or settings) across a pool of worker processes, with product values
+ streamed back to the calling process step by step
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from PySDM.backends.impl_numba.kernel_cache import kernel_cache
+from PySDM.formulae import Formulae
+
+_WORKER = {}
+
+
+def _init_worker(backend_class, formulae_kwargs, kernel_cache_directory):
+    if kernel_cache_directory is not None and not kernel_cache.enabled:
+        kernel_cache.enable(kernel_cache_directory)
+    _WORKER.clear()
+    _WORKER["backend_class"] = backend_class
+    _WORKER["formulae_kwargs"] = formulae_kwargs
+    _WORKER["backend"] = None
+
+
+def _warm_backend(seed):
+    """returns the worker's backend (instantiated once, hence with kernels compiled
+    once per worker), with formulae seed set to the one of a given member (or reset
+    to the one the backend was instantiated with if `seed` is None)"""
+    if _WORKER["backend"] is None:
+        _WORKER["backend"] = _WORKER["backend_class"](
+            Formulae(**_WORKER["formulae_kwargs"])
+        )
+        _WORKER["seed"] = _WORKER["backend"].formulae.seed
+    backend = _WORKER["backend"]
+    backend.formulae.seed = _WORKER["seed"] if seed is None else seed
+    return backend
+
+
+def _simulate(*, member_id, member, setup, steps, product_names, emit):
+    member = dict(member)
+    particulator = setup(_warm_backend(member.pop("seed", None)), **member)
+    names = product_names or tuple(particulator.products.keys())
+    for step in steps:
+        particulator.run(step - particulator.n_steps)
+        emit(
+            (
+                member_id,
+                step,
+                {name: particulator.products[name].get().copy() for name in names},
+            )
+        )
+
+
+def _run_member(*, queue, **kwargs):
+    try:
+        _simulate(emit=queue.put, **kwargs)
+    finally:
+        queue.put((kwargs["member_id"], None, None))
+
+
+class EnsembleRunner:  # pylint: disable=too-few-public-methods
+    """runs a set of members, each being a dict of keyword arguments passed to
+    `setup(backend, **member)` which is expected to return a built
+    `PySDM.particulator.Particulator`; a `seed` key, if present, is not passed to
+    `setup` but is set as the worker backend's `formulae.seed` instead (members
+    without a `seed` key run with the seed resulting from `formulae_kwargs`).
+    The `setup` callable needs to be picklable (e.g., a module-level function).
+    Each worker process instantiates one backend (with `Formulae(**formulae_kwargs)`)
+    and reuses it, together with its compiled kernels, for all members it runs;
+    the on-disk kernel cache, if enabled, is enabled in the workers as well."""
+
+    def __init__(
+        self,
+        *,
+        setup: Callable,
+        backend_class,
+        formulae_kwargs: Optional[dict] = None,
+        n_workers: Optional[int] = None,
+        mp_context=None,
+    ):
+        self.setup = setup
+        self.backend_class = backend_class
+        self.formulae_kwargs = formulae_kwargs or {}
+        self.n_workers = n_workers or multiprocessing.cpu_count()
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(
+        self,
+        members: Iterable[dict],
+        *,
+        steps: Iterable[int],
+        product_names: Optional[Iterable[str]] = None,
+    ):
+        """generator yielding `(member_id, step, {product_name: value})` tuples
+        as soon as they are computed (i.e., in an undefined order across members
+        but in order of `steps` for a given member), with `member_id` being the
+        index of the member in `members`; with `n_workers=1` members are run
+        one after another in the calling process"""
+        members = tuple(members)
+        kwargs = {
+            "setup": self.setup,
+            "steps": tuple(steps),
+            "product_names": None if product_names is None else tuple(product_names),
+        }
+        initargs = (self.backend_class, self.formulae_kwargs, kernel_cache.directory)
+
+        if self.n_workers == 1:
+            _init_worker(*initargs)
+            results = []
+            for member_id, member in enumerate(members):
+                _simulate(
+                    member_id=member_id, member=member, emit=results.append, **kwargs
+                )
+                yield from results
+                results.clear()
+            return
+
+        with self.mp_context.Manager() as manager, ProcessPoolExecutor(
+            max_workers=min(self.n_workers, len(members)) or 1,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=initargs,
+        ) as executor:
+            queue = manager.Queue()
+            futures = [
+                executor.submit(
+                    _run_member,
+                    queue=queue,
+                    member_id=member_id,
+                    member=member,
+                    **kwargs,
+                )
+                for member_id, member in enumerate(members)
+            ]
+            n_running = len(futures)
+            while n_running > 0:
+                item = queue.get()
+                if item[1] is None:
+                    n_running -= 1
+                    futures[item[0]].result()
+                else:
+                    yield item
+
+    def run_to_dict(self, members: Iterable[dict], **kwargs):
+        """runs all members and returns a list (one element per member) of dicts
+        of lists of product values (one element per step)"""
+        members = tuple(members)
+        output = [{} for _ in members]
+        for member_id, _, values in self.run(members, **kwargs):
+            for name, value in values.items():
+                output[member_id].setdefault(name, []).append(value)
+        return output
@@ -4,6 +4,7 @@ Bare zero-dimensional framework
 
 import numpy as np
 
+from PySDM.impl import checkpoint
 from PySDM.impl.mesh import Mesh
 from PySDM.environments.impl import register_environment
 
@@ -27,6 +28,13 @@ class Box:
         else:
             self._ambient_air[key][:] = value
 
+    def checkpoint_state(self):
+        return {"ambient air": checkpoint.download(self._ambient_air)}
+
+    def restore_checkpoint_state(self, state):
+        for key, value in state["ambient air"].items():
+            self[key] = np.asarray(value)[0]
+
     def register(self, builder):
         self.particulator = builder.particulator
 
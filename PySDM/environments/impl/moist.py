@@ -6,6 +6,8 @@ from abc import abstractmethod
 
 import numpy as np
 
+from PySDM.impl import checkpoint
+
 
 class Moist:
     def __init__(self, dt, mesh, variables, mixed_phase=False):
@@ -38,6 +40,17 @@ class Moist:
         self._nan_field = self._allocate(("_",))["_"]
         self._nan_field.fill(np.nan)
 
+    def checkpoint_state(self):
+        assert self._values["predicted"] is None
+        return {
+            "current": checkpoint.download(self._values["current"]),
+            "tmp": checkpoint.download(self._tmp),
+        }
+
+    def restore_checkpoint_state(self, state):
+        checkpoint.upload(self._values["current"], state["current"])
+        checkpoint.upload(self._tmp, state["tmp"])
+
     def _allocate(self, variables):
         result = {}
         for var in variables:
@@ -53,6 +53,22 @@ class Parcel(Moist):  # pylint: disable=too-many-instance-attributes
             rhod_mean, self.mass_of_dry_air
         )
 
+    def checkpoint_state(self):
+        return {
+            **super().checkpoint_state(),
+            "delta_liquid_water_mixing_ratio": np.asarray(
+                self.delta_liquid_water_mixing_ratio
+            ),
+            "dv": np.asarray(self.mesh.dv),
+        }
+
+    def restore_checkpoint_state(self, state):
+        super().restore_checkpoint_state(state)
+        self.delta_liquid_water_mixing_ratio = np.array(
+            state["delta_liquid_water_mixing_ratio"]
+        )[()]
+        self.mesh.dv = np.array(state["dv"])[()]
+
     def register(self, builder):
         formulae = builder.particulator.formulae
 
@@ -0,0 +1,230 @@
+"""
+Ensemble of independent zero-dimensional adiabatic parcels sharing one particulator
+(each parcel is represented by a separate cell, i.e., super-droplets of the i-th
+ member have `cell id` equal to i)
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from PySDM.environments.impl import register_environment
+from PySDM.environments.impl.moist import Moist
+from PySDM.environments.parcel import Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.hygroscopic_equilibrium import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+@register_environment()
+class ParcelEnsemble(Parcel):  # pylint: disable=too-many-instance-attributes
+    """all of `mass_of_dry_air`, `p0`, `T0`, `z0`, `w` and the initial humidity
+    can be given either as scalars (shared by all members) or as sequences of
+    per-member values; `w` can also be a callable of time returning either"""
+
+    def __init__(
+        self,
+        *,
+        dt,
+        mass_of_dry_air: Union[float, np.ndarray],
+        p0: Union[float, np.ndarray],
+        T0: Union[float, np.ndarray],
+        w: Union[float, np.ndarray, callable],
+        z0: Union[float, np.ndarray] = 0,
+        n_members: Optional[int] = None,
+        mixed_phase=False,
+        variables: Optional[List[str]] = None,
+        initial_water_vapour_mixing_ratio: Union[float, np.ndarray] = None,
+        initial_relative_humidity: Union[float, np.ndarray] = None,
+    ):
+        per_member = [
+            np.asarray(value, dtype=float)
+            for value in (
+                mass_of_dry_air,
+                p0,
+                T0,
+                z0,
+                initial_water_vapour_mixing_ratio,
+                initial_relative_humidity,
+                None if callable(w) else w,
+            )
+            if value is not None
+        ]
+        shape = np.broadcast_shapes(*(value.shape for value in per_member))
+        if n_members is None:
+            if len(shape) != 1:
+                raise ValueError(
+                    "n_members must be given if all parameters are scalars"
+                )
+            n_members = shape[0]
+        if np.broadcast_shapes(shape, (n_members,)) != (n_members,):
+            raise ValueError(f"parameter shapes {shape} incompatible with ensemble")
+
+        super().__init__(
+            dt=dt,
+            mass_of_dry_air=self._broadcast(mass_of_dry_air, n_members),
+            p0=self._broadcast(p0, n_members),
+            T0=self._broadcast(T0, n_members),
+            w=w if callable(w) else self._broadcast(w, n_members),
+            z0=self._broadcast(z0, n_members),
+            mixed_phase=mixed_phase,
+            variables=variables,
+            initial_water_vapour_mixing_ratio=self._broadcast(
+                initial_water_vapour_mixing_ratio, n_members
+            ),
+            initial_relative_humidity=self._broadcast(
+                initial_relative_humidity, n_members
+            ),
+        )
+        self.mesh = Mesh(
+            grid=(n_members,),
+            size=(),
+            n_cell=n_members,
+            dv=np.nan,
+            n_dims=0,
+            strides=(-1,),
+        )
+        self.delta_liquid_water_mixing_ratio = np.full(n_members, np.nan)
+
+    @staticmethod
+    def _broadcast(value, n_members):
+        if value is None:
+            return None
+        return np.broadcast_to(np.asarray(value, dtype=float), (n_members,)).copy()
+
+    @property
+    def n_members(self):
+        return self.mesh.n_cell
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.particulator.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        formulae = builder.particulator.formulae
+
+        if self.initial_relative_humidity is not None:
+            self.initial_water_vapour_mixing_ratio = np.asarray(
+                [
+                    formulae.trivia.water_vapour_mixing_ratio(
+                        p0,
+                        initial_relative_humidity,
+                        formulae.saturation_vapour_pressure.pvs_water(T0),
+                    )
+                    for p0, T0, initial_relative_humidity in zip(
+                        self.p0, self.T0, self.initial_relative_humidity
+                    )
+                ]
+            )
+
+        pd0 = np.asarray(
+            [
+                formulae.trivia.p_d(p0, water_vapour_mixing_ratio)
+                for p0, water_vapour_mixing_ratio in zip(
+                    self.p0, self.initial_water_vapour_mixing_ratio
+                )
+            ]
+        )
+        rhod0 = np.asarray(
+            [
+                formulae.state_variable_triplet.rhod_of_pd_T(pd, T0)
+                for pd, T0 in zip(pd0, self.T0)
+            ]
+        )
+        self.mesh.dv = np.asarray(
+            [
+                formulae.trivia.volume_of_density_mass(rhod, mass_of_dry_air)
+                for rhod, mass_of_dry_air in zip(rhod0, self.mass_of_dry_air)
+            ]
+        )
+
+        Moist.register(self, builder)
+
+        self["water_vapour_mixing_ratio"].upload(self.initial_water_vapour_mixing_ratio)
+        self["thd"].upload(
+            np.asarray([formulae.trivia.th_std(pd, T0) for pd, T0 in zip(pd0, self.T0)])
+        )
+        self["rhod"].upload(rhod0)
+        self["z"].upload(self.z0)
+
+        self._tmp["water_vapour_mixing_ratio"].upload(
+            self.initial_water_vapour_mixing_ratio
+        )
+
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: np.ndarray,
+        kappa: Union[float, np.ndarray],
+        r_dry: np.ndarray,
+        rtol=default_rtol,
+        include_dry_volume_in_attribute: bool = True,
+    ):
+        """`n_in_dv` and `r_dry` are either 1D arrays (same spectrum used for all
+        members) or 2D arrays of shape (n_members, n_sd_per_member); `kappa` is
+        either a scalar or a per-member array"""
+        shape = (self.n_members, np.shape(r_dry)[-1])
+        r_dry = np.broadcast_to(r_dry, shape).ravel()
+        n_in_dv = np.broadcast_to(n_in_dv, shape).ravel()
+        kappa = np.broadcast_to(
+            np.reshape(np.asarray(kappa, dtype=float), (-1, 1)), shape
+        ).ravel()
+        cell_id = np.repeat(np.arange(self.n_members, dtype=np.int64), shape[1])
+
+        attributes = {}
+        dry_volume = self.particulator.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = dry_volume * kappa
+        attributes["multiplicity"] = n_in_dv
+        attributes["cell id"] = cell_id
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=cell_id,
+            rtol=rtol,
+        )
+        attributes["volume"] = self.particulator.formulae.trivia.volume(radius=r_wet)
+        if include_dry_volume_in_attribute:
+            attributes["dry volume"] = dry_volume
+        return attributes
+
+    def advance_parcel_vars(self):
+        """compute new values of displacement, dry-air density and volume
+        of all members, and write them to self._tmp and self.mesh.dv"""
+        dt = self.particulator.dt
+        dz_dt = self._broadcast(
+            self.w((self.particulator.n_steps + 1 / 2) * dt),  # "mid-point"
+            self.n_members,
+        )
+        self.particulator.backend.advance_parcel_vars(
+            dt=dt,
+            dz_dt=dz_dt,
+            T=self["T"],
+            p=self["p"],
+            water_vapour_mixing_ratio=self["water_vapour_mixing_ratio"],
+            delta_liquid_water_mixing_ratio=self.delta_liquid_water_mixing_ratio,
+            rhod=self["rhod"],
+            mass_of_dry_air=self.mass_of_dry_air,
+            z_out=self._tmp["z"],
+            rhod_out=self._tmp["rhod"],
+            dv_out=self.mesh.dv,
+        )
+
+    def sync_parcel_vars(self):
+        self.delta_liquid_water_mixing_ratio = (
+            self._tmp["water_vapour_mixing_ratio"].to_ndarray()
+            - self["water_vapour_mixing_ratio"].to_ndarray()
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
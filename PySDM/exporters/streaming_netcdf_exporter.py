@@ -0,0 +1,183 @@
+"""
+streaming netCDF-4/HDF5 exporter implemented using [h5py](https://www.h5py.org/)
+(optional dependency, imported lazily): product values are appended to chunked
+(and optionally compressed) datasets one output step at a time, with the disk
+writes carried out on a background thread
+"""
+
+import queue
+import threading
+
+import numpy as np
+
+from .netcdf_exporter import DIM_SUFFIX
+
+SPATIAL_DIMS = {1: ("Z",), 2: ("X", "Z"), 3: ("X", "Y", "Z")}
+
+
+class StreamingNetCDFExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with StreamingNetCDFExporter(particulator, filename="output.nc") as exporter:
+        for _ in range(n_outputs):
+            particulator.run(steps_per_output)
+            exporter.write()
+
+    `write()` takes a snapshot of all products and returns while the snapshot is
+    being appended to the file by a background thread; up to `max_pending`
+    snapshots are buffered - if the writer falls behind, `write()` blocks until
+    there is room in the buffer (the number of such stalls is kept in `stalls`)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        particulator,
+        *,
+        filename,
+        compression=None,
+        compression_opts=None,
+        max_pending=2,
+        attributes=None,
+    ):
+        import h5py  # pylint: disable=import-outside-toplevel
+
+        self.particulator = particulator
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.stalls = 0
+        self.n_records = 0
+        self.vars = None
+
+        self._file = h5py.File(filename, mode="w")
+        for key, value in (attributes or {}).items():
+            self._file.attrs[key] = value
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _snapshot(self):
+        snapshot = {}
+        for name, product in self.particulator.products.items():
+            value = np.array(product.get(), dtype=float)
+            if self.particulator.mesh.n_dims == 0 and value.shape[:1] == (1,):
+                value = value[0]
+            snapshot[name] = value
+        return snapshot
+
+    def write(self, time=None):
+        """snapshots product values (at `time` defaulting to the current model time)
+        and enqueues them for writing, blocking if `max_pending` snapshots are
+        already waiting"""
+        self._raise_writer_error()
+        if time is None:
+            time = self.particulator.n_steps * self.particulator.dt
+        record = (time, self._snapshot())
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.stalls += 1
+            self._queue.put(record)
+
+    def close(self):
+        """waits for all enqueued snapshots to be written and closes the file"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._file:
+            self._file.close()
+        self._raise_writer_error()
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("streaming netCDF writer failed") from error
+
+    def _writer_loop(self):
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            if self._error is not None:
+                continue
+            try:
+                self._write_record(*record)
+                self._file.flush()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._error = error
+
+    def _dimension(self, label, values, units):
+        self.vars[label] = self._file.create_dataset(label, data=values)
+        self.vars[label].attrs["units"] = units
+        self.vars[label].make_scale(label)
+
+    def _spatial_dims(self, name, shape):
+        mesh = self.particulator.mesh
+        if tuple(shape) == tuple(mesh.grid) and len(shape) in SPATIAL_DIMS:
+            labels = SPATIAL_DIMS[len(shape)]
+            for index, label in enumerate(labels):
+                if label not in self.vars:
+                    self._dimension(
+                        label,
+                        (mesh.size[index] / mesh.grid[index])
+                        * (1 / 2 + np.arange(mesh.grid[index])),
+                        "metres",
+                    )
+            return labels
+        return tuple(f"{name}_dim_{index}" for index in range(len(shape)))
+
+    def _create_variables(self, snapshot):
+        self.vars = {}
+        self.vars["T"] = self._file.create_dataset(
+            "T", shape=(0,), maxshape=(None,), dtype=float, chunks=(1,)
+        )
+        self.vars["T"].attrs["units"] = "seconds"
+        self.vars["T"].make_scale("T")
+
+        for name, value in snapshot.items():
+            product = self.particulator.products[name]
+            bins = getattr(product, "attr_bins_edges", None)
+            n_bin_dims = 1 if bins is not None and value.ndim > 0 else 0
+            dims = self._spatial_dims(name, value.shape[: value.ndim - n_bin_dims])
+            if n_bin_dims:
+                label = f"{name}{DIM_SUFFIX}"
+                self._dimension(
+                    label, np.asarray(bins.to_ndarray())[:-1], product.attr_unit
+                )
+                dims = (*dims, label)
+
+            if name in self.vars:
+                raise AssertionError(
+                    f"product ({name}) has same name as one of netCDF dimensions"
+                )
+            self.vars[name] = self._file.create_dataset(
+                name,
+                shape=(0, *value.shape),
+                maxshape=(None, *value.shape),
+                dtype=float,
+                chunks=(1, *value.shape) if value.size > 0 else None,
+                compression=self.compression,
+                compression_opts=self.compression_opts,
+            )
+            self.vars[name].attrs["units"] = product.unit
+            for index, label in enumerate(("T", *dims)):
+                if label in self.vars:
+                    self.vars[name].dims[index].attach_scale(self.vars[label])
+
+    def _write_record(self, time, snapshot):
+        if self.vars is None:
+            self._create_variables(snapshot)
+        i = self.n_records
+        for name in ("T", *snapshot.keys()):
+            self.vars[name].resize(i + 1, axis=0)
+        self.vars["T"][i] = time
+        for name, value in snapshot.items():
+            self.vars[name][i] = value
+        self.n_records += 1
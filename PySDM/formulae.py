@@ -19,6 +19,7 @@ from numba.core.errors import NumbaExperimentalFeatureWarning
 
 from PySDM import physics
 from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.dynamics.terminal_velocity import (
     GunnKinzer1949,
     PowerSeries,
@@ -239,7 +240,15 @@ def _formula(func, constants, dimensional_analysis, **kw):
 
     extras = func.__extras if hasattr(func, "__extras") else {}
     exec(  # pylint:disable=exec-used
-        source, {"const": constants, "np": np, "math": math, **extras}, loc
+        source,
+        {
+            "__name__": func.__module__,  # so that the compiled code can be cached
+            "const": constants,
+            "np": np,
+            "math": math,
+            **extras,
+        },
+        loc,
     )
 
     n_params = len(parameters_keys) - (1 if parameters_keys[0] in special_params else 0)
@@ -262,7 +271,7 @@ def _formula(func, constants, dimensional_analysis, **kw):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaExperimentalFeatureWarning)
             return vectorizer(function)
-    return numba.njit(
+    return njit(
         getattr(loc["_"], func.__name__),
         **{
             **conf.JIT_FLAGS,
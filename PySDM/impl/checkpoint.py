@@ -0,0 +1,68 @@
+"""
+on-disk layout of `PySDM.particulator.Particulator` checkpoints: a directory with
+ a `state.json` file holding the (nested) state dictionary in which arrays are
+ replaced with references to uncompressed `.npy` files stored alongside
+ (and loaded as read-only memory maps upon restart)
+"""
+
+import json
+import os
+
+import numpy as np
+
+STATE_FILE = "state.json"
+ARRAY_KEY = "__npy__"
+FORMAT_VERSION = 1
+
+
+def save_checkpoint(path, state: dict):
+    """writes `state` (a nested dict of arrays and JSON-serialisable values)
+    to the `path` directory (created if needed)"""
+    os.makedirs(path, exist_ok=True)
+
+    def dump(node, keys):
+        if isinstance(node, dict):
+            return {key: dump(value, (*keys, str(key))) for key, value in node.items()}
+        if isinstance(node, np.ndarray):
+            file_name = ".".join(keys) + ".npy"
+            np.save(os.path.join(path, file_name), node, allow_pickle=False)
+            return {ARRAY_KEY: file_name}
+        if isinstance(node, np.generic):
+            return node.item()
+        return node
+
+    with open(os.path.join(path, STATE_FILE), "w", encoding="utf-8") as file:
+        json.dump({"version": FORMAT_VERSION, "state": dump(state, ())}, file)
+
+
+def load_checkpoint(path, mmap_mode="r"):
+    """returns the state dictionary saved with `save_checkpoint` with arrays
+    memory-mapped (unless `mmap_mode` is `None`)"""
+    with open(os.path.join(path, STATE_FILE), encoding="utf-8") as file:
+        content = json.load(file)
+    if content["version"] != FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint format version: {content['version']}")
+
+    def load(node):
+        if isinstance(node, dict):
+            if ARRAY_KEY in node:
+                return np.load(
+                    os.path.join(path, node[ARRAY_KEY]),
+                    mmap_mode=mmap_mode,
+                    allow_pickle=False,
+                )
+            return {key: load(value) for key, value in node.items()}
+        return node
+
+    return load(content["state"])
+
+
+def download(storages: dict):
+    """returns a dict of arrays with copies of the (raw) storage data"""
+    return {key: storage.to_ndarray() for key, storage in storages.items()}
+
+
+def upload(storages: dict, arrays: dict):
+    """copies arrays (e.g., memory-mapped ones) into the corresponding storages"""
+    for key, storage in storages.items():
+        storage.upload(np.asarray(arrays[key]))
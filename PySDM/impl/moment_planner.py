@@ -0,0 +1,189 @@
+"""
+evaluation planner for statistical-moment requests issued by products through
+ `PySDM.particulator.Particulator.moments()` and
+ `PySDM.particulator.Particulator.spectrum_moments()`: requests are collected
+ into a plan grouped by filter attribute, filter bins and weighting; whenever
+ the particle state changed since the previous evaluation, all requests made
+ since then are evaluated in a single pass over super-droplets, so that
+ subsequent requests (e.g., from other products at the same output step) only
+ read the precomputed results
+"""
+
+import numpy as np
+
+
+class MomentPlanner:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.plan = {}
+        """ maps `(filter attribute, bin edges, weighting attribute, weighting rank)`
+        groups onto lists of `(attribute, rank)` moment specs evaluated in each pass
+        (i.e., the ones requested since the previous pass) """
+        self.counters = {"fused passes": 0}
+        self.__requested = {}
+        self.__state = None
+        self.__attr_names = None
+        self.__layout = None
+        self.__moment_0 = None
+        self.__moments = None
+        self.__rows_0 = None
+        self.__rows = None
+
+    def moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        specs,
+        attr_name,
+        attr_range,
+        weighting_attribute,
+        weighting_rank,
+        skip_division_by_m0,
+    ):
+        """see `PySDM.particulator.Particulator.moments()`"""
+        group = (
+            attr_name,
+            (float(attr_range[0]), float(attr_range[1])),
+            weighting_attribute,
+            float(weighting_rank),
+        )
+        entries = [(attr, float(rank)) for attr in specs for rank in specs[attr]]
+        if np.isnan(group[1]).any():
+            moment_0.fill(0)
+            for k in range(len(entries)):
+                moments[k, :].fill(0)
+            return
+        self.__evaluate(group, entries)
+
+        moment_0.fill(self.__moment_0[self.__rows_0[group], :])
+        for k, entry in enumerate(entries):
+            moments[k, :].fill(self.__moments[self.__rows[(group, entry)], :])
+            if not skip_division_by_m0:
+                moments[k, :].divide_if_not_zero(moment_0)
+
+    def spectrum_moments(  # pylint: disable=too-many-locals
+        self,
+        *,
+        moment_0,
+        moments,
+        attr,
+        rank,
+        attr_bins,
+        attr_name,
+        weighting_attribute,
+        weighting_rank,
+    ):
+        """see `PySDM.particulator.Particulator.spectrum_moments()`"""
+        edges = tuple(float(edge) for edge in attr_bins.to_ndarray())
+        group = (attr_name, edges, weighting_attribute, float(weighting_rank))
+        entry = (attr, float(rank))
+        self.__evaluate(group, [entry])
+
+        n_bins = len(edges) - 1
+        row_0 = self.__rows_0[group]
+        row = self.__rows[(group, entry)]
+        moment_0.fill(self.__moment_0[row_0 : row_0 + n_bins])
+        moments.fill(self.__moments[row : row + n_bins])
+        for k in range(n_bins):
+            moments[k, :].divide_if_not_zero(moment_0[k, :])
+
+    def __evaluate(self, group, entries):
+        requested = self.__requested.setdefault(group, [])
+        requested.extend(entry for entry in entries if entry not in requested)
+
+        attributes = self.particulator.attributes
+        state = (
+            self.particulator.n_steps,
+            attributes.super_droplet_count,
+            attributes.base_attribute_timestamps(),
+        )
+        if state != self.__state:
+            plan = self.__requested
+            self.__requested = {group: list(entries)}
+        elif group not in self.plan or any(
+            entry not in self.plan[group] for entry in entries
+        ):
+            plan = {key: list(specs) for key, specs in self.plan.items()}
+            specs = plan.setdefault(group, [])
+            specs.extend(entry for entry in entries if entry not in specs)
+        else:
+            return
+        if plan != self.plan:
+            self.plan = {key: list(specs) for key, specs in plan.items()}
+            self.__make_layout()
+
+        self.particulator.backend.fused_moments(
+            moment_0=self.__moment_0,
+            moments=self.__moments,
+            multiplicity=attributes["multiplicity"],
+            attr_data=tuple(attributes[name] for name in self.__attr_names),
+            cell_id=attributes["cell id"],
+            idx=attributes._ParticleAttributes__idx,  # pylint: disable=protected-access
+            length=attributes.super_droplet_count,
+            **self.__layout,
+        )
+        self.__state = state
+        self.counters["fused passes"] += 1
+
+    def __make_layout(self):  # pylint: disable=too-many-locals
+        attr_names = []
+        for (x_attr, _, weighting_attribute, _), specs in self.plan.items():
+            for name in (x_attr, weighting_attribute, *(attr for attr, _ in specs)):
+                if name not in attr_names:
+                    attr_names.append(name)
+
+        layout = {
+            key: [0]
+            for key in ("group_edges_start", "group_rows_start", "group_moments_start")
+        }
+        for key in (
+            "bin_edges",
+            "group_x_attr",
+            "group_weighting_attr",
+            "group_weighting_rank",
+            "moment_attr",
+            "moment_rank",
+            "moment_rows_start",
+        ):
+            layout[key] = []
+        self.__rows_0, self.__rows = {}, {}
+        n_rows = 0
+        for group, specs in self.plan.items():
+            x_attr, edges, weighting_attribute, weighting_rank = group
+            n_bins = len(edges) - 1
+            self.__rows_0[group] = layout["group_rows_start"][-1]
+            layout["bin_edges"].extend(edges)
+            layout["group_edges_start"].append(len(layout["bin_edges"]))
+            layout["group_rows_start"].append(self.__rows_0[group] + n_bins)
+            layout["group_x_attr"].append(attr_names.index(x_attr))
+            layout["group_weighting_attr"].append(attr_names.index(weighting_attribute))
+            layout["group_weighting_rank"].append(weighting_rank)
+            for attr, rank in specs:
+                self.__rows[(group, (attr, rank))] = n_rows
+                layout["moment_attr"].append(attr_names.index(attr))
+                layout["moment_rank"].append(rank)
+                layout["moment_rows_start"].append(n_rows)
+                n_rows += n_bins
+            layout["group_moments_start"].append(len(layout["moment_attr"]))
+
+        storage = self.particulator.Storage
+        n_cell = self.particulator.mesh.n_cell
+        self.__attr_names = attr_names
+        self.__moment_0 = storage.empty(
+            (layout["group_rows_start"][-1], n_cell), dtype=float
+        )
+        self.__moments = storage.empty((max(n_rows, 1), n_cell), dtype=float)
+        self.__layout = {
+            key: storage.from_ndarray(
+                np.asarray(
+                    values,
+                    dtype=(
+                        float
+                        if key in ("bin_edges", "moment_rank", "group_weighting_rank")
+                        else np.int64
+                    ),
+                )
+            )
+            for key, values in layout.items()
+        }
@@ -8,9 +8,11 @@ from typing import Dict
 import numpy as np
 
 from PySDM.attributes.impl.attribute import Attribute
+from PySDM.attributes.impl.base_attribute import BaseAttribute
+from PySDM.attributes.impl.extensive_attribute import ExtensiveAttribute
 
 
-class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
+class ParticleAttributes:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(
         self,
         *,
@@ -21,7 +23,10 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         cell_start,
         attributes: Dict[str, Attribute],
     ):
+        self.__particulator = particulator
+        self.__backend = particulator.backend
         self.__valid_n_sd = particulator.n_sd
+        self.__n_occupied_slots = particulator.n_sd
         self.__healthy_memory = particulator.Storage.from_ndarray(np.full((1,), 1))
         self.__idx = idx
 
@@ -30,6 +35,7 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
 
         self.cell_idx = particulator.Index.identity_index(len(cell_start) - 1)
         self.__cell_start = particulator.Storage.from_ndarray(cell_start)
+        self.__sorting_scheme = particulator.sorting_scheme
         self.__cell_caretaker = particulator.backend.make_cell_caretaker(
             self.__idx.shape,
             self.__idx.dtype,
@@ -39,6 +45,36 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         self.__sorted = False
         self.__attributes = attributes
 
+        self.compaction_threshold = None
+        """ if set, super-droplet data is compacted (see `compact()`) at the
+        beginning of a step (see `physical_sort_if_needed()`) following removal
+        of super-droplets after which the fraction of unused slots among the ones
+        spanned by the index exceeded the threshold """
+        self.compaction_by_cell = False
+        """ whether the automatic compaction orders super-droplets by cell """
+        self.physical_sort_interval = None
+        """ if set, a physical sort (compaction ordered by cell, see `compact()`)
+        is done at the beginning of a step if at least that many steps passed
+        since the last one """
+        self.physical_sort_threshold = None
+        """ if set, a physical sort is done at the beginning of a step if the
+        fraction of super-droplets stored outside of the slot range of their
+        cell (see `out_of_cell_fraction()`) exceeds the threshold """
+        self.incremental_sort_threshold = 0.25
+        """ with the "incremental" sorting scheme, the fraction of super-droplets
+        to be relocated in the index (having changed cell since the previous sort)
+        above which a full sort is done instead """
+        self.counters = {
+            "cell sorts": 0,
+            "incremental cell sorts": 0,
+            "cell-sorted super-droplets": 0,
+            "relocated super-droplets": 0,
+            "physical sorts": 0,
+            "compactions": 0,
+        }
+        self.__last_physical_sort_step = 0
+        self.__compaction_due = False
+
     @property
     def healthy(self) -> bool:
         return bool(self.__healthy_memory[0])
@@ -64,6 +100,15 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def mark_updated(self, key):
         self.__attributes[key].mark_updated()
 
+    def base_attribute_timestamps(self):
+        """returns the update counts (see `mark_updated()`) of all base attributes,
+        on which all other attributes depend"""
+        return tuple(
+            attribute.timestamp
+            for attribute in self.__attributes.values()
+            if isinstance(attribute, BaseAttribute)
+        )
+
     def sanitize(self):
         if not self.healthy:
             self.__idx.length = self.__valid_n_sd
@@ -71,6 +116,69 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
             self.__valid_n_sd = self.__idx.length
             self.healthy = True
             self.__sorted = False
+            if (
+                self.compaction_threshold is not None
+                and 1 - self.__valid_n_sd / self.__n_occupied_slots
+                > self.compaction_threshold
+            ):
+                # deferred as dynamics might hold references to attribute values
+                self.__compaction_due = True
+
+    def compact(self, *, by_cell=False):
+        """physically packs (in index order, or sorted by cell if `by_cell`)
+        the base attribute data of all super-droplets into leading slots
+        of the storages so that the index becomes an identity permutation,
+        and hence kernels traverse contiguous memory"""
+        assert self.healthy
+        if by_cell and not self.__sorted:
+            self.__sort_by_cell_id()
+        length = len(self.__idx)
+        for storage in self.__base_attribute_storages():
+            self.__backend.compact(data=storage, idx=self.__idx, length=length)
+        self.__idx.reset_index()
+        self.__n_occupied_slots = length
+        self.__compaction_due = False
+        self.counters["compactions"] += 1
+        if by_cell:
+            self.counters["physical sorts"] += 1
+            self.__last_physical_sort_step = self.__particulator.n_steps
+        for attribute in self.__attributes.values():
+            if isinstance(attribute, BaseAttribute):
+                attribute.mark_updated()
+
+    def add_copies(self, *, source, destination, count):
+        """appends to the index `count` super-droplets stored in slots
+        `destination[:count]` (with multiplicities already set) copying into
+        them all other base attribute values of super-droplets from slots
+        `source[:count]`"""
+        assert self.healthy
+        if count == 0:
+            return
+        for storage in self.__base_attribute_storages():
+            if storage is not self["multiplicity"]:
+                self.__backend.copy_slots(
+                    data=storage, source=source, destination=destination, count=count
+                )
+        self.__valid_n_sd += count
+        self.__idx.length = self.__valid_n_sd
+        self.__n_occupied_slots = max(
+            self.__n_occupied_slots, int(max(destination.to_ndarray()[:count])) + 1
+        )
+        self.__sorted = False
+        for attribute in self.__attributes.values():
+            if isinstance(attribute, BaseAttribute):
+                attribute.mark_updated()
+
+    def __base_attribute_storages(self):
+        storages = [
+            attribute.data
+            for attribute in self.__attributes.values()
+            if isinstance(attribute, BaseAttribute)
+            and not isinstance(attribute, ExtensiveAttribute)
+        ]
+        if len(self.__extensive_keys) > 0:
+            storages.append(self.__extensive_attribute_storage)
+        return storages
 
     def cut_working_length(self, length):
         assert length <= len(self.__idx)
@@ -105,10 +213,60 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
             self.__sorted = False
 
     def __sort_by_cell_id(self):
-        self.__cell_caretaker(
-            self["cell id"], self.cell_idx, self.__cell_start, self.__idx
-        )
+        if self.__sorting_scheme == "incremental":
+            n_moved, patched = self.__cell_caretaker(
+                self["cell id"],
+                self.cell_idx,
+                self.__cell_start,
+                self.__idx,
+                max_moved_fraction=self.incremental_sort_threshold,
+            )
+            self.counters["incremental cell sorts"] += int(patched)
+            self.counters["cell-sorted super-droplets"] += len(self.__idx)
+            self.counters["relocated super-droplets"] += n_moved
+        else:
+            self.__cell_caretaker(
+                self["cell id"], self.cell_idx, self.__cell_start, self.__idx
+            )
         self.__sorted = True
+        self.counters["cell sorts"] += 1
+
+    def physical_sort_if_needed(self):
+        """performs a physical sort (compaction ordered by cell) if due according
+        to `physical_sort_interval` or `physical_sort_threshold`, or otherwise
+        a compaction if one was found due upon `sanitize()`; called by
+        `PySDM.particulator.Particulator.run` at the beginning of each step
+        (i.e., when no dynamic holds references to derived attribute values)"""
+        if (
+            self.physical_sort_interval is not None
+            and self.__particulator.n_steps - self.__last_physical_sort_step
+            >= self.physical_sort_interval
+        ) or (
+            self.physical_sort_threshold is not None
+            and self.out_of_cell_fraction() > self.physical_sort_threshold
+        ):
+            self.compact(by_cell=True)
+        elif self.__compaction_due:
+            self.compact(by_cell=self.compaction_by_cell)
+
+    def out_of_cell_fraction(self):
+        """returns the fraction of super-droplets with attribute data stored
+        outside of the range of slots matching the range of their cell in the
+        cell-sorted index (zero right after a physical sort, growing as
+        super-droplets move between cells)"""
+        length = len(self.__idx)
+        if length == 0:
+            return 0
+        return (
+            self.__backend.count_out_of_cell_range(
+                idx=self.__idx,
+                length=length,
+                cell_id=self["cell id"],
+                cell_idx=self.cell_idx,
+                cell_start=self.cell_start,
+            )
+            / length
+        )
 
     def get_extensive_attribute_storage(self):
         return self.__extensive_attribute_storage
@@ -116,10 +274,54 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def get_extensive_attribute_keys(self):
         return self.__extensive_keys.keys()
 
+    def get_base_attribute_keys(self):
+        """returns names of base attributes other than the extensive ones (which
+        share a single storage, see `get_extensive_attribute_storage()`)"""
+        return tuple(
+            key
+            for key, attribute in self.__attributes.items()
+            if isinstance(attribute, BaseAttribute)
+            and not isinstance(attribute, ExtensiveAttribute)
+        )
+
     def has_attribute(self, attr):
         return attr in self.__attributes
 
+    def checkpoint_state(self):
+        return {
+            "base attributes": {
+                key: attribute.data.to_ndarray(raw=True)
+                for key, attribute in self.__attributes.items()
+                if isinstance(attribute, BaseAttribute)
+            },
+            "idx": self.__idx.to_ndarray(),
+            "idx length": len(self.__idx),
+            "valid n_sd": self.__valid_n_sd,
+            "occupied slots": self.__n_occupied_slots,
+            "cell start": self.__cell_start.to_ndarray(),
+            "cell idx": self.cell_idx.to_ndarray(),
+            "sorted": self.__sorted,
+            "counters": dict(self.counters),
+            "last physical sort step": self.__last_physical_sort_step,
+        }
+
+    def restore_checkpoint_state(self, state):
+        for key, data in state["base attributes"].items():
+            self.__attributes[key].data.upload(np.asarray(data))
+            self.__attributes[key].mark_updated()
+        self.__idx.upload(np.asarray(state["idx"]))
+        self.__idx.length = self.__idx.INT(state["idx length"])
+        self.__valid_n_sd = state["valid n_sd"]
+        self.__n_occupied_slots = state["occupied slots"]
+        self.__cell_start.upload(np.asarray(state["cell start"]))
+        self.cell_idx.upload(np.asarray(state["cell idx"]))
+        self.__sorted = state["sorted"]
+        self.counters.update(state["counters"])
+        self.__last_physical_sort_step = state["last physical sort step"]
+        self.healthy = True
+
     def reset_idx(self):
         self.__valid_n_sd = self.__idx.shape[0]
+        self.__n_occupied_slots = self.__valid_n_sd
         self.__idx.reset_index()
         self.healthy = False
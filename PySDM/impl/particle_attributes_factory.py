@@ -18,7 +18,7 @@ from PySDM.attributes.impl import get_attribute_class
 class ParticleAttributesFactory:
     @staticmethod
     def attributes(particulator, req_attr, attributes):
-        # pylint: disable=too-many-locals
+        # pylint: disable=too-many-locals,too-many-statements
         idx = particulator.Index.identity_index(particulator.n_sd)
 
         extensive_attr = []
@@ -33,6 +33,7 @@ class ParticleAttributesFactory:
                 (
                     DerivedAttribute,
                     get_attribute_class("multiplicity"),
+                    get_attribute_class("super droplet id"),
                     CellAttribute,
                     DummyAttribute,
                 ),
@@ -107,6 +108,13 @@ class ParticleAttributesFactory:
             )
         except KeyError:
             position_in_cell = None
+        if "super droplet id" in req_attr:
+            super_droplet_id = req_attr["super droplet id"]
+            super_droplet_id.allocate(idx)
+            super_droplet_id.init(attributes["super droplet id"])
+            req_attr["super droplet id"].data = particulator.IndexedStorage.indexed(
+                idx, super_droplet_id.data
+            )
 
         cell_start = np.empty(particulator.mesh.n_cell + 1, dtype=int)
 
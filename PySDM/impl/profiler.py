@@ -0,0 +1,158 @@
+"""
+hierarchical profiler collecting nested wall-time spans (with call counts) from
+ dynamics, backend methods and derived-attribute recalculations, exportable as
+ JSON summary or as [Chrome trace](https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU)
+ events (viewable, e.g., with [Perfetto](https://ui.perfetto.dev/));
+ when disabled (the default), `span()` returns a shared no-op context manager
+"""  # pylint: disable=line-too-long
+
+import functools
+import inspect
+import json
+import time
+from contextlib import nullcontext
+
+_NULL_SPAN = nullcontext()
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.children = {}
+
+    def to_dict(self):
+        return {
+            name: {
+                "count": child.count,
+                "time": child.time,
+                "children": child.to_dict(),
+            }
+            for name, child in self.children.items()
+        }
+
+
+class _Span:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        stack = self.profiler._stack  # pylint: disable=protected-access
+        parent = stack[-1]
+        if self.name not in parent.children:
+            parent.children[self.name] = _Node()
+        stack.append(parent.children[self.name])
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_):
+        duration = time.perf_counter() - self.start
+        node = self.profiler._stack.pop()  # pylint: disable=protected-access
+        node.count += 1
+        node.time += duration
+        if self.profiler.trace:
+            self.profiler.events.append(
+                {
+                    "name": self.name,
+                    "ph": "X",
+                    "ts": (self.start - self.profiler.epoch) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+
+
+class Profiler:
+    """
+    Example of use:
+
+    with particulator.profiler:
+        particulator.run(steps=100)
+    particulator.profiler.to_chrome_trace("trace.json")
+
+    while enabled, public methods of the particulator's backend are wrapped so
+    that each call is recorded as a span nested within the span of its caller
+    (e.g., within the span of a dynamic)
+    """
+
+    def __init__(self, backend=None, *, trace=True):
+        self.backend = backend
+        self.trace = trace
+        self.enabled = False
+        self.epoch = time.perf_counter()
+        self.events = []
+        self._root = _Node()
+        self._stack = [self._root]
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *_):
+        self.disable()
+
+    def span(self, name):
+        """context manager recording a (nested) span named `name` if enabled"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        if self.backend is not None:
+            self.__instrument(self.backend)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self.backend is not None:
+            for name in self.__backend_method_names(self.backend):
+                if name in vars(self.backend):
+                    delattr(self.backend, name)
+
+    def reset(self):
+        self.epoch = time.perf_counter()
+        self.events = []
+        self._root = _Node()
+        self._stack = [self._root]
+
+    @staticmethod
+    def __backend_method_names(backend):
+        for name in dir(type(backend)):
+            if name.startswith("_"):
+                continue
+            member = inspect.getattr_static(type(backend), name)
+            if isinstance(member, (staticmethod, classmethod)) or inspect.isfunction(
+                member
+            ):
+                yield name
+
+    def __instrument(self, backend):
+        for name in self.__backend_method_names(backend):
+            setattr(backend, name, self.__wrap(name, getattr(backend, name)))
+
+    def __wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with self.span(name):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    def summary(self):
+        """returns a nested dictionary with call counts and total wall times
+        (in seconds, including children) keyed by span names"""
+        return self._root.to_dict()
+
+    def to_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=1)
+
+    def to_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, file)
@@ -6,6 +6,7 @@ import numba
 import numpy as np
 
 from ..backends.impl_numba.conf import JIT_FLAGS
+from ..backends.impl_numba.kernel_cache import njit
 from ..backends.impl_numba.toms748 import toms748_solve
 from ..backends.impl_numba.warnings import warn
 
@@ -41,7 +42,7 @@ def _solve_equilibrium_radii(
     if f_org is None:
         f_org = np.zeros_like(radii_in, dtype=float)
 
-    @numba.njit(**jit_flags)
+    @njit(**jit_flags)
     def impl(radii_in, iters, T, RH, cell_id, kappa, f_org):
         radii_out = np.empty_like(radii_in)
         for i in numba.prange(len(radii_in)):  # pylint: disable=not-an-iterable
@@ -125,15 +126,15 @@ def equilibrate_dry_radii(
     RH_eq = formulae.hygroscopicity.RH_eq
     jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def get_args(T_i, RH_i, kappa, r_wet, f_org):
         return T_i, RH_i, kappa, r_wet, f_org
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def get_bounds(r_wet, _, __):
         return 0.0, r_wet
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def minfun_dry(r_dry, temperature, relative_humidity, kappa, r_wet, f_org):
         r_dry_3 = r_dry**3
         sgm = sigma(
@@ -175,17 +176,17 @@ def equilibrate_wet_radii(
     r_cr = formulae.hygroscopicity.r_cr
     jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def get_args(T_i, RH_i, kappa, r_dry, f_org):
         return T_i, RH_i, kappa, r_dry**3, f_org
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def get_bounds(r_dry, T_i, kappa):
         a = r_dry
         b = r_cr(kappa, r_dry**3, T_i, const.sgm_w)
         return a, b
 
-    @numba.njit(**{**jit_flags, "parallel": False})
+    @njit(**{**jit_flags, "parallel": False})
     def minfun_wet(r_wet, temperature, relative_humidity, kappa, r_dry_3, f_org):
         sgm = sigma(
             temperature, phys_volume(radius=r_wet), const.PI_4_3 * r_dry_3, f_org
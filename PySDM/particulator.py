@@ -15,7 +15,10 @@ from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl.checkpoint import save_checkpoint
+from PySDM.impl.moment_planner import MomentPlanner
 from PySDM.impl.particle_attributes import ParticleAttributes
+from PySDM.impl.profiler import Profiler
 
 
 class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
@@ -36,6 +39,12 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
 
         self.sorting_scheme = "default"
         self.condensation_solver = None
+        self.moment_planner = (
+            MomentPlanner(self) if hasattr(backend, "fused_moments") else None
+        )
+        """ if set, moment requests (see `moments()` and `spectrum_moments()`)
+        are served from a single fused pass over super-droplets per particle
+        state (see `PySDM.impl.moment_planner.MomentPlanner`) """
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
         self.PairIndicator = make_PairIndicator(backend)  # pylint: disable=invalid-name
@@ -47,18 +56,48 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
 
         self.timers = {}
+        self.profiler = Profiler(backend)
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
         if len(self.initialisers) > 0:
             self._notify_initialisers()
         for _ in range(steps):
+            if self.attributes is not None:
+                self.attributes.physical_sort_if_needed()
             for key, dynamic in self.dynamics.items():
-                with self.timers[key]:
+                with self.timers[key], self.profiler.span(key):
                     dynamic()
             self.n_steps += 1
             self._notify_observers()
 
+    def save_checkpoint(self, path):
+        """saves the state of the simulation (attributes, environment, dynamics
+        and step count) into the `path` directory in a layout allowing to
+        memory-map the arrays upon restart with
+        `PySDM.builder.Builder.from_checkpoint()`; to be called between steps"""
+        save_checkpoint(
+            path,
+            {
+                "n_sd": self.n_sd,
+                "n_steps": self.n_steps,
+                "attributes": self.attributes.checkpoint_state(),
+                "environment": self.environment.checkpoint_state(),
+                "dynamics": {
+                    key: dynamic.checkpoint_state()
+                    for key, dynamic in self.dynamics.items()
+                    if hasattr(dynamic, "checkpoint_state")
+                },
+            },
+        )
+
+    def _restore_checkpoint_state(self, state):
+        self.attributes.restore_checkpoint_state(state["attributes"])
+        self.environment.restore_checkpoint_state(state["environment"])
+        for key, dynamic_state in state["dynamics"].items():
+            self.dynamics[key].restore_checkpoint_state(dynamic_state)
+        self.n_steps = state["n_steps"]
+
     def _notify_observers(self):
         reversed_order_so_that_environment_is_last = reversed(self.observers)
         for observer in reversed_order_so_that_environment_is_last:
@@ -216,6 +255,50 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 coalescence_rate=coalescence_rate,
                 is_first_in_pair=is_first_in_pair,
             )
+        self.__mark_collided()
+
+    def collision_coalescence_breakup_fused(
+        self,
+        *,
+        gamma,
+        rand,
+        rand_frag,
+        coalescence_rate,
+        breakup_rate,
+        breakup_rate_deficit,
+        is_first_in_pair,
+        warn_overflows,
+        max_multiplicity,
+        pair_attributes,
+        **efficiencies_and_fragmentation,
+    ):
+        """as `collision_coalescence_breakup()` with breakup enabled, but with
+        efficiencies and fragment masses evaluated within the backend pass over pairs
+        (see `collision_coalescence_breakup_fused()` backend method); `pair_attributes`
+        maps the backend method arguments onto the names of attributes passed"""
+        # pylint: disable=too-many-arguments
+        self.backend.collision_coalescence_breakup_fused(
+            multiplicity=self.attributes["multiplicity"],
+            idx=self.attributes._ParticleAttributes__idx,
+            attributes=self.attributes.get_extensive_attribute_storage(),
+            gamma=gamma,
+            rand=rand,
+            rand_frag=rand_frag,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            cell_id=self.attributes["cell id"],
+            coalescence_rate=coalescence_rate,
+            breakup_rate=breakup_rate,
+            breakup_rate_deficit=breakup_rate_deficit,
+            is_first_in_pair=is_first_in_pair,
+            warn_overflows=warn_overflows,
+            particle_mass=self.attributes["water mass"],
+            max_multiplicity=max_multiplicity,
+            **{key: self.attributes[name] for key, name in pair_attributes.items()},
+            **efficiencies_and_fragmentation,
+        )
+        self.__mark_collided()
+
+    def __mark_collided(self):
         self.attributes.sanitize()
         self.attributes.mark_updated("multiplicity")
         for key in self.attributes.get_extensive_attribute_keys():
@@ -266,7 +349,6 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
     ):
         self.backend.dissolution(
             n_cell=self.mesh.n_cell,
-            n_threads=1,
             cell_order=np.arange(self.mesh.n_cell),
             cell_start_arg=self.attributes.cell_start,
             idx=self.attributes._ParticleAttributes__idx,
@@ -346,6 +428,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         """
         if len(specs) == 0:
             raise ValueError("empty specs passed")
+        if self.moment_planner is not None:
+            self.moment_planner.moments(
+                moment_0=moment_0,
+                moments=moments,
+                specs=specs,
+                attr_name=attr_name,
+                attr_range=attr_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+            return
         attr_data, ranks = [], []
         for attr in specs:
             for rank in specs[attr]:
@@ -388,6 +482,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         weighting_attribute="water mass",
         weighting_rank=0,
     ):
+        if self.moment_planner is not None:
+            self.moment_planner.spectrum_moments(
+                moment_0=moment_0,
+                moments=moments,
+                attr=attr,
+                rank=rank,
+                attr_bins=attr_bins,
+                attr_name=attr_name,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+            )
+            return
         attr_data = self.attributes[attr]
         self.backend.spectrum_moments(
             moment_0=moment_0,
@@ -448,6 +554,50 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 n_substeps=n_substeps,
             )
 
+    def advect_particles(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        displacement,
+        courant,
+        n_substeps,
+        grid,
+        strides,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        """fused counterpart of `calculate_displacement` followed by position update,
+        `remove_precipitated` (if `enable_sedimentation`), `flag_out_of_column`,
+        cell-origin update, periodic boundary condition and `recalculate_cell_id`
+        repeated over a whole timestep with per-cell `n_substeps` (see
+        `PySDM.dynamics.displacement.Displacement.upload_courant_field`);
+        returns the mass of water that crossed the precipitation-counting level"""
+        sedimentation_kwargs = {}
+        if enable_sedimentation:
+            sedimentation_kwargs = {
+                "relative_fall_velocity": self.attributes["relative fall velocity"],
+                "dt_over_dz": self.dt / self.mesh.dz,
+                "water_mass": self.attributes["water mass"],
+                "multiplicity": self.attributes["multiplicity"],
+                "precipitation_counting_level_index": precipitation_counting_level_index,
+            }
+        rainfall_mass = self.backend.advect_particles(
+            displacement=displacement,
+            courant=courant,
+            cell_id=self.attributes["cell id"],
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            grid=grid,
+            strides=strides,
+            n_substeps=n_substeps,
+            **sedimentation_kwargs,
+        )
+        self.attributes.sanitize()
+        self.attributes._ParticleAttributes__sorted = False
+        return rainfall_mass
+
     def isotopic_fractionation(self, heavy_isotopes: tuple):
         for isotope in heavy_isotopes:
             self.backend.isotopic_fractionation(
@@ -513,6 +663,42 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
+    def merge_super_droplets(self, *, multiplicity_threshold, rtol, min_count_per_cell):
+        n_merged = self.backend.merge_super_droplets(
+            idx=self.attributes._ParticleAttributes__idx,
+            cell_start=self.attributes.cell_start,
+            multiplicity=self.attributes["multiplicity"],
+            extensive_attributes=self.attributes.get_extensive_attribute_storage(),
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            multiplicity_threshold=multiplicity_threshold,
+            rtol=rtol,
+            min_count_per_cell=min_count_per_cell,
+        )
+        if n_merged > 0:
+            self.attributes.mark_updated("multiplicity")
+            for key in self.attributes.get_extensive_attribute_keys():
+                self.attributes.mark_updated(key)
+            self.attributes.sanitize()
+        return n_merged
+
+    def split_super_droplets(
+        self, *, multiplicity_threshold, max_count_per_cell, source, destination
+    ):
+        n_split = self.backend.split_super_droplets(
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            cell_start=self.attributes.cell_start,
+            multiplicity=self.attributes["multiplicity"],
+            source=source,
+            destination=destination,
+            multiplicity_threshold=multiplicity_threshold,
+            max_count_per_cell=max_count_per_cell,
+        )
+        self.attributes.add_copies(
+            source=source, destination=destination, count=n_split
+        )
+        return n_split
+
     def deposition(self, adaptive: bool):
         self.backend.deposition(
             adaptive=adaptive,
@@ -3,25 +3,23 @@ surface tension coefficient model featuring surface-partitioning
  as in [Ruehl et al. (2016)](https://doi.org/10.1126/science.aad4889)
 """
 
-import numba
 import numpy as np
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS as jit_flags
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.physics.trivia import Trivia
 
 
 # pylint: disable=too-many-arguments
-@numba.njit(**{**jit_flags, "parallel": False})
+@njit(**{**jit_flags, "parallel": False})
 def minfun(f_surf, Cb_iso, RUEHL_C0, RUEHL_A0, A_iso, c):
     lhs = Cb_iso * (1 - f_surf) / RUEHL_C0
     rhs = np.exp(c * (RUEHL_A0**2 - (A_iso / f_surf) ** 2))
     return lhs - rhs
 
 
-within_tolerance = numba.njit(
-    Trivia.within_tolerance, **{**jit_flags, "parallel": False}
-)
+within_tolerance = njit(Trivia.within_tolerance, **{**jit_flags, "parallel": False})
 
 
 class CompressedFilmRuehl:  # pylint: disable=too-few-public-methods
@@ -0,0 +1,32 @@
+"""
+mean number of iterations per pH equilibration root search (see the
+ `pH_warm_start` option of `PySDM.dynamics.aqueous_chemistry.AqueousChemistry`)
+ done since the previous product get() call (fetching a value resets the counter)
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class AciditySolverIterations(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.aqueous_chemistry = None
+        self.last_counts = (0, 0)
+
+    def register(self, builder):
+        super().register(builder)
+        self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
+        self.shape = ()
+
+    def __counts(self):
+        counters = self.aqueous_chemistry.counters
+        return counters["pH iterations"], counters["pH solves"]
+
+    def _impl(self, **kwargs):
+        counts = self.__counts()
+        iterations, solves = np.subtract(counts, self.last_counts)
+        self.last_counts = counts
+        return iterations / solves if solves > 0 else np.nan
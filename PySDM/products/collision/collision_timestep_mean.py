@@ -3,10 +3,10 @@ Average collision timestep length used when adaptive timestepping is enabled in
  `PySDM.dynamics.collisions.collision.Collision` dynamic (fetching a value reset the counter)
 """
 
-import numba
 import numpy as np
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.products.impl import Product, register_product
 
 
@@ -25,7 +25,7 @@ class CollisionTimestepMean(Product):
         self.range = self.collision.dt_coal_range
 
     @staticmethod
-    @numba.njit(**JIT_FLAGS)
+    @njit(**JIT_FLAGS)
     def __get_impl(buffer, count, dt):
         buffer[:] = np.where(buffer[:] > 0, count * dt / buffer[:], np.nan)
 
@@ -0,0 +1,21 @@
+"""
+reports on the number of particle-displacement substeps in each cell
+(see `PySDM.dynamics.displacement.Displacement.upload_courant_field`)
+"""
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class DisplacementSubsteps(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(unit=unit, name=name)
+        self.displacement = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.displacement = self.particulator.dynamics["Displacement"]
+
+    def _impl(self, **kwargs):
+        self._download_to_buffer(self.displacement.n_substeps_per_cell)
+        return self.buffer
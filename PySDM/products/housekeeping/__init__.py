@@ -2,7 +2,9 @@
 Housekeeping products: time, super-particle count, wall-time timers...
 """
 
+from .cell_sort_moved_fraction import CellSortMovedFraction
 from .dynamic_wall_time import DynamicWallTime
+from .super_droplet_count_imbalance import SuperDropletCountImbalance
 from .super_droplet_count_per_gridbox import SuperDropletCountPerGridbox
 from .time import Time
 from .timers import CPUTime, WallTime
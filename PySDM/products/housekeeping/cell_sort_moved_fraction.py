@@ -0,0 +1,34 @@
+"""
+fraction of super-droplets relocated in the cell-sorted index by the incremental
+ cell sorts (see the "incremental" `PySDM.particulator.Particulator.sorting_scheme`)
+ done since the previous product get() call (i.e., roughly the fraction of
+ super-droplets that changed cell, fetching a value resets the counter)
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class CellSortMovedFraction(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+        self.last_counts = (0, 0)
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+
+    def __counts(self):
+        counters = self.particulator.attributes.counters
+        return (
+            counters["relocated super-droplets"],
+            counters["cell-sorted super-droplets"],
+        )
+
+    def _impl(self, **kwargs):
+        counts = self.__counts()
+        moved, sorted_total = np.subtract(counts, self.last_counts)
+        self.last_counts = counts
+        return moved / sorted_total if sorted_total > 0 else np.nan
@@ -0,0 +1,25 @@
+"""
+super-droplet count imbalance across gridboxes (dimensionless): ratio of the
+ largest per-gridbox super-droplet count to the mean one (unity for a perfectly
+ balanced domain, the factor by which the cost of per-cell work exceeds the
+ balanced one if cells are processed in parallel)
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class SuperDropletCountImbalance(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(unit=unit, name=name)
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+
+    def _impl(self, **kwargs):
+        counts = np.diff(self.particulator.attributes.cell_start.to_ndarray())
+        mean = np.mean(counts)
+        return np.max(counts) / mean if mean > 0 else np.nan
@@ -5,6 +5,7 @@ super-droplet count per gridbox (dimensionless)
 import numba
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.products.impl import Product, register_product
 
 
@@ -17,7 +18,7 @@ class SuperDropletCountPerGridbox(Product):
     def register(self, builder):
         super().register(builder)
 
-        @numba.njit(**{**JIT_FLAGS, "fastmath": builder.formulae.fastmath})
+        @njit(**{**JIT_FLAGS, "fastmath": builder.formulae.fastmath})
         def jit_impl(cell_start, ravelled_buffer):
             n_cell = cell_start.shape[0] - 1
             for i in numba.prange(n_cell):  # pylint: disable=not-an-iterable
@@ -3,6 +3,8 @@ cloud water path integrated over parcel displacement taking into account changes
 in parcel volume along the way
 """
 
+import numpy as np
+
 from PySDM.environments.parcel import Parcel
 
 from PySDM.products.impl import (
@@ -49,8 +51,7 @@ class ParcelLiquidWaterPath(MomentProduct, ActivationFilteredProduct):
         dz = current_z - self.previous["z"]
         cwc_mean = (cwc + self.previous["cwc"]) / 2
 
-        if self.previous["cwc"] > 0:
-            self.cwp += cwc_mean * dz
+        self.cwp += np.where(self.previous["cwc"] > 0, cwc_mean * dz, 0)
 
         self.previous["z"] = current_z
         self.previous["cwc"] = cwc
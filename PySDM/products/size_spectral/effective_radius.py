@@ -3,10 +3,10 @@ effective radius of particles within a grid cell (ratio of third to second momen
  optionally restricted to a given size range)
 """
 
-import numba
 import numpy as np
 
 from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.kernel_cache import njit
 from PySDM.physics import constants as const
 from PySDM.products.impl import MomentProduct, register_product
 
@@ -25,7 +25,7 @@ class EffectiveRadius(MomentProduct):
         self.volume_range = self.formulae.trivia.volume(np.asarray(self.radius_range))
 
     @staticmethod
-    @numba.njit(**JIT_FLAGS)
+    @njit(**JIT_FLAGS)
     def nan_aware_reff_impl(input_volume_output_reff, volume_2_3):
         """computes the effective radius (<r^3>/<r^2>) based on <v^(2/3)> and <v>"""
         input_volume_output_reff[:] = np.where(
@@ -6,8 +6,9 @@ class SpinUp:
         self.spin_up_steps = spin_up_steps
         particulator.observers.append(self)
         self.particulator = particulator
-        self.set(Collision, "enable", False)
-        self.set(Displacement, "enable_sedimentation", False)
+        if particulator.n_steps < spin_up_steps:  # e.g., not if restarted afterwards
+            self.set(Collision, "enable", False)
+            self.set(Displacement, "enable_sedimentation", False)
 
     def notify(self):
         if self.particulator.n_steps == self.spin_up_steps:
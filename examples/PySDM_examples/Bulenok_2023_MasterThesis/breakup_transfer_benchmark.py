@@ -0,0 +1,103 @@
+"""
+microbenchmark of the per-pair multi-breakup transfer computation
+ (`compute_transfer_multiplicities()`) for pairs with large `gamma`, comparing
+ the closed-form evaluation used by the Numba backend (above
+ `ITERATIVE_TRANSFER_MAX_BREAKUPS`) against the iterative loop (one iteration
+ per breakup)
+"""
+
+import os
+from time import perf_counter
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba.methods.collisions_methods import (
+    compute_transfer_multiplicities,
+    iterate_transfer_multiplicities,
+)
+
+
+def make_kernel(compute):
+    @numba.njit
+    def kernel(
+        gamma, multiplicity, particle_mass, fragment_mass, max_multiplicity, result
+    ):
+        for i in range(len(gamma)):
+            take_from_j, new_mult_k, gamma_j_k, _ = compute(
+                gamma[i],
+                2 * i,
+                2 * i + 1,
+                multiplicity,
+                particle_mass,
+                fragment_mass[i],
+                max_multiplicity,
+            )
+            result[0, i] = take_from_j
+            result[1, i] = new_mult_k
+            result[2, i] = gamma_j_k
+
+    return kernel
+
+
+def main():  # pylint: disable=too-many-locals
+    CI = "CI" in os.environ  # pylint: disable=invalid-name
+
+    n_pairs = 2**10 if CI else 2**12
+    n_repeats = 2 if CI else 10
+    gammas = (1e1, 1e3) if CI else (1e1, 3e1, 1e2, 1e3, 1e4, 1e5)
+
+    rng = np.random.default_rng(seed=44)
+    multiplicity = np.full(2 * n_pairs, 2**62, dtype=np.int64)
+    multiplicity[1::2] = 1
+    particle_mass = rng.uniform(1e-12, 1e-9, size=2 * n_pairs)
+    particle_mass[::2] *= 1e-6  # tiny j-th droplets: many breakups fit within n_j
+    fragment_mass = particle_mass[1::2] / rng.uniform(1, 2, size=n_pairs)
+    max_multiplicity = 2**62
+
+    kernels = {
+        "iterative": make_kernel(iterate_transfer_multiplicities),
+        "closed-form": make_kernel(compute_transfer_multiplicities),
+    }
+    results = {label: {} for label in kernels}
+    for gamma_value in gammas:
+        gamma = {
+            "iterative": np.full(n_pairs, int(gamma_value)),
+            "closed-form": np.full(n_pairs, gamma_value),
+        }
+        outputs = {}
+        for label, kernel in kernels.items():
+            outputs[label] = np.empty((3, n_pairs))
+            args = (
+                gamma[label],
+                multiplicity,
+                particle_mass,
+                fragment_mass,
+                max_multiplicity,
+                outputs[label],
+            )
+            kernel(*args)
+            start = perf_counter()
+            for _ in range(n_repeats):
+                kernel(*args)
+            results[label][gamma_value] = (perf_counter() - start) / n_repeats
+        np.testing.assert_array_equal(
+            outputs["closed-form"][2], outputs["iterative"][2]
+        )
+        np.testing.assert_allclose(
+            outputs["closed-form"][:2], outputs["iterative"][:2], rtol=1e-9
+        )
+
+    print(f"wall time per {n_pairs} pairs [s]")
+    for gamma_value in gammas:
+        print(
+            f"  gamma={gamma_value:.0e}:"
+            f" iterative {results['iterative'][gamma_value]:.3e},"
+            f" closed-form {results['closed-form'][gamma_value]:.3e}"
+            f" ({results['iterative'][gamma_value] / results['closed-form'][gamma_value]:.1f}x)"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
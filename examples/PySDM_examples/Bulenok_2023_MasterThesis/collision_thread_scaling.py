@@ -0,0 +1,68 @@
+"""
+thread-scaling benchmark of the Numba collision kernels on a single-cell (`Box`)
+ setup in which all candidate pairs share one cell (and hence one entry of the
+ per-cell collision/coalescence/breakup rate arrays)
+"""
+
+import os
+
+import numba
+import numpy as np
+
+from PySDM_examples.Bulenok_2023_MasterThesis.setups import (
+    setup_coalescence_breakup_sim,
+    setup_coalescence_only_sim,
+)
+from PySDM_examples.Bulenok_2023_MasterThesis.utils import (
+    go_benchmark,
+    process_results,
+)
+
+from PySDM.backends import CPU
+
+
+def main():
+    CI = "CI" in os.environ  # pylint: disable=invalid-name
+
+    n_sd = 2**10 if CI else 2**20
+    n_steps = 3 if CI else 50
+    seeds = (0,) if CI else (0, 1, 2)
+    max_threads = numba.config.NUMBA_NUM_THREADS  # pylint: disable=no-member
+    numba_n_threads = [
+        n_threads
+        for n_threads in (1, 2, 4, 8, 16, 32, 64)
+        if n_threads <= (min(2, max_threads) if CI else max_threads)
+    ]
+
+    results = {}
+    for label, setup_sim in (
+        ("coalescence", setup_coalescence_only_sim),
+        ("coalescence+breakup", setup_coalescence_breakup_sim),
+    ):
+        processed = process_results(
+            go_benchmark(
+                setup_sim,
+                (n_sd,),
+                n_steps,
+                seeds,
+                numba_n_threads=numba_n_threads,
+                backends=(CPU,),
+            )
+        )
+        results[label] = {
+            int(backend.split("_")[-1]): values[n_sd]["mean"]
+            for backend, values in processed.items()
+        }
+
+    print()
+    print(f"wall time per step [s] and speedup (Box, n_sd={n_sd})")
+    for label, times in results.items():
+        print(label)
+        for n_threads, time in sorted(times.items()):
+            print(f"  {n_threads:3d} threads: {time:.3e} ({times[1] / time:.2f}x)")
+    assert all(np.isfinite(list(times.values())).all() for times in results.values())
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -78,5 +78,17 @@ class MPDATA_1D:
         np.testing.assert_array_less(np.abs(self.advector), 1)
         self.__t += 0.5 * self.dt
 
+    def checkpoint_state(self):
+        return {
+            "t": self.__t,
+            "advectee": self.advectee.copy(),
+            "advector": self.advector.copy(),
+        }
+
+    def restore_checkpoint_state(self, state):
+        self.__t = state["t"]
+        self.advectee[:] = state["advectee"]
+        self.advector[:] = state["advector"]
+
     def __call__(self, _):
         self.solver.advance(1)
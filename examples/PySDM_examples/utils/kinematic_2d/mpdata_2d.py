@@ -29,8 +29,14 @@ class MPDATA_2D:
         infinite_gauge=True,
         nonoscillatory=True,
         third_order_terms=False,
+        subdomain=None,
     ):
+        """with `subdomain` given (e.g., `functools.partial` of
+        `PySDM.decomposition.SlabDecomposition.halo_window`), the solver operates on
+        the part of the (global) `grid` returned by `subdomain(array, staggered)` for
+        global fields (incl. the `advectees`)"""
         self._grid = grid
+        self.subdomain = subdomain or (lambda array, staggered=False: array)
         self.size = size
         self.dt = dt
         self.stream_function = stream_function
@@ -40,7 +46,9 @@ class MPDATA_2D:
         self.asynchronous = False
         self.thread: (Thread, None) = None
         self.t = 0
-        self.advectees = advectees
+        self.advectees = {
+            key: self.subdomain(np.asarray(value)) for key, value in advectees.items()
+        }
 
         self._options = Options(
             n_iters=n_iters,
@@ -49,10 +57,10 @@ class MPDATA_2D:
             third_order_terms=third_order_terms,
         )
 
-        self.g_factor = make_rhod(grid, rhod_of_zZ)
+        self.g_factor = self.subdomain(make_rhod(grid, rhod_of_zZ))
         self.g_factor_vec = (
-            rhod_of_zZ(zZ=x_vec_coord(grid)[-1]),
-            rhod_of_zZ(zZ=z_vec_coord(grid)[-1]),
+            self.subdomain(rhod_of_zZ(zZ=x_vec_coord(grid)[-1]), staggered=True),
+            self.subdomain(rhod_of_zZ(zZ=z_vec_coord(grid)[-1])),
         )
 
     @cached_property
@@ -61,17 +69,18 @@ class MPDATA_2D:
         if not conf.JIT_FLAGS["parallel"]:
             disable_threads_if_needed["n_threads"] = 1
 
+        grid = self.g_factor.shape
         stepper = Stepper(
             options=self._options,
-            grid=self._grid,
+            grid=grid,
             non_unit_g_factor=True,
             **disable_threads_if_needed,
         )
 
         advector_impl = VectorField(
             (
-                np.full((self._grid[0] + 1, self._grid[1]), np.nan),
-                np.full((self._grid[0], self._grid[1] + 1), np.nan),
+                np.full((grid[0] + 1, grid[1]), np.nan),
+                np.full((grid[0], grid[1] + 1), np.nan),
             ),
             halo=self._options.n_halo,
             boundary_conditions=(Periodic(), Periodic()),
@@ -103,6 +112,23 @@ class MPDATA_2D:
             return self.mpdatas[key].advectee.get()
         return self.advectees[key]
 
+    def checkpoint_state(self):
+        self.wait()
+        return {
+            "t": self.t,
+            "advectees": {key: np.array(self[key]) for key in self.advectees},
+        }
+
+    def restore_checkpoint_state(self, state):
+        self.t = state["t"]
+        for key, value in state["advectees"].items():
+            if "mpdatas" in self.__dict__:
+                self.mpdatas[key].advectee.get()[:] = value
+            else:
+                self.advectees[key] = np.array(value)
+        if self.t != 0 and not self.stream_function_time_dependent:
+            self.refresh_advector(displacement=None)
+
     def __call__(self, displacement):
         if self.asynchronous:
             self.thread = Thread(target=self.step, args=())
@@ -117,9 +143,14 @@ class MPDATA_2D:
 
     def refresh_advector(self, displacement):
         for mpdata in self.mpdatas.values():
-            advector = nondivergent_vector_field_2d(
-                self._grid, self.size, self.dt, self.stream_function, t=self.t
-            )
+            advector = [
+                self.subdomain(component, staggered=d == 0)
+                for d, component in enumerate(
+                    nondivergent_vector_field_2d(
+                        self._grid, self.size, self.dt, self.stream_function, t=self.t
+                    )
+                )
+            ]
             for d in range(len(self._grid)):
                 np.testing.assert_array_less(np.abs(advector[d]), 1)
                 mpdata.advector.get_component(d)[:] = advector[d]
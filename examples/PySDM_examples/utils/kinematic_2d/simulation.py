@@ -32,7 +32,9 @@ class Simulation:
     def products(self):
         return self.particulator.products
 
-    def reinit(self, products=None):
+    def reinit(self, products=None, checkpoint=None):
+        """with `checkpoint` (a path passed to `PySDM.particulator.Particulator.save_checkpoint()`
+        in a simulation with the same settings), the state is restored from it"""
         formulae = self.settings.formulae
         backend = self.backend
         environment = Kinematic2D(
@@ -151,6 +153,11 @@ class Simulation:
             dynamics=dynamics,
         )
 
+        if checkpoint is not None:
+            self.particulator = builder.from_checkpoint(checkpoint, tuple(products))
+            self.__init_spin_up_and_storage()
+            return
+
         attributes = builder.particulator.environment.init_attributes(
             spatial_discretisation=spatial_sampling.Pseudorandom(),
             dry_radius_spectrum=self.settings.spectrum_per_mass_of_dry_air,
@@ -223,7 +230,9 @@ class Simulation:
                 assert non_zero_per_gridbox == self.settings.n_sd_per_gridbox / 2
 
         self.particulator = builder.build(attributes, tuple(products))
+        self.__init_spin_up_and_storage()
 
+    def __init_spin_up_and_storage(self):
         if self.SpinUp is not None:
             self.SpinUp(self.particulator, self.settings.n_spin_up)
         if self.storage is not None:
@@ -0,0 +1,65 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+from PySDM_examples.Arabas_et_al_2015 import Settings, SpinUp
+from PySDM_examples.utils.kinematic_2d import Simulation
+
+from PySDM.backends import ThrustRTC
+from PySDM.formulae import Formulae
+from PySDM.physics import si
+
+N_STEPS = 6
+
+
+def make_simulation(backend):
+    settings = Settings(Formulae(seed=44))
+    settings.dt = 0.5 * si.second
+    settings.grid = (3, 25)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 2 * N_STEPS * settings.dt
+    settings.output_interval = 1 * settings.dt
+    settings.spin_up_time = 3 * settings.dt
+    return Simulation(settings, storage=None, SpinUp=SpinUp, backend=backend)
+
+
+def state(particulator):
+    result = {
+        key: particulator.attributes[key].to_ndarray()
+        for key in ("multiplicity", "water mass", "cell id")
+    }
+    solvers = particulator.dynamics["EulerianAdvection"].solvers
+    for key in ("th", "water_vapour_mixing_ratio"):
+        result[f"advectee: {key}"] = np.array(solvers[key])
+    for key in ("thd", "water_vapour_mixing_ratio"):
+        result[f"environment: {key}"] = particulator.environment[key].to_ndarray()
+    return result
+
+
+@pytest.mark.parametrize("checkpoint_step", (2, 4))
+def test_restart_matches_uninterrupted_run(tmp_path, backend_instance, checkpoint_step):
+    if isinstance(backend_instance, ThrustRTC):
+        pytest.skip("random number generator state not exposed by the backend")
+
+    # arrange
+    simulation = make_simulation(backend_instance)
+    simulation.reinit(products=())
+    simulation.particulator.run(steps=checkpoint_step)
+    simulation.particulator.save_checkpoint(tmp_path)
+    simulation.particulator.run(steps=N_STEPS)
+    expected = state(simulation.particulator)
+
+    # act
+    restarted = make_simulation(backend_instance)
+    restarted.reinit(products=(), checkpoint=tmp_path)
+    restarted.particulator.run(steps=N_STEPS)
+
+    # assert
+    assert restarted.particulator.n_steps == checkpoint_step + N_STEPS
+    actual = state(restarted.particulator)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value, err_msg=key)
+    assert (
+        expected["advectee: water_vapour_mixing_ratio"]
+        != restarted.settings.initial_vapour_mixing_ratio_profile
+    ).any()
@@ -0,0 +1,148 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import multiprocessing
+from functools import partial
+
+import numpy as np
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.utils.kinematic_2d import MPDATA_2D
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.decomposition import (
+    PipeTransport,
+    SlabDecomposition,
+    SlabDisplacement,
+    SlabEulerianAdvection,
+)
+from PySDM.dynamics import AmbientThermodynamics, Displacement, EulerianAdvection
+from PySDM.environments import Kinematic2D
+from PySDM.physics import si
+
+GRID = (12, 8)
+N_SD = 48
+N_STEPS = 6
+N_SLABS = 2
+# n_iters times the halo width of the MPDATA scheme (with the settings' options)
+N_HALO = 4
+# non-uniform in both dimensions so that the advected fields evolve
+PERTURBATION = 1 + 0.01 * np.sin(
+    2 * np.pi * (np.arange(GRID[0]).reshape(-1, 1) + 0.5) / GRID[0]
+) * np.cos(np.pi * (np.arange(GRID[1]).reshape(1, -1) + 0.5) / GRID[1])
+POSITIONS = np.random.default_rng(seed=44).uniform(
+    low=0, high=np.asarray(GRID).reshape(2, 1), size=(2, N_SD)
+)
+
+
+def run(decomposition=None):  # pylint: disable=too-many-locals
+    settings = Settings()
+    settings.grid = GRID
+    grid, size, subdomain = settings.grid, settings.size, None
+    positions, multiplicities = POSITIONS, np.arange(1, N_SD + 1)
+    if decomposition is not None:
+        grid, size = decomposition.local_grid, decomposition.local_size
+        subdomain = partial(decomposition.halo_window, n_halo=N_HALO)
+        mask, positions = decomposition.local_positions(POSITIONS)
+        multiplicities = multiplicities[mask]
+
+    solvers = MPDATA_2D(
+        advectees={
+            "th": settings.initial_dry_potential_temperature_profile * PERTURBATION,
+            "water_vapour_mixing_ratio": (
+                settings.initial_vapour_mixing_ratio_profile * PERTURBATION
+            ),
+        },
+        stream_function=settings.stream_function,
+        rhod_of_zZ=settings.rhod_of_zZ,
+        dt=settings.dt,
+        grid=settings.grid,
+        size=settings.size,
+        n_iters=settings.mpdata_iters,
+        infinite_gauge=settings.mpdata_iga,
+        nonoscillatory=settings.mpdata_fct,
+        third_order_terms=settings.mpdata_tot,
+        subdomain=subdomain,
+    )
+    if decomposition is None:
+        advection = (EulerianAdvection(solvers), Displacement())
+    else:
+        advection = (
+            SlabEulerianAdvection(solvers, decomposition=decomposition, n_halo=N_HALO),
+            SlabDisplacement(decomposition=decomposition),
+        )
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(settings.formulae),
+        environment=Kinematic2D(
+            dt=settings.dt, grid=grid, size=size, rhod_of=settings.rhod_of_zZ
+        ),
+        dynamics=(AmbientThermodynamics(), *advection),
+    )
+    cell_id, cell_origin, position_in_cell = (
+        builder.particulator.mesh.cellular_attributes(positions)
+    )
+    attributes = {
+        "multiplicity": multiplicities,
+        "water mass": np.full(len(multiplicities), 1 * si.ng),
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+    }
+    if decomposition is not None:
+        attributes = SlabDecomposition.pad_attributes(attributes, N_SD)
+    particulator = builder.build(attributes=attributes)
+    particulator.run(steps=N_STEPS)
+
+    positions = (
+        particulator.attributes["cell origin"].to_ndarray()
+        + particulator.attributes["position in cell"].to_ndarray()
+    )
+    if decomposition is not None:
+        positions[0] += decomposition.offset
+    return {
+        "multiplicity": particulator.attributes["multiplicity"].to_ndarray(),
+        "positions": positions,
+        **{
+            key: np.array(particulator.dynamics["EulerianAdvection"].solvers[key])
+            for key in ("th", "water_vapour_mixing_ratio")
+        },
+    }
+
+
+def run_slab(transport, queue):
+    decomposition = SlabDecomposition(
+        grid=GRID, size=Settings().size, transport=transport
+    )
+    queue.put((transport.rank, run(decomposition)))
+
+
+def test_slabs_match_single_domain():
+    # arrange
+    expected = run()
+    mp_context = multiprocessing.get_context("spawn")
+    queue = mp_context.Queue()
+    processes = [
+        mp_context.Process(target=run_slab, args=(transport, queue))
+        for transport in PipeTransport.create(N_SLABS, mp_context=mp_context)
+    ]
+
+    # act
+    for process in processes:
+        process.start()
+    results = [
+        result for _, result in sorted(queue.get(timeout=1800) for _ in processes)
+    ]
+    for process in processes:
+        process.join()
+
+    # assert
+    for key in ("th", "water_vapour_mixing_ratio"):
+        np.testing.assert_array_equal(
+            np.concatenate([result[key] for result in results]), expected[key]
+        )
+    multiplicities = np.concatenate([result["multiplicity"] for result in results])
+    positions = np.concatenate([result["positions"] for result in results], axis=1)
+    np.testing.assert_array_equal(np.sort(multiplicities), expected["multiplicity"])
+    np.testing.assert_allclose(
+        positions[:, np.argsort(multiplicities)],
+        expected["positions"][:, np.argsort(expected["multiplicity"])],
+    )
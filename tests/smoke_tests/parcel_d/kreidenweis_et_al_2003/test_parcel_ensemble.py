@@ -0,0 +1,95 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+from PySDM_examples.Kreidenweis_et_al_2003 import Settings
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, AqueousChemistry, Condensation
+from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.physics import si
+
+W = (1 * si.m / si.s, 2 * si.m / si.s, 4 * si.m / si.s)
+N_STEPS = 30
+
+
+def run(settings, environment, n_members):
+    builder = Builder(
+        n_sd=settings.n_sd * n_members,
+        backend=CPU(formulae=settings.formulae),
+        environment=environment,
+        dynamics=(
+            AmbientThermodynamics(),
+            Condensation(),
+            AqueousChemistry(
+                environment_mole_fractions=settings.ENVIRONMENT_MOLE_FRACTIONS,
+                system_type=settings.system_type,
+                n_substep=settings.n_substep,
+                dry_rho=settings.DRY_RHO,
+                dry_molar_mass=settings.dry_molar_mass,
+            ),
+        ),
+    )
+    attributes = builder.particulator.environment.init_attributes(
+        n_in_dv=settings.n_in_dv,
+        kappa=settings.kappa,
+        r_dry=settings.r_dry,
+        include_dry_volume_in_attribute=False,
+    )
+    for key, value in settings.starting_amounts.items():
+        attributes[key] = np.tile(value, n_members)
+    particulator = builder.build(attributes=attributes, products=())
+    particulator.run(steps=N_STEPS)
+    return {
+        **{
+            f"moles_{key}": particulator.attributes[f"moles_{key}"].to_ndarray()
+            for key in AQUEOUS_COMPOUNDS
+        },
+        "pH": particulator.attributes["pH"].to_ndarray(),
+        **{
+            f"gas {compound}": mixing_ratio
+            for compound, mixing_ratio in particulator.dynamics[
+                "AqueousChemistry"
+            ].environment_mixing_ratios.items()
+        },
+    }
+
+
+@pytest.mark.parametrize("system_type", ("open", "closed"))
+def test_ensemble_members_match_independent_parcels(system_type):
+    # arrange
+    settings = Settings(dt=1 * si.s, n_sd=10, n_substep=2)
+    settings.system_type = system_type
+    common = {
+        "dt": settings.dt,
+        "mass_of_dry_air": settings.mass_of_dry_air,
+        "p0": settings.p0,
+        # note: closer to saturation than in the paper to reach cloud within a few steps
+        "initial_relative_humidity": 0.99,
+        "T0": settings.T0,
+    }
+
+    # act
+    ensemble = run(settings, ParcelEnsemble(w=W, **common), n_members=len(W))
+    parcels = [run(settings, Parcel(w=w, **common), n_members=1) for w in W]
+
+    # assert
+    for i, parcel in enumerate(parcels):
+        sd_range = slice(i * settings.n_sd, (i + 1) * settings.n_sd)
+        for key, value in parcel.items():
+            if key.startswith("gas "):
+                np.testing.assert_allclose(
+                    ensemble[key][i], value[0], rtol=1e-10, err_msg=key
+                )
+            else:
+                np.testing.assert_allclose(
+                    ensemble[key][sd_range], value, rtol=1e-10, err_msg=key
+                )
+    assert (
+        ensemble["moles_S_VI"]
+        > np.tile(settings.starting_amounts["moles_S_VI"], len(W))
+    ).any()
+    assert len(np.unique(ensemble["gas SO2"])) == (
+        1 if system_type == "open" else len(W)
+    )
@@ -7,17 +7,15 @@ from chempy import Equilibrium
 from chempy.chemistry import Species
 from chempy.equilibria import EqSystem
 
-from PySDM.backends.impl_numba.methods.chemistry_methods import (
-    _K,
-    ChemistryMethods,
-    _conc,
-)
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.chemistry_methods import _K, _conc
 from PySDM.dynamics import aqueous_chemistry
 from PySDM.dynamics.impl.chemistry_utils import EquilibriumConsts, M
 from PySDM.formulae import Formulae
 from PySDM.physics.constants import K_H2O
 
 FORMULAE = Formulae()
+BACKEND = CPU(FORMULAE)
 EQUILIBRIUM_CONST = EquilibriumConsts(FORMULAE).EQUILIBRIUM_CONST
 
 
@@ -31,10 +29,7 @@ class TestAcidity:
 
         # Act
         result = np.empty(1)
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=FORMULAE.trivia.within_tolerance,
-            pH2H=FORMULAE.trivia.pH2H,
-            H2pH=FORMULAE.trivia.H2pH,
+        BACKEND._equilibrate_H_body(  # pylint: disable=protected-access
             conc=_conc(
                 N_mIII=np.zeros(1),
                 N_V=np.zeros(1),
@@ -43,13 +38,13 @@ class TestAcidity:
                 S_VI=np.zeros(1),
             ),
             K=_K(
-                HNO3=eqs["K_HNO3"].data,
-                HCO3=eqs["K_HCO3"].data,
-                HSO3=eqs["K_HSO3"].data,
-                HSO4=eqs["K_HSO4"].data,
-                CO2=eqs["K_CO2"].data,
-                NH3=eqs["K_NH3"].data,
-                SO2=eqs["K_SO2"].data,
+                HNO3=eqs["K_HNO3"],
+                HCO3=eqs["K_HCO3"],
+                HSO3=eqs["K_HSO3"],
+                HSO4=eqs["K_HSO4"],
+                CO2=eqs["K_CO2"],
+                NH3=eqs["K_NH3"],
+                SO2=eqs["K_SO2"],
             ),
             cell_id=np.zeros(1, dtype=int),
             # output
@@ -60,6 +55,7 @@ class TestAcidity:
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
             ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
             rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+            warm_start=False,
         )
 
         # Assert
@@ -124,10 +120,7 @@ class TestAcidity:
             eqs[key] = np.full(1, const.at(env_T))
 
         actual_pH = np.empty(1)
-        ChemistryMethods.equilibrate_H_body(
-            within_tolerance=FORMULAE.trivia.within_tolerance,
-            pH2H=FORMULAE.trivia.pH2H,
-            H2pH=FORMULAE.trivia.H2pH,
+        BACKEND._equilibrate_H_body(  # pylint: disable=protected-access
             conc=_conc(
                 N_mIII=np.full(1, init_conc["NH3"] * 1e3),
                 N_V=np.full(1, init_conc["HNO3(aq)"] * 1e3),
@@ -136,13 +129,13 @@ class TestAcidity:
                 S_VI=np.full(1, init_conc["HSO4-"] * 1e3),
             ),
             K=_K(
-                HNO3=eqs["K_HNO3"].data,
-                HCO3=eqs["K_HCO3"].data,
-                HSO3=eqs["K_HSO3"].data,
-                HSO4=eqs["K_HSO4"].data,
-                CO2=eqs["K_CO2"].data,
-                NH3=eqs["K_NH3"].data,
-                SO2=eqs["K_SO2"].data,
+                HNO3=eqs["K_HNO3"],
+                HCO3=eqs["K_HCO3"],
+                HSO3=eqs["K_HSO3"],
+                HSO4=eqs["K_HSO4"],
+                CO2=eqs["K_CO2"],
+                NH3=eqs["K_NH3"],
+                SO2=eqs["K_SO2"],
             ),
             cell_id=np.zeros(1, dtype=int),
             # output
@@ -153,6 +146,7 @@ class TestAcidity:
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
             ionic_strength_threshold=aqueous_chemistry.DEFAULTS.ionic_strength_threshold,
             rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+            warm_start=False,
         )
 
         np.testing.assert_allclose(actual_pH[0], expected_pH, rtol=1e-5)
@@ -0,0 +1,283 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.chemistry_methods import _conc
+from PySDM.dynamics import aqueous_chemistry
+from PySDM.dynamics.impl.chemistry_utils import (
+    DIFFUSION_CONST,
+    DISSOCIATION_FACTORS,
+    GASEOUS_COMPOUNDS,
+)
+from PySDM.physics import si
+from PySDM.physics.constants import M
+
+N_SD = 12
+N_CELL = 3
+DV = 1 * si.m**3
+MOLE_FRACTIONS = {
+    "HNO3": 0.1e-9,
+    "H2O2": 0.5e-9,
+    "NH3": 0.1e-9,
+    "SO2": 0.2e-9,
+    "CO2": 360e-6,
+    "O3": 50e-9,
+}
+
+
+def make_args(backend, cells):
+    """arguments for `dissolution()` with the super-droplets of the given cells
+    (renumbered consecutively, in reversed storage order)"""
+    rng = np.random.default_rng(seed=44)
+    cell_id = np.repeat(np.arange(N_CELL), N_SD // N_CELL)
+    volume = backend.formulae.trivia.volume(
+        radius=rng.uniform(1, 20, size=N_SD) * si.um
+    )
+    do_chemistry_flag = rng.uniform(size=N_SD) > 0.2
+    sd_ids = np.nonzero(np.isin(cell_id, cells))[0][::-1]
+    renumbered = np.searchsorted(cells, cell_id[sd_ids])
+    idx = np.argsort(renumbered, kind="stable")
+    env = {
+        "T": np.linspace(275, 295, N_CELL) * si.K,
+        "p": np.linspace(900, 1000, N_CELL) * si.hPa,
+        "rhod": np.linspace(1, 1.2, N_CELL) * si.kg / si.m**3,
+    }
+    storage = backend.Storage.from_ndarray
+    return {
+        "n_cell": len(cells),
+        "cell_order": np.arange(len(cells)),
+        "cell_start_arg": storage(
+            np.searchsorted(renumbered[idx], np.arange(len(cells) + 1))
+        ),
+        "idx": storage(idx),
+        "do_chemistry_flag": storage(do_chemistry_flag[sd_ids]),
+        "mole_amounts": {
+            key: storage(np.zeros(len(sd_ids))) for key in GASEOUS_COMPOUNDS
+        },
+        "env_mixing_ratio": {
+            compound: np.full(
+                len(cells),
+                backend.formulae.trivia.mole_fraction_2_mixing_ratio(
+                    MOLE_FRACTIONS[compound],
+                    backend.specific_gravities[compound],
+                ),
+            )
+            for compound in GASEOUS_COMPOUNDS.values()
+        },
+        "env_T": storage(env["T"][cells]),
+        "env_p": storage(env["p"][cells]),
+        "env_rho_d": storage(env["rhod"][cells]),
+        "dissociation_factors": {
+            key: storage(np.ones(len(sd_ids))) for key in DIFFUSION_CONST
+        },
+        "timestep": 1 * si.s,
+        "dv": DV,
+        "system_type": "closed",
+        "droplet_volume": storage(volume[sd_ids]),
+        "multiplicity": storage(np.full(len(sd_ids), 10**6)),
+    }
+
+
+def total_moles(backend, args, compound, key):
+    gas = (
+        args["env_mixing_ratio"][compound]
+        * args["env_rho_d"].to_ndarray()
+        * DV
+        / (backend.specific_gravities[compound] * backend.formulae.constants.Md)
+    )
+    cell_start = args["cell_start_arg"].to_ndarray()
+    idx = args["idx"].to_ndarray()
+    aqueous = args["multiplicity"].to_ndarray() * args["mole_amounts"][key].to_ndarray()
+    return gas + np.asarray(
+        [
+            np.sum(aqueous[idx[cell_start[cell] : cell_start[cell + 1]]])
+            for cell in range(args["n_cell"])
+        ]
+    )
+
+
+class TestChemistryMethods:
+    @staticmethod
+    def test_dissolution_multi_cell_matches_single_cell():
+        # arrange
+        backend = CPU()
+        sut = make_args(backend, cells=np.arange(N_CELL))
+        expected = [
+            make_args(backend, cells=np.asarray([cell])) for cell in range(N_CELL)
+        ]
+
+        # act
+        backend.dissolution(**sut)
+        for args in expected:
+            backend.dissolution(**args)
+
+        # assert
+        for key, compound in GASEOUS_COMPOUNDS.items():
+            moles = sut["mole_amounts"][key].to_ndarray()
+            assert (moles > 0).any()
+            np.testing.assert_allclose(
+                moles,
+                np.concatenate(
+                    [args["mole_amounts"][key].to_ndarray() for args in expected[::-1]]
+                ),
+                rtol=1e-12,
+            )
+            np.testing.assert_allclose(
+                sut["env_mixing_ratio"][compound],
+                [args["env_mixing_ratio"][compound][0] for args in expected],
+                rtol=1e-12,
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("system_type", ("open", "closed"))
+    def test_dissolution_per_cell_uptake(system_type):
+        # arrange
+        backend = CPU()
+        args = make_args(backend, cells=np.arange(N_CELL))
+        args["system_type"] = system_type
+        mixing_ratios = {k: np.copy(v) for k, v in args["env_mixing_ratio"].items()}
+        totals = {
+            compound: total_moles(backend, args, compound, key)
+            for key, compound in GASEOUS_COMPOUNDS.items()
+        }
+
+        # act
+        backend.dissolution(**args)
+
+        # assert
+        for key, compound in GASEOUS_COMPOUNDS.items():
+            if system_type == "closed":
+                assert (
+                    args["env_mixing_ratio"][compound] < mixing_ratios[compound]
+                ).all()
+                np.testing.assert_allclose(
+                    total_moles(backend, args, compound, key),
+                    totals[compound],
+                    rtol=1e-12,
+                )
+            else:
+                np.testing.assert_array_equal(
+                    args["env_mixing_ratio"][compound], mixing_ratios[compound]
+                )
+
+    @staticmethod
+    def test_chem_recalculate_cell_and_drop_data():
+        # arrange
+        backend = CPU()
+        temperature = backend.Storage.from_ndarray(np.linspace(270, 300, N_CELL))
+        cell_id = backend.Storage.from_ndarray(np.arange(N_SD) % N_CELL)
+        pH = backend.Storage.from_ndarray(np.linspace(3, 7, N_SD))
+        equilibrium_consts = {
+            key: backend.Storage.empty(N_CELL, dtype=float)
+            for key in backend.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST
+        }
+        kinetic_consts = {
+            key: backend.Storage.empty(N_CELL, dtype=float)
+            for key in backend.KINETIC_CONST.KINETIC_CONST
+        }
+        dissociation_factors = {
+            key: backend.Storage.empty(N_SD, dtype=float) for key in DIFFUSION_CONST
+        }
+
+        # act
+        backend.chem_recalculate_cell_data(
+            equilibrium_consts=equilibrium_consts,
+            kinetic_consts=kinetic_consts,
+            temperature=temperature,
+        )
+        backend.chem_recalculate_drop_data(
+            dissociation_factors=dissociation_factors,
+            equilibrium_consts=equilibrium_consts,
+            cell_id=cell_id,
+            pH=pH,
+        )
+
+        # assert
+        for consts, reference in (
+            (equilibrium_consts, backend.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST),
+            (kinetic_consts, backend.KINETIC_CONST.KINETIC_CONST),
+        ):
+            for key, value in consts.items():
+                np.testing.assert_allclose(
+                    value.to_ndarray(),
+                    [reference[key].at(T) for T in temperature.to_ndarray()],
+                    rtol=1e-12,
+                )
+        for key, value in dissociation_factors.items():
+            np.testing.assert_allclose(
+                value.to_ndarray(),
+                [
+                    DISSOCIATION_FACTORS[key](
+                        backend.formulae.trivia.pH2H(pH.data[i]),
+                        equilibrium_consts,
+                        cell_id.data[i],
+                    )
+                    for i in range(N_SD)
+                ],
+                rtol=1e-12,
+            )
+
+    @staticmethod
+    def test_equilibrate_H_warm_start():
+        # arrange
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        n_sd = 100
+        conc = {
+            key: rng.uniform(0, 1e-4, size=n_sd) * M
+            for key in ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI")
+        }
+        equilibrium_consts = {
+            key: backend.Storage.from_ndarray(
+                np.full(1, const.at(backend.formulae.constants.ROOM_TEMP))
+            )
+            for key, const in backend.EQUILIBRIUM_CONST.EQUILIBRIUM_CONST.items()
+        }
+        trivia = backend.formulae.trivia
+
+        def equilibrate(pH, *, warm_start, perturbation=1):
+            return backend.equilibrate_H(
+                equilibrium_consts=equilibrium_consts,
+                cell_id=backend.Storage.from_ndarray(np.zeros(n_sd, dtype=int)),
+                conc=_conc(
+                    **{
+                        key: backend.Storage.from_ndarray(value * perturbation)
+                        for key, value in conc.items()
+                    }
+                ),
+                do_chemistry_flag=backend.Storage.empty(n_sd, dtype=bool),
+                pH=pH,
+                H_min=trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
+                H_max=trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
+                ionic_strength_threshold=np.inf,
+                rtol=aqueous_chemistry.DEFAULTS.pH_rtol,
+                warm_start=warm_start,
+            )
+
+        previous_pH = backend.Storage.from_ndarray(np.full(n_sd, 7.0))
+        equilibrate(previous_pH, warm_start=False)
+        perturbation = rng.uniform(0.9, 1.1, size=n_sd)
+        pH = {
+            warm_start: backend.Storage.from_ndarray(previous_pH.to_ndarray())
+            for warm_start in (True, False)
+        }
+
+        # act
+        stats = {
+            warm_start: equilibrate(
+                pH[warm_start], warm_start=warm_start, perturbation=perturbation
+            )
+            for warm_start in (True, False)
+        }
+
+        # assert
+        assert stats[True][0] == stats[False][0] == n_sd
+        assert stats[True][1] < stats[False][1]
+        assert stats[True][2] <= stats[False][2]
+        assert (pH[True].to_ndarray() != previous_pH.to_ndarray()).all()
+        np.testing.assert_allclose(
+            trivia.pH2H(pH[True].to_ndarray()),
+            trivia.pH2H(pH[False].to_ndarray()),
+            rtol=10 * aqueous_chemistry.DEFAULTS.pH_rtol,
+        )
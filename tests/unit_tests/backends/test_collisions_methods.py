@@ -8,7 +8,12 @@ from PySDM.backends import CPU, GPU
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
-from PySDM.backends.impl_numba.methods.collisions_methods import pair_indices, coalesce
+from PySDM.backends.impl_numba.methods.collisions_methods import (
+    coalesce,
+    compute_transfer_multiplicities,
+    iterate_transfer_multiplicities,
+    pair_indices,
+)
 
 NONZERO = 44
 
@@ -206,7 +211,13 @@ class TestCollisionMethods:
     @staticmethod
     @pytest.mark.parametrize(
         "backend_class, scheme",
-        ((CPU, "counting_sort"), (CPU, "counting_sort_parallel"), (GPU, "default")),
+        (
+            (CPU, "counting_sort"),
+            (CPU, "counting_sort_parallel"),
+            (CPU, "radix_sort_parallel"),
+            (CPU, "incremental"),
+            (GPU, "default"),
+        ),
     )
     def test_cell_caretaker(backend_class, scheme):
         # Arrange
@@ -236,6 +247,102 @@ class TestCollisionMethods:
         # Assert
         assert all(cell_start.to_ndarray()[:] == np.array([0, 3]))
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "n_moved, n_removed, max_moved_fraction, expect_patched",
+        ((0, 0, 0.25, True), (10, 3, 0.25, True), (100, 0, 0.25, False)),
+    )
+    # pylint: disable=too-many-locals
+    def test_incremental_cell_caretaker(
+        n_moved, n_removed, max_moved_fraction, expect_patched
+    ):
+        # arrange
+        backend = CPU()
+        n_sd, n_cell = 200, 7
+        rng = np.random.default_rng(seed=44)
+        cell_id = backend.Storage.from_ndarray(rng.integers(0, n_cell, size=n_sd))
+        cell_idx = make_Index(backend).from_ndarray(rng.permutation(n_cell))
+        cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=int))
+        idx = make_Index(backend).identity_index(n_sd)
+        sut = backend.make_cell_caretaker(
+            idx.shape, idx.dtype, len(cell_start), scheme="incremental"
+        )
+        sut(cell_id, cell_idx, cell_start, idx, max_moved_fraction=0)
+
+        multiplicity = make_IndexedStorage(backend).from_ndarray(
+            idx, np.ones(n_sd, dtype=int)
+        )
+        multiplicity[rng.choice(n_sd, size=n_removed, replace=False)] = 0
+        idx.remove_zero_n_or_flagged(multiplicity)
+        cell_id[rng.choice(n_sd, size=n_moved, replace=False)] = (
+            backend.Storage.from_ndarray(rng.integers(0, n_cell, size=n_moved))
+        )
+
+        # act
+        moved, patched = sut(
+            cell_id,
+            cell_idx,
+            cell_start,
+            idx,
+            max_moved_fraction=max_moved_fraction,
+        )
+
+        # assert
+        assert patched == expect_patched
+        assert moved >= n_moved * (1 - 1 / n_cell) // 2
+        live = idx.to_ndarray()[: len(idx)]
+        keys = cell_idx.to_ndarray()[cell_id.to_ndarray()[live]]
+        assert sorted(live) == sorted(np.flatnonzero(multiplicity.to_ndarray(raw=True)))
+        assert (np.diff(keys) >= 0).all()
+        np.testing.assert_array_equal(
+            cell_start.to_ndarray(),
+            np.concatenate(((0,), np.cumsum(np.bincount(keys, minlength=n_cell)))),
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("n_sd, n_cell", ((0, 3), (1, 1), (500, 7), (2000, 70000)))
+    def test_radix_sort_matches_counting_sort(n_sd, n_cell):
+        # arrange
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        cell_id = backend.Storage.from_ndarray(
+            rng.integers(0, n_cell, size=n_sd, dtype=np.int64)
+        )
+        cell_idx = make_Index(backend).from_ndarray(rng.permutation(n_cell))
+        permutation = rng.permutation(n_sd)
+        results = {}
+
+        # act
+        for scheme in ("counting_sort", "radix_sort_parallel"):
+            idx = make_Index(backend).from_ndarray(permutation.copy())
+            cell_start = backend.Storage.from_ndarray(np.full(n_cell + 1, -1))
+            sut = backend.make_cell_caretaker(
+                idx.shape, idx.dtype, len(cell_start), scheme=scheme
+            )
+            sut(cell_id, cell_idx, cell_start, idx)
+            results[scheme] = idx.to_ndarray(), cell_start.to_ndarray()
+
+        # assert
+        for expected, actual in zip(
+            results["counting_sort"], results["radix_sort_parallel"]
+        ):
+            np.testing.assert_array_equal(actual, expected)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "n_sd, n_cell, n_threads, expected",
+        (
+            (10**6, 1000, 1, "counting_sort"),
+            (10**6, 1000, 64, "counting_sort_parallel"),
+            (10**6, 1000 * 1000, 64, "radix_sort_parallel"),
+        ),
+    )
+    def test_choose_sorting_scheme(n_sd, n_cell, n_threads, expected):
+        assert (
+            CPU().choose_sorting_scheme(n_sd=n_sd, n_cell=n_cell, n_threads=n_threads)
+            == expected
+        )
+
     @staticmethod
     @pytest.mark.parametrize(
         "gamma, permutation, multiplicity, cell_id, dt_left, dt, dt_max, is_first_in_pair, ",
@@ -296,7 +403,6 @@ class TestCollisionMethods:
             )
             assert all(_gamma.data == _gamma.data.astype(int))
             n_pair = len(gamma)
-            n_cell = len(dt_left)
             for i in range(n_pair):
                 j, k, skip_pair = pair_indices(
                     i=i,
@@ -309,7 +415,6 @@ class TestCollisionMethods:
                         i=i,
                         j=j,
                         k=k,
-                        cid=cell_id[j],
                         multiplicity=_multiplicity.data,
                         gamma=_gamma.data,
                         attributes=np.empty(
@@ -318,7 +423,6 @@ class TestCollisionMethods:
                                 0,
                             )
                         ),
-                        coalescence_rate=np.empty(n_cell),
                     )
                     if _multiplicity.data[j] == 0:
                         _is_first_in_pair.indicator.data[j] = False
@@ -334,3 +438,37 @@ class TestCollisionMethods:
             _multiplicity.data
             == (0, 1, 25, 25, 25, 25, 12, 13, 12, 13, 50, 50, 50, 50, 50, 50)
         )
+
+    @staticmethod
+    @pytest.mark.parametrize("seed", range(8))
+    def test_compute_transfer_multiplicities_matches_iterative(seed):
+        # arrange
+        rng = np.random.default_rng(seed=seed)
+        cases = []
+        for _ in range(1000):
+            particle_mass = rng.uniform(0, 1, size=2) * 10.0 ** rng.integers(-6, 3)
+            multiplicity = rng.integers(1, 10 ** rng.integers(1, 18), size=2)
+            multiplicity[::-1].sort()
+            cases.append(
+                (
+                    rng.uniform(0, 10.0 ** rng.integers(0, 5)),
+                    0,
+                    1,
+                    multiplicity,
+                    particle_mass,
+                    (particle_mass[0] + particle_mass[1]) / rng.uniform(1, 1e3),
+                    float(10 ** rng.integers(2, 19)),
+                )
+            )
+        cases.append(
+            (1e6, 0, 1, np.asarray([2**62, 1]), np.asarray([0.0, 1.0]), 1, 1e20)
+        )
+
+        for case in cases:
+            # act
+            sut = compute_transfer_multiplicities(*case)
+
+            # assert
+            expected = iterate_transfer_multiplicities(int(case[0]), *case[1:])
+            assert sut[2:] == expected[2:]
+            np.testing.assert_allclose(sut[:2], expected[:2], rtol=1e-9)
@@ -0,0 +1,170 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    CondensationMethods,
+)
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import (
+    ActivatingRate,
+    AmbientRelativeHumidity,
+    PeakSaturation,
+)
+
+N_SD = 256
+N_STEPS = 20
+
+
+def run_parcel(*, particle_parallel):
+    backend = CPU(Formulae())
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            T0=285 * si.K,
+            initial_water_vapour_mixing_ratio=10 * si.g / si.kg,
+            w=1 * si.m / si.s,
+        ),
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+    r_dry, specific_concentration = spectral_sampling.Logarithmic(
+        Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample_deterministic(N_SD)
+    particulator = builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=specific_concentration * 1 * si.kg, kappa=0.5, r_dry=r_dry
+        ),
+        products=(
+            AmbientRelativeHumidity(name="RH"),
+            PeakSaturation(name="S_max"),
+            ActivatingRate(name="activating rate"),
+        ),
+    )
+    particulator.condensation_solver = (
+        CondensationMethods.make_condensation_solver_impl(
+            formulae=backend.formulae_flattened,
+            timestep=particulator.dt,
+            particle_parallel=particle_parallel,
+            **builder.condensation_params,
+        )
+    )
+    activating = 0
+    for _ in range(N_STEPS):
+        particulator.run(steps=1)
+        activating += particulator.products["activating rate"].get()[0]
+    return {
+        "liquid water": np.dot(
+            particulator.attributes["multiplicity"].to_ndarray(),
+            particulator.attributes["water mass"].to_ndarray(),
+        ),
+        "RH": particulator.products["RH"].get()[0],
+        "activating": activating,
+        "saved solves": particulator.dynamics["Condensation"]
+        .counters["n_saved_solves"]
+        .to_ndarray()[0],
+    }
+
+
+def run_ensemble(*, n_members, n_threads):
+    """runs with the condensation solver picked by the backend for a given
+    number of threads (per-particle or per-cell parallelism)"""
+    n_threads_before = numba.get_num_threads()
+    numba.set_num_threads(n_threads)
+    try:
+        builder = Builder(
+            n_sd=N_SD,
+            backend=CPU(Formulae()),
+            environment=ParcelEnsemble(
+                dt=1 * si.s,
+                mass_of_dry_air=1 * si.kg,
+                p0=1000 * si.hPa,
+                T0=np.linspace(283 * si.K, 287 * si.K, n_members),
+                initial_water_vapour_mixing_ratio=10 * si.g / si.kg,
+                w=np.linspace(0.5 * si.m / si.s, 2 * si.m / si.s, n_members),
+            ),
+            dynamics=(AmbientThermodynamics(), Condensation()),
+        )
+        r_dry, specific_concentration = spectral_sampling.Logarithmic(
+            Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+        ).sample_deterministic(N_SD // n_members)
+        particulator = builder.build(
+            attributes=builder.particulator.environment.init_attributes(
+                n_in_dv=specific_concentration * 1 * si.kg, kappa=0.5, r_dry=r_dry
+            ),
+            products=(AmbientRelativeHumidity(name="RH"),),
+        )
+        particulator.run(steps=N_STEPS)
+        return {
+            "particle parallel": particulator.condensation_solver.particle_parallel,
+            "RH": particulator.products["RH"].get().copy(),
+            "liquid water": np.dot(
+                particulator.attributes["multiplicity"].to_ndarray(),
+                particulator.attributes["water mass"].to_ndarray(),
+            ),
+            # raw order as the in-cell order of idx may depend on the number of threads
+            "water mass": particulator.attributes["water mass"].to_ndarray(raw=True),
+        }
+    finally:
+        numba.set_num_threads(n_threads_before)
+
+
+class TestCondensationMethods:
+    @staticmethod
+    def test_particle_parallel_solver_matches_cell_serial_one():
+        # arrange
+        expected = run_parcel(particle_parallel=False)
+
+        # act
+        actual = run_parcel(particle_parallel=True)
+
+        # assert
+        assert expected["activating"] > 0
+        for key, value in expected.items():
+            np.testing.assert_allclose(actual[key], value, rtol=1e-7)
+
+    @staticmethod
+    def test_accepted_trial_substep_reused():
+        # act
+        result = run_parcel(particle_parallel=False)
+
+        # assert
+        assert result["saved solves"] == N_SD
+
+    @staticmethod
+    @pytest.mark.parametrize("n_members", (1, 2, 4))
+    @pytest.mark.parametrize("n_threads", (2, 3))
+    def test_multi_threaded_run_matches_single_threaded_one(n_members, n_threads):
+        if numba.config.NUMBA_NUM_THREADS < n_threads:  # pylint: disable=no-member
+            pytest.skip("not enough Numba threads")
+        if not CPU().default_jit_flags["parallel"]:
+            pytest.skip("Numba threading disabled")
+
+        # arrange
+        expected = run_ensemble(n_members=n_members, n_threads=1)
+
+        # act
+        actual = run_ensemble(n_members=n_members, n_threads=n_threads)
+
+        # assert
+        assert not expected["particle parallel"]
+        assert actual["particle parallel"] == (n_members < n_threads)
+        # liquid water sums are accumulated in a thread-count-dependent order, and
+        # masses of haze droplets (found iteratively with `rtol_x`) are sensitive to RH
+        np.testing.assert_allclose(actual["RH"], expected["RH"], rtol=1e-5)
+        np.testing.assert_allclose(
+            actual["liquid water"], expected["liquid water"], rtol=1e-5
+        )
+        np.testing.assert_allclose(
+            actual["water mass"], expected["water mass"], rtol=1e-3
+        )
@@ -0,0 +1,164 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.lookup_table import LookupTable, interpolate, lookup
+
+N_PAIRS = 10000
+
+
+@numba.njit
+def interpolated(table, x):
+    out = np.empty_like(x)
+    for i, x_i in enumerate(x):
+        position, weight = lookup(table, x_i)
+        out[i] = np.nan if position < 0 else interpolate(table, 0, position, weight)
+    return out
+
+
+def straub_args(rng, storage):
+    r_1, r_2 = (rng.uniform(0.1, 3, N_PAIRS) * 1e-3 for _ in range(2))
+    return {
+        "CW": storage(rng.uniform(0, 60, N_PAIRS)),
+        "gam": storage(np.maximum(r_1, r_2) / np.minimum(r_1, r_2)),
+        "ds": storage(2 * np.minimum(r_1, r_2)),
+        "v_max": storage(4 / 3 * np.pi * np.maximum(r_1, r_2) ** 3),
+        "x_plus_y": storage(4 / 3 * np.pi * (r_1**3 + r_2**3)),
+        **{
+            key: storage(np.zeros(N_PAIRS))
+            for key in ("Nr1", "Nr2", "Nr3", "Nr4", "Nrt", "d34")
+        },
+    }
+
+
+def ll82_args(rng, storage):
+    r_1, r_2 = (rng.uniform(0.1, 3, N_PAIRS) * 1e-3 for _ in range(2))
+    d_s, d_l = 2 * np.minimum(r_1, r_2), 2 * np.maximum(r_1, r_2)
+    return {
+        "CKE": storage(10 ** rng.uniform(-8, -4, N_PAIRS)),
+        "W": storage(rng.uniform(0, 3, N_PAIRS)),
+        "W2": storage(rng.uniform(0, 3, N_PAIRS)),
+        "St": storage(np.pi * 0.072 * (d_s**2 + d_l**2)),
+        "ds": storage(d_s),
+        "dl": storage(d_l),
+        "dcoal": storage((d_s**3 + d_l**3) ** (1 / 3)),
+        "x_plus_y": storage(4 / 3 * np.pi * (r_1**3 + r_2**3)),
+        **{key: storage(np.zeros(N_PAIRS)) for key in ("Rf", "Rs", "Rd")},
+    }
+
+
+class TestFragmentationMethods:
+    @staticmethod
+    @pytest.mark.parametrize("log_grid", (True, False))
+    def test_lookup_table_error_estimate(log_grid):
+        # arrange
+        x_range = (0.1, 10)
+        sut = LookupTable(
+            functions=(np.sqrt,), x_range=x_range, n_points=100, log_grid=log_grid
+        )
+        x = np.random.default_rng(seed=44).uniform(*x_range, 10000)
+
+        # act
+        error = np.abs(interpolated(sut.data, x) - np.sqrt(x))
+
+        # assert
+        assert 0 < np.amax(error) <= sut.error[0] * 1.01
+        if not log_grid:
+            h = (x_range[1] - x_range[0]) / 99
+            max_abs_second_derivative = x_range[0] ** -1.5 / 4
+            assert sut.error[0] <= h**2 / 8 * max_abs_second_derivative
+
+    @staticmethod
+    def test_lookup_out_of_range():
+        # arrange
+        tables = (
+            LookupTable(functions=(np.exp,), x_range=(1, 2), n_points=10).data,
+            LookupTable.disabled(1),
+        )
+
+        # act
+        values = [interpolated(table, np.asarray([0.5, 1.5, 2.5])) for table in tables]
+
+        # assert
+        np.testing.assert_array_equal(np.isnan(values[0]), (True, False, True))
+        assert np.isnan(values[1]).all()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "fragmentation, make_args",
+        (("Straub2010Nf", straub_args), ("LowList1982Nf", ll82_args)),
+    )
+    def test_tabulated_fragmentation_matches_direct_evaluation(
+        fragmentation, make_args
+    ):
+        # arrange
+        backend = CPU(Formulae(fragmentation_function=fragmentation))
+        storage = backend.Storage.from_ndarray
+        method, tables = {
+            "Straub2010Nf": (
+                backend.straub_fragmentation,
+                backend.straub_lookup_tables,
+            ),
+            "LowList1982Nf": (backend.ll82_fragmentation, backend.ll82_lookup_tables),
+        }[fragmentation]
+        rand = np.random.default_rng(seed=44).uniform(0, 1, N_PAIRS)
+        frag_volume = {}
+
+        # act
+        for tabulate in (True, False):
+            frag_volume[tabulate] = storage(np.zeros(N_PAIRS))
+            method(
+                **make_args(np.random.default_rng(seed=44), storage),
+                n_fragment=storage(np.zeros(N_PAIRS)),
+                frag_volume=frag_volume[tabulate],
+                rand=storage(rand),
+                vmin=0.0,
+                nfmax=None,
+                tables=tables() if tabulate else None,
+            )
+
+        # assert
+        sut, expected = (
+            frag_volume[tabulate].to_ndarray() for tabulate in (True, False)
+        )
+        assert (sut != expected).any()
+        # sampled mode may differ if rand is within table error from mode-fraction sum
+        assert np.mean(~np.isclose(sut, expected, rtol=1e-3, atol=0)) <= 1e-3
+
+    @staticmethod
+    def test_slams_fragmentation_matches_series():
+        # arrange
+        backend = CPU()
+        storage = backend.Storage.from_ndarray
+        rand = np.concatenate(
+            (np.random.default_rng(seed=44).uniform(0, 1, N_PAIRS), (0.0, 0.999))
+        )
+        n_fragment = storage(np.zeros(rand.size))
+        probs = storage(np.zeros(rand.size))
+
+        # act
+        backend.slams_fragmentation(
+            n_fragment=n_fragment,
+            frag_volume=storage(np.zeros(rand.size)),
+            x_plus_y=storage(np.ones(rand.size)),
+            probs=probs,
+            rand=storage(rand),
+            vmin=0.0,
+            nfmax=None,
+        )
+
+        # assert
+        expected_n_fragment = np.ones(rand.size)
+        expected_probs = np.zeros(rand.size)
+        for i, rand_i in enumerate(rand):
+            for n in range(22):
+                expected_probs[i] += 0.91 * (n + 2) ** (-1.56)
+                if rand_i < expected_probs[i]:
+                    expected_n_fragment[i] = n + 2
+                    break
+        np.testing.assert_array_equal(n_fragment.to_ndarray(), expected_n_fragment)
+        np.testing.assert_allclose(probs.to_ndarray(), expected_probs, rtol=1e-12)
+        assert n_fragment.to_ndarray()[-1] == 1
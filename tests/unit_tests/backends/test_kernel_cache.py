@@ -0,0 +1,114 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import os
+import subprocess
+import sys
+import time
+
+import numba
+import pytest
+
+from PySDM.backends.impl_numba.kernel_cache import KernelCache, kernel_cache
+from PySDM.formulae import Formulae
+
+SCRIPT = """
+import numpy as np
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.kernel_cache import kernel_cache
+backend = CPU()
+data = backend.Storage.from_ndarray(np.linspace(1e-12, 1e-9, 10))
+out = backend.Storage.empty(data.shape, float)
+backend.volume_of_water_mass(out, data)
+print(kernel_cache.hits, kernel_cache.misses, kernel_cache.uncacheable)
+"""
+
+
+def _entry(directory, name, size, age):
+    subdir = directory / name[:2]
+    subdir.mkdir(exist_ok=True)
+    paths = (subdir / f"{name}.py311.nbi", subdir / f"{name}.py311.0.nbc")
+    for path in paths:
+        path.write_bytes(b"0" * size)
+        os.utime(path, (time.time() - age, time.time() - age))
+    return paths
+
+
+class TestKernelCache:
+    @staticmethod
+    @pytest.mark.skipif(
+        numba.config.DISABLE_JIT,  # pylint: disable=no-member
+        reason="no compilation without JIT",
+    )
+    def test_key_depends_on_constants_but_not_on_seed():
+        # arrange
+        formulae = (
+            Formulae(seed=1),
+            Formulae(seed=2),
+            Formulae(constants={"rho_w": 666}),
+        )
+
+        # act
+        keys = [
+            kernel_cache.key(f.particle_shape_and_density.mass_to_volume)
+            for f in formulae
+        ]
+
+        # assert
+        assert keys[0] == keys[1]
+        assert keys[0] != keys[2]
+
+    @staticmethod
+    @pytest.mark.skipif(
+        numba.config.DISABLE_JIT,  # pylint: disable=no-member
+        reason="no compilation without JIT",
+    )
+    def test_second_process_loads_from_cache(tmp_path):
+        # arrange
+        env = {**os.environ, "PYSDM_KERNEL_CACHE_DIR": str(tmp_path)}
+
+        # act
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", SCRIPT],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            for _ in range(2)
+        ]
+
+        # assert
+        hits, misses, uncacheable = (int(value) for value in outputs[0])
+        assert hits == 0 and misses > uncacheable
+        hits, misses, uncacheable = (int(value) for value in outputs[1])
+        assert hits > 0 and misses == uncacheable
+
+    @staticmethod
+    def test_evict_by_age_and_size(tmp_path):
+        # arrange
+        sut = KernelCache()
+        sut.enable(tmp_path)
+        old = _entry(tmp_path, "aa_old", size=10, age=100)
+        lru = _entry(tmp_path, "bb_lru", size=10, age=10)
+        mru = _entry(tmp_path, "cc_mru", size=10, age=1)
+
+        # act
+        removed = sut.evict(max_age=50, max_size=25)
+
+        # assert
+        assert removed == 2
+        assert not any(path.exists() for path in old + lru)
+        assert all(path.exists() for path in mru)
+        assert sut.size() == 20
+
+    @staticmethod
+    def test_clear(tmp_path):
+        # arrange
+        sut = KernelCache(directory=tmp_path)
+        _entry(tmp_path, "dd_any", size=10, age=0)
+
+        # act
+        sut.clear()
+
+        # assert
+        assert len(sut.entries()) == 0
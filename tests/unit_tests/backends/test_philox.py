@@ -0,0 +1,152 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.philox import philox4x32, uniform
+from PySDM.backends.impl_numba.random import CounterBasedRandom
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
+# known-answer test vectors from the Random123 library (kat_vectors)
+M = 0xFFFFFFFF
+
+
+class TestPhilox:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "counter, key, expected",
+        (
+            ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+            ((M, M, M, M), (M, M), (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD)),
+            (
+                (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+                (0xA4093822, 0x299F31D0),
+                (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+            ),
+        ),
+    )
+    def test_known_answers(counter, key, expected):
+        # act
+        actual = philox4x32(*counter, *key)
+
+        # assert
+        assert tuple(int(word) for word in actual) == expected
+
+    @staticmethod
+    def test_uniform_range_and_moments():
+        # act
+        sut = np.asarray([uniform(44, 0, i) for i in range(10000)])
+
+        # assert
+        assert (sut >= 0).all() and (sut < 1).all()
+        np.testing.assert_allclose(np.mean(sut), 1 / 2, atol=0.01)
+        np.testing.assert_allclose(np.var(sut), 1 / 12, atol=0.01)
+
+    @staticmethod
+    @pytest.mark.parametrize("parallel", (False, True))
+    def test_counter_based_random_independent_of_size_and_threading(parallel):
+        # arrange
+        storage = CPU().Storage
+        short, long = storage.empty(10, dtype=float), storage.empty(100, dtype=float)
+
+        # act
+        CounterBasedRandom(10, 44, parallel=parallel)(short)
+        CounterBasedRandom(100, 44)(long)
+
+        # assert
+        np.testing.assert_array_equal(short.to_ndarray(), long.to_ndarray()[:10])
+        assert short.to_ndarray()[9] == uniform(44, 0, 9)
+
+    @staticmethod
+    def test_counter_based_random_keyed_on_array_position():
+        # arrange
+        storage = CPU().Storage.empty(8, dtype=float)
+        sut = CounterBasedRandom(8, 44)
+        sut(storage)
+
+        # act
+        sut(storage)
+
+        # assert
+        np.testing.assert_array_equal(
+            storage.to_ndarray(), [uniform(44, 1, position) for position in range(8)]
+        )
+
+    @staticmethod
+    def test_reserve_step():
+        # arrange
+        storage = CPU().Storage.empty(8, dtype=float)
+        sut = CounterBasedRandom(8, 44)
+        sut(storage)
+
+        # act
+        seed, step = sut.reserve_step()
+        sut(storage)
+
+        # assert
+        assert (seed, step) == (44, 1)
+        assert storage.to_ndarray()[0] == uniform(44, 2, 0)
+
+    @staticmethod
+    def test_coalescence_keyed_on_super_droplet_id():
+        # arrange
+        n_sd = 8
+        builder = Builder(
+            n_sd=n_sd,
+            backend=CPU(counter_based_random=True),
+            environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+            dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+        )
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.full(n_sd, 1e6),
+                "volume": np.linspace(1, 2, n_sd) * si.um**3,
+            },
+        )
+        sut = particulator.dynamics["Collision"]
+
+        # act
+        particulator.run(steps=2)
+
+        # assert
+        assert sut.keyed_rand
+        assert sut.rnd_opt_coll.rand is None
+        np.testing.assert_array_equal(
+            np.sort(particulator.attributes["super droplet id"].to_ndarray()),
+            np.arange(n_sd),
+        )
+        assert sut.rnd_opt_coll.rnd.get_state()["step"] == 4
+
+    @staticmethod
+    def test_counter_based_random_state():
+        # arrange
+        storage = CPU().Storage.empty(16, dtype=float)
+        sut = CounterBasedRandom(16, 44)
+        sut(storage)
+        state = sut.get_state()
+        sut(storage)
+        expected = storage.to_ndarray()
+
+        # act
+        sut.set_state(state)
+        sut(storage)
+
+        # assert
+        np.testing.assert_array_equal(storage.to_ndarray(), expected)
+        assert state == {"seed": 44, "step": 1}
+
+    @staticmethod
+    def test_backend_option():
+        # arrange
+        backend = CPU(counter_based_random=True)
+
+        # act
+        sut = backend.Random(8, 44)
+
+        # assert
+        assert isinstance(sut, CounterBasedRandom)
+        assert not isinstance(CPU().Random(8, 44), CounterBasedRandom)
@@ -0,0 +1,202 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import multiprocessing
+from threading import Thread
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.decomposition import PipeTransport, SlabDecomposition, SlabDisplacement
+from PySDM.dynamics import Displacement
+from PySDM.environments import Kinematic2D
+from PySDM.physics import si
+
+GRID = (6, 3)
+SIZE = (60 * si.m, 30 * si.m)
+N_SD = 24
+N_STEPS = 8
+POSITIONS = np.random.default_rng(seed=44).uniform(
+    low=0, high=np.asarray(GRID).reshape(2, 1), size=(2, N_SD)
+)
+COURANT_FIELD = (
+    np.full((GRID[0] + 1, GRID[1]), 0.4),
+    np.zeros((GRID[0], GRID[1] + 1)),
+)
+
+
+def freezing_temperature(multiplicities):
+    """non-extensive base attribute unique to each super-droplet"""
+    return 200 * si.K + np.asarray(multiplicities, dtype=float)
+
+
+def _run(positions, multiplicities, displacement, courant_field, grid, n_sd):
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(),
+        environment=Kinematic2D(
+            dt=1 * si.s, grid=grid, size=SIZE, rhod_of=lambda zZ: 1 + 0 * zZ
+        ),
+        dynamics=(displacement,),
+    )
+    cell_id, cell_origin, position_in_cell = (
+        builder.particulator.mesh.cellular_attributes(positions)
+    )
+    attributes = {
+        "multiplicity": multiplicities,
+        "water mass": np.full(len(multiplicities), 1 * si.ng),
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+        "freezing temperature": freezing_temperature(multiplicities),
+    }
+    if n_sd > len(multiplicities):
+        attributes = SlabDecomposition.pad_attributes(attributes, n_sd)
+    particulator = builder.build(attributes=attributes)
+    particulator.dynamics["Displacement"].upload_courant_field(courant_field)
+    particulator.run(steps=N_STEPS)
+    return (
+        particulator.attributes["multiplicity"].to_ndarray(),
+        particulator.attributes["cell origin"].to_ndarray()
+        + particulator.attributes["position in cell"].to_ndarray(),
+        particulator.attributes["freezing temperature"].to_ndarray(),
+    )
+
+
+def _run_slab(transport, queue):
+    decomposition = SlabDecomposition(grid=GRID, size=SIZE, transport=transport)
+    mask, positions = decomposition.local_positions(POSITIONS)
+    multiplicities, positions, freezing_temperatures = _run(
+        positions=positions,
+        multiplicities=np.arange(1, N_SD + 1)[mask],
+        displacement=SlabDisplacement(decomposition=decomposition),
+        courant_field=decomposition.courant_field(COURANT_FIELD),
+        grid=decomposition.local_grid,
+        n_sd=N_SD,
+    )
+    positions[0] += decomposition.offset
+    queue.put((transport.rank, multiplicities, positions, freezing_temperatures))
+
+
+class TestSlabDecomposition:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "nx, n_slabs, widths", ((6, 3, (2, 2, 2)), (7, 3, (3, 2, 2)), (2, 1, (2,)))
+    )
+    def test_widths_and_offsets(nx, n_slabs, widths):
+        # act
+        sut = [
+            SlabDecomposition(grid=(nx, 1), size=(nx, 1), transport=transport)
+            for transport in PipeTransport.create(n_slabs)
+        ]
+
+        # assert
+        assert tuple(slab.width for slab in sut) == widths
+        assert tuple(slab.offset for slab in sut) == tuple(np.cumsum((0, *widths[:-1])))
+        assert sum(slab.local_size[0] for slab in sut) == nx
+
+    @staticmethod
+    @pytest.mark.parametrize("n_slabs", (1, 2, 3))
+    def test_exchange_halos(n_slabs, n_halo=2):
+        # arrange
+        field = np.arange(9 * 2, dtype=float).reshape(9, 2)
+        expected = np.pad(field, ((n_halo, n_halo), (0, 0)), mode="wrap")
+        slabs = [
+            SlabDecomposition(grid=field.shape, size=field.shape, transport=transport)
+            for transport in PipeTransport.create(n_slabs)
+        ]
+        fields = [
+            np.pad(slab.subdomain(field), ((n_halo, n_halo), (0, 0))) for slab in slabs
+        ]
+
+        # act
+        threads = [
+            Thread(target=slab.exchange_halos, args=(local_field, n_halo))
+            for slab, local_field in zip(slabs, fields)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # assert
+        for slab, local_field in zip(slabs, fields):
+            np.testing.assert_array_equal(
+                local_field,
+                expected[slab.offset : slab.offset + slab.width + 2 * n_halo],
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("staggered", (False, True))
+    def test_halo_window(staggered, n_halo=2):
+        # arrange
+        n_rows = 5
+        field = np.arange((n_rows + staggered) * 2).reshape(-1, 2)
+        slabs = [
+            SlabDecomposition(grid=(n_rows, 2), size=(n_rows, 2), transport=transport)
+            for transport in PipeTransport.create(2)
+        ]
+
+        # act
+        sut = [slab.halo_window(field, n_halo, staggered=staggered) for slab in slabs]
+
+        # assert
+        periodic = np.pad(
+            field[:n_rows], ((n_halo, n_halo + staggered), (0, 0)), "wrap"
+        )
+        for slab, window in zip(slabs, sut):
+            assert window.shape[0] == slab.width + 2 * n_halo + staggered
+            np.testing.assert_array_equal(
+                window, periodic[slab.offset : slab.offset + window.shape[0]]
+            )
+
+    @staticmethod
+    def test_pad_attributes():
+        # act
+        sut = SlabDecomposition.pad_attributes(
+            {"multiplicity": np.asarray([2, 3]), "cell origin": np.zeros((2, 2))}, 4
+        )
+
+        # assert
+        np.testing.assert_array_equal(sut["multiplicity"], (2, 3, 0, 0))
+        assert sut["cell origin"].shape == (2, 4)
+
+    @staticmethod
+    def test_migration_matches_single_domain(n_slabs=2):
+        # arrange
+        multiplicities, positions, _ = _run(
+            positions=POSITIONS,
+            multiplicities=np.arange(1, N_SD + 1),
+            displacement=Displacement(),
+            courant_field=COURANT_FIELD,
+            grid=GRID,
+            n_sd=N_SD,
+        )
+        expected = positions[:, np.argsort(multiplicities)]
+        mp_context = multiprocessing.get_context("spawn")
+        queue = mp_context.Queue()
+        processes = [
+            mp_context.Process(target=_run_slab, args=(transport, queue))
+            for transport in PipeTransport.create(n_slabs, mp_context=mp_context)
+        ]
+
+        # act
+        for process in processes:
+            process.start()
+        results = [queue.get(timeout=600) for _ in processes]
+        for process in processes:
+            process.join()
+
+        # assert
+        multiplicities = np.concatenate([result[1] for result in results])
+        positions = np.concatenate([result[2] for result in results], axis=1)
+        freezing_temperatures = np.concatenate([result[3] for result in results])
+        np.testing.assert_array_equal(np.sort(multiplicities), np.arange(1, N_SD + 1))
+        np.testing.assert_allclose(positions[:, np.argsort(multiplicities)], expected)
+        np.testing.assert_array_equal(
+            freezing_temperatures, freezing_temperature(multiplicities)
+        )
+        for rank, _, slab_positions, _ in results:
+            width = GRID[0] // n_slabs
+            assert (rank * width <= slab_positions[0]).all()
+            assert (slab_positions[0] < (rank + 1) * width).all()
@@ -40,6 +40,7 @@ class TestFragmentations:  # pylint: disable=too-few-public-methods
             ),
             SLAMS(),
             Straub2010Nf(),
+            Straub2010Nf(tabulate=True),
         ),
     )
     def test_fragmentation_fn_call(fragmentation_fn, backend_class):
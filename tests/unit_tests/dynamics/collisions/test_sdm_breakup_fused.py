@@ -0,0 +1,226 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics.collisions import breakup_fragmentations
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.coalescence_efficiencies import (
+    ConstEc,
+    LowList1982Ec,
+    Straub2010Ec,
+)
+from PySDM.dynamics.collisions.collision import (
+    FUSED_FRAGMENTATIONS,
+    Collision,
+    fused_variant,
+)
+from PySDM.dynamics.collisions.collision_kernels import ConstantK
+from PySDM.environments import Box
+from PySDM.initialisation import spectra
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.physics import si
+
+N_SD = 2**6
+N_STEPS = 3
+
+FRAGMENTATIONS = {
+    "Gaussian": lambda: breakup_fragmentations.Gaussian(
+        mu=(100 * si.um) ** 3, sigma=(50 * si.um) ** 3, vmin=(1 * si.um) ** 3
+    ),
+    "Exponential": lambda: breakup_fragmentations.Exponential(
+        scale=(100 * si.um) ** 3, nfmax=10
+    ),
+    "Straub2010Nf": lambda **kwargs: breakup_fragmentations.Straub2010Nf(
+        vmin=(1 * si.um) ** 3, **kwargs
+    ),
+    "LowList1982Nf": lambda **kwargs: breakup_fragmentations.LowList1982Nf(
+        vmin=(1 * si.um) ** 3, **kwargs
+    ),
+}
+
+COALESCENCE_EFFICIENCIES = {
+    "ConstEc": lambda: ConstEc(Ec=0.5),
+    "Straub2010Ec": Straub2010Ec,
+    "LowList1982Ec": LowList1982Ec,
+}
+
+
+def make_particulator(
+    *, fused, coalescence_efficiency, fragmentation, fragmentation_kwargs=None
+):
+    formulae = Formulae(fragmentation_function=fragmentation, seed=44)
+    collision = Collision(
+        collision_kernel=ConstantK(a=1 * si.cm**3 / si.s),
+        coalescence_efficiency=COALESCENCE_EFFICIENCIES[coalescence_efficiency](),
+        breakup_efficiency=ConstEb(Eb=0.5),
+        fragmentation_function=FRAGMENTATIONS[fragmentation](
+            **(fragmentation_kwargs or {})
+        ),
+        adaptive=False,
+        warn_overflows=False,
+        fused=fused,
+    )
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(formulae),
+        environment=Box(dv=1 * si.m**3, dt=1 * si.s),
+        dynamics=(collision,),
+    )
+    attributes = {}
+    attributes["volume"], attributes["multiplicity"] = ConstantMultiplicity(
+        spectra.Exponential(
+            norm_factor=1e6 / si.m**3,
+            scale=formulae.trivia.volume(radius=500 * si.um),
+        )
+    ).sample_deterministic(N_SD)
+    particulator = builder.build(attributes)
+    particulator.environment["rhod"] = 1.0
+    return particulator
+
+
+class TestSDMBreakupFused:
+    @staticmethod
+    @pytest.mark.parametrize("fragmentation", FRAGMENTATIONS)
+    @pytest.mark.parametrize("coalescence_efficiency", COALESCENCE_EFFICIENCIES)
+    def test_fused_matches_pairwise_storage_path(coalescence_efficiency, fragmentation):
+        # arrange
+        particulators = {
+            fused: make_particulator(
+                fused=fused,
+                coalescence_efficiency=coalescence_efficiency,
+                fragmentation=fragmentation,
+            )
+            for fused in (True, False)
+        }
+
+        # act
+        for particulator in particulators.values():
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        sut, expected = (
+            particulators[fused].dynamics["Collision"] for fused in (True, False)
+        )
+        assert sut.fused and not expected.fused
+        assert sut.Ec_temp is None and sut.fragment_mass is None
+        assert expected.breakup_rate.to_ndarray()[0] > 0
+        for rate in ("coalescence_rate", "breakup_rate", "breakup_rate_deficit"):
+            np.testing.assert_array_equal(
+                getattr(sut, rate).to_ndarray(), getattr(expected, rate).to_ndarray()
+            )
+        for attr in ("multiplicity", "water mass"):
+            np.testing.assert_allclose(
+                particulators[True].attributes[attr].to_ndarray(),
+                particulators[False].attributes[attr].to_ndarray(),
+                rtol=1e-9,
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("fragmentation", ("Straub2010Nf", "LowList1982Nf"))
+    def test_fused_matches_pairwise_storage_path_with_lookup_tables(fragmentation):
+        # arrange
+        particulators = {
+            fused: make_particulator(
+                fused=fused,
+                coalescence_efficiency="ConstEc",
+                fragmentation=fragmentation,
+                fragmentation_kwargs={"tabulate": True},
+            )
+            for fused in (True, False)
+        }
+
+        # act
+        for particulator in particulators.values():
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        sut, expected = (
+            particulators[fused].dynamics["Collision"] for fused in (True, False)
+        )
+        assert sut.fused and not expected.fused
+        assert sut.fused_args["fragmentation_tables"] is not None
+        assert (
+            sut.fused_args["fragmentation_tables"]
+            is sut.compute_number_of_fragments.tables
+        )
+        assert expected.compute_number_of_fragments.tables is not None
+        np.testing.assert_array_equal(
+            sut.breakup_rate.to_ndarray(), expected.breakup_rate.to_ndarray()
+        )
+        np.testing.assert_allclose(
+            particulators[True].attributes["water mass"].to_ndarray(),
+            particulators[False].attributes["water mass"].to_ndarray(),
+            rtol=1e-9,
+        )
+
+    @staticmethod
+    def test_fallback_for_unsupported_fragmentation():
+        # arrange
+        collision = Collision(
+            collision_kernel=ConstantK(a=1 * si.cm**3 / si.s),
+            coalescence_efficiency=ConstEc(Ec=0.5),
+            breakup_efficiency=ConstEb(Eb=0.5),
+            fragmentation_function=breakup_fragmentations.AlwaysN(n=2),
+        )
+        builder = Builder(
+            n_sd=N_SD,
+            backend=CPU(Formulae(fragmentation_function="AlwaysN")),
+            environment=Box(dv=1 * si.m**3, dt=1 * si.s),
+            dynamics=(collision,),
+        )
+
+        # act
+        particulator = builder.build(
+            {
+                "multiplicity": np.ones(N_SD),
+                "volume": np.full(N_SD, (10 * si.um) ** 3),
+            }
+        )
+
+        # assert
+        sut = particulator.dynamics["Collision"]
+        assert not sut.fused
+        assert sut.fragment_mass is not None
+
+    @staticmethod
+    def test_fallback_for_subclass_of_supported_fragmentation():
+        # arrange
+        class Subclass(breakup_fragmentations.Exponential):
+            def __call__(self, nf, frag_mass, u01, is_first_in_pair):
+                super().__call__(nf, frag_mass, u01, is_first_in_pair)
+                frag_mass /= 2
+
+        fragmentation = Subclass(scale=1 * si.um**3)
+        collision = Collision(
+            collision_kernel=ConstantK(a=1 * si.cm**3 / si.s),
+            coalescence_efficiency=ConstEc(Ec=0.5),
+            breakup_efficiency=ConstEb(Eb=0.5),
+            fragmentation_function=fragmentation,
+        )
+        builder = Builder(
+            n_sd=N_SD,
+            backend=CPU(Formulae(fragmentation_function="Exponential")),
+            environment=Box(dv=1 * si.m**3, dt=1 * si.s),
+            dynamics=(collision,),
+        )
+
+        # act
+        particulator = builder.build(
+            {
+                "multiplicity": np.ones(N_SD),
+                "volume": np.full(N_SD, (10 * si.um) ** 3),
+            }
+        )
+
+        # assert
+        assert fused_variant(fragmentation, FUSED_FRAGMENTATIONS) is None
+        assert (
+            fused_variant(
+                breakup_fragmentations.Exponential(scale=1 * si.um**3),
+                FUSED_FRAGMENTATIONS,
+            )
+            is breakup_fragmentations.Exponential
+        )
+        assert not particulator.dynamics["Collision"].fused
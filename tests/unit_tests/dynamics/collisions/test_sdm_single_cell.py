@@ -2,7 +2,8 @@
 import numpy as np
 import pytest
 
-from PySDM.backends import ThrustRTC
+from PySDM.backends import CPU, ThrustRTC
+from PySDM.backends.impl_numba.philox import uniform
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
@@ -257,6 +258,50 @@ class TestSDMSingleCell:
                 # Assert
                 assert expected(p, r) == prob_arr.to_ndarray()[0]
 
+    @staticmethod
+    def test_compute_gamma_keyed_on_super_droplet_ids():
+        # Arrange
+        backend = CPU(counter_based_random=True)
+        n_sd = 16
+        seed, step = 44, 3
+        slots = np.random.default_rng(seed=44).permutation(n_sd)
+        super_droplet_id = np.empty(n_sd, dtype=backend.Storage.INT)
+        super_droplet_id[slots] = np.arange(n_sd)[::-1]
+        prob = np.linspace(0.1, 0.9, n_sd // 2)
+        idx = make_Index(backend).from_ndarray(slots)
+        mult = make_IndexedStorage(backend).from_ndarray(
+            idx, np.full(n_sd, 1, dtype=backend.Storage.INT)
+        )
+        indicator = make_PairIndicator(backend)(n_sd)
+        indicator.indicator[:] = backend.Storage.from_ndarray(np.arange(n_sd) % 2 == 0)
+        out = backend.Storage.from_ndarray(prob.copy())
+        _ = backend.Storage.from_ndarray(np.zeros(1, dtype=backend.Storage.INT))
+
+        # Act
+        backend.compute_gamma(
+            prob=out,
+            rand=(seed, step),
+            multiplicity=mult,
+            cell_id=backend.Storage.from_ndarray(
+                np.zeros(n_sd, dtype=backend.Storage.INT)
+            ),
+            is_first_in_pair=indicator,
+            collision_rate=_,
+            collision_rate_deficit=_,
+            out=out,
+            super_droplet_id=make_IndexedStorage(backend).from_ndarray(
+                idx, super_droplet_id
+            ),
+        )
+
+        # Assert
+        pair_ids = super_droplet_id[slots].reshape(-1, 2)
+        expected = [
+            np.ceil(p - uniform(seed, step, min(ids))) for p, ids in zip(prob, pair_ids)
+        ]
+        np.testing.assert_array_equal(out.to_ndarray(), expected)
+        assert 0 < np.sum(expected) < len(expected)
+
     @staticmethod
     @pytest.mark.parametrize(
         "optimized_random",
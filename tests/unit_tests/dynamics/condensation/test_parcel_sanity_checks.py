@@ -198,6 +198,38 @@ class TestParcelSanityChecks:
         else:
             assert pred_thd_old == env.get_predicted("thd")[cell_id]
 
+    @staticmethod
+    def test_saved_solves_counter_zero_without_adaptivity(backend_class):
+        # arrange
+        env = Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.mg,
+            p0=1000 * si.hPa,
+            initial_water_vapour_mixing_ratio=22.2 * si.g / si.kg,
+            T0=300 * si.K,
+            w=1 * si.m / si.s,
+        )
+        builder = Builder(
+            n_sd=10,
+            backend=backend_class(),
+            environment=env,
+            dynamics=(AmbientThermodynamics(), Condensation(adaptive=False)),
+        )
+        particulator = builder.build(
+            products=(),
+            attributes=builder.particulator.environment.init_attributes(
+                kappa=1, r_dry=0.25 * si.um, n_in_dv=1000
+            ),
+        )
+        sut = particulator.dynamics["Condensation"].counters["n_saved_solves"]
+        assert sut.to_ndarray() == 0
+
+        # act
+        particulator.run(steps=1)
+
+        # assert
+        assert sut.to_ndarray() == 0
+
     @staticmethod
     def test_zero_initial_delta_liquid_water_mixing_ratio(backend_class):
         # arrange
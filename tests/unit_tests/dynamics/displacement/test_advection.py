@@ -2,9 +2,27 @@
 import numpy as np
 import pytest
 
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement
+
 from .displacement_settings import DisplacementSettings
 
 
+def settings_with_substeps_varying_in_space(grid, n_sd=32):
+    """flow confined to the right half of the domain in the first dimension"""
+    settings = DisplacementSettings(n_sd=n_sd, grid=grid)
+    x = np.linspace(0, 1, grid[0] + 1)
+    settings.courant_field_data = (
+        np.repeat((0.3 * np.sin(2 * np.pi * x) * (x > 0.5))[:, None], grid[1], 1),
+        np.zeros((grid[0], grid[1] + 1)),
+    )
+    settings.positions = [
+        list(np.repeat(np.arange(grid[0]) + 0.5, n_sd // grid[0])),
+        list(np.tile(np.arange(grid[1]) + 0.5, n_sd // grid[1])),
+    ]
+    return settings
+
+
 class TestExplicitEulerWithInterpolation:
     @staticmethod
     @pytest.mark.parametrize(
@@ -84,6 +102,140 @@ class TestExplicitEulerWithInterpolation:
             particulator.attributes["cell origin"][:, dim_x], np.array([2, 1])
         )
 
+    @staticmethod
+    @pytest.mark.parametrize("grid", ((7,), (4, 5), (3, 4, 2)))
+    def test_fused_matches_multi_pass(grid):
+        # Arrange
+        rng = np.random.default_rng(seed=44)
+        n_sd = 64
+        settings = DisplacementSettings(n_sd=n_sd, grid=grid)
+        settings.courant_field_data = tuple(
+            rng.uniform(
+                -0.4, 0.4, size=np.asarray(grid) + np.eye(len(grid), dtype=int)[dim]
+            )
+            for dim in range(len(grid))
+        )
+        settings.positions = [list(rng.uniform(0, size, n_sd)) for size in grid]
+        suts, particulators = zip(
+            *(
+                settings.get_displacement(
+                    CPU, scheme="ImplicitInSpace", adaptive=False, fused=fused
+                )
+                for fused in (True, False)
+            )
+        )
+
+        # Act
+        for sut in suts:
+            for _ in range(3):
+                sut()
+
+        # Assert
+        assert 0 < particulators[0].attributes.super_droplet_count < n_sd
+        values = [
+            {
+                key: particulator.attributes[key].to_ndarray()
+                for key in ("cell id", "cell origin", "position in cell")
+            }
+            for particulator in particulators
+        ]
+        order = [np.lexsort((*v["position in cell"], v["cell id"])) for v in values]
+        for key in values[0]:
+            np.testing.assert_allclose(
+                values[0][key][..., order[0]],
+                values[1][key][..., order[1]],
+                rtol=1e-14,
+            )
+
+    @staticmethod
+    def test_fused_matches_multi_pass_with_domain_wide_substeps():
+        # Arrange
+        grid = (8, 4)
+        settings = settings_with_substeps_varying_in_space(grid)
+        suts, particulators = zip(
+            *(
+                settings.get_displacement(CPU, scheme="ImplicitInSpace", fused=fused)
+                for fused in (True, False)
+            )
+        )
+
+        # Act
+        for sut in suts:
+            for _ in range(3):
+                sut()
+
+        # Assert
+        assert suts[0].fused and not suts[1].fused
+        for sut in suts:
+            assert sut._n_substeps > 1
+            np.testing.assert_array_equal(
+                sut.n_substeps_per_cell.to_ndarray(), sut._n_substeps
+            )
+        for key in ("cell id", "cell origin", "position in cell"):
+            np.testing.assert_allclose(
+                *(
+                    particulator.attributes[key].to_ndarray()
+                    for particulator in particulators
+                ),
+                rtol=1e-14,
+            )
+
+    @staticmethod
+    def test_substeps_per_cell_require_fused_pass():
+        with pytest.raises(NotImplementedError):
+            DisplacementSettings().get_displacement(
+                CPU, scheme="ImplicitInSpace", fused=False, substeps_per_cell=True
+            )
+
+    @staticmethod
+    def test_multi_pass_by_default():
+        # Arrange
+        settings = DisplacementSettings()
+
+        # Act
+        sut = Displacement()
+        sut.register(settings.get_displacement(CPU, scheme="ImplicitInSpace")[1])
+
+        # Assert
+        assert not sut.fused
+
+    @staticmethod
+    def test_substeps_vary_in_space():
+        # Arrange
+        grid = (8, 4)
+        settings = settings_with_substeps_varying_in_space(grid)
+        suts, particulators = zip(
+            *(
+                settings.get_displacement(
+                    CPU,
+                    scheme="ImplicitInSpace",
+                    fused=fused,
+                    substeps_per_cell=fused,
+                )
+                for fused in (True, False)
+            )
+        )
+        n_sd = len(settings.n)
+
+        # Act
+        for sut in suts:
+            sut()
+
+        # Assert
+        n_substeps = suts[0].n_substeps_per_cell.to_ndarray().reshape(grid)
+        assert (n_substeps[: grid[0] // 2] == 1).all()
+        assert (n_substeps[grid[0] // 2 :] > 1).all()
+        for particulator in particulators:
+            assert particulator.attributes.super_droplet_count == n_sd
+        np.testing.assert_allclose(
+            *(
+                particulator.attributes["cell origin"].to_ndarray()
+                + particulator.attributes["position in cell"].to_ndarray()
+                for particulator in particulators
+            ),
+            atol=suts[0].rtol,
+        )
+
     @staticmethod
     def test_calculate_displacement(backend_class):
         # Arrange
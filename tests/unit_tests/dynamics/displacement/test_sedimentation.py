@@ -18,13 +18,14 @@ VOLUMES = (1.0, -1.0)
 class TestSedimentation:  # pylint: disable=too-few-public-methods
     @staticmethod
     @pytest.mark.parametrize("volume", [np.asarray((v,)) for v in VOLUMES])
-    def test_boundary_condition(backend_class, volume):
+    @pytest.mark.parametrize("fused", (True, False))
+    def test_boundary_condition(backend_class, volume, fused):
         # Arrange
         settings = DisplacementSettings(n_sd=len(volume), volume=volume)
         settings.dt = 1
         settings.sedimentation = True
         sut, particulator = settings.get_displacement(
-            backend_class, scheme="ImplicitInSpace"
+            backend_class, scheme="ImplicitInSpace", fused=fused
         )
 
         particulator.attributes._ParticleAttributes__attributes[
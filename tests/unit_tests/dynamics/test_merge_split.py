@@ -0,0 +1,150 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import MergeSplit
+from PySDM.environments import Box
+from PySDM.physics import si
+
+
+def make_particulator(*, multiplicity, volume, n_sd=None, **kwargs):
+    n_sd = n_sd or len(multiplicity)
+    n_free = n_sd - len(multiplicity)
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(MergeSplit(**kwargs),),
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.concatenate(
+                (np.asarray(multiplicity, dtype=float), np.full(n_free, np.nan))
+            ),
+            "volume": np.concatenate((np.asarray(volume), np.zeros(n_free))),
+        }
+    )
+
+
+def totals(particulator):
+    multiplicity = particulator.attributes["multiplicity"].to_ndarray()
+    volume = particulator.attributes["volume"].to_ndarray()
+    return np.sum(multiplicity), np.dot(multiplicity, volume)
+
+
+class TestMergeSplit:
+    @staticmethod
+    def test_split_into_free_slots():
+        # arrange
+        particulator = make_particulator(
+            multiplicity=(1001, 10, 2000, 5),
+            volume=np.asarray((1, 2, 3, 4)) * si.um**3,
+            n_sd=8,
+            merge_multiplicity_threshold=1,
+            split_multiplicity_threshold=100,
+        )
+        expected = totals(particulator)
+        assert particulator.attributes.super_droplet_count == 4
+
+        # act
+        particulator.run(steps=1)
+
+        # assert
+        assert particulator.dynamics["MergeSplit"].counters["splits"] == 2
+        assert particulator.attributes.super_droplet_count == 6
+        np.testing.assert_allclose(totals(particulator), expected, rtol=1e-15)
+        assert sorted(particulator.attributes["multiplicity"].to_ndarray()) == [
+            5,
+            10,
+            500,
+            501,
+            1000,
+            1000,
+        ]
+
+    @staticmethod
+    def test_split_bounded_by_free_slots_and_count_per_cell():
+        # arrange
+        particulator = make_particulator(
+            multiplicity=(1000,) * 4,
+            volume=np.ones(4) * si.um**3,
+            n_sd=16,
+            merge_multiplicity_threshold=1,
+            split_multiplicity_threshold=10,
+            count_per_cell_range=(0, 10),
+        )
+
+        # act
+        particulator.run(steps=5)
+
+        # assert
+        assert particulator.attributes.super_droplet_count == 10
+        assert sum(particulator.attributes["multiplicity"].to_ndarray()) == 4000
+
+    @staticmethod
+    def test_merge_near_identical():
+        # arrange
+        particulator = make_particulator(
+            multiplicity=(3, 4, 5, 6, 1000),
+            volume=np.asarray((1, 1.001, 2, 3, 1)) * si.um**3,
+            merge_multiplicity_threshold=10,
+            split_multiplicity_threshold=10000,
+            rtol=0.01,
+        )
+        expected = totals(particulator)
+
+        # act
+        particulator.run(steps=1)
+
+        # assert
+        assert particulator.dynamics["MergeSplit"].counters["merges"] == 1
+        assert particulator.attributes.super_droplet_count == 4
+        np.testing.assert_allclose(totals(particulator), expected, rtol=1e-15)
+        multiplicity = particulator.attributes["multiplicity"].to_ndarray()
+        volume = particulator.attributes["volume"].to_ndarray()
+        merged = multiplicity == 7
+        assert sum(merged) == 1
+        np.testing.assert_allclose(
+            volume[merged], (3 * 1 + 4 * 1.001) / 7 * si.um**3, rtol=1e-15
+        )
+
+    @staticmethod
+    def test_merge_bounded_by_min_count_per_cell():
+        # arrange
+        particulator = make_particulator(
+            multiplicity=(1,) * 8,
+            volume=np.ones(8) * si.um**3,
+            merge_multiplicity_threshold=10,
+            split_multiplicity_threshold=10000,
+            count_per_cell_range=(5, np.inf),
+        )
+
+        # act
+        particulator.run(steps=3)
+
+        # assert
+        assert particulator.attributes.super_droplet_count == 5
+        assert sum(particulator.attributes["multiplicity"].to_ndarray()) == 8
+
+    @staticmethod
+    @pytest.mark.parametrize("interval", (1, 3))
+    def test_interval(interval):
+        # arrange
+        particulator = make_particulator(
+            multiplicity=(1000,),
+            volume=(1 * si.um**3,),
+            n_sd=16,
+            merge_multiplicity_threshold=1,
+            split_multiplicity_threshold=10,
+            interval=interval,
+        )
+
+        # act
+        particulator.run(steps=3)
+
+        # assert
+        assert particulator.dynamics["MergeSplit"].counters["splits"] == (
+            1 + 2 + 4 if interval == 1 else 1
+        )
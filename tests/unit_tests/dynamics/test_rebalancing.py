@@ -0,0 +1,128 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.attributes.impl import get_attribute_class
+from PySDM.backends import CPU
+from PySDM.dynamics import Rebalancing
+from PySDM.physics import si
+from PySDM.products import SuperDropletCountImbalance, SuperDropletCountPerGridbox
+
+from ..dummy_environment import DummyEnvironment
+
+COUNTS = (12, 2, 4)
+N_FREE = 6
+# volumes spread by up to tens of percent between neighbours once merged
+RTOL = 0.25
+
+
+def make_particulator(multiplicity=100, **kwargs):
+    n_sd = sum(COUNTS) + N_FREE
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(),
+        environment=DummyEnvironment(timestep=1 * si.s, grid=(1, len(COUNTS))),
+        dynamics=(Rebalancing(**kwargs),),
+    )
+    positions = np.zeros((2, n_sd))
+    positions[1] = np.concatenate(
+        [np.full(count, cell + 0.5) for cell, count in enumerate(COUNTS)]
+        + [np.full(N_FREE, 0.5)]
+    )
+    cell_id, cell_origin, position_in_cell = (
+        builder.particulator.mesh.cellular_attributes(positions)
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.concatenate(
+                (np.full(sum(COUNTS), multiplicity), np.full(N_FREE, np.nan))
+            ),
+            "volume": np.concatenate(
+                (np.linspace(1, 2, sum(COUNTS)) * si.um**3, np.zeros(N_FREE))
+            ),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        },
+        products=(SuperDropletCountPerGridbox(), SuperDropletCountImbalance()),
+    )
+
+
+def totals(particulator):
+    multiplicity = particulator.attributes["multiplicity"].to_ndarray()
+    volume = particulator.attributes["volume"].to_ndarray()
+    return np.sum(multiplicity), np.dot(multiplicity, volume)
+
+
+class TestRebalancing:
+    @staticmethod
+    def test_counts_reach_target():
+        # arrange
+        particulator = make_particulator(
+            target_count_per_cell=4, tolerance=0, rtol=RTOL
+        )
+        expected_totals = totals(particulator)
+        imbalance_before = particulator.products["super droplet count imbalance"].get()
+
+        # act
+        particulator.run(steps=2)
+
+        # assert
+        np.testing.assert_array_equal(
+            particulator.products["super droplet count per gridbox"].get().ravel(),
+            (4, 4, 4),
+        )
+        assert imbalance_before == 2
+        assert particulator.products["super droplet count imbalance"].get() == 1
+        np.testing.assert_allclose(totals(particulator), expected_totals, rtol=1e-14)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "tolerance, expected_counts", ((0.5, (6, 2, 4)), (0.25, (5, 3, 4)))
+    )
+    def test_tolerance(tolerance, expected_counts):
+        # arrange
+        particulator = make_particulator(
+            target_count_per_cell=4, tolerance=tolerance, rtol=RTOL
+        )
+
+        # act
+        particulator.run(steps=2)
+
+        # assert
+        np.testing.assert_array_equal(
+            particulator.products["super droplet count per gridbox"].get().ravel(),
+            expected_counts,
+        )
+        assert particulator.attributes.super_droplet_count == sum(expected_counts)
+
+    @staticmethod
+    def test_no_merges_of_dissimilar_by_default():
+        # arrange
+        particulator = make_particulator(target_count_per_cell=4, tolerance=0)
+
+        # act
+        particulator.run(steps=2)
+
+        # assert
+        assert particulator.dynamics["Rebalancing"].counters["merges"] == 0
+        assert (
+            particulator.products["super droplet count per gridbox"].get().ravel()[0]
+            == COUNTS[0]
+        )
+
+    @staticmethod
+    def test_no_multiplicity_overflow_upon_merging():
+        # arrange
+        multiplicity = get_attribute_class("multiplicity").MAX_VALUE // 2 + 1
+        particulator = make_particulator(
+            multiplicity=multiplicity, target_count_per_cell=4, tolerance=0, rtol=RTOL
+        )
+
+        # act
+        particulator.run(steps=2)
+
+        # assert
+        assert particulator.dynamics["Rebalancing"].counters["merges"] == 0
+        assert (particulator.attributes["multiplicity"].to_ndarray() > 0).all()
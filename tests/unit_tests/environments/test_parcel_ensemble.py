@@ -0,0 +1,96 @@
+"""tests for the parcel-ensemble environment"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import AmbientRelativeHumidity, ParcelDisplacement
+
+COMMON = {
+    "dt": 1 * si.s,
+    "mass_of_dry_air": 1 * si.kg,
+    "p0": 1000 * si.hPa,
+    "initial_water_vapour_mixing_ratio": 20 * si.g / si.kg,
+}
+W = (0.5 * si.m / si.s, 2 * si.m / si.s, 5 * si.m / si.s)
+T0 = (298 * si.K, 300 * si.K, 301 * si.K)
+KAPPA = (0.1, 0.5, 1.2)
+N_SD_PER_MEMBER = 8
+N_STEPS = 20
+
+R_DRY, SPECIFIC_CONCENTRATION = spectral_sampling.Logarithmic(
+    Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+).sample_deterministic(N_SD_PER_MEMBER)
+
+
+def _run(environment, n_sd, kappa):
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(Formulae()),
+        environment=environment,
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+    attributes = builder.particulator.environment.init_attributes(
+        n_in_dv=SPECIFIC_CONCENTRATION * COMMON["mass_of_dry_air"],
+        kappa=kappa,
+        r_dry=R_DRY,
+    )
+    particulator = builder.build(
+        attributes=attributes,
+        products=(AmbientRelativeHumidity(name="RH"), ParcelDisplacement(name="z")),
+    )
+    particulator.run(steps=N_STEPS)
+    return {
+        "RH": particulator.products["RH"].get().copy(),
+        "z": particulator.products["z"].get().copy(),
+        "water mass": particulator.attributes["water mass"].to_ndarray(),
+    }
+
+
+class TestParcelEnsemble:
+    @staticmethod
+    def test_members_match_independent_parcels():
+        # act
+        ensemble = _run(
+            ParcelEnsemble(w=W, T0=T0, **COMMON),
+            n_sd=len(W) * N_SD_PER_MEMBER,
+            kappa=KAPPA,
+        )
+        parcels = [
+            _run(Parcel(w=w, T0=t0, **COMMON), n_sd=N_SD_PER_MEMBER, kappa=kappa)
+            for w, t0, kappa in zip(W, T0, KAPPA)
+        ]
+
+        # assert
+        for i, parcel in enumerate(parcels):
+            np.testing.assert_allclose(ensemble["RH"][i], parcel["RH"][0], rtol=1e-10)
+            np.testing.assert_allclose(ensemble["z"][i], parcel["z"][0], rtol=1e-10)
+            np.testing.assert_allclose(
+                ensemble["water mass"][i * N_SD_PER_MEMBER : (i + 1) * N_SD_PER_MEMBER],
+                parcel["water mass"],
+                rtol=1e-10,
+            )
+        np.testing.assert_allclose(ensemble["z"], np.asarray(W) * N_STEPS)
+        assert (0.8 < ensemble["RH"]).all() and (ensemble["RH"] < 1.01).all()
+        assert len(np.unique(ensemble["RH"])) == len(W)
+
+    @staticmethod
+    def test_scalar_parameters_require_n_members():
+        # act
+        sut = ParcelEnsemble(w=1 * si.m / si.s, T0=300 * si.K, n_members=4, **COMMON)
+
+        # assert
+        assert sut.mesh.n_cell == 4
+        with pytest.raises(ValueError):
+            ParcelEnsemble(w=1 * si.m / si.s, T0=300 * si.K, **COMMON)
+
+    @staticmethod
+    def test_incompatible_member_counts():
+        with pytest.raises(ValueError):
+            ParcelEnsemble(w=W, T0=T0[:2], **COMMON)
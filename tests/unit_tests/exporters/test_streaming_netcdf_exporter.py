@@ -0,0 +1,95 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.exporters import StreamingNetCDFExporter
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+from PySDM.products import AmbientRelativeHumidity, ParticleSizeSpectrumPerVolume
+
+h5py = pytest.importorskip("h5py")
+
+N_SD = 16
+N_OUTPUTS = 5
+
+
+def make_particulator():
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(Formulae()),
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            T0=300 * si.K,
+            initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+            w=1 * si.m / si.s,
+        ),
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+    r_dry, specific_concentration = spectral_sampling.Logarithmic(
+        Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample_deterministic(N_SD)
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=specific_concentration * 1 * si.kg, kappa=0.5, r_dry=r_dry
+        ),
+        products=(
+            AmbientRelativeHumidity(name="RH"),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum", radius_bins_edges=np.logspace(-8, -5, 7)
+            ),
+        ),
+    )
+
+
+class TestStreamingNetCDFExporter:
+    @staticmethod
+    @pytest.mark.parametrize("compression", (None, "gzip"))
+    def test_appends_each_output_step(tmp_path, compression):
+        # arrange
+        filename = tmp_path / "output.nc"
+        particulator = make_particulator()
+        expected = {"RH": [], "spectrum": []}
+
+        # act
+        with StreamingNetCDFExporter(
+            particulator, filename=filename, compression=compression, max_pending=1
+        ) as sut:
+            for _ in range(N_OUTPUTS):
+                particulator.run(steps=2)
+                sut.write()
+                for key, values in expected.items():
+                    values.append(particulator.products[key].get().copy())
+
+        # assert
+        assert sut.n_records == N_OUTPUTS
+        with h5py.File(filename, mode="r") as file:
+            np.testing.assert_array_equal(
+                file["T"][:], 2 * np.arange(1, N_OUTPUTS + 1) * particulator.dt
+            )
+            np.testing.assert_array_equal(file["RH"][:], np.ravel(expected["RH"]))
+            np.testing.assert_array_equal(file["spectrum"][:], expected["spectrum"])
+            assert file["spectrum"].chunks == (1, 6)
+            assert file["spectrum"].compression == compression
+            assert file["spectrum"].dims[1].keys() == ["spectrum_bin_left_edges"]
+
+    @staticmethod
+    def test_writer_error_is_raised_in_calling_thread(tmp_path):
+        # arrange
+        particulator = make_particulator()
+        sut = StreamingNetCDFExporter(
+            particulator, filename=tmp_path / "output.nc", compression="nonexistent"
+        )
+
+        # act
+        sut.write()
+
+        # assert
+        with pytest.raises(RuntimeError):
+            sut.close()
@@ -0,0 +1,129 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.physics import si
+from PySDM.products import (
+    EffectiveRadius,
+    MeanRadius,
+    ParticleConcentration,
+    ParticleSizeSpectrumPerVolume,
+)
+
+from ..dummy_environment import DummyEnvironment
+
+N_SD = 64
+GRID = (1, 3)
+
+
+def make_particulator(*, fused):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(),
+        environment=DummyEnvironment(timestep=1 * si.s, grid=GRID),
+    )
+    builder.request_attribute("radius")
+    if not fused:
+        builder.particulator.moment_planner = None
+    rng = np.random.default_rng(seed=44)
+    positions = rng.uniform(0, 1, size=(2, N_SD)) * np.asarray(GRID)[:, None]
+    cell_id, cell_origin, position_in_cell = (
+        builder.particulator.mesh.cellular_attributes(positions)
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": rng.integers(1, 100, size=N_SD),
+            "volume": builder.formulae.trivia.volume(
+                radius=rng.uniform(0.1, 10, size=N_SD) * si.um
+            ),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        },
+        products=(
+            ParticleConcentration(name="n", radius_range=(0, 5 * si.um)),
+            MeanRadius(name="r_mean"),
+            EffectiveRadius(name="r_eff", radius_range=(1 * si.um, np.inf)),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum", radius_bins_edges=np.linspace(0, 12, 7) * si.um
+            ),
+        ),
+    )
+
+
+def get_all(particulator):
+    return {key: product.get() for key, product in particulator.products.items()}
+
+
+class TestMomentPlanner:
+    @staticmethod
+    def test_matches_per_product_evaluation():
+        # arrange
+        fused = make_particulator(fused=True)
+        separate = make_particulator(fused=False)
+
+        # act
+        sut = get_all(fused)
+        expected = get_all(separate)
+
+        # assert
+        assert separate.moment_planner is None
+        for key, value in expected.items():
+            assert np.isfinite(value).any()
+            np.testing.assert_allclose(sut[key], value, rtol=1e-12)
+
+    @staticmethod
+    @pytest.mark.parametrize("n_steps", (1, 3))
+    def test_single_pass_per_output_step(n_steps):
+        # arrange
+        particulator = make_particulator(fused=True)
+        get_all(particulator)
+        n_passes = particulator.moment_planner.counters["fused passes"]
+        plan = dict(particulator.moment_planner.plan)
+
+        # act
+        for _ in range(n_steps):
+            particulator.run(steps=1)
+            get_all(particulator)
+            get_all(particulator)
+
+        # assert
+        assert (
+            particulator.moment_planner.counters["fused passes"] == n_passes + n_steps
+        )
+        assert particulator.moment_planner.plan == plan
+
+    @staticmethod
+    def test_specs_of_different_attributes():
+        # arrange
+        particulator = make_particulator(fused=True)
+        moment_0 = particulator.Storage.empty(particulator.mesh.n_cell, dtype=float)
+        moments = particulator.Storage.empty((3, particulator.mesh.n_cell), dtype=float)
+        volume = particulator.attributes["volume"].to_ndarray()
+        radius = particulator.attributes["radius"].to_ndarray()
+        multiplicity = particulator.attributes["multiplicity"].to_ndarray()
+        cell_id = particulator.attributes["cell id"].to_ndarray()
+
+        # act
+        particulator.moments(
+            moment_0=moment_0,
+            moments=moments,
+            specs={"volume": (1,), "radius": (1, 2)},
+            attr_name="volume",
+        )
+
+        # assert
+        for cell in range(particulator.mesh.n_cell):
+            in_cell = cell_id == cell
+            weights = multiplicity[in_cell] / np.sum(multiplicity[in_cell])
+            np.testing.assert_allclose(
+                moments.to_ndarray()[:, cell],
+                (
+                    np.dot(weights, volume[in_cell]),
+                    np.dot(weights, radius[in_cell]),
+                    np.dot(weights, radius[in_cell] ** 2),
+                ),
+                rtol=1e-12,
+            )
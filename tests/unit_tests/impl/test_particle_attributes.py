@@ -6,6 +6,7 @@ from PySDM.backends import Numba, ThrustRTC
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
+from PySDM.products import CellSortMovedFraction
 
 from ..dummy_environment import DummyEnvironment
 from ..dummy_particulator import DummyParticulator
@@ -281,3 +282,165 @@ class TestParticleAttributes:
         np.testing.assert_array_equal(
             sut._ParticleAttributes__idx.to_ndarray(), expected
         )
+
+    @staticmethod
+    @pytest.mark.parametrize("by_cell", (False, True))
+    def test_compaction_due_upon_sanitize(backend_class, by_cell):
+        if by_cell and backend_class is ThrustRTC:
+            pytest.skip("TODO #330")
+
+        # Arrange
+        multiplicity = np.array([0, 4, 0, 0, 3, 2, 0, 1])
+        cell_id = np.array([0, 1, 2, 0, 0, 2, 1, 1])
+        water_mass = np.arange(len(multiplicity), dtype=float)
+        particulator = DummyParticulator(backend_class, n_sd=len(multiplicity))
+        particulator.environment.mesh.n_cell = 3
+        particulator.request_attribute("water mass")
+        particulator.build(
+            {
+                "multiplicity": multiplicity,
+                "cell id": cell_id,
+                "water mass": water_mass,
+            },
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        sut.compaction_threshold = 0.25
+        sut.compaction_by_cell = by_cell
+        sut.healthy = False
+
+        # Act
+        sut.sanitize()
+        raw_after_sanitize = sut["multiplicity"].to_ndarray(raw=True)
+        sut.physical_sort_if_needed()
+
+        # Assert
+        np.testing.assert_array_equal(raw_after_sanitize, multiplicity)
+        assert sut.counters["compactions"] == 1
+        n_valid = (multiplicity != 0).sum()
+        assert sut.super_droplet_count == n_valid
+        np.testing.assert_array_equal(
+            sut._ParticleAttributes__idx.to_ndarray()[:n_valid], np.arange(n_valid)
+        )
+        raw = sut["multiplicity"].to_ndarray(raw=True)
+        np.testing.assert_array_equal(raw[n_valid:], 0)
+        np.testing.assert_array_equal(
+            np.sort(raw[:n_valid]), np.sort(multiplicity[multiplicity != 0])
+        )
+        np.testing.assert_array_equal(
+            sut["water mass"].to_ndarray(),
+            water_mass[[np.flatnonzero(multiplicity == n)[0] for n in raw[:n_valid]]],
+        )
+        cells = sut["cell id"].to_ndarray()
+        if by_cell:
+            np.testing.assert_array_equal(cells, np.sort(cells))
+        if backend_class is not ThrustRTC:  # TODO #330
+            np.testing.assert_array_equal(
+                sut.cell_start.to_ndarray(),
+                np.concatenate(((0,), np.cumsum(np.bincount(cells, minlength=3)))),
+            )
+
+    @staticmethod
+    def test_no_compaction_below_threshold(backend_class):
+        # Arrange
+        multiplicity = np.array([1, 1, 0, 1])
+        particulator = DummyParticulator(backend_class, n_sd=len(multiplicity))
+        particulator.build({"multiplicity": multiplicity}, int_caster=np.int64)
+        sut = particulator.attributes
+        sut.compaction_threshold = 0.5
+        sut.healthy = False
+
+        # Act
+        sut.sanitize()
+        sut.physical_sort_if_needed()
+
+        # Assert
+        np.testing.assert_array_equal(
+            sut["multiplicity"].to_ndarray(raw=True), multiplicity
+        )
+
+    @staticmethod
+    def test_physical_sort_upon_threshold(backend_class):
+        if backend_class is ThrustRTC:
+            pytest.skip("TODO #330")
+
+        # Arrange
+        n_cell = 3
+        cell_id = np.array([2, 0, 1, 0, 2, 1])
+        particulator = DummyParticulator(backend_class, n_sd=len(cell_id))
+        particulator.environment.mesh.n_cell = n_cell
+        particulator.build(
+            {"multiplicity": np.arange(1, len(cell_id) + 1), "cell id": cell_id},
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        sut.physical_sort_threshold = 0.25
+        fraction_before = sut.out_of_cell_fraction()
+
+        # Act
+        sut.physical_sort_if_needed()
+
+        # Assert
+        assert fraction_before > sut.physical_sort_threshold
+        assert sut.out_of_cell_fraction() == 0
+        assert sut.counters["physical sorts"] == 1
+        np.testing.assert_array_equal(
+            sut["cell id"].to_ndarray(raw=True), np.sort(cell_id)
+        )
+        np.testing.assert_array_equal(
+            sut["multiplicity"].to_ndarray(raw=True), [2, 4, 3, 6, 1, 5]
+        )
+
+        # Act
+        sut.physical_sort_if_needed()
+
+        # Assert
+        assert sut.counters["physical sorts"] == 1
+
+    @staticmethod
+    def test_incremental_cell_sort():
+        # Arrange
+        n_cell = 4
+        cell_id = np.repeat(np.arange(n_cell), 5)
+        particulator = DummyParticulator(Numba, n_sd=len(cell_id))
+        particulator.environment.mesh.n_cell = n_cell
+        particulator.sorting_scheme = "incremental"
+        particulator.build(
+            {"multiplicity": np.ones(len(cell_id)), "cell id": cell_id},
+            products=(CellSortMovedFraction(),),
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        product = particulator.products["cell sort moved fraction"]
+        _ = sut.cell_start
+        initial_fraction = product.get()
+
+        cell_id[[0, 7, 13]] = (3, 0, 1)
+        sut["cell id"].upload(cell_id)
+        sut._ParticleAttributes__sorted = False
+
+        # Act
+        cell_start = sut.cell_start.to_ndarray()
+
+        # Assert
+        assert initial_fraction == 1
+        assert product.get() == 3 / len(cell_id)
+        assert sut.counters["cell sorts"] == 2
+        assert sut.counters["incremental cell sorts"] == 1
+        np.testing.assert_array_equal(cell_start, (0, 5, 10, 14, 20))
+        np.testing.assert_array_equal(
+            np.diff(cell_id[sut._ParticleAttributes__idx.to_ndarray()]) >= 0, True
+        )
+
+    @staticmethod
+    def test_physical_sort_interval(backend_class):
+        # Arrange
+        particulator = DummyParticulator(backend_class, n_sd=2)
+        particulator.build({"multiplicity": np.ones(2)}, int_caster=np.int64)
+        particulator.attributes.physical_sort_interval = 2
+
+        # Act
+        particulator.run(steps=5)
+
+        # Assert
+        assert particulator.attributes.counters["physical sorts"] == 2
@@ -0,0 +1,82 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import json
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
+N_SD = 64
+N_STEPS = 3
+
+
+def make_particulator(backend_instance):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_instance,
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)),),
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e6),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3,
+        }
+    )
+
+
+class TestProfiler:
+    @staticmethod
+    def test_disabled_by_default(backend_instance):
+        # arrange
+        particulator = make_particulator(backend_instance)
+
+        # act
+        particulator.run(steps=N_STEPS)
+
+        # assert
+        assert not particulator.profiler.enabled
+        assert particulator.profiler.summary() == {}
+        assert "compute_gamma" not in vars(particulator.backend)
+
+    @staticmethod
+    def test_nested_spans(backend_instance):
+        # arrange
+        particulator = make_particulator(backend_instance)
+
+        # act
+        with particulator.profiler:
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        summary = particulator.profiler.summary()
+        assert summary["Collision"]["count"] == N_STEPS
+        phases = summary["Collision"]["children"]
+        for phase in ("permutation", "kernel", "gamma", "coalescence/breakup"):
+            assert phases[phase]["count"] == N_STEPS
+            assert phases[phase]["time"] <= summary["Collision"]["time"]
+        assert phases["gamma"]["children"]["compute_gamma"]["count"] == N_STEPS
+        assert "recalculate: volume" in phases["kernel"]["children"]
+        assert "compute_gamma" not in vars(particulator.backend)
+
+    @staticmethod
+    def test_export(backend_instance, tmp_path):
+        # arrange
+        particulator = make_particulator(backend_instance)
+        with particulator.profiler:
+            particulator.run(steps=1)
+
+        # act
+        particulator.profiler.to_json(tmp_path / "summary.json")
+        particulator.profiler.to_chrome_trace(tmp_path / "trace.json")
+
+        # assert
+        with open(tmp_path / "summary.json", encoding="utf-8") as file:
+            assert json.load(file) == particulator.profiler.summary()
+        with open(tmp_path / "trace.json", encoding="utf-8") as file:
+            events = json.load(file)["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+        assert "Collision" in {event["name"] for event in events}
@@ -84,3 +84,26 @@ class TestBuilder:
         )
 
         # assert
+
+    @staticmethod
+    @pytest.mark.parametrize("sorting_scheme", ("default", "radix_sort_parallel"))
+    def test_sorting_scheme(sorting_scheme):
+        # arrange
+        backend = CPU()
+        builder = Builder(
+            backend=backend, n_sd=1, environment=Box(dt=np.nan, dv=np.nan)
+        )
+        builder.particulator.sorting_scheme = sorting_scheme
+
+        # act
+        particulator = builder.build(
+            products=(),
+            attributes={k: np.asarray([1]) for k in ("multiplicity", "volume")},
+        )
+
+        # assert
+        assert particulator.sorting_scheme == (
+            backend.choose_sorting_scheme(n_sd=1, n_cell=1)
+            if sorting_scheme == "default"
+            else sorting_scheme
+        )
@@ -0,0 +1,144 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Parcel
+from PySDM.impl.checkpoint import load_checkpoint
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Exponential, Lognormal
+from PySDM.physics import si
+from PySDM.products import AmbientRelativeHumidity, ParcelDisplacement
+
+N_SD = 32
+N_STEPS = 4
+
+
+def parcel_builder():
+    return Builder(
+        n_sd=N_SD,
+        backend=CPU(Formulae()),
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=1000 * si.hPa,
+            T0=300 * si.K,
+            initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+            w=2 * si.m / si.s,
+        ),
+        dynamics=(AmbientThermodynamics(), Condensation()),
+    )
+
+
+def parcel_attributes(builder):
+    r_dry, specific_concentration = spectral_sampling.Logarithmic(
+        Lognormal(norm_factor=1e4 / si.mg, m_mode=50 * si.nm, s_geom=1.5)
+    ).sample_deterministic(N_SD)
+    return builder.particulator.environment.init_attributes(
+        n_in_dv=specific_concentration * 1 * si.kg, kappa=0.5, r_dry=r_dry
+    )
+
+
+def box_builder():
+    return Builder(
+        n_sd=N_SD,
+        backend=CPU(Formulae(seed=44)),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        dynamics=(Coalescence(collision_kernel=Golovin(b=1.5e4 / si.s)),),
+    )
+
+
+def box_attributes(builder):
+    volume, multiplicity = spectral_sampling.ConstantMultiplicity(
+        Exponential(
+            norm_factor=2**23 / si.m**3, scale=4 * np.pi / 3 * (30 * si.um) ** 3
+        )
+    ).sample_deterministic(N_SD, backend=builder.particulator.backend)
+    return {"volume": volume, "multiplicity": multiplicity}
+
+
+PRODUCTS = {
+    "parcel": (AmbientRelativeHumidity(name="RH"), ParcelDisplacement(name="z")),
+    "box": (),
+}
+
+
+def state(particulator):
+    result = {
+        key: particulator.attributes[key].to_ndarray()
+        for key in ("multiplicity", "water mass")
+    }
+    for key, product in particulator.products.items():
+        result[key] = product.get().copy()
+    return result
+
+
+class TestCheckpoint:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "make_builder, make_attributes, products",
+        (
+            (parcel_builder, parcel_attributes, "parcel"),
+            (box_builder, box_attributes, "box"),
+        ),
+    )
+    def test_restart_matches_uninterrupted_run(
+        tmp_path, make_builder, make_attributes, products
+    ):
+        # arrange
+        builder = make_builder()
+        particulator = builder.build(
+            attributes=make_attributes(builder), products=PRODUCTS[products]
+        )
+        particulator.run(steps=N_STEPS)
+        particulator.save_checkpoint(tmp_path)
+        particulator.run(steps=N_STEPS)
+        expected = state(particulator)
+
+        # act
+        restarted = make_builder().from_checkpoint(
+            tmp_path, products=PRODUCTS[products]
+        )
+        restarted.run(steps=N_STEPS)
+
+        # assert
+        assert restarted.n_steps == 2 * N_STEPS
+        actual = state(restarted)
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            np.testing.assert_array_equal(actual[key], value)
+
+    @staticmethod
+    def test_arrays_are_memory_mapped(tmp_path):
+        # arrange
+        builder = box_builder()
+        particulator = builder.build(attributes=box_attributes(builder))
+        particulator.save_checkpoint(tmp_path)
+
+        # act
+        sut = load_checkpoint(tmp_path)
+
+        # assert
+        assert isinstance(
+            sut["attributes"]["base attributes"]["multiplicity"], np.memmap
+        )
+
+    @staticmethod
+    def test_n_sd_mismatch(tmp_path):
+        # arrange
+        builder = box_builder()
+        builder.build(attributes=box_attributes(builder)).save_checkpoint(tmp_path)
+
+        # act
+        sut = Builder(
+            n_sd=N_SD // 2,
+            backend=CPU(Formulae()),
+            environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        )
+
+        # assert
+        with pytest.raises(ValueError):
+            sut.from_checkpoint(tmp_path)
@@ -0,0 +1,105 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, EnsembleRunner
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import TotalParticleConcentration
+
+DV = 1 * si.m**3
+STEPS = (0, 1, 2)
+
+
+def setup(backend, *, n_sd):
+    """multiplicity set to the seed so that the seed passed to backend is tested"""
+    builder = Builder(n_sd=n_sd, backend=backend, environment=Box(dt=1 * si.s, dv=DV))
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(n_sd, backend.formulae.seed),
+            "water mass": np.full(n_sd, 1 * si.ng),
+        },
+        products=(TotalParticleConcentration(name="n", unit="m^-3"),),
+    )
+
+
+MEMBERS = ({"n_sd": 1, "seed": 44}, {"n_sd": 2, "seed": 66}, {"n_sd": 4, "seed": 11})
+
+
+class TestEnsembleRunner:
+    @staticmethod
+    def test_serial():
+        # arrange
+        sut = EnsembleRunner(setup=setup, backend_class=CPU, n_workers=1)
+
+        # act
+        items = list(sut.run(MEMBERS, steps=STEPS))
+
+        # assert
+        assert [(member_id, step) for member_id, step, _ in items] == [
+            (member_id, step) for member_id in range(len(MEMBERS)) for step in STEPS
+        ]
+        for member_id, _, values in items:
+            member = MEMBERS[member_id]
+            np.testing.assert_array_equal(
+                values["n"], member["n_sd"] * member["seed"] / DV
+            )
+
+    @staticmethod
+    def test_pool_matches_serial():
+        # arrange
+        kwargs = {"setup": setup, "backend_class": CPU}
+
+        # act
+        serial = EnsembleRunner(n_workers=1, **kwargs).run_to_dict(MEMBERS, steps=STEPS)
+        pool = EnsembleRunner(
+            n_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+            **kwargs,
+        ).run_to_dict(MEMBERS, steps=STEPS, product_names=("n",))
+
+        # assert
+        assert len(pool) == len(MEMBERS)
+        for serial_member, pool_member in zip(serial, pool):
+            assert len(pool_member["n"]) == len(STEPS)
+            np.testing.assert_array_equal(serial_member["n"], pool_member["n"])
+
+    @staticmethod
+    @pytest.mark.parametrize("n_workers", (1, 2))
+    def test_members_without_seed_do_not_inherit_seed_of_previous_member(n_workers):
+        # arrange
+        members = (
+            {"n_sd": 1},
+            {"n_sd": 1, "seed": 44},
+            {"n_sd": 1},
+            {"n_sd": 1, "seed": 11},
+            {"n_sd": 1},
+        )
+        default_seed = 66
+        sut = EnsembleRunner(
+            setup=setup,
+            backend_class=CPU,
+            formulae_kwargs={"seed": default_seed},
+            n_workers=n_workers,
+        )
+
+        # act
+        output = sut.run_to_dict(members, steps=STEPS)
+
+        # assert
+        for member, member_output in zip(members, output):
+            np.testing.assert_array_equal(
+                member_output["n"], member.get("seed", default_seed) / DV
+            )
+
+    @staticmethod
+    def test_worker_exception_is_propagated():
+        # arrange
+        sut = EnsembleRunner(setup=setup, backend_class=CPU, n_workers=2)
+
+        # act
+        with pytest.raises(TypeError):
+            list(sut.run(({"n_sd": 1, "unknown": 0},), steps=STEPS))
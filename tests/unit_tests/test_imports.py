@@ -6,12 +6,14 @@ import PySDM
 
 CLASSES = (
     "Builder",
+    "EnsembleRunner",
     "Formulae",
     "Particulator",
     "attributes.chemistry.Acidity",
     "attributes.physics.DryVolume",
     "backends.CPU",
     "backends.GPU",
+    "decomposition.SlabDecomposition",
     "dynamics.Condensation",
     "dynamics.collisions.breakup_fragmentations.AlwaysN",
     "dynamics.collisions.coalescence_efficiencies.LowList1982Ec",